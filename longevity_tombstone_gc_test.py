@@ -101,8 +101,10 @@ class TombstoneGcLongevityTest(TWCSLongevityTest):
         sstables = sstable_utils.get_sstables(from_minutes_ago=delta_repair_date_minutes)
         self.log.debug('Starting sstabledump to verify correctness of tombstones for %s sstables',
                        len(sstables))
-        for sstable in sstables:
-            sstable_utils.verify_post_repair_sstable_tombstones(table_repair_date=table_repair_date, sstable=sstable)
+        sstable_utils.run_on_sstables(
+            lambda sstable: sstable_utils.verify_post_repair_sstable_tombstones(
+                table_repair_date=table_repair_date, sstable=sstable),
+            sstables)
 
         self.log.info("Change tombstone-gc mode to 'immediate'")
         with self.db_cluster.cql_connection_patient(node=self.db_node) as session:
@@ -128,6 +130,7 @@ class TombstoneGcLongevityTest(TWCSLongevityTest):
         sstables = sstable_utils.get_sstables(from_minutes_ago=compaction_gc_delta_minutes)
         self.log.debug('Starting sstabledump to verify correctness of tombstones for %s sstables',
                        len(sstables))
-        for sstable in sstables:
-            tombstone_deletion_info = sstable_utils.get_compacted_tombstone_deletion_info(sstable=sstable)
+        tombstones_deletion_info = sstable_utils.run_on_sstables(
+            sstable_utils.get_compacted_tombstone_deletion_info, sstables)
+        for sstable, tombstone_deletion_info in zip(sstables, tombstones_deletion_info):
             assert not tombstone_deletion_info, f"Found unexpected existing tombstones: {tombstone_deletion_info} for sstable: {sstable}"
@@ -1,4 +1,3 @@
-import pathlib
 import time
 from enum import Enum
 from collections import defaultdict
@@ -180,15 +179,15 @@ class PerformanceRegressionPredefinedStepsTest(PerformanceRegressionTest):
         self.log.info("Dataset has been populated")
 
     def check_latency_during_steps(self, step):
-        with open(self.latency_results_file, encoding="utf-8") as file:
-            latency_results = json.load(file)
+        self.latency_cycles_pipeline.flush()
+        latency_results = self.latency_results_journal.load()
         self.log.debug('Step %s: latency_results were loaded from file %s and its result is %s',
                        step, self.latency_results_file, latency_results)
         if latency_results and self.create_stats:
             latency_results[step]["step"] = step
             latency_results[step] = calculate_latency(latency_results[step])
             latency_results = analyze_hdr_percentiles(latency_results)
-            pathlib.Path(self.latency_results_file).unlink()
+            self.latency_results_journal.clear()
             self.log.debug('collected latency values are: %s', latency_results)
             self.update({"latency_during_ops": latency_results})
             return latency_results
@@ -13,7 +13,6 @@
 
 import os
 import uuid
-import time
 import logging
 
 from sdcm.loader import CassandraHarryStressExporter
@@ -23,31 +22,26 @@ from sdcm.utils.docker_remote import RemoteDocker
 from sdcm.stress_thread import DockerBasedStressThread
 from sdcm.stress.base import format_stress_cmd_error
 from sdcm.utils.common import FileFollowerThread
+from sdcm.utils.pattern_set import PatternSet
 
 
 LOGGER = logging.getLogger(__name__)
 
+CASSANDRA_HARRY_ERROR_EVENTS_PATTERN_SET = PatternSet(CASSANDRA_HARRY_ERROR_EVENTS_PATTERNS)
+
 
 class CassandraHarryStressEventsPublisher(FileFollowerThread):
     def __init__(self, node, harry_log_filename):
         super().__init__()
-        self.harry_log_filename = harry_log_filename
+        self.harry_log_filename = self.followed_filename = harry_log_filename
         self.node = str(node)
 
-    def run(self):
-        while not self.stopped():
-            exists = os.path.isfile(self.harry_log_filename)
-            if not exists:
-                time.sleep(0.5)
-                continue
-
-            for line_number, line in enumerate(self.follow_file(self.harry_log_filename)):
-                if self.stopped():
-                    break
-
-                for pattern, event in CASSANDRA_HARRY_ERROR_EVENTS_PATTERNS:
-                    if pattern.search(line):
-                        event.add_info(node=self.node, line=line, line_number=line_number).publish()
+    def process_line(self, line_number, line):
+        published = 0
+        for _, event in CASSANDRA_HARRY_ERROR_EVENTS_PATTERN_SET.search_all(line):
+            event.add_info(node=self.node, line=line, line_number=line_number).publish()
+            published += 1
+        return published
 
 
 class CassandraHarryThread(DockerBasedStressThread):
@@ -42,7 +42,7 @@ from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from contextlib import ExitStack, contextmanager
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import as_completed
 import packaging.version
 
 import yaml
@@ -89,6 +89,7 @@ from sdcm.utils import properties
 from sdcm.utils.adaptive_timeouts import Operations, adaptive_timeout
 from sdcm.utils.aws_kms import AwsKms
 from sdcm.utils.cql_utils import cql_quote_if_needed
+from sdcm.utils.backtrace_decoder import BacktraceDecoder
 from sdcm.utils.benchmarks import ScyllaClusterBenchmarkManager
 from sdcm.utils.common import (
     S3Storage,
@@ -145,7 +146,10 @@ from sdcm.utils.ldap import LDAP_SSH_TUNNEL_LOCAL_PORT, LDAP_BASE_OBJECT, LDAP_P
     LDAP_PORT, DEFAULT_PWD_SUFFIX
 from sdcm.utils.remote_logger import get_system_logging_thread
 from sdcm.utils.scylla_args import ScyllaArgParser
-from sdcm.utils.file import File
+from sdcm.utils.file import ReiterableGenerator
+from sdcm.utils.log_scanner import IncrementalLogScanner, LiteralsPrefilter
+from sdcm.utils.parallel_executor import get_parallel_executor, in_current_context
+from sdcm.utils.pattern_set import PatternSet
 from sdcm.utils import cdc
 from sdcm.utils.raft import get_raft_mode
 from sdcm.coredump import CoredumpExportSystemdThread
@@ -254,6 +258,7 @@ class BaseNode(AutoSshContainerMixin):
                                   ]
 
     SYSTEM_EVENTS_PATTERNS = SYSTEM_ERROR_EVENTS_PATTERNS + INSTANCE_STATUS_EVENTS_PATTERNS
+    decode_backtraces_batch_size = 100  # max number of backtraces decoded at once on the monitor node
 
     def __init__(self, name, parent_cluster, ssh_login_info=None, base_logdir=None, node_prefix=None, dc_idx=0, rack=0):
         self.name = name
@@ -1354,13 +1359,19 @@ class BaseNode(AutoSshContainerMixin):
                 severity=Severity.WARNING, ).publish_or_dump()
 
     def get_cfstats(self, keyspace):
+        results = []
+
         def keyspace_available():
             self.run_nodetool("flush", ignore_status=True, timeout=300)
             res = self.run_nodetool(sub_cmd='cfstats', args=keyspace, ignore_status=True, timeout=300)
+            results.append(res)
             return res.exit_status == 0
 
         wait.wait_for(keyspace_available, timeout=600, step=60,
                       text='Waiting until keyspace {} is available'.format(keyspace), throw_exc=False)
+        # the output of the last successful wait is used, so it isn't requested again
+        if results and results[-1].exit_status == 0:
+            return self._parse_cfstats(results[-1].stdout)
         # Don't need NodetoolEvent when waiting for space_node_threshold before start the nemesis, not publish it
         result = self.run_nodetool(sub_cmd='cfstats', args=keyspace, timeout=300,
                                    warning_event_on_exception=(Failure, UnexpectedExit, Libssh2_UnexpectedExit,), publish_event=False)
@@ -1495,20 +1506,18 @@ class BaseNode(AutoSshContainerMixin):
         This is for use with the from_mark parameter of watch_log_for_* methods,
         allowing to watch the log from the position when this method was called.
         """
-        if not os.path.exists(self.system_log):
+        try:
+            return os.path.getsize(self.system_log)
+        except FileNotFoundError:
             return 0
-        with open(self.system_log, encoding="utf-8") as log_file:
-            log_file.seek(0, os.SEEK_END)
-            return log_file.tell()
 
     def follow_system_log(
             self,
             patterns: Optional[List[Union[str, re.Pattern, LogEvent]]] = None,
             start_from_beginning: bool = False
     ) -> Iterable[str]:
-        stream = File(self.system_log)
-        if not start_from_beginning:
-            stream.move_to_end()
+        if not os.path.exists(self.system_log):
+            raise FileNotFoundError(f"No such file: '{self.system_log}'")
         if not patterns:
             patterns = [p[0] for p in SYSTEM_ERROR_EVENTS_PATTERNS]
         regexps = []
@@ -1519,7 +1528,16 @@ class BaseNode(AutoSshContainerMixin):
                 regexps.append(re.compile(pattern, flags=re.IGNORECASE))
             elif isinstance(pattern, LogEvent):
                 regexps.append(re.compile(pattern.regex, flags=re.IGNORECASE))
-        return stream.read_lines_filtered(*regexps)
+        pattern_set = PatternSet((regexp, None) for regexp in regexps)
+        scanner = IncrementalLogScanner(path=self.system_log, prefilter=LiteralsPrefilter(pattern_set))
+        if not start_from_beginning:
+            scanner.seek_to_end()
+
+        def generator():
+            for _, line in scanner.scan():
+                if pattern_set.search(line):
+                    yield line
+        return ReiterableGenerator(generator=generator)
 
     @contextlib.contextmanager
     def open_system_log(self, on_datetime: Optional[datetime] = None) -> IO[AnyStr]:
@@ -1531,32 +1549,36 @@ class BaseNode(AutoSshContainerMixin):
             else:
                 # ignore microseconds because log lines don't have them
                 on_datetime = on_datetime.replace(microsecond=0)
-            left, right = 0, log_file.seek(0, 2)
-            log_size = right
-            while left <= right:
-                mid = (left + right) // 2
-                log_file.seek(mid)
-                log_file.readline()  # skip line fragment
-                line = log_file.readline()
-                if not line:  # EOF
-                    right = mid - 1
-                    continue
-                while True:
-                    try:
-                        log_time = datetime.fromisoformat(line.split(' ')[0]).replace(tzinfo=None)
-                    except ValueError:
-                        # in case it gets to split line fragment
-                        line = log_file.readline()
-                        if not line:
-                            return
+            # bisect over bytes, only the timestamp of a line needs to be decoded
+            with open(self.system_log, 'rb') as binary_log_file:
+                left, right = 0, binary_log_file.seek(0, 2)
+                log_size = right
+                while left <= right:
+                    mid = (left + right) // 2
+                    binary_log_file.seek(mid)
+                    binary_log_file.readline()  # skip line fragment
+                    line = binary_log_file.readline()
+                    if not line:  # EOF
+                        right = mid - 1
                         continue
-                    break
-                if log_time < on_datetime:
-                    left = mid + 1
-                elif log_time >= on_datetime:
-                    right = mid - 1
+                    while True:
+                        try:
+                            log_time = datetime.fromisoformat(line.split(b' ', 1)[0].decode()).replace(tzinfo=None)
+                        except ValueError:
+                            # in case it gets to split line fragment
+                            line = binary_log_file.readline()
+                            if not line:
+                                return
+                            continue
+                        break
+                    if log_time < on_datetime:
+                        left = mid + 1
+                    elif log_time >= on_datetime:
+                        right = mid - 1
+                position = binary_log_file.tell()
             self.log.debug("Asked to open log at %s, the closest log line is %s. log size: %s, line: <%s>...",
-                           on_datetime, log_time, log_size, line[100])
+                           on_datetime, log_time, log_size, line[:100].decode(errors="replace"))
+            log_file.seek(position)
             yield log_file
 
     def start_decode_on_monitor_node_thread(self):
@@ -1566,47 +1588,90 @@ class BaseNode(AutoSshContainerMixin):
         self._decoding_backtraces_thread.start()
 
     def decode_backtrace(self):
-        while True:
-            event = None
+        """Decode backtraces from DECODING_QUEUE in batches: all backtraces queued so far are decoded at once."""
+        decoder = BacktraceDecoder(run_command=lambda cmd: self.remoter.run(cmd, verbose=False).stdout)
+        debug_files = {}  # build id -> path on monitor node
+        stop = False
+        while not stop:
+            batch = []
             try:
                 obj = self.test_config.DECODING_QUEUE.get(timeout=5)
-                if obj is None:
-                    break
-                event = obj["event"]
-                self.log.debug("Event origin severity: %s", event.severity)
-                scylla_debug_file = self.copy_scylla_debug_info(obj["node"], obj["build_id"])
-                output = self.decode_raw_backtrace(scylla_debug_file, " ".join(event.raw_backtrace.split('\n')))
-                event.backtrace = output.stdout
-                the_map = FindIssuePerBacktrace()
-                if issue_url := the_map.find_issue(backtrace_type=event.type, decoded_backtrace=event.backtrace):
-                    event.known_issue = issue_url
-                    skip_per_issue = SkipPerIssues(issue_url, self.parent_cluster.params)
-                    # If found issue is closed
-                    if not skip_per_issue.issues_opened():
-                        if skip_per_issue.issues_labeled():
-                            # If found issue has skip label, this issue was fixed but won't be backported to the tested branch.
-                            # So this reactor stall is expected and shouldn't fail the test
-                            # if this event severity is Error or Critical - decrease to warning.
-                            event.severity = Severity.WARNING if event.severity.value > Severity.WARNING.value else event.severity
-                        else:
-                            # If found issue has no skip label - increase severity to Error (if not).
-                            # A reason: the issue was fixed, and it is not expected to get this reactor stall
-                            event.severity = Severity.ERROR if event.severity.value < Severity.ERROR.value else event.severity
-                    self.log.debug("Found issue for %s event: %s", event.event_id, event.known_issue)
+                while obj is not None:
+                    batch.append(obj)
+                    if len(batch) >= self.decode_backtraces_batch_size:
+                        break
+                    obj = self.test_config.DECODING_QUEUE.get_nowait()
+                stop = obj is None
             except queue.Empty:
                 pass
             except Exception as details:  # noqa: BLE001
-                self.log.error("failed to decode backtrace %s", details)
-                if "is closed" in str(details):
-                    break
-            finally:
-                if event:
-                    event.ready_to_publish()
-                    event.publish()
-
+                self.log.error("failed to get backtraces to decode %s", details)
+                stop = "is closed" in str(details)
+            if batch:
+                self._decode_and_publish_backtraces(decoder, debug_files, batch)
             if self.termination_event.is_set() and self.test_config.DECODING_QUEUE.empty():
                 break
 
+    def _decode_and_publish_backtraces(self, decoder: BacktraceDecoder, debug_files: dict, batch: list) -> None:
+        try:
+            to_decode = []
+            for obj in batch:
+                self.log.debug("Event origin severity: %s", obj["event"].severity)
+                try:
+                    if obj["build_id"] not in debug_files:
+                        debug_files[obj["build_id"]] = self.copy_scylla_debug_info(obj["node"], obj["build_id"])
+                except Exception as details:  # noqa: BLE001
+                    self.log.error("failed to get debug info for backtrace %s", details)
+                    continue
+                to_decode.append((obj, debug_files[obj["build_id"]]))
+            for obj in self._decode_backtraces(decoder, to_decode):
+                try:
+                    self._set_backtrace_known_issue(obj["event"])
+                except Exception as details:  # noqa: BLE001
+                    self.log.error("failed to find known issue of backtrace %s", details)
+        finally:
+            for obj in batch:
+                obj["event"].ready_to_publish()
+                obj["event"].publish()
+
+    def _decode_backtraces(self, decoder: BacktraceDecoder, to_decode: list) -> list:
+        """Decode all backtraces at once, or one by one if it fails, and return items which were decoded."""
+        if not to_decode:
+            return []
+        try:
+            backtraces = decoder.decode([(debug_file, obj["event"].raw_backtrace) for obj, debug_file in to_decode])
+            for (obj, _), backtrace in zip(to_decode, backtraces):
+                obj["event"].backtrace = backtrace
+            return [obj for obj, _ in to_decode]
+        except Exception as details:  # noqa: BLE001
+            self.log.error("failed to decode backtraces, will decode them one by one: %s", details)
+        decoded = []
+        for obj, debug_file in to_decode:
+            try:
+                obj["event"].backtrace, = decoder.decode([(debug_file, obj["event"].raw_backtrace)])
+                decoded.append(obj)
+            except Exception as details:  # noqa: BLE001
+                self.log.error("failed to decode backtrace %s", details)
+        return decoded
+
+    def _set_backtrace_known_issue(self, event) -> None:
+        the_map = FindIssuePerBacktrace()
+        if issue_url := the_map.find_issue(backtrace_type=event.type, decoded_backtrace=event.backtrace):
+            event.known_issue = issue_url
+            skip_per_issue = SkipPerIssues(issue_url, self.parent_cluster.params)
+            # If found issue is closed
+            if not skip_per_issue.issues_opened():
+                if skip_per_issue.issues_labeled():
+                    # If found issue has skip label, this issue was fixed but won't be backported to the tested branch.
+                    # So this reactor stall is expected and shouldn't fail the test
+                    # if this event severity is Error or Critical - decrease to warning.
+                    event.severity = Severity.WARNING if event.severity.value > Severity.WARNING.value else event.severity
+                else:
+                    # If found issue has no skip label - increase severity to Error (if not).
+                    # A reason: the issue was fixed, and it is not expected to get this reactor stall
+                    event.severity = Severity.ERROR if event.severity.value < Severity.ERROR.value else event.severity
+            self.log.debug("Found issue for %s event: %s", event.event_id, event.known_issue)
+
     def copy_scylla_debug_info(self, node_name: str, build_id: str):
         """Copy scylla debug file from db-node to monitor-node.
 
@@ -1662,19 +1727,6 @@ class BaseNode(AutoSshContainerMixin):
 
         raise Exception("Couldn't find scylla debug information")
 
-    def decode_raw_backtrace(self, scylla_debug_file, raw_backtrace):
-        """run decode backtrace on monitor node
-
-        Decode backtrace on monitor node
-        :param scylla_debug_file: file path on db-node
-        :type scylla_debug_file: str
-        :param raw_backtrace: string with backtrace data
-        :type raw_backtrace: str
-        :returns: result of bactrace
-        :rtype: {str}
-        """
-        return self.remoter.run('addr2line -Cpife {0} {1}'.format(scylla_debug_file, raw_backtrace), verbose=True)
-
     def get_scylla_build_id(self) -> Optional[str]:
         for scylla_executable in ("/usr/bin/scylla", "/opt/scylladb/libexec/scylla", ):
             build_id_result = self.remoter.run(f"{scylla_executable} --build-id", ignore_status=True)
@@ -2003,8 +2055,7 @@ class BaseNode(AutoSshContainerMixin):
             "find /var/lib/scylla/view_hints -type f -delete"
         ]
         self.log.debug("Clean all files from scylla data dirs")
-        for cmd in clean_commands_list:
-            self.remoter.sudo(cmd, ignore_status=True)
+        self.remoter.sudo_batch(clean_commands_list, ignore_status=True)
 
     def clean_scylla(self):
         """
@@ -3462,11 +3513,12 @@ class BaseCluster:
         if node_list is None:
             node_list = self.nodes
 
-        with ThreadPoolExecutor() as executor:
-            futures = [executor.submit(func, node) for node in node_list]
-            results = [future.result() for future in as_completed(futures)]
-
-        return results
+        task_group = get_parallel_executor().task_group(name=getattr(func, "__qualname__", None))
+        futures = [task_group.submit(func, node) for node in node_list]
+        try:
+            return [future.result() for future in as_completed(futures)]
+        finally:
+            task_group.cancel()
 
     def get_backtraces(self):
         for node in self.nodes:
@@ -4045,14 +4097,15 @@ def wait_for_init_wrap(method):
             # setup in parallel
             for node in node_list:
                 current_setup_thread = threading.Thread(
-                    target=node_setup, args=(node, setup_queue), daemon=True)
+                    target=in_current_context(node_setup), args=(node, setup_queue), daemon=True)
                 current_setup_thread.start()
             while len(setup_results) != len(node_list):
                 verify_node_setup_or_startup(start_time, setup_queue, setup_results)
             # startup
             for node in node_list:
                 if cl_inst.parallel_startup:
-                    threading.Thread(target=node_startup, args=(node, startup_queue), daemon=True).start()
+                    threading.Thread(target=in_current_context(node_startup), args=(node, startup_queue),
+                                     daemon=True).start()
                 else:
                     node_startup(node, startup_queue)
             while len(startup_results) != len(node_list):
@@ -6128,7 +6181,8 @@ class BaseMonitorSet:
 
         return screenshot_links
 
-    def get_grafana_screenshots(self, node: BaseNode, test_start_time: float) -> list[str]:
+    def get_grafana_screenshots(self, node: BaseNode, test_start_time: float,
+                                test_end_time: Optional[float] = None) -> list[str]:
         screenshot_links = []
         grafana_extra_dashboards = []
         if 'alternator_port' in self.params:
@@ -6137,6 +6191,7 @@ class BaseMonitorSet:
 
         screenshot_collector = GrafanaScreenShot(name="grafana-screenshot",
                                                  test_start_time=test_start_time,
+                                                 test_end_time=test_end_time,
                                                  extra_entities=grafana_extra_dashboards)
         screenshot_files = screenshot_collector.collect(node, self.logdir)
         for screenshot in screenshot_files:
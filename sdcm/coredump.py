@@ -192,18 +192,11 @@ class CoredumpThreadBase(Thread):
 
     def extract_info_from_core_pids(
             self, new_cores: Optional[List[CoreDumpInfo]], exclude_cores: List[CoreDumpInfo]) -> List[CoreDumpInfo]:
-        output = []
-        for new_core_info in new_cores:
-            found = False
-            for e_core_info in exclude_cores:
-                if e_core_info.pid == new_core_info.pid:
-                    found = True
-                    break
-            if found:
-                continue
-            self.update_new_coredump_with_exec_information(new_core_info)
+        excluded_pids = {e_core_info.pid for e_core_info in exclude_cores}
+        output = [new_core_info for new_core_info in new_cores if new_core_info.pid not in excluded_pids]
+        self.update_new_coredumps_with_exec_information(output)
+        for new_core_info in output:
             self.publish_event(new_core_info)
-            output.append(new_core_info)
         return output
 
     # @retrying(n=10, sleep_time=20, allowed_exceptions=NETWORK_EXCEPTIONS, message="Retrying on uploading coredump")
@@ -303,36 +296,48 @@ class CoredumpThreadBase(Thread):
     def update_coredump_info_with_more_information(self, core_info: CoreDumpInfo):
         pass
 
-    def _get_core_by_pid(self, pid: str) -> Optional[dict]:
-        result = self.node.remoter.sudo(f"coredumpctl list {pid} -q --json=short", verbose=False, ignore_status=True)
-        if not result.ok:
-            return None
-
-        try:
-            cores_info = json.loads(result.stdout)
-        except json.JSONDecodeError:
-            self.log.warning("couldn't parse:\n %s", result.stdout)
-            return None
-        return cores_info[0]
-
-    def _get_executable_version(self, executable: str) -> Optional[str]:
+    def _get_cores_by_pids(self, pids: List[str]) -> List[Optional[dict]]:
+        results = self.node.remoter.sudo_batch(
+            [f"coredumpctl list {pid} -q --json=short" for pid in pids], verbose=False, ignore_status=True)
+        cores = []
+        for result in results:
+            if not result.ok:
+                cores.append(None)
+                continue
+            try:
+                cores.append(json.loads(result.stdout)[0])
+            except json.JSONDecodeError:
+                self.log.warning("couldn't parse:\n %s", result.stdout)
+                cores.append(None)
+        return cores
+
+    def _get_executables_versions(self, executables: List[str]) -> Dict[str, Optional[str]]:
+        """Query packages of the executables and their versions, a batch of commands for each step."""
+        executables = list(dict.fromkeys(executables))
         if self.node.distro.is_rhel_like:
-            pkg = self.node.remoter.run(f"rpm -qf {executable}", ignore_status=True).stdout.strip()
-            release_version = self.node.remoter.run(
-                f"rpm -q --queryformat '%{{VERSION}}' {pkg}", ignore_status=True).stdout.strip()
+            pkgs = [result.stdout.strip() for result in self.node.remoter.run_batch(
+                [f"rpm -qf {executable}" for executable in executables], ignore_status=True)]
+            release_versions = self.node.remoter.run_batch(
+                [f"rpm -q --queryformat '%{{VERSION}}' {pkg}" for pkg in pkgs], ignore_status=True)
         elif self.node.distro.is_ubuntu or self.node.distro.is_debian:
-            pkg = self.node.remoter.sudo(f"dpkg -S {executable}", ignore_status=True).stdout.split(':')[0].strip()
-            release_version = self.node.remoter.run(
-                f"dpkg-query --showformat='${{Version}}' --show {pkg}", ignore_status=True).stdout.strip()
+            pkgs = [result.stdout.split(':')[0].strip() for result in self.node.remoter.sudo_batch(
+                [f"dpkg -S {executable}" for executable in executables], ignore_status=True)]
+            release_versions = self.node.remoter.run_batch(
+                [f"dpkg-query --showformat='${{Version}}' --show {pkg}" for pkg in pkgs], ignore_status=True)
         else:
             raise RuntimeError("Distro is not supported")
 
-        return self._extract_version(release_version)
+        return {executable: self._extract_version(release_version.stdout.strip())
+                for executable, release_version in zip(executables, release_versions)}
 
-    def update_new_coredump_with_exec_information(self, core_info: CoreDumpInfo) -> None:
-        core = self._get_core_by_pid(core_info.pid)
-        core_info.update(executable=core.get('exe', 'N\A'),
-                         executable_version=self._get_executable_version(core.get('exe', 'N\A')))
+    def update_new_coredumps_with_exec_information(self, cores_info: List[CoreDumpInfo]) -> None:
+        if not cores_info:
+            return
+        cores = self._get_cores_by_pids([core_info.pid for core_info in cores_info])
+        executables = [core.get('exe', 'N\A') for core in cores]
+        versions = self._get_executables_versions(executables)
+        for core_info, executable in zip(cores_info, executables):
+            core_info.update(executable=executable, executable_version=versions[executable])
 
     @staticmethod
     def _extract_version(release_version: str) -> Optional[str]:
@@ -584,8 +589,10 @@ class CoredumpExportFileThread(CoredumpThreadBase):
 
     def get_list_of_cores(self) -> Optional[List[CoreDumpInfo]]:
         output = []
-        for directory in self.coredumps_directories:
-            for corefile in self.node.remoter.sudo(f'ls {directory}', verbose=False, ignore_status=True).stdout.split():
+        results = self.node.remoter.sudo_batch(
+            [f'ls {directory}' for directory in self.coredumps_directories], verbose=False, ignore_status=True)
+        for directory, result in zip(self.coredumps_directories, results):
+            for corefile in result.stdout.split():
                 self.log.debug(f'Found core file at {corefile}')
                 core_data = self._extract_core_info_from_file_name(os.path.basename(corefile))
                 output.append(
@@ -14,7 +14,6 @@
 import logging
 import re
 import os
-import time
 import contextlib
 from typing import Any
 from sdcm.loader import CqlStressCassandraStressExporter, CqlStressHDRExporter
@@ -25,35 +24,30 @@ from sdcm.sct_events.loaders import CQL_STRESS_CS_ERROR_EVENTS_PATTERNS, CqlStre
 from sdcm.stress_thread import CassandraStressThread
 from sdcm.utils.common import FileFollowerThread, SoftTimeoutContext
 from sdcm.utils.docker_remote import RemoteDocker
+from sdcm.utils.pattern_set import PatternSet
 from sdcm.utils.remote_logger import HDRHistogramFileLogger
 
 LOGGER = logging.getLogger(__name__)
 
+CQL_STRESS_CS_ERROR_EVENTS_PATTERN_SET = PatternSet(CQL_STRESS_CS_ERROR_EVENTS_PATTERNS)
+
 
 class CqlStressCassandraStressEventsPublisher(FileFollowerThread):
     def __init__(self, node: Any, log_filename: str, event_id: str = None):
         super().__init__()
 
         self.node = str(node)
-        self.log_filename = log_filename
+        self.log_filename = self.followed_filename = log_filename
         self.event_id = event_id
 
-    def run(self) -> None:
-        while not self.stopped():
-            if not os.path.isfile(self.log_filename):
-                time.sleep(0.5)
-                continue
-
-            for line_number, line in enumerate(self.follow_file(self.log_filename)):
-                if self.stopped():
-                    break
-
-                for pattern, event in CQL_STRESS_CS_ERROR_EVENTS_PATTERNS:
-                    if self.event_id:
-                        event.event_id = self.event_id
-
-                    if pattern.search(line):
-                        event.add_info(node=self.node, line=line, line_number=line_number).publish()
+    def process_line(self, line_number: int, line: str) -> int:
+        published = 0
+        for _, event in CQL_STRESS_CS_ERROR_EVENTS_PATTERN_SET.search_all(line):
+            if self.event_id:
+                event.event_id = self.event_id
+            event.add_info(node=self.node, line=line, line_number=line_number).publish()
+            published += 1
+        return published
 
 
 class CqlStressCassandraStressThread(CassandraStressThread):
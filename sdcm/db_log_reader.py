@@ -14,7 +14,6 @@
 
 import json
 import logging
-import os
 import re
 from functools import cached_property
 from multiprocessing import Process, Event, Queue
@@ -26,6 +25,8 @@ from sdcm.sct_events.base import LogEvent
 from sdcm.sct_events.database import get_pattern_to_event_to_func_mapping, BACKTRACE_RE
 from sdcm.sct_events.decorators import raise_event_on_failure
 from sdcm.utils.common import make_threads_be_daemonic_by_default
+from sdcm.utils.log_scanner import IncrementalLogScanner, LiteralsPrefilter
+from sdcm.utils.pattern_set import PatternSet
 
 LOGGER = logging.getLogger(__name__)
 
@@ -72,113 +73,100 @@ class DbLogReader(Process):
 
         self._terminate_event = Event()
         self._last_error: LogEvent | None = None
-        self._last_line_no = -1
-        self._last_log_position = 0
         self._remoter = remoter
-        self._skipped_end_line = 0
         self._build_id = None
         super().__init__(name=self.__class__.__name__, daemon=True)
 
     @cached_property
-    def _continuous_event_patterns(self):
-        return get_pattern_to_event_to_func_mapping(node=self._node_name)
+    def _continuous_event_patterns(self) -> PatternSet:
+        return PatternSet((item.pattern, item) for item in get_pattern_to_event_to_func_mapping(node=self._node_name))
+
+    @cached_property
+    def _system_event_pattern_set(self) -> PatternSet:
+        return PatternSet(self._system_event_patterns)
+
+    @cached_property
+    def _log_scanner(self) -> IncrementalLogScanner:
+        if self._log_lines:
+            # all lines are logged, so there is nothing to prefilter
+            prefilter = None
+        else:
+            prefilter = LiteralsPrefilter(self._continuous_event_patterns, self._system_event_pattern_set,
+                                          extra_literals=("build-id", "0x"))
+        return IncrementalLogScanner(path=self._system_log,
+                                     prefilter=prefilter,
+                                     max_line_size=LOG_LINE_MAX_PROCESSING_SIZE)
 
     def _read_and_publish_events(self) -> None:  # noqa: PLR0912
         """Search for all known patterns listed in `sdcm.sct_events.database.SYSTEM_ERROR_EVENTS'."""
 
         backtraces = []
-        index = 0
-
-        if not os.path.exists(self._system_log):
-            return
-
-        with open(self._system_log, encoding="utf-8") as db_file:
-            if self._last_log_position:
-                db_file.seek(self._last_log_position)
-            for index, line in enumerate(db_file, start=self._last_line_no + 1):
-                if len(line) > LOG_LINE_MAX_PROCESSING_SIZE:
-                    # trim to avoid filling the memory when lot of long line is writen
-                    line = line[:LOG_LINE_MAX_PROCESSING_SIZE]  # noqa: PLW2901
-
-                # Postpone processing line with no ending in case if half of line is written to the disc
-                if line[-1] == '\n' or self._skipped_end_line > 20:
-                    self._skipped_end_line = 0
-                else:
-                    self._skipped_end_line += 1
-                    continue
-                try:
-                    json_log = None
-                    if line[0] == '{':
-                        try:
-                            json_log = json.loads(line)
-                        except Exception:  # noqa: BLE001
-                            pass
-
-                    if self._log_lines:
-                        line = line.strip()  # noqa: PLW2901
-                        for pattern in self.EXCLUDE_FROM_LOGGING:
-                            if pattern in line:
-                                break
-                        else:
-                            LOGGER.debug(line)
-
-                    if json_log:
-                        continue
 
-                    if match := self.BUILD_ID_REGEX.search(line):
-                        self._build_id = match.groups()[0]
-                        LOGGER.debug("Found build-id: %s", self._build_id)
-
-                    one_line_backtrace = []
-                    if ("backtrace:" in line.lower() or "report: at" in line.lower()) and "0x" in line:
-                        # This part handles the backtrases are printed in one line.
-                        # Example:
-                        # [shard 2] seastar - Exceptional future ignored: exceptions::mutation_write_timeout_exception
-                        # (Operation timed out for system.paxos - received only 0 responses from 1 CL=ONE.),
-                        # backtrace:   0x3316f4d#012  0x2e2d177#012  0x189d397#012  0x2e76ea0#012  0x2e770af#012
-                        # 0x2eaf065#012  0x2ebd68c#012  0x2e48d5d#012  /opt/scylladb/libreloc/libpthread.so.0+0x94e1#012
-                        splitted_line = re.split("backtrace:|report: at", line, flags=re.IGNORECASE)
-                        for trace_line in splitted_line[1].split():
-                            if trace_line.startswith('0x') or 'scylladb/lib' in trace_line:
-                                one_line_backtrace.append(trace_line)
-
-                    elif (match := BACKTRACE_RE.search(line)) and backtraces:
-                        data = match.groupdict()
-                        if data['other_bt']:
-                            backtraces[-1]['backtrace'] += [data['other_bt'].strip()]
-                        if data['scylla_bt']:
-                            backtraces[-1]['backtrace'] += [data['scylla_bt'].strip()]
-
-                    # for each line, if it matches a continuous event pattern,
-                    # call the appropriate function with the class tied to that pattern
-                    for item in self._continuous_event_patterns:
-                        if event_match := item.pattern.search(line):
-                            item.period_func(match=event_match)
+        for index, line in self._log_scanner.scan():
+            try:
+                json_log = None
+                if line[0] == '{':
+                    try:
+                        json_log = json.loads(line)
+                    except Exception:  # noqa: BLE001
+                        pass
+
+                if self._log_lines:
+                    line = line.strip()  # noqa: PLW2901
+                    for pattern in self.EXCLUDE_FROM_LOGGING:
+                        if pattern in line:
                             break
+                    else:
+                        LOGGER.debug(line)
 
-                    skip_to_next_line = False
-                    # for each line use all regexes to match, and if found send an event
-                    for pattern, event in self._system_event_patterns:
-                        if pattern.search(line):
-                            if event.severity == Severity.SUPPRESS:
-                                skip_to_next_line = True
-                                break
-                            cloned_event = event.clone().add_info(node=self._node_name, line_number=index, line=line)
-                            backtraces.append(dict(event=cloned_event, backtrace=[]))
-                            break  # Stop iterating patterns to avoid creating two events for one line of the log
-
-                    if skip_to_next_line:
-                        continue
+                if json_log:
+                    continue
 
-                    if one_line_backtrace and backtraces:
-                        backtraces[-1]['backtrace'] = one_line_backtrace
-                except Exception:
-                    LOGGER.exception('Processing of %s line of %s failed, line content:\n%s',
-                                     index, self._system_log, line)
+                if "build-id" in line and (match := self.BUILD_ID_REGEX.search(line)):
+                    self._build_id = match.groups()[0]
+                    LOGGER.debug("Found build-id: %s", self._build_id)
+
+                one_line_backtrace = []
+                lowered_line = line.lower()
+                if ("backtrace:" in lowered_line or "report: at" in lowered_line) and "0x" in line:
+                    # This part handles the backtrases are printed in one line.
+                    # Example:
+                    # [shard 2] seastar - Exceptional future ignored: exceptions::mutation_write_timeout_exception
+                    # (Operation timed out for system.paxos - received only 0 responses from 1 CL=ONE.),
+                    # backtrace:   0x3316f4d#012  0x2e2d177#012  0x189d397#012  0x2e76ea0#012  0x2e770af#012
+                    # 0x2eaf065#012  0x2ebd68c#012  0x2e48d5d#012  /opt/scylladb/libreloc/libpthread.so.0+0x94e1#012
+                    splitted_line = re.split("backtrace:|report: at", line, flags=re.IGNORECASE)
+                    for trace_line in splitted_line[1].split():
+                        if trace_line.startswith('0x') or 'scylladb/lib' in trace_line:
+                            one_line_backtrace.append(trace_line)
+
+                elif backtraces and "0x" in lowered_line and (match := BACKTRACE_RE.search(line)):
+                    data = match.groupdict()
+                    if data['other_bt']:
+                        backtraces[-1]['backtrace'] += [data['other_bt'].strip()]
+                    if data['scylla_bt']:
+                        backtraces[-1]['backtrace'] += [data['scylla_bt'].strip()]
+
+                # for each line, if it matches a continuous event pattern,
+                # call the appropriate function with the class tied to that pattern
+                if found := self._continuous_event_patterns.search(line):
+                    event_match, item = found
+                    item.period_func(match=event_match)
+
+                # for each line find the first matching regex, and if found send an event.
+                # Only one event is created for one line of the log.
+                if found := self._system_event_pattern_set.search(line):
+                    _, event = found
+                    if event.severity == Severity.SUPPRESS:
+                        continue
+                    cloned_event = event.clone().add_info(node=self._node_name, line_number=index, line=line)
+                    backtraces.append(dict(event=cloned_event, backtrace=[]))
 
-            if index:
-                self._last_line_no = index
-                self._last_log_position = db_file.tell()
+                if one_line_backtrace and backtraces:
+                    backtraces[-1]['backtrace'] = one_line_backtrace
+            except Exception:
+                LOGGER.exception('Processing of %s line of %s failed, line content:\n%s',
+                                 index, self._system_log, line)
 
         traces_count = 0
         for backtrace in backtraces:
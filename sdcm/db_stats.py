@@ -18,11 +18,11 @@ import os
 import platform
 import logging
 import json
+import threading
 import urllib.parse
 
 from textwrap import dedent
-from math import sqrt
-from typing import Optional
+from typing import Hashable, Optional
 from functools import cached_property
 from collections import defaultdict
 
@@ -36,9 +36,19 @@ from sdcm.utils.git import get_git_commit_id
 from sdcm.utils.decorators import retrying
 from sdcm.sct_events.system import ElasticsearchEvent
 from sdcm.utils.ci_tools import get_job_name, get_job_url
+from sdcm.utils.parallel_executor import get_parallel_executor
+from sdcm.utils.metric_series import MetricSeries
 
 LOGGER = logging.getLogger(__name__)
 
+PROMETHEUS_CONNECTIONS_POOL_SIZE = 16  # per Prometheus server
+PROMETHEUS_CONFIG_CACHE_TTL = 600  # seconds
+
+_PROMETHEUS_LOCK = threading.Lock()
+_PROMETHEUS_SESSION: Optional[requests.Session] = None
+_PROMETHEUS_SESSION_PID: Optional[int] = None
+_PROMETHEUS_CONFIGS: dict[str, tuple[float, dict]] = {}  # base URL -> (fetch time, parsed config)
+
 FS_SIZE_METRIC = 'node_filesystem_size_bytes'
 FS_SIZE_METRIC_OLD = 'node_filesystem_size'
 AVAIL_SIZE_METRIC = 'node_filesystem_avail_bytes'
@@ -65,8 +75,7 @@ class CassandraStressCmdParseError(Exception):
 
 
 def stddev(lst):
-    mean = float(sum(lst)) / len(lst)
-    return sqrt(sum((x - mean)**2 for x in lst) / len(lst))
+    return MetricSeries(lst).pstdev()
 
 
 def get_stress_cmd_params(cmd):
@@ -199,13 +208,28 @@ def get_cdcreader_cmd_params(cmd):
     return get_raw_cmd_params(cmd)
 
 
+def get_prometheus_session() -> requests.Session:
+    """Return HTTP session shared by all Prometheus clients of the process, so connections are kept alive."""
+    global _PROMETHEUS_SESSION, _PROMETHEUS_SESSION_PID  # noqa: PLW0603
+    with _PROMETHEUS_LOCK:
+        if _PROMETHEUS_SESSION is None or _PROMETHEUS_SESSION_PID != os.getpid():  # sockets can't be shared with fork()
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=PROMETHEUS_CONNECTIONS_POOL_SIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _PROMETHEUS_SESSION, _PROMETHEUS_SESSION_PID = session, os.getpid()
+        return _PROMETHEUS_SESSION
+
+
 class PrometheusDBStats:
+    max_parallel_queries = 8
+
     def __init__(self, host, port=9090, protocol='http', alternator=None):
         self.host = host
         self.port = port
         self.protocol = protocol
-        self.range_query_url = "{}://{}:{}/api/v1/query_range?query=".format(
-            protocol, normalize_ipv6_url(host), port)
+        self.base_url = "{}://{}:{}".format(protocol, normalize_ipv6_url(host), port)
+        self.range_query_url = f"{self.base_url}/api/v1/query_range?query="
         self.config = self.get_configuration()
         self.alternator = alternator
 
@@ -218,10 +242,7 @@ class PrometheusDBStats:
         kwargs = {}
         if self.protocol == 'https':
             kwargs['verify'] = False
-        if post:
-            response = requests.post(url, **kwargs)
-        else:
-            response = requests.get(url, **kwargs)
+        response = get_prometheus_session().request("POST" if post else "GET", url, **kwargs)
         response.raise_for_status()
 
         result = json.loads(response.content)
@@ -233,14 +254,21 @@ class PrometheusDBStats:
         return None
 
     def get_configuration(self):
-        result = self.request(url="{}://{}:{}/api/v1/status/config".format(
-            self.protocol, normalize_ipv6_url(self.host), self.port))
+        """Return parsed config of the Prometheus server, it's cached for PROMETHEUS_CONFIG_CACHE_TTL seconds."""
+        with _PROMETHEUS_LOCK:
+            fetch_time, configs = _PROMETHEUS_CONFIGS.get(self.base_url, (None, None))
+        if fetch_time is not None and time.monotonic() - fetch_time < PROMETHEUS_CONFIG_CACHE_TTL:
+            return configs
+        fetch_time = time.monotonic()
+        result = self.request(url=f"{self.base_url}/api/v1/status/config")
         configs = yaml.safe_load(result["data"]["yaml"])
         LOGGER.debug("Parsed Prometheus configs: %s", configs)
         new_scrape_configs = {}
         for conf in configs["scrape_configs"]:
             new_scrape_configs[conf["job_name"]] = conf
         configs["scrape_configs"] = new_scrape_configs
+        with _PROMETHEUS_LOCK:
+            _PROMETHEUS_CONFIGS[self.base_url] = (fetch_time, configs)
         return configs
 
     def query(self, query, start, end, scrap_metrics_step=None):
@@ -254,11 +282,10 @@ class PrometheusDBStats:
                   values: [[linux_timestamp1, value1], [linux_timestamp2, value2]...[linux_timestampN, valueN]]
                  }
         """
-        url = "{}://{}:{}/api/v1/query_range?query=".format(self.protocol, normalize_ipv6_url(self.host), self.port)
         if not scrap_metrics_step:
             scrap_metrics_step = self.scylla_scrape_interval
         _query = "{url}{query}&start={start}&end={end}&step={scrap_metrics_step}".format(
-            url=url, query=query, start=start, end=end, scrap_metrics_step=scrap_metrics_step)
+            url=self.range_query_url, query=query, start=start, end=end, scrap_metrics_step=scrap_metrics_step)
         LOGGER.debug("Query to PrometheusDB: %s", _query)
         result = self.request(url=_query)
         if result:
@@ -267,6 +294,25 @@ class PrometheusDBStats:
             LOGGER.error("Prometheus query unsuccessful!")
             return []
 
+    def query_many(self, queries: dict[Hashable, str], start, end, scrap_metrics_step=None) -> dict[Hashable, list]:
+        """
+        Run range queries for the same time window concurrently.
+
+        :param queries: queries by arbitrary keys
+        :return: results of `query()' by the same keys
+        """
+        if not scrap_metrics_step:
+            scrap_metrics_step = self.scylla_scrape_interval
+        task_group = get_parallel_executor().task_group(max_workers=self.max_parallel_queries,
+                                                        name="PrometheusDBStats.query")
+        try:
+            futures = {key: task_group.submit(self.query, query=query, start=start, end=end,
+                                              scrap_metrics_step=scrap_metrics_step)
+                       for key, query in queries.items()}
+            return {key: future.result() for key, future in futures.items()}
+        finally:
+            task_group.cancel()
+
     @staticmethod
     def _check_start_end_time(start_time, end_time):
         if end_time - start_time < 120:
@@ -732,13 +778,13 @@ class TestStatsMixin(Stats):
                 self.log.error("Not enough data from Prometheus: %s" % ps_results)
                 return {}
             stat = {}
-            ops_per_sec = [float(val) for _, val in ps_results if val.lower() != "nan"]  # float("nan") is not a number
-            stat["max"] = max(ops_per_sec)
+            ops_per_sec = MetricSeries.from_prometheus_values(ps_results)
+            stat["max"] = ops_per_sec.max()
             # filter all values that are less than 1% of max
-            ops_filtered = [x for x in ops_per_sec if x >= stat["max"] * 0.01]
-            stat["min"] = min(ops_filtered)
-            stat["avg"] = float(sum(ops_filtered)) / len(ops_filtered)
-            stat["stdev"] = stddev(ops_filtered)
+            ops_filtered = ops_per_sec.at_least(stat["max"] * 0.01)
+            stat["min"] = ops_filtered.min()
+            stat["avg"] = ops_filtered.mean()
+            stat["stdev"] = ops_filtered.pstdev()
             self.log.debug("Stats: %s", stat)
             return stat
         except Exception as ex:  # noqa: BLE001
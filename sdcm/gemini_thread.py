@@ -24,6 +24,7 @@ from sdcm.sct_events import Severity
 from sdcm.utils.common import FileFollowerThread
 from sdcm.sct_events.loaders import GeminiStressEvent, GeminiStressLogEvent
 from sdcm.stress_thread import DockerBasedStressThread
+from sdcm.stress.summary_parsers import parse_gemini_summary
 from sdcm.utils.docker_remote import RemoteDocker
 from sdcm.reporting.tooling_reporter import GeminiVersionReporter
 
@@ -40,24 +41,17 @@ class NotGeminiErrorResult:
 class GeminiEventsPublisher(FileFollowerThread):
     def __init__(self, node, gemini_log_filename, verbose=False, event_id=None):
         super().__init__()
-        self.gemini_log_filename = gemini_log_filename
+        self.gemini_log_filename = self.followed_filename = gemini_log_filename
         self.node = str(node)
         self.verbose = verbose
         self.event_id = event_id
 
-    def run(self):
-        while not self.stopped():
-            if not os.path.isfile(self.gemini_log_filename):
-                time.sleep(0.5)
-                continue
-            for line_number, line in enumerate(self.follow_file(self.gemini_log_filename), start=1):
-                gemini_event = GeminiStressLogEvent.GeminiEvent(verbose=self.verbose)
-                gemini_event.add_info(node=self.node, line=line, line_number=line_number)
-                gemini_event.event_id = self.event_id
-                gemini_event.publish(warn_not_ready=False)
-
-                if self.stopped():
-                    break
+    def process_line(self, line_number, line):
+        gemini_event = GeminiStressLogEvent.GeminiEvent(verbose=self.verbose)
+        gemini_event.add_info(node=self.node, line=line, line_number=line_number + 1)
+        gemini_event.event_id = self.event_id
+        gemini_event.publish(warn_not_ready=False)
+        return 1
 
 
 class GeminiStressThread(DockerBasedStressThread):
@@ -264,22 +258,4 @@ class GeminiStressThread(DockerBasedStressThread):
 
     @staticmethod
     def _parse_gemini_summary(lines):
-        results = {}
-        enable_parse = False
-
-        for line in lines:
-            line.strip()
-            if "Results:" in line:
-                enable_parse = True
-                continue
-            if "run completed" in line:
-                enable_parse = False
-                continue
-            if not enable_parse:
-                continue
-
-            split_idx = line.index(":")
-            key = line[:split_idx].strip()
-            value = line[split_idx + 1:].split()[0]
-            results[key] = int(value)
-        return results
+        return parse_gemini_summary("\n".join(lines))
@@ -18,7 +18,7 @@ import time
 import logging
 from typing import NamedTuple
 
-from sdcm.prometheus import NemesisMetrics
+from sdcm.prometheus import NemesisMetrics, stress_metrics_aggregator
 from sdcm.utils.common import FileFollowerThread, convert_metric_to_ms
 from sdcm.utils.hdrhistogram import (
     make_hdrhistogram_summary_from_log_line,
@@ -63,6 +63,8 @@ class StressExporter(FileFollowerThread, metaclass=ABCMeta):
         self.cpu_idx = cpu_idx
         self.metrics_positions = self.metrics_position_in_log()
         self.keyspace = keyspace
+        self.metrics_aggregator = stress_metrics_aggregator()
+        self._published_labels = set()
         self.init()
 
     def init(self):
@@ -76,8 +78,17 @@ class StressExporter(FileFollowerThread, metaclass=ABCMeta):
     def create_metrix_gauge(self) -> str:
         ...
 
+    def metric_labels(self, name: str) -> tuple:
+        return tuple(map(str, (0, self.instance_name, self.loader_idx, self.cpu_idx, name, self.keyspace)))
+
+    def publish_metrics(self, values: dict[str, float]) -> None:
+        """Publish metrics of an interval (i.e., of a line of the log) to the stress metrics aggregator."""
+        metrics = [(self.metric_labels(name), value) for name, value in values.items()]
+        self._published_labels.update(labels for labels, _ in metrics)
+        self.metrics_aggregator.publish(self.stress_metric, metrics)
+
     def set_metric(self, name: str, value: float) -> None:
-        self.stress_metric.labels(0, self.instance_name, self.loader_idx, self.cpu_idx, name, self.keyspace).set(value)
+        self.publish_metrics({name: value})
 
     def clear_metrics(self) -> None:
         if self.stress_metric:
@@ -105,31 +116,40 @@ class StressExporter(FileFollowerThread, metaclass=ABCMeta):
 
         return value
 
-    def run(self):
-        while not self.stopped():
-            exists = os.path.isfile(self.stress_log_filename)
-            if not exists:
-                time.sleep(0.5)
-                continue
+    def process_metrics_line(self, line: str) -> None:
+        if self.skip_line(line=line):
+            return
 
-            for line in self.follow_file(self.stress_log_filename):
-                if self.stopped():
-                    break
+        cols = self.split_line(line=line)
+        values = {}
 
-                if self.skip_line(line=line):
-                    continue
+        for metric in self.METRIC_NAMES:
+            if metric_value := self.get_metric_value(columns=cols, metric_name=metric):
+                values[metric] = convert_metric_to_ms(str(metric_value))
 
-                cols = self.split_line(line=line)
+        if ops := self.get_metric_value(columns=cols, metric_name='ops'):
+            values['ops'] = float(ops)
 
-                for metric in self.METRIC_NAMES:
-                    if metric_value := self.get_metric_value(columns=cols, metric_name=metric):
-                        self.set_metric(metric, convert_metric_to_ms(str(metric_value)))
+        if errors := self.get_metric_value(columns=cols, metric_name='errors'):
+            values['errors'] = int(errors)
 
-                if ops := self.get_metric_value(columns=cols, metric_name='ops'):
-                    self.set_metric('ops', float(ops))
+        if values:
+            self.publish_metrics(values)
 
-                if errors := self.get_metric_value(columns=cols, metric_name='errors'):
-                    self.set_metric('errors', int(errors))
+    def run(self):
+        try:
+            while not self.stopped():
+                exists = os.path.isfile(self.stress_log_filename)
+                if not exists:
+                    time.sleep(0.5)
+                    continue
+
+                for line in self.follow_file(self.stress_log_filename):
+                    if self.stopped():
+                        break
+                    self.process_metrics_line(line)
+        finally:
+            self.metrics_aggregator.release(self.stress_metric, self._published_labels)
 
 
 class CassandraStressExporter(StressExporter):
@@ -283,9 +303,9 @@ class CassandraStressHDRExporter(StressExporter):
                 return False
         return True
 
-    def set_metric(self, name: str, value: float) -> None:
-        self.stress_metric.labels(self.current_line_hdr_tag, self.instance_name, self.loader_idx,
-                                  self.cpu_idx, name, self.keyspace).set(value)
+    def metric_labels(self, name: str) -> tuple:
+        return tuple(map(str, (self.current_line_hdr_tag, self.instance_name, self.loader_idx,
+                               self.cpu_idx, name, self.keyspace)))
 
     def split_line(self, line: str) -> list:
         summary_data = make_hdrhistogram_summary_from_log_line(
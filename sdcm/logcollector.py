@@ -22,6 +22,7 @@ import datetime
 import tempfile
 import traceback
 from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Optional, Tuple, List
 from pathlib import Path
 from functools import cached_property
@@ -62,9 +63,33 @@ from sdcm.utils.get_username import get_username
 from sdcm.utils.k8s import KubernetesOps
 from sdcm.utils.s3_remote_uploader import upload_remote_files_directly_to_s3
 from sdcm.utils.gce_utils import gce_public_addresses, gce_private_addresses
+from sdcm.utils.parallel_executor import get_parallel_executor
 
 LOGGER = logging.getLogger(__name__)
 
+# Compress a log stream on a node before it's sent over SSH, or send it as is if there is no zstd on the node.
+STREAM_COMPRESS_CMD = "if command -v zstd >/dev/null 2>&1; then zstd -q -c; else cat; fi"
+# Use all local cores to compress the final archives.
+LOCAL_COMPRESS_PROGRAM = "zstd -T0"
+
+
+@dataclass
+class NodeLogsStats:
+    size: int = 0  # bytes collected by this attempt
+    duration: float = 0
+    failed: int = 0
+
+
+def get_dir_size(path: str) -> int:
+    total_size = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            filepath = os.path.join(dirpath, filename)
+            # skip if it is symbolic link
+            if not os.path.islink(filepath):
+                total_size += os.path.getsize(filepath)
+    return total_size
+
 
 class CollectingNode:
     logdir = None
@@ -214,6 +239,15 @@ class CommandLog(BaseLogEntity):
     def collect(self, node, local_dst, remote_dst=None, local_search_path=None) -> Optional[str]:
         if not node or not node.remoter or remote_dst is None:
             return None
+        local_logfile = os.path.join(local_dst, self.name)
+        if os.path.exists(local_logfile):
+            LOGGER.debug("'%s' is already collected from host '%s'", self.name, node.name)
+            return local_logfile
+        if LogCollector.stream_log_remotely(node=node,
+                                            cmd=self.cmd,
+                                            local_path=local_logfile,
+                                            timeout=self.collect_timeout) is not None:
+            return local_logfile
         remote_logfile = LogCollector.collect_log_remotely(node=node,
                                                            cmd=self.cmd,
                                                            log_filename=os.path.join(remote_dst, self.name))
@@ -481,15 +515,17 @@ class GrafanaEntity(BaseMonitoringEntity):
     ]
 
     grafana_port = 3000
-    grafana_entity_url_tmpl = "http://{node_ip}:{grafana_port}/render{path}?from={st}&to=now&refresh=1d"
+    grafana_entity_url_tmpl = "http://{node_ip}:{grafana_port}/render{path}?from={st}&to={et}&refresh=1d"
     sct_base_path = get_sct_root_path()
 
     def __init__(self, *args, **kwargs):
         test_start_time = kwargs.pop("test_start_time", None)
+        test_end_time = kwargs.pop("test_end_time", None)
         if not test_start_time:
             # set test start time previous 6 hours
             test_start_time = time.time() - (6 * 3600)
         self.start_time = str(test_start_time).split('.', maxsplit=1)[0] + '000'
+        self.end_time = str(test_end_time).split('.', maxsplit=1)[0] + '000' if test_end_time else "now"
         self.grafana_dashboards = self.base_grafana_dashboards + kwargs.pop("extra_entities", [])
         super().__init__(*args, **kwargs)
 
@@ -535,7 +571,8 @@ class GrafanaScreenShot(GrafanaEntity):
                         node_ip=normalize_ipv6_url(node.grafana_address),
                         grafana_port=self.grafana_port,
                         path=dashboard_metadata["url"],
-                        st=self.start_time)
+                        st=self.start_time,
+                        et=self.end_time)
                     screenshot_path = os.path.join(local_dst,
                                                    "%s-%s-%s-%s.png" % (self.name,
                                                                         dashboard.name,
@@ -586,6 +623,7 @@ class LogCollector:
     log_entities = []
     node_remote_dir = '/tmp'
     collect_timeout = 300
+    max_streams_per_node = None  # default is `max_channels_per_host' of the node's remoter
 
     @property
     def current_run(self):
@@ -596,6 +634,7 @@ class LogCollector:
         self.nodes = nodes
         self.local_dir = self.create_local_storage_dir(storage_dir)
         self.params = params
+        self.nodes_stats: dict[str, NodeLogsStats] = {}
         for entity in self.log_entities:
             if self.params:
                 entity.set_params(self.params)
@@ -638,6 +677,37 @@ class LogCollector:
         result = node.remoter.run(f"test -f '{log_filename}'", ignore_status=True)
         return log_filename if result.ok else None
 
+    @staticmethod
+    def stream_log_remotely(node, cmd: str, local_path: str, timeout: float = 300) -> Optional[int]:
+        """Run `cmd' on the node and stream its output to `local_path' w/o storing it on the node.
+
+        The output is zstd-compressed on the node (if zstd is installed there) and decompressed locally.
+        Return the number of received bytes, or None if the remoter can't stream the output or streaming failed.
+        """
+        if not node.remoter:
+            return None
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        stream_path = f"{local_path}.zst.part"
+        try:
+            if not node.remoter.receive_command_output(cmd=f"{{ {cmd} ; }} 2>&1 | {STREAM_COMPRESS_CMD}",
+                                                       dst=stream_path,
+                                                       timeout=timeout):
+                return None
+            received = os.path.getsize(stream_path)
+            # `-f' makes zstd pass uncompressed output through as is.
+            LocalCmdRunner().run(f"zstd -q -d -c -f '{stream_path}' > '{local_path}.part'", verbose=False)
+            os.replace(f"{local_path}.part", local_path)
+            return received
+        except NotImplementedError:
+            return None
+        except Exception as details:  # noqa: BLE001
+            LOGGER.error("Unable to stream output of `%s' from host '%s': %s", cmd, node.name, details)
+            return None
+        finally:
+            for part_path in (stream_path, f"{local_path}.part"):
+                if os.path.exists(part_path):
+                    os.remove(part_path)
+
     @staticmethod
     def archive_log_remotely(node, log_filename: str, archive_name: Optional[str] = None) -> Optional[str]:
         if not node.remoter:
@@ -661,21 +731,44 @@ class LogCollector:
                                        timeout=timeout)
         return local_dir
 
+    def collect_logs_from_node(self, node, local_search_path: Optional[str] = None) -> NodeLogsStats:
+        """Collect log entities of the node, up to `max_streams_per_node' of them at once.
+
+        Entities which are already collected (e.g., by a previous attempt) are skipped.
+        """
+        LOGGER.info('Collecting logs on host: %s', node.name)
+        start_time = time.perf_counter()
+        remote_node_dir = self.create_remote_storage_dir(node)
+        local_node_dir = os.path.join(self.local_dir, node.name)
+        local_parent_dir = self.local_dir
+        size_before = get_dir_size(local_node_dir)
+        max_streams = self.max_streams_per_node or getattr(node.remoter, "max_channels_per_host", None)
+        task_group = get_parallel_executor().task_group(max_workers=max_streams,
+                                                        name=f"log_collector.{self.cluster_log_type}")
+        futures = {log_entity.name: task_group.submit(
+            log_entity.collect,
+            node=node,
+            local_dst=local_parent_dir if log_entity.collect_from_parent else local_node_dir,
+            remote_dst=remote_node_dir,
+            local_search_path=local_search_path) for log_entity in self.log_entities}
+        failed = 0
+        for name, future in futures.items():
+            try:
+                future.result()
+            except Exception as details:  # noqa: BLE001
+                failed += 1
+                LOGGER.error("Error occured during collecting of %s on host: %s\n%s", name, node.name, details)
+        stats = NodeLogsStats(size=get_dir_size(local_node_dir) - size_before,
+                              duration=time.perf_counter() - start_time,
+                              failed=failed)
+        self.nodes_stats[node.name] = stats
+        LOGGER.info("Collected %d bytes of logs on host %s in %.1fs (%d entities failed)",
+                    stats.size, node.name, stats.duration, stats.failed)
+        return stats
+
     def collect_logs(self, local_search_path: Optional[str] = None) -> list[str]:
         def collect_logs_per_node(node):
-            LOGGER.info('Collecting logs on host: %s', node.name)
-            remote_node_dir = self.create_remote_storage_dir(node)
-            local_node_dir = os.path.join(self.local_dir, node.name)
-            local_parent_dir = self.local_dir
-            for log_entity in self.log_entities:
-                try:
-                    log_entity.collect(node=node,
-                                       local_dst=local_parent_dir if log_entity.collect_from_parent else local_node_dir,
-                                       remote_dst=remote_node_dir,
-                                       local_search_path=local_search_path)
-                except Exception as details:  # noqa: BLE001
-                    LOGGER.error("Error occured during collecting of %s on host: %s\n%s",
-                                 log_entity.name, node.name, details)
+            self.collect_logs_from_node(node, local_search_path=local_search_path)
 
         LOGGER.debug("Nodes list %s", [node.name for node in self.nodes])
 
@@ -727,7 +820,8 @@ class LogCollector:
         archive_dir, log_filename = os.path.split(src_path)
 
         LocalCmdRunner().run(
-            cmd=f"tar --zstd --warning=no-file-changed -cf '{archive_name}' -C '{archive_dir}' --transform 's/{log_filename}/{src_name}/' '{log_filename}'")
+            cmd=f"tar --use-compress-program='{LOCAL_COMPRESS_PROGRAM}' --warning=no-file-changed "
+                f"-cf '{archive_name}' -C '{archive_dir}' --transform 's/{log_filename}/{src_name}/' '{log_filename}'")
 
         return archive_name
 
@@ -1049,14 +1143,7 @@ class BaseSCTLogCollector(LogCollector):
         return self.create_archive_and_upload()
 
     def get_files_size(self) -> int:
-        total_size = 0
-        for dirpath, _, filenames in os.walk(self.local_dir):
-            for filename in filenames:
-                filepath = os.path.join(dirpath, filename)
-                # skip if it is symbolic link
-                if not os.path.islink(filepath):
-                    total_size += os.path.getsize(filepath)
-        return total_size
+        return get_dir_size(self.local_dir)
 
     @property
     def is_collect_to_a_single_archive(self) -> bool:
@@ -18,53 +18,57 @@ import time
 import uuid
 from typing import Any
 
-from sdcm.prometheus import nemesis_metrics_obj
+from sdcm.prometheus import nemesis_metrics_obj, stress_metrics_aggregator
 from sdcm.sct_events.loaders import NdBenchStressEvent, NDBENCH_ERROR_EVENTS_PATTERNS
 from sdcm.utils.common import FileFollowerThread
+from sdcm.utils.pattern_set import PatternSet
 from sdcm.utils.docker_remote import RemoteDocker
 from sdcm.stress_thread import DockerBasedStressThread
 from sdcm.stress.base import format_stress_cmd_error
 
 LOGGER = logging.getLogger(__name__)
 
+NDBENCH_ERROR_EVENTS_PATTERN_SET = PatternSet(NDBENCH_ERROR_EVENTS_PATTERNS)
+
 
 class NdBenchStressEventsPublisher(FileFollowerThread):
     def __init__(self, node: Any, ndbench_log_filename: str, event_id: str = None):
         super().__init__()
 
         self.node = str(node)
-        self.ndbench_log_filename = ndbench_log_filename
+        self.ndbench_log_filename = self.followed_filename = ndbench_log_filename
         self.event_id = event_id
 
-    def run(self) -> None:
-        while not self.stopped():
-            if not os.path.isfile(self.ndbench_log_filename):
-                time.sleep(0.5)
-                continue
-
-            for line_number, line in enumerate(self.follow_file(self.ndbench_log_filename)):
-                if self.stopped():
-                    break
-
-                for pattern, event in NDBENCH_ERROR_EVENTS_PATTERNS:
-                    if self.event_id:
-                        # Connect the event to the stress load
-                        event.event_id = self.event_id
-
-                    if pattern.search(line):
-                        event.add_info(node=self.node, line=line, line_number=line_number).publish()
-                        break  # Stop iterating patterns to avoid creating two events for one line of the log
+    def process_line(self, line_number: int, line: str) -> int:
+        # Only the first matched pattern is used to avoid creating two events for one line of the log.
+        if not (found := NDBENCH_ERROR_EVENTS_PATTERN_SET.search(line)):
+            return 0
+        _, event = found
+        if self.event_id:
+            # Connect the event to the stress load
+            event.event_id = self.event_id
+        event.add_info(node=self.node, line=line, line_number=line_number).publish()
+        return 1
 
 
 class NdBenchStatsPublisher(FileFollowerThread):
     METRICS = {}
     collectible_ops = ['read', 'write']
 
+    # INFO RPSCount:78 - Read avg: 0.314ms, Read RPS: 7246, Write avg: 0.39ms, Write RPS: 1802, total RPS: 9048, Success Ratio: 100%
+    STAT_REGEX = re.compile(
+        r'Read avg: (?P<read_lat_avg>.*?)ms.*?'
+        r'Read RPS: (?P<read_ops>.*?),.*?'
+        r'Write avg: (?P<write_lat_avg>.*?)ms.*?'
+        r'Write RPS: (?P<write_ops>.*?),', re.IGNORECASE)
+
     def __init__(self, loader_node, loader_idx, ndbench_log_filename):
         super().__init__()
         self.loader_node = loader_node
         self.loader_idx = loader_idx
         self.ndbench_log_filename = ndbench_log_filename
+        self.metrics_aggregator = stress_metrics_aggregator()
+        self._published_labels = {}
 
         for operation in self.collectible_ops:
             gauge_name = self.gauge_name(operation)
@@ -78,36 +82,41 @@ class NdBenchStatsPublisher(FileFollowerThread):
     def gauge_name(operation):
         return 'sct_ndbench_%s_gauge' % operation.replace('-', '_')
 
-    def set_metric(self, operation, name, value):
+    def publish_metrics(self, operation, values):
         metric = self.METRICS[self.gauge_name(operation)]
-        metric.labels(self.loader_node.ip_address, self.loader_idx, name).set(value)
+        metrics = [((self.loader_node.ip_address, str(self.loader_idx), name), value) for name, value in values.items()]
+        self._published_labels.setdefault(operation, set()).update(labels for labels, _ in metrics)
+        self.metrics_aggregator.publish(metric, metrics)
+
+    def set_metric(self, operation, name, value):
+        self.publish_metrics(operation, {name: value})
 
     def run(self):
-        # INFO RPSCount:78 - Read avg: 0.314ms, Read RPS: 7246, Write avg: 0.39ms, Write RPS: 1802, total RPS: 9048, Success Ratio: 100%
-        stat_regex = re.compile(
-            r'Read avg: (?P<read_lat_avg>.*?)ms.*?'
-            r'Read RPS: (?P<read_ops>.*?),.*?'
-            r'Write avg: (?P<write_lat_avg>.*?)ms.*?'
-            r'Write RPS: (?P<write_ops>.*?),', re.IGNORECASE)
-
-        while not self.stopped():
-            exists = os.path.isfile(self.ndbench_log_filename)
-            if not exists:
-                time.sleep(0.5)
-                continue
-
-            for _, line in enumerate(self.follow_file(self.ndbench_log_filename)):
-                if self.stopped():
-                    break
-                try:
-                    match = stat_regex.search(line)
-                    if match:
-                        for key, value in match.groupdict().items():
-                            operation, name = key.split('_', 1)
-                            self.set_metric(operation, name, float(value))
-
-                except Exception as exc:  # noqa: BLE001
-                    LOGGER.warning("Failed to send metric. Failed with exception {exc}".format(exc=exc))
+        try:
+            while not self.stopped():
+                exists = os.path.isfile(self.ndbench_log_filename)
+                if not exists:
+                    time.sleep(0.5)
+                    continue
+
+                for _, line in enumerate(self.follow_file(self.ndbench_log_filename)):
+                    if self.stopped():
+                        break
+                    try:
+                        match = self.STAT_REGEX.search(line)
+                        if match:
+                            values = {}
+                            for key, value in match.groupdict().items():
+                                operation, name = key.split('_', 1)
+                                values.setdefault(operation, {})[name] = float(value)
+                            for operation, operation_values in values.items():
+                                self.publish_metrics(operation, operation_values)
+
+                    except Exception as exc:  # noqa: BLE001
+                        LOGGER.warning("Failed to send metric. Failed with exception {exc}".format(exc=exc))
+        finally:
+            for operation, labels in self._published_labels.items():
+                self.metrics_aggregator.release(self.METRICS[self.gauge_name(operation)], labels)
 
 
 class NdBenchStressThread(DockerBasedStressThread):
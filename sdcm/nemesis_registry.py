@@ -1,14 +1,14 @@
 import ast
 import inspect
 import re
+import threading
 from functools import lru_cache
 from typing import List, TypeVar, Callable, Dict, Tuple
 
-from sdcm.utils.ast_utils import BooleanEvaluator
-
 DISRUPT_PATTERN = re.compile(r"self\.(?P<method_name>disrupt_[0-9A-Za-z_]+?)\(.*\)", flags=re.MULTILINE)
 SourceType = TypeVar("SourceType")
 DisruptMethod = Callable[[], None]
+SelectorPredicate = Callable[[int, Callable[[str], int]], bool]
 
 
 @lru_cache
@@ -19,6 +19,87 @@ def get_disrupt_method_from_class(nemesis_cls):
         return method_name.group("method_name")
 
 
+@lru_cache
+def get_class_properties(nemesis_cls) -> Dict[str, bool]:
+    """Returns non-callable attributes defined in the class itself, these are the nemesis flags"""
+    properties = {}
+    for attribute in nemesis_cls.__dict__.keys():
+        if attribute[:2] != "__" and attribute not in ("additional_params", "additional_configs"):
+            value = getattr(nemesis_cls, attribute)
+            if not callable(value):
+                properties[attribute] = value
+    return properties
+
+
+class NemesisFlagsIndex:
+    """
+    Process wide index of nemesis flags.
+
+    Every name which a selector can match for a class (a truthy attribute defined in the class itself, the class name
+    and the name of its disrupt method) gets a bit, and every class is represented by a bitset of its names.
+    Bitsets are built once per class, so selectors are evaluated without building any evaluation context.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bits: Dict[str, int] = {}
+        self._masks: Dict[type, int] = {}
+
+    def bit(self, name: str) -> int:
+        """Returns bit of the name, or 0 if there is no class which has it"""
+        return self._bits.get(name, 0)
+
+    def mask(self, nemesis_cls) -> int:
+        if (mask := self._masks.get(nemesis_cls)) is not None:
+            return mask
+        names = [attribute for attribute, value in nemesis_cls.__dict__.items() if value]
+        names.append(nemesis_cls.__name__)
+        if method_name := get_disrupt_method_from_class(nemesis_cls):
+            names.append(method_name)
+        with self._lock:
+            mask = 0
+            for name in names:
+                mask |= self._bits.setdefault(name, 1 << len(self._bits))
+            self._masks[nemesis_cls] = mask
+        return mask
+
+
+NEMESIS_FLAGS_INDEX = NemesisFlagsIndex()
+
+
+def _compile_node(node: ast.AST) -> SelectorPredicate:
+    """Same semantics as `sdcm.utils.ast_utils.BooleanEvaluator', but names are checked against a bitset"""
+    match node:
+        case ast.Expression():
+            return _compile_node(node.body)
+        case ast.BoolOp(op=ast.And()):
+            operands = [_compile_node(value) for value in node.values]
+            return lambda mask, bit: all(operand(mask, bit) for operand in operands)
+        case ast.BoolOp(op=ast.Or()):
+            operands = [_compile_node(value) for value in node.values]
+            return lambda mask, bit: any(operand(mask, bit) for operand in operands)
+        case ast.UnaryOp(op=ast.Not()):
+            operand = _compile_node(node.operand)
+            return lambda mask, bit: not operand(mask, bit)
+        case ast.BoolOp() | ast.UnaryOp():
+            raise NotImplementedError(node.op.__doc__ + " Operator")
+        case ast.Name():
+            name = node.id
+            return lambda mask, bit: bool(mask & bit(name))
+        case ast.Constant():
+            if not isinstance(node.value, bool):
+                raise ValueError("non-boolean value")
+            value = node.value
+            return lambda mask, bit: value
+    raise RuntimeError("non-boolean expression")
+
+
+@lru_cache
+def compile_selector(logical_phrase: str) -> SelectorPredicate:
+    """Compiles a logical phrase (e.g. "not disruptive") into a predicate of a class bitset"""
+    return _compile_node(ast.parse(logical_phrase, mode="eval"))
+
+
 class NemesisRegistry:
     """
     Class, that serves as a Nemesis discovery mechanism.
@@ -38,25 +119,11 @@ class NemesisRegistry:
             if any value in the filter does not match what nemeses have,
             nemeses will be filtered out.
         """
-        nemesis_subclasses = []
-
-        evaluator = BooleanEvaluator()
-        if logical_phrase:
-            expression_ast = ast.parse(logical_phrase, mode="eval")
-
-        for nemesis in list_of_nemesis:
-            if nemesis in self.excluded_list:
-                continue
-            evaluator.context = dict(**nemesis.__dict__, **{nemesis.__name__: True})
-            if logical_phrase and "disrupt_" in logical_phrase and (method_name := get_disrupt_method_from_class(nemesis)):
-                # if the `logical_phrase` has a method name of any disrupt method
-                # we look it up for the specific class and add it to the context
-                # so we can match on those as well
-                # example: 'disrupt_create_index or disrupt_drop_index'
-                evaluator.context[method_name] = True
-            if not logical_phrase or evaluator.visit(expression_ast):
-                nemesis_subclasses.append(nemesis)
-        return nemesis_subclasses
+        if not logical_phrase:
+            return [nemesis for nemesis in list_of_nemesis if nemesis not in self.excluded_list]
+        predicate = compile_selector(logical_phrase)
+        return [nemesis for nemesis in list_of_nemesis
+                if nemesis not in self.excluded_list and predicate(NEMESIS_FLAGS_INDEX.mask(nemesis), NEMESIS_FLAGS_INDEX.bit)]
 
     def get_disrupt_methods(self, logical_phrase: str | None = None) -> List[DisruptMethod]:
         """Return all disrupt methods that satisfy logical phrase"""
@@ -76,27 +143,16 @@ class NemesisRegistry:
 
     def extract_methods(self, subclasses_list: List[SourceType]) -> List[DisruptMethod]:
         """Transform list of classes into a list of disrupt method to run"""
-        disrupt_methods = []
-        for subclass in subclasses_list:
-            if method_name_str := get_disrupt_method_from_class(subclass):
-                disrupt_methods.append(method_name_str)
-        disrupt_methods_objects_list = [func for name, func in inspect.getmembers(
-            self.base_class) if name in disrupt_methods and callable(func)]
-        return disrupt_methods_objects_list
+        disrupt_methods = {get_disrupt_method_from_class(subclass) for subclass in subclasses_list} - {None}
+        # sorted by name, as `inspect.getmembers' would return them
+        return [func for name in sorted(disrupt_methods) if callable(func := getattr(self.base_class, name, None))]
 
     def gather_properties(self) -> Tuple[Dict[SourceType, Dict[str, bool]], Dict[str, Dict[str, bool]]]:
         """Return all properties for all known subclasses and their respective disrupt methods"""
         class_properties = {}
         method_properties = {}
         for subclass in self.get_subclasses():
-            properties_list = {}
-            for attribute in subclass.__dict__.keys():
-                if attribute[:2] != "__" and attribute not in ("additional_params", "additional_configs"):
-                    value = getattr(subclass, attribute)
-                    if not callable(value):
-                        properties_list[attribute] = value
-
             if method_name_str := get_disrupt_method_from_class(subclass):
-                class_properties[subclass.__name__] = properties_list
-                method_properties[method_name_str] = properties_list
+                class_properties[subclass.__name__] = dict(get_class_properties(subclass))
+                method_properties[method_name_str] = dict(get_class_properties(subclass))
         return class_properties, method_properties
@@ -13,7 +13,6 @@
 
 import os
 import logging
-import time
 import uuid
 import threading
 
@@ -21,29 +20,25 @@ from sdcm.cluster import BaseNode
 from sdcm.stress.base import DockerBasedStressThread
 from sdcm.sct_events.loaders import NoSQLBenchStressEvent, NOSQLBENCH_EVENT_PATTERNS
 from sdcm.utils.common import FileFollowerThread
+from sdcm.utils.pattern_set import PatternSet
 
 LOGGER = logging.getLogger(__name__)
 
+NOSQLBENCH_EVENT_PATTERN_SET = PatternSet(NOSQLBENCH_EVENT_PATTERNS)
+
 
 class NoSQLBenchEventsPublisher(FileFollowerThread):
     def __init__(self, node: BaseNode, log_filename: str):
         super().__init__()
-        self.nb_log_filename = log_filename
+        self.nb_log_filename = self.followed_filename = log_filename
         self.node = node
 
-    def run(self) -> None:
-        while not self.stopped():
-            if not os.path.isfile(self.nb_log_filename):
-                time.sleep(0.5)
-                continue
-
-            for line_number, line in enumerate(self.follow_file(self.nb_log_filename)):
-                if self.stopped():
-                    break
-
-                for pattern, event in NOSQLBENCH_EVENT_PATTERNS:
-                    if pattern.search(line):
-                        event.clone().add_info(node=self.node, line=line, line_number=line_number).publish()
+    def process_line(self, line_number: int, line: str) -> int:
+        published = 0
+        for _, event in NOSQLBENCH_EVENT_PATTERN_SET.search_all(line):
+            event.clone().add_info(node=self.node, line=line, line_number=line_number).publish()
+            published += 1
+        return published
 
 
 class NoSQLBenchStressThread(DockerBasedStressThread):
@@ -11,11 +11,13 @@
 #
 # Copyright (c) 2020 ScyllaDB
 
+import os
 import time
 import logging
 import datetime
 import threading
-from typing import Optional
+from collections import deque
+from typing import Iterable, Optional
 from http.server import HTTPServer
 from socketserver import ThreadingMixIn
 
@@ -124,6 +126,116 @@ class NemesisMetrics:
             LOGGER.exception('Cannot stop metrics event: %s', ex)
 
 
+class StressMetricsAggregator:
+    """
+    Expose per-interval records of stress tools as Prometheus gauges.
+
+    Followers of stress tools logs publish a record per parsed output line into a ring buffer, which is cheap, and
+    a single thread sets the gauges once per `interval' seconds from the latest value of every series.  A record
+    is a gauge and a list of (label values, value) pairs.  A follower releases its series when it stops, so
+    series of finished stress commands are removed from the gauges (the last values are exposed till the next
+    flush), and the number of series is capped.
+    """
+
+    buffer_size = 100_000  # records
+    interval = 1  # seconds
+    max_series = 10_000
+
+    def __init__(self):
+        self._records = deque(maxlen=self.buffer_size)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._children = {}  # (gauge, label values) -> gauge child
+        self._released = set()  # series to remove on the next flush, their last values are exposed till then
+        self._thread = None
+        self.dropped_records = 0
+        self.dropped_updates = 0
+
+    @property
+    def series_count(self) -> int:
+        return len(self._children)
+
+    def publish(self, gauge, values: Iterable[tuple[tuple, float]]) -> None:
+        if gauge is None:  # failed to create the gauge
+            return
+        self._append((gauge, True, list(values)))
+
+    def release(self, gauge, labels: Iterable[tuple]) -> None:
+        """Remove the series from the gauge after the values published before are flushed."""
+        if gauge is None:
+            return
+        self._append((gauge, False, list(labels)))
+
+    def _append(self, record) -> None:
+        if len(self._records) == self._records.maxlen:
+            self.dropped_records += 1
+        self._records.append(record)
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name=self.__class__.__name__, daemon=True)
+                    self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.flush()
+            except Exception:  # noqa: BLE001
+                LOGGER.exception("Failed to flush stress metrics")
+
+    def flush(self) -> None:
+        """Set the gauges to the latest published values and remove released series."""
+        with self._flush_lock:
+            latest = {}
+            removed, self._released = self._released, set()
+            while True:
+                try:
+                    gauge, is_publish, items = self._records.popleft()
+                except IndexError:
+                    break
+                if is_publish:
+                    for labels, value in items:
+                        latest[key := (gauge, labels)] = value
+                        removed.discard(key)  # e.g., the next stress command with the same labels
+                        self._released.discard(key)
+                    continue
+                for labels in items:
+                    if (key := (gauge, labels)) in latest:
+                        self._released.add(key)  # don't lose the last values published before the release
+                    else:
+                        removed.add(key)
+            for key in removed:
+                if self._children.pop(key, None) is not None:
+                    gauge, labels = key
+                    gauge.remove(*labels)
+            for key, value in latest.items():
+                if (child := self._children.get(key)) is None:
+                    if len(self._children) >= self.max_series:
+                        if not self.dropped_updates:
+                            LOGGER.warning("Too many stress metrics series (%s), new series are dropped",
+                                           self.max_series)
+                        self.dropped_updates += 1
+                        continue
+                    gauge, labels = key
+                    child = self._children[key] = gauge.labels(*labels)
+                child.set(value)
+
+
+_STRESS_METRICS_AGGREGATOR_LOCK = threading.Lock()
+_STRESS_METRICS_AGGREGATOR: Optional[StressMetricsAggregator] = None
+_STRESS_METRICS_AGGREGATOR_PID: Optional[int] = None
+
+
+def stress_metrics_aggregator() -> StressMetricsAggregator:
+    global _STRESS_METRICS_AGGREGATOR, _STRESS_METRICS_AGGREGATOR_PID  # noqa: PLW0603
+    with _STRESS_METRICS_AGGREGATOR_LOCK:
+        if _STRESS_METRICS_AGGREGATOR is None or _STRESS_METRICS_AGGREGATOR_PID != os.getpid():
+            # threads don't survive fork()
+            _STRESS_METRICS_AGGREGATOR, _STRESS_METRICS_AGGREGATOR_PID = StressMetricsAggregator(), os.getpid()
+        return _STRESS_METRICS_AGGREGATOR
+
+
 class PrometheusAlertManagerListener(threading.Thread):
 
     def __init__(self, ip, port=9093, interval=10, stop_flag: threading.Event = None):
@@ -13,6 +13,7 @@
 
 from typing import Optional, List, Callable
 from abc import abstractmethod, ABCMeta
+from concurrent.futures import wait
 import shlex
 import logging
 import re
@@ -24,6 +25,8 @@ from invoke.watchers import StreamWatcher, Responder
 from invoke.runners import Result
 from fabric import Connection
 
+from sdcm.utils.parallel_executor import get_parallel_executor
+
 
 class OutputCheckError(Exception):
     """
@@ -49,6 +52,7 @@ class RetryableNetworkException(Exception):
 
 class CommandRunner(metaclass=ABCMeta):
     _connection = None
+    max_channels_per_host: int = 4  # max number of commands run by `run_batch()' at once
 
     def __init__(self, hostname: str, user: str = 'root', password: str = None):
         self.hostname = hostname
@@ -103,6 +107,28 @@ class CommandRunner(metaclass=ABCMeta):
             ) -> Result:
         pass
 
+    def run_batch(self,
+                  cmds: List[str],
+                  timeout: Optional[float] = None,
+                  ignore_status: bool = False,
+                  verbose: bool = True,
+                  retry: int = 1,
+                  max_channels: Optional[int] = None) -> List[Result]:
+        """
+        Run independent commands in parallel (up to `max_channels' at once) and return their results in the same order.
+
+        If a command fails and `ignore_status' is False, the exception is raised after all commands are done.
+        """
+        task_group = get_parallel_executor().task_group(max_workers=max_channels or self.max_channels_per_host,
+                                                        name=f"{type(self).__name__}.run_batch")
+        futures = [task_group.submit(self._run_batch_command, cmd=cmd, timeout=timeout,
+                                     ignore_status=ignore_status, verbose=verbose, retry=retry) for cmd in cmds]
+        wait(futures)
+        return [future.result() for future in futures]
+
+    def _run_batch_command(self, cmd: str, **kwargs) -> Result:
+        return self.run(cmd, **kwargs)
+
     def sudo(self,
              cmd: str,
              timeout: Optional[float] = None,
@@ -113,12 +139,7 @@ class CommandRunner(metaclass=ABCMeta):
              retry: int = 1,
              watchers: Optional[List[StreamWatcher]] = None,
              user: Optional[str] = 'root') -> Result:
-        if user != self.user:
-            if user == 'root':
-                cmd = f"sudo {cmd}"
-            else:
-                cmd = f"sudo -u {user} {cmd}"
-        return self.run(cmd=cmd,
+        return self.run(cmd=self._sudo_cmd(cmd, user=user),
                         timeout=timeout,
                         ignore_status=ignore_status,
                         verbose=verbose,
@@ -127,6 +148,37 @@ class CommandRunner(metaclass=ABCMeta):
                         retry=retry,
                         watchers=watchers)
 
+    def sudo_batch(self,
+                   cmds: List[str],
+                   timeout: Optional[float] = None,
+                   ignore_status: bool = False,
+                   verbose: bool = True,
+                   retry: int = 1,
+                   max_channels: Optional[int] = None,
+                   user: Optional[str] = 'root') -> List[Result]:
+        return self.run_batch(cmds=[self._sudo_cmd(cmd, user=user) for cmd in cmds],
+                              timeout=timeout,
+                              ignore_status=ignore_status,
+                              verbose=verbose,
+                              retry=retry,
+                              max_channels=max_channels)
+
+    def receive_command_output(self, cmd: str, dst: str, timeout: Optional[float] = 300) -> bool:
+        """
+        Run a command and write its stdout to the local file `dst'.
+
+        Unlike `run()', the output is neither decoded nor kept in memory, so it can be a large binary stream
+        (e.g., compressed logs.)  Runners which can't stream the output raise NotImplementedError.
+        """
+        raise NotImplementedError()
+
+    def _sudo_cmd(self, cmd: str, user: Optional[str] = 'root') -> str:
+        if user != self.user:
+            if user == 'root':
+                return f"sudo {cmd}"
+            return f"sudo -u {user} {cmd}"
+        return cmd
+
     @abstractmethod
     def _create_connection(self):
         pass
@@ -218,6 +218,10 @@ class KubernetesCmdRunner(RemoteCmdRunnerBase):
                                 container=self.container, timeout=timeout)
         return True
 
+    def receive_command_output(self, cmd, dst, timeout=300):
+        # NOTE: pods have no SSH access, and output of the websocket runs is decoded, use `receive_files()' instead.
+        raise NotImplementedError()
+
     @retrying(n=3, sleep_time=5, allowed_exceptions=(RetryableNetworkException, ))
     def send_files(self, src, dst, delete_dst=False, preserve_symlinks=False, verbose=False):
         with KEY_BASED_LOCKS.get_lock(f"k8s--{self.kluster.name}--{self.namespace}--{self.pod_name}"):
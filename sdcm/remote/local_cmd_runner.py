@@ -16,6 +16,7 @@ import os
 import time
 import getpass
 import socket
+from shlex import quote
 from fabric import Connection
 from invoke.exceptions import UnexpectedExit, Failure
 from invoke.runners import Result
@@ -96,6 +97,9 @@ class LocalCmdRunner(CommandRunner):
             return True
         return self.run(f'cp {src} {dst}', timeout=timeout).ok
 
+    def receive_command_output(self, cmd: str, dst: str, timeout: Optional[float] = 300) -> bool:
+        return self.run(f"( {cmd} ) > {quote(dst)}", timeout=timeout, ignore_status=True, verbose=False).ok
+
     @retrying(n=3, sleep_time=5, allowed_exceptions=(RetryableNetworkException,))
     def send_files(
             self, src: str, dst: str, delete_dst: bool = False, preserve_symlinks: bool = False, verbose: bool = False,
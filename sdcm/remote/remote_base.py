@@ -12,7 +12,7 @@
 # Copyright (c) 2020 ScyllaDB
 
 from abc import abstractmethod
-from typing import Type, Tuple, List, Optional
+from typing import Any, Callable, Type, Tuple, List, Optional
 from shlex import quote
 import glob
 import os
@@ -26,10 +26,58 @@ from invoke.runners import Result
 
 from sdcm.utils.decorators import retrying
 
-from .base import RetryableNetworkException, CommandRunner
+from .base import RetryableNetworkException, SSHConnectTimeoutError, CommandRunner
 from .local_cmd_runner import LocalCmdRunner
 
 
+class ConnectionPool:
+    """
+    Authenticated connections to a host, each of them is used for one command at a time.
+
+    Connections are reused, so only the first commands pay for the connection setup and authentication.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.created = 0
+        self._semaphore = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self._idle = []
+
+    def get(self, create_connection: Callable[[], Any]) -> Any:
+        self._semaphore.acquire()
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+            self.created += 1
+        try:
+            return create_connection()
+        except Exception:
+            self._semaphore.release()
+            raise
+
+    def put(self, connection: Any, broken: bool = False) -> None:
+        if broken:
+            self._close(connection)
+        else:
+            with self._lock:
+                self._idle.append(connection)
+        self._semaphore.release()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            self._close(connection)
+
+    @staticmethod
+    def _close(connection: Any) -> None:
+        try:
+            connection.close()
+        except Exception:  # noqa: BLE001
+            pass
+
+
 class RemoteCmdRunnerBase(CommandRunner):
     port: int = 22
     connect_timeout: int = 60
@@ -49,6 +97,9 @@ class RemoteCmdRunnerBase(CommandRunner):
     exception_failure: Type[Exception] = None
     exception_retryable: Tuple[Type[Exception]] = None
     connection_thread_map = threading.local()
+    pooled_connection_map = threading.local()  # connections taken from the pool by `run_batch()'
+    _connection_pools: dict[tuple, ConnectionPool] = {}  # shared by all remoters of a host
+    _connection_pools_lock = threading.Lock()
     default_run_retry = 3
 
     def __init__(self, hostname: str, user: str = 'root',  # noqa: PLR0913
@@ -89,6 +140,8 @@ class RemoteCmdRunnerBase(CommandRunner):
         Map connection to current thread.
         If there is no such thread, create it.
         """
+        if (connection := getattr(self.pooled_connection_map, str(id(self)), None)) is not None:
+            return connection
         connection = getattr(self.connection_thread_map, str(id(self)), None)
         if connection is None:
             connection = self._create_connection()
@@ -96,6 +149,24 @@ class RemoteCmdRunnerBase(CommandRunner):
             self._bind_generation_to_connection(connection)
         return connection
 
+    @property
+    def _connection_pool_key(self) -> tuple:
+        return (type(self), os.getpid(), self.hostname, self.port, self.user,
+                self.proxy_host, self.proxy_port, self.proxy_user)
+
+    @property
+    def connection_pool(self) -> ConnectionPool:
+        """Pool of connections to the host, shared by all remoters of the same type, host and user."""
+        with self._connection_pools_lock:
+            if (pool := self._connection_pools.get(key := self._connection_pool_key)) is None:
+                pool = self._connection_pools[key] = ConnectionPool(max_size=self.max_channels_per_host)
+            return pool
+
+    def _create_pooled_connection(self):
+        connection = self._create_connection()
+        self._bind_generation_to_connection(connection)
+        return connection
+
     @classmethod
     def get_retryable_exceptions(cls) -> Tuple[Type[Exception]]:
         return cls.exception_retryable
@@ -134,6 +205,10 @@ class RemoteCmdRunnerBase(CommandRunner):
     def set_default_remoter_class(remoter_class: Type['RemoteCmdRunnerBase']):
         RemoteCmdRunnerBase.default_remoter_class = remoter_class
 
+    @staticmethod
+    def set_max_channels_per_host(max_channels: int):
+        RemoteCmdRunnerBase.max_channels_per_host = max_channels
+
     @abstractmethod
     def _create_connection(self):
         pass
@@ -146,6 +221,9 @@ class RemoteCmdRunnerBase(CommandRunner):
 
     def stop(self):
         self._close_connection()
+        # idle connections only, connections in use by other remoters of the host are put back to the pool
+        if (pool := self._connection_pools.get(self._connection_pool_key)) is not None:
+            pool.close()
 
     def _close_connection(self):
         if self.connection:
@@ -372,6 +450,26 @@ class RemoteCmdRunnerBase(CommandRunner):
                     files_sent = False
         return files_sent
 
+    def receive_command_output(self, cmd: str, dst: str, timeout: Optional[float] = 300) -> bool:
+        """
+        Run a command on the remote host and write its stdout to the local file `dst'.
+
+        The output goes over a separate SSH session (the same way as `receive_files()' uses rsync/scp) directly
+        to the file, so it's neither decoded nor kept in memory and nothing is stored on the remote host.
+        """
+        proxy_cmd = ''
+        if self.proxy_host:
+            proxy_cmd = self._make_proxy_cmd()
+        ssh_cmd = self._make_ssh_command(
+            user=self.user, port=self.port, hosts_file=self.known_hosts_file, key_file=self.key_file,
+            opts="-T", extra_ssh_options=self.extra_ssh_options, proxy_cmd=proxy_cmd)
+        result = LocalCmdRunner().run(f"{ssh_cmd} {quote(self.hostname)} {quote(cmd)} > {quote(dst)}",
+                                      timeout=timeout, ignore_status=True, verbose=False)
+        if not result.ok:
+            self.log.warning("<%s>: Unable to receive output of `%s' to %s: %s",
+                             self.hostname, cmd, dst, result.stderr.strip())
+        return result.ok
+
     def use_rsync(self) -> bool:
         if self._use_rsync is not None:
             return self._use_rsync
@@ -592,6 +690,20 @@ class RemoteCmdRunnerBase(CommandRunner):
             self._print_command_results(exc.result, verbose, ignore_status)
         return True
 
+    def _run_batch_command(self, cmd: str, **kwargs) -> Result:
+        """Run the command using a connection from the pool instead of the connection of the current thread."""
+        connection = self.connection_pool.get(self._create_pooled_connection)
+        setattr(self.pooled_connection_map, str(id(self)), connection)
+        broken = False
+        try:
+            return self.run(cmd, **kwargs)
+        except (RetryableNetworkException, SSHConnectTimeoutError) + tuple(self.exception_retryable or ()):
+            broken = True
+            raise
+        finally:
+            delattr(self.pooled_connection_map, str(id(self)))
+            self.connection_pool.put(connection, broken=broken)
+
     def _get_retry_params(self, retry: int = 1) -> dict:
         if retry == 0:
             # Won't retry on any case
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 import datetime
+import hashlib
 import logging
 import random
-import tempfile
 import threading
 import time
 import traceback
 from pathlib import Path
 from abc import abstractmethod
+from collections import deque
+from itertools import zip_longest
 from string import Template
 from typing import Optional, Type, NamedTuple, TYPE_CHECKING
 from contextlib import contextmanager
@@ -19,7 +21,6 @@ from cassandra.cluster import ResponseFuture, ResultSet
 from cassandra.query import SimpleStatement
 from cassandra.policies import ExponentialBackoffRetryPolicy
 
-from sdcm.remote import LocalCmdRunner
 from sdcm.sct_events import Severity
 from sdcm.sct_events.database import FullScanEvent, FullPartitionScanReversedOrderEvent, FullPartitionScanEvent, \
     FullScanAggregateEvent
@@ -35,7 +36,7 @@ if TYPE_CHECKING:
 
 ERROR_SUBSTRINGS = ("timed out", "unpack requires", "timeout", 'host has been marked down or removed')
 BYPASS_CACHE_VALUES = [" BYPASS CACHE", ""]
-LOCAL_CMD_RUNNER = LocalCmdRunner()
+ROW_DIGEST_SIZE = 16
 
 
 class FullScanCommand(NamedTuple):
@@ -48,6 +49,14 @@ class FullScanAggregateCommands(NamedTuple):
     AGG_COUNT_ALL = FullScanCommand("AGG_COUNT_ALL", Template("SELECT count(*) FROM $ks_cf$bypass_cache$timeout"))
 
 
+class RowDigest(NamedTuple):
+    key: str
+    digest: bytes
+
+    def __str__(self):
+        return f"{self.key} {self.digest.hex()}"
+
+
 class FullscanException(Exception):
     """ Exception during running a fullscan"""
 
@@ -244,10 +253,10 @@ class FullPartitionScanOperation(FullscanOperationBase):
                                                'no_filter': {'count': 0, 'total_scan_duration': 0}}
         self.ck_filter = ''
         self.limit = ''
-        self.reversed_query_output = tempfile.NamedTemporaryFile(mode='w+', delete=False,
-                                                                 encoding='utf-8')
-        self.normal_query_output = tempfile.NamedTemporaryFile(mode='w+', delete=False,
-                                                               encoding='utf-8')
+        # Digests of rows are compared in memory, in case of a limit only the last `limit' rows of the normal query
+        # are kept, since only they are expected in the output of the reversed query
+        self.reversed_query_digests: list[RowDigest] = []
+        self.normal_query_digests: deque[RowDigest] = deque()
 
     def get_table_clustering_order(self) -> str:
         node = self._get_random_node()
@@ -365,58 +374,43 @@ class FullPartitionScanOperation(FullscanOperationBase):
         session.default_consistency_level = ConsistencyLevel.ONE
         return session.execute_async(cmd)
 
-    def reset_output_files(self):
-        self.normal_query_output.close()
-        self.reversed_query_output.close()
-        self.reversed_query_output = tempfile.NamedTemporaryFile(mode='w+', delete=False,
-                                                                 encoding='utf-8')
-        self.normal_query_output = tempfile.NamedTemporaryFile(mode='w+', delete=False,
-                                                               encoding='utf-8')
-
-    def _compare_output_files(self) -> bool:
-        self.normal_query_output.flush()
-        self.reversed_query_output.flush()
-        result = False
-
-        with tempfile.NamedTemporaryFile(mode='w+', delete=True, encoding='utf-8') as reorder_normal_query_output:
-            cmd = f'tac {self.normal_query_output.name}'
-
-            if self.limit:
-                cmd += f' | head -n {self.limit}'
-
-            cmd += f' > {reorder_normal_query_output.name}'
-            LOCAL_CMD_RUNNER.run(cmd=cmd, ignore_status=True)
-            reorder_normal_query_output.flush()
-            LOCAL_CMD_RUNNER.run(cmd=f'cp {reorder_normal_query_output.name} {self.normal_query_output.name}',
-                                 ignore_status=True)
-            self.normal_query_output.flush()
-            file_names = f' {self.normal_query_output.name} {self.reversed_query_output.name}'
-            diff_cmd = f"diff -y --suppress-common-lines {file_names}"
-            self.log.debug("Comparing scan queries output files by: %s", diff_cmd)
+    def reset_digests(self):
+        self.reversed_query_digests = []
+        self.normal_query_digests = deque(maxlen=self.limit or None)
+
+    def _write_digests_diff(self, normal_digests: list[RowDigest], log_file: Path) -> int:
+        """Write mismatched rows in a `diff -y --suppress-common-lines' like format and return their number."""
+        mismatches = 0
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        with log_file.open("w", encoding="utf-8") as diff_file:
+            for normal, reversed_ in zip_longest(normal_digests, self.reversed_query_digests):
+                if normal == reversed_:
+                    continue
+                mismatches += 1
+                if reversed_ is None:
+                    diff_file.write(f"{normal!s:<60} <\n")
+                elif normal is None:
+                    diff_file.write(f"{'':<60} > {reversed_}\n")
+                else:
+                    diff_file.write(f"{normal!s:<60} | {reversed_}\n")
+        return mismatches
+
+    def _compare_digests(self) -> bool:
+        normal_digests = list(reversed(self.normal_query_digests))
+        try:
+            if normal_digests == self.reversed_query_digests:
+                self.log.debug("Compared output of normal and reversed queries is identical! (%s rows)",
+                               len(normal_digests))
+                return True
             log_file = Path(TestConfig().logdir()) / 'fullscans' / \
                 f'partition_range_scan_diff_{datetime.datetime.now(tz=utc).strftime("%Y_%m_%d-%I_%M_%S")}.log'
-            log_file.parent.mkdir(parents=True, exist_ok=True)
-            result = LOCAL_CMD_RUNNER.run(cmd=diff_cmd, ignore_status=True, verbose=False, log_file=str(log_file))
-
-        if not result.stderr:
-            if not result.stdout:
-                self.log.debug("Compared output of normal and reversed queries is identical!")
-                result = True
-            else:
-                self.log.warning("Normal and reversed queries output differs: output results in %s", log_file)
-                ls_cmd = f"ls -alh {file_names}"
-                head_cmd = f"head {file_names}"
-                for cmd in [ls_cmd, head_cmd]:
-                    result = LOCAL_CMD_RUNNER.run(cmd=cmd, ignore_status=True)
-                    if result.stdout:
-                        stdout = result.stdout.strip()
-                        self.log.debug("%s command output is: \n%s", cmd, stdout)
-        else:
-            self.log.warning("Comparison of output of normal and reversed queries failed with stderr:\n%s",
-                             result.stderr)
-
-        self.reset_output_files()
-        return result
+            mismatches = self._write_digests_diff(normal_digests=normal_digests, log_file=log_file)
+            self.log.warning("Normal and reversed queries output differs in %s rows (normal: %s rows, reversed: %s "
+                             "rows): output results in %s", mismatches, len(normal_digests),
+                             len(self.reversed_query_digests), log_file)
+            return False
+        finally:
+            self.reset_digests()
 
     def run_scan_operation(self, cmd: str = None):
         self.table_clustering_order = self.get_table_clustering_order()
@@ -426,6 +420,7 @@ class FullPartitionScanOperation(FullscanOperationBase):
             return
 
         normal_query, reversed_query = queries
+        self.reset_digests()
 
         full_partition_op_stat = OneOperationStat(
             op_type=self.__class__.__name__,
@@ -444,7 +439,7 @@ class FullPartitionScanOperation(FullscanOperationBase):
             self.log.debug('Executing the normal query: %s', normal_query)
             self.scan_event = FullPartitionScanEvent
             regular_op_stat = self.run_scan_event(cmd=normal_query, scan_event=self.scan_event)
-            comparison_result = self._compare_output_files()
+            comparison_result = self._compare_digests()
             full_partition_op_stat.nemesis_at_end = self.db_node.running_nemesis
             full_partition_op_stat.exceptions.append(regular_op_stat.exceptions)
             full_partition_op_stat.exceptions.append(reversed_op_stat.exceptions)
@@ -544,25 +539,24 @@ class PagedResultHandler:
             callback=self.handle_page,
             errback=self.handle_error)
 
-    def _row_to_string(self, row, include_data_column: bool = False) -> str:
-        row_string = str(getattr(row, self.scan_operation.fullscan_params.pk_name))
-        row_string += str(getattr(row, self.scan_operation.fullscan_params.ck_name))
+    def _row_digest(self, row, include_data_column: bool = False) -> RowDigest:
+        params = self.scan_operation.fullscan_params
+        key = f"{getattr(row, params.pk_name)} {getattr(row, params.ck_name)}"
+        digest = hashlib.blake2b(key.encode(), digest_size=ROW_DIGEST_SIZE)
         if include_data_column:
-            row_string += str(getattr(row, self.scan_operation.fullscan_params.data_column_name))
-        return f'{row_string}\n'
+            digest.update(str(getattr(row, params.data_column_name)).encode())
+        return RowDigest(key=key, digest=digest.digest())
 
     def handle_page(self, rows):
         include_data_column = self.scan_operation.fullscan_params.include_data_column
         if self.scan_operation.scan_event == FullPartitionScanEvent:
-            for row in rows:
-                self.scan_operation.normal_query_output.write(
-                    self._row_to_string(row=row, include_data_column=include_data_column))
+            self.scan_operation.normal_query_digests.extend(
+                self._row_digest(row=row, include_data_column=include_data_column) for row in rows)
         elif self.scan_operation.scan_event == FullPartitionScanReversedOrderEvent:
             self.scan_operation.fullscan_stats.number_of_rows_read += len(rows)
             if self.scan_operation.fullscan_params.validate_data:
-                for row in rows:
-                    self.scan_operation.reversed_query_output.write(
-                        self._row_to_string(row=row, include_data_column=include_data_column))
+                self.scan_operation.reversed_query_digests.extend(
+                    self._row_digest(row=row, include_data_column=include_data_column) for row in rows)
 
         if self.future.has_more_pages and self.current_read_pages <= self.max_read_pages:
             self.log.debug('Will fetch the next page: %s', self.current_read_pages)
@@ -564,6 +564,8 @@ class SCTConfiguration(dict):
              help="""Turn on sct profiling"""),
         dict(name="ssh_transport", env="SSH_TRANSPORT", type=str,
              help="""Set type of ssh library to use. Could be 'fabric' (default) or 'libssh2'"""),
+        dict(name="ssh_max_channels_per_host", env="SCT_SSH_MAX_CHANNELS_PER_HOST", type=int,
+             help="""Max number of SSH connections to a host used at once to run a batch of commands"""),
 
         # Scylla command line arguments options
         dict(name="experimental_features", env="SCT_EXPERIMENTAL_FEATURES", type=list,
@@ -1169,6 +1171,8 @@ class SCTConfiguration(dict):
                        for partitions to be validated by reads and not to be deleted during test. Example: 0-250.
                    5. max_partitions_in_test_table - Relevant for scylla-bench. Max partition keys (partition-count)
                        in the scylla_bench.test table.
+                   6. max_concurrent_queries - max number of partitions counted at once by the validate_partitions check.
+                       Default: 100.
                   """),
 
         dict(name="stress_read_cmd", env="SCT_STRESS_READ_CMD",
@@ -1656,6 +1660,14 @@ class SCTConfiguration(dict):
         dict(name="enable_argus", env="SCT_ENABLE_ARGUS", type=boolean,
              help="Control reporting to argus"),
 
+        dict(name="events_device_batched", env="SCT_EVENTS_DEVICE_BATCHED", type=boolean,
+             help="Publish SCT events in batches without waiting for delivery of every event. "
+                  "Useful for tests which generate storms of events"),
+
+        dict(name="parallel_tasks_max_concurrency", env="SCT_PARALLEL_TASKS_MAX_CONCURRENCY", type=int,
+             help="Max number of top-level tasks run in parallel (e.g., by ParallelObject) at once in the SCT "
+                  "process. Tasks started by other tasks are not limited by it. 0 means no limit"),
+
         dict(name="cs_populating_distribution", env="SCT_CS_POPULATING_DISTRIBUTION", type=str,
              help="""set c-s parameter '-pop' with gauss/uniform distribution for
              performance gradual throughtput grow tests"""),
@@ -16,8 +16,10 @@ import queue
 import ctypes
 import pickle
 import logging
+import contextlib
+import collections
 import multiprocessing
-from typing import Optional, Generator, Any, Tuple, Callable, cast, Dict
+from typing import Optional, Generator, Any, Tuple, Callable, cast, Dict, List, Deque
 from pathlib import Path
 from functools import cached_property, partial
 from uuid import UUID
@@ -36,6 +38,10 @@ PUB_QUEUE_WAIT_TIMEOUT: float = 1  # seconds
 PUB_QUEUE_EVENTS_RATE: float = 0  # seconds
 PUBLISH_EVENT_TIMEOUT: float = 5  # seconds
 FILTERS_GC_PERIOD: float = 60  # Cleanup old filters once in a while
+PUB_BATCH_SIZE: int = 500  # events
+MAX_BATCHES_IN_FLIGHT: int = 64
+RAW_EVENTS_FLUSH_PERIOD: float = 1  # seconds
+RAW_EVENTS_BUFFER_SIZE: int = 1024 * 1024  # bytes
 
 EVENTS_LOG_DIR: str = "events_log"
 RAW_EVENTS_LOG: str = "raw_events.log"
@@ -187,8 +193,119 @@ class EventsDevice(multiprocessing.Process):
         return self._running.is_set()
 
 
+class BatchedEventsDevice(EventsDevice):
+    """
+    EventsDevice which sends events in batches and doesn't wait for delivery of a batch before sending next one.
+
+    Events are drained from the queue in groups of up to `pub_batch_size' and every group is sent as one
+    multipart message prefixed with a sequence number.  Delivery is verified by the sequence numbers received
+    by the verification subscriber, while up to `max_batches_in_flight' batches are not confirmed yet.
+
+    Raw events are written by the device process itself using one buffered writer which is flushed
+    once in `raw_events_flush_period' seconds and when there are no more events in the queue.
+    """
+
+    pub_batch_size = PUB_BATCH_SIZE
+    max_batches_in_flight = MAX_BATCHES_IN_FLIGHT
+    raw_events_flush_period = RAW_EVENTS_FLUSH_PERIOD
+
+    def run(self):
+        with suppress_interrupt(), verbose_suppress("BatchedEventsDevice failed"):
+            with zmq.Context() as ctx, ctx.socket(zmq.PUB) as pub, ctx.socket(zmq.SUB) as sub, \
+                    open(self.raw_events_log, "ab", buffering=RAW_EVENTS_BUFFER_SIZE) as raw_events_log:
+                self._sub_port.value = pub.bind_to_random_port("tcp://*")
+                self._running.set()
+
+                LOGGER.debug("BatchedEventsDevice listen on %s", self.subscribe_address)
+
+                # Delivery verification subscriber.
+                sub.connect(self.subscribe_address)
+                sub.subscribe(b"")
+
+                time.sleep(self.start_delay)
+
+                sequence = 0
+                in_flight: Deque[Tuple[int, List[bytes]]] = collections.deque()
+                flush_time = time.perf_counter() + self.raw_events_flush_period
+                while self._running.is_set() or not self._queue.empty():
+                    if batch := self._get_batch(timeout=0 if in_flight else self.pub_queue_wait_timeout):
+                        sequence += 1
+                        raw_events = [raw_event for raw_event, _ in batch]
+                        events = [event for _, event in batch]
+                        with verbose_suppress("%s: failed to write raw events to %s", self, self.raw_events_log):
+                            raw_events_log.write(b"".join(raw_events))
+                        try:
+                            pub.send_multipart([sequence.to_bytes(8, "big"), *events])
+                        except zmq.ZMQError:
+                            LOGGER.exception("BatchedEventsDevice failed to send %s events", len(events))
+                        else:
+                            in_flight.append((sequence, events))
+                    if not batch or len(in_flight) >= self.max_batches_in_flight:
+                        self._verify_delivery(sub=sub, in_flight=in_flight, timeout=self.sub_polling_timeout)
+                    else:
+                        self._verify_delivery(sub=sub, in_flight=in_flight, timeout=0)
+                    if not batch or flush_time < time.perf_counter():
+                        with verbose_suppress("%s: failed to flush %s", self, self.raw_events_log):
+                            raw_events_log.flush()
+                        flush_time = time.perf_counter() + self.raw_events_flush_period
+                    time.sleep(self.pub_queue_events_rate)
+
+                while in_flight:
+                    self._verify_delivery(sub=sub, in_flight=in_flight, timeout=self.sub_polling_timeout)
+
+    def _get_batch(self, timeout: float) -> List[Tuple[bytes, bytes]]:
+        try:
+            batch = [self._queue.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+        with contextlib.suppress(queue.Empty):
+            while len(batch) < self.pub_batch_size:
+                batch.append(self._queue.get_nowait())
+        return batch
+
+    @staticmethod
+    def _verify_delivery(sub: zmq.Socket, in_flight: Deque[Tuple[int, List[bytes]]], timeout: int) -> None:
+        """Confirm the batches in flight by sequence numbers received by the verification subscriber.
+
+        A batch which is older than a received one is not going to be delivered anymore.  If nothing was
+        received in `timeout' milliseconds, the oldest batch in flight is considered as lost.
+        """
+        received = False
+        while in_flight:
+            try:
+                if not sub.poll(timeout=0 if received else timeout):
+                    break
+                sequence = int.from_bytes(sub.recv_multipart(flags=zmq.NOBLOCK, copy=False)[0].bytes, "big")
+            except zmq.ZMQError:
+                break
+            received = True
+            while in_flight and in_flight[0][0] <= sequence:
+                batch_sequence, events = in_flight.popleft()
+                if batch_sequence != sequence:
+                    for event in events:
+                        LOGGER.error("BatchedEventsDevice failed to verify delivery of %s", pickle.loads(event))
+        if not received and timeout and in_flight:
+            for event in in_flight.popleft()[1]:
+                LOGGER.error("BatchedEventsDevice failed to verify delivery of %s", pickle.loads(event))
+
+    def publish_event(self, event, timeout=PUBLISH_EVENT_TIMEOUT) -> None:
+        with verbose_suppress("%s: failed to publish %s", self, event):
+            self._queue.put((event.to_json().encode("utf-8") + b"\n", pickle.dumps(event)), timeout=timeout)
+            self._events_counter.value += 1
+
+    def inbound_events(self, stop_event: StopEvent) -> Generator[Any, None, None]:
+        with zmq.Context() as ctx, self._sub_socket(ctx) as sub:
+            while not stop_event.is_set():
+                if sub.poll(timeout=self.sub_polling_timeout):
+                    _, *events = sub.recv_multipart(flags=zmq.NOBLOCK)
+                    for event in events:
+                        yield pickle.loads(event)
+
+
 start_events_main_device = partial(start_events_process, EVENTS_MAIN_DEVICE_ID, EventsDevice)
+start_batched_events_main_device = partial(start_events_process, EVENTS_MAIN_DEVICE_ID, BatchedEventsDevice)
 get_events_main_device = cast(Callable[..., EventsDevice], partial(get_events_process, EVENTS_MAIN_DEVICE_ID))
 
 
-__all__ = ("EventsDevice", "start_events_main_device", "get_events_main_device", )
+__all__ = ("EventsDevice", "BatchedEventsDevice", "start_events_main_device", "start_batched_events_main_device",
+           "get_events_main_device", )
@@ -13,10 +13,12 @@
 
 import re
 import json
+import time
 import logging
+import threading
 import collections
 import multiprocessing
-from typing import Tuple, Optional, Callable, Any, Dict, List, cast
+from typing import Tuple, Optional, Callable, Any, Dict, List, BinaryIO, cast
 from pathlib import Path
 from functools import partial
 from itertools import chain
@@ -39,6 +41,11 @@ WARNING_LOG: str = "warning.log"
 NORMAL_LOG: str = "normal.log"
 DEBUG_LOG: str = "debug.log"
 
+EVENTS_LOG_BUFFER_SIZE: int = 64 * 1024  # bytes
+EVENTS_LOG_FLUSH_PERIOD: float = 0.5  # seconds, max delay of writes during events storms
+EVENTS_LOG_IDLE_FLUSH_DELAY: float = 0.05  # seconds, flush if no new events received during this time
+EVENTS_LOG_FLUSH_SEVERITIES = (Severity.ERROR, Severity.CRITICAL, )  # flush immediately, readers are in other processes
+
 LINE_START_RE = re.compile(r"^\d{4}-\d{2}-\d{2} ")  # date in YYYY-MM-DD format
 
 LOGGER = logging.getLogger(__name__)
@@ -56,7 +63,37 @@ class head(list):
             super().append(item)
 
 
+class EventsLogWriter:
+    """Append to log files using long-lived file objects.
+
+    Data is written to the disk when a file buffer is full, on `flush()' and on `close()' calls.
+    """
+
+    def __init__(self, buffer_size: int = EVENTS_LOG_BUFFER_SIZE):
+        self.buffer_size = buffer_size
+        self._files: Dict[Path, BinaryIO] = {}
+
+    def write(self, path: Path, data: bytes) -> None:
+        if (fobj := self._files.get(path)) is None:
+            fobj = self._files[path] = path.open("ab", buffering=self.buffer_size)
+        fobj.write(data)
+
+    def flush(self) -> None:
+        for path, fobj in self._files.items():
+            with verbose_suppress("%s: failed to flush %s", self, path):
+                fobj.flush()
+
+    def close(self) -> None:
+        for path, fobj in self._files.items():
+            with verbose_suppress("%s: failed to close %s", self, path):
+                fobj.close()
+        self._files.clear()
+
+
 class EventsFileLogger(BaseEventsProcess[Tuple[str, Any], None], multiprocessing.Process):
+    flush_period = EVENTS_LOG_FLUSH_PERIOD
+    idle_flush_delay = EVENTS_LOG_IDLE_FLUSH_DELAY
+
     def __init__(self, _registry: EventsProcessesRegistry):
         base_dir: Path = get_events_main_device(_registry=_registry).events_log_base_dir
 
@@ -71,6 +108,13 @@ class EventsFileLogger(BaseEventsProcess[Tuple[str, Any], None], multiprocessing
 
         self.events_summary = collections.defaultdict(int)
         self.events_summary_log = base_dir / SUMMARY_LOG
+        self._events_summary_changed = False
+        self._last_write_time = self._last_flush_time = 0.0
+
+        # Buffered writer is used in the logger process only, `write_event()' called from other processes
+        # writes unbuffered.
+        self._log_writer: Optional[EventsLogWriter] = None
+        self._log_writer_lock = threading.RLock()
 
         super().__init__(_registry=_registry)
 
@@ -80,10 +124,49 @@ class EventsFileLogger(BaseEventsProcess[Tuple[str, Any], None], multiprocessing
         for log_file in chain((self.events_log, self.events_summary_log, ), self.events_logs_by_severity.values(), ):
             log_file.touch()
 
-        for event_tuple in self.inbound_events():
-            with verbose_suppress("EventsFileLogger failed to process %s", event_tuple):
-                _, event = event_tuple  # try to unpack event from EventsDevice
-                self.write_event(event=event)
+        self._log_writer = EventsLogWriter()
+        flusher_stop_event = threading.Event()
+        flusher = threading.Thread(target=self._flush_periodically, args=(flusher_stop_event, ), daemon=True)
+        flusher.start()
+        try:
+            for event_tuple in self.inbound_events():
+                with verbose_suppress("EventsFileLogger failed to process %s", event_tuple):
+                    _, event = event_tuple  # try to unpack event from EventsDevice
+                    self.write_event(event=event)
+        finally:
+            flusher_stop_event.set()
+            flusher.join()
+            with self._log_writer_lock:
+                self.flush()
+                self._log_writer.close()
+                self._log_writer = None
+
+    def _flush_periodically(self, stop_event: threading.Event) -> None:
+        while not stop_event.wait(timeout=min(self.idle_flush_delay, self.flush_period)):
+            now = time.perf_counter()
+            if self._last_write_time > self._last_flush_time and (
+                    now - self._last_write_time >= self.idle_flush_delay or
+                    now - self._last_flush_time >= self.flush_period):
+                self.flush()
+
+    def flush(self) -> None:
+        """Write buffered events to the log files and update summary.log file if needed."""
+        with self._log_writer_lock:
+            self._last_flush_time = time.perf_counter()
+            if self._log_writer:
+                self._log_writer.flush()
+            if self._events_summary_changed:
+                self._events_summary_changed = False
+                with verbose_suppress("%s: failed to update %s", self, self.events_summary_log):
+                    with self.events_summary_log.open("wb", buffering=0) as fobj:
+                        fobj.write(json.dumps(dict(self.events_summary), indent=4).encode("utf-8"))
+
+    def _write(self, log_file: Path, data: bytes) -> None:
+        if self._log_writer:
+            self._log_writer.write(log_file, data)
+        else:
+            with log_file.open("ab+", buffering=0) as fobj:
+                fobj.write(data)
 
     def write_event(self, event: SctEvent) -> None:
         if event.source_timestamp:
@@ -100,22 +183,22 @@ class EventsFileLogger(BaseEventsProcess[Tuple[str, Any], None], multiprocessing
                 with verbose_suppress("%s: failed to tee %s to %s", self, event, tee):
                     tee(message)
 
-        # Write event to events.log file
-        if getattr(event, 'save_to_files', False):
-            with verbose_suppress("%s: failed to write %s to %s", self, event, self.events_log):
-                with self.events_log.open("ab+", buffering=0) as fobj:
-                    fobj.write(message_bin)
+        with self._log_writer_lock:
+            # Write event to events.log file
+            if getattr(event, 'save_to_files', False):
+                with verbose_suppress("%s: failed to write %s to %s", self, event, self.events_log):
+                    self._write(self.events_log, message_bin)
 
-            if log_file := self.events_logs_by_severity.get(event.severity):
-                with verbose_suppress("%s: failed to write %s to %s", self, event, log_file):
-                    with log_file.open("ab+", buffering=0) as fobj:
-                        fobj.write(message_bin)
+                if log_file := self.events_logs_by_severity.get(event.severity):
+                    with verbose_suppress("%s: failed to write %s to %s", self, event, log_file):
+                        self._write(log_file, message_bin)
 
-        # Update summary.log file (statistics.)
-        self.events_summary[Severity(event.severity).name] += 1
-        with verbose_suppress("%s: failed to update %s", self, self.events_summary_log):
-            with self.events_summary_log.open("wb", buffering=0) as fobj:
-                fobj.write(json.dumps(dict(self.events_summary), indent=4).encode("utf-8"))
+            # Update summary.log file (statistics) periodically, but don't delay ERROR and CRITICAL events.
+            self.events_summary[Severity(event.severity).name] += 1
+            self._events_summary_changed = True
+            self._last_write_time = time.perf_counter()
+            if self._log_writer is None or event.severity in EVENTS_LOG_FLUSH_SEVERITIES:
+                self.flush()
 
     def get_events_by_category(self, limit: Optional[int] = None) -> Dict[str, List[str]]:
         output = {}
@@ -160,5 +243,5 @@ def get_logger_event_summary(_registry: Optional[EventsProcessesRegistry] = None
     return {}
 
 
-__all__ = ("EventsFileLogger",
+__all__ = ("EventsFileLogger", "EventsLogWriter",
            "start_events_logger", "get_events_logger", "get_events_grouped_by_category", "get_logger_event_summary", )
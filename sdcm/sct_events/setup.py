@@ -25,7 +25,7 @@ from sdcm.sct_events.filters import DbEventsFilter, EventsSeverityChangerFilter
 from sdcm.sct_events.database import DatabaseLogEvent
 from sdcm.sct_events.loaders import CassandraStressLogEvent
 from sdcm.sct_events.file_logger import start_events_logger
-from sdcm.sct_events.events_device import start_events_main_device
+from sdcm.sct_events.events_device import start_events_main_device, start_batched_events_main_device
 from sdcm.sct_events.events_analyzer import start_events_analyzer
 from sdcm.sct_events.event_counter import start_events_counter
 from sdcm.sct_events.events_processes import \
@@ -43,13 +43,17 @@ LOGGER = logging.getLogger(__name__)
 
 
 def start_events_device(log_dir: Optional[Union[str, Path]] = None,
-                        _registry: Optional[EventsProcessesRegistry] = None) -> None:
+                        _registry: Optional[EventsProcessesRegistry] = None,
+                        batched: bool = False) -> None:
     if _registry is None:
         if log_dir is None:
             raise RuntimeError("Should provide log_dir or instance of EventsProcessesRegistry")
         _registry = create_default_events_process_registry(log_dir=log_dir)
 
-    start_events_main_device(_registry=_registry)
+    if batched:
+        start_batched_events_main_device(_registry=_registry)
+    else:
+        start_events_main_device(_registry=_registry)
 
     time.sleep(EVENTS_DEVICE_START_DELAY)
 
@@ -15,7 +15,6 @@ import os
 import re
 import uuid
 import time
-import builtins
 import logging
 import contextlib
 from enum import Enum
@@ -25,14 +24,18 @@ from sdcm.prometheus import nemesis_metrics_obj
 from sdcm.provision.helpers.certificate import SCYLLA_SSL_CONF_DIR, TLSAssets
 from sdcm.reporting.tooling_reporter import ScyllaBenchVersionReporter
 from sdcm.sct_events.loaders import ScyllaBenchEvent, SCYLLA_BENCH_ERROR_EVENTS_PATTERNS
-from sdcm.utils.common import FileFollowerThread, convert_metric_to_ms
+from sdcm.utils.common import FileFollowerThread
+from sdcm.utils.pattern_set import PatternSet
 from sdcm.stress_thread import DockerBasedStressThread
+from sdcm.stress.summary_parsers import parse_scylla_bench_summary
 from sdcm.utils.docker_remote import RemoteDocker
 from sdcm.wait import wait_for
 
 
 LOGGER = logging.getLogger(__name__)
 
+SCYLLA_BENCH_ERROR_EVENTS_PATTERN_SET = PatternSet(SCYLLA_BENCH_ERROR_EVENTS_PATTERNS)
+
 
 class ScyllaBenchModes(str, Enum):
     WRITE = "write"
@@ -51,70 +54,24 @@ class ScyllaBenchWorkloads(str, Enum):
 class ScyllaBenchStressEventsPublisher(FileFollowerThread):
     def __init__(self, node, sb_log_filename, event_id=None):
         super().__init__()
-        self.sb_log_filename = sb_log_filename
+        self.sb_log_filename = self.followed_filename = sb_log_filename
         self.node = str(node)
         self.event_id = event_id
 
-    def run(self):
-        while not self.stopped():
-            exists = os.path.isfile(self.sb_log_filename)
-            if not exists:
-                time.sleep(0.5)
-                continue
-
-            for line_number, line in enumerate(self.follow_file(self.sb_log_filename)):
-                if self.stopped():
-                    break
-
-                for pattern, event in SCYLLA_BENCH_ERROR_EVENTS_PATTERNS:
-                    if self.event_id:
-                        # Connect the event to the stress load
-                        event.event_id = self.event_id
-
-                    if pattern.search(line):
-                        event.add_info(node=self.node, line=line, line_number=line_number).publish()
+    def process_line(self, line_number, line):
+        published = 0
+        for _, event in SCYLLA_BENCH_ERROR_EVENTS_PATTERN_SET.search_all(line):
+            if self.event_id:
+                # Connect the event to the stress load
+                event.event_id = self.event_id
+            event.add_info(node=self.node, line=line, line_number=line_number).publish()
+            published += 1
+        return published
 
 
 class ScyllaBenchThread(DockerBasedStressThread):
 
     DOCKER_IMAGE_PARAM_NAME = "stress_image.scylla-bench"
-    _SB_STATS_MAPPING = {
-        # Mapping for scylla-bench statistic and configuration keys to db stats keys
-        'Mode': (str, 'Mode'),
-        'Workload': (str, 'Workload'),
-        'Timeout': (int, 'Timeout'),
-        'Consistency level': (str, 'Consistency level'),
-        'Partition count': (int, 'Partition count'),
-        'Clustering rows': (int, 'Clustering rows'),
-        'Page size': (int, 'Page size'),
-        'Concurrency': (int, 'Concurrency'),
-        'Connections': (int, 'Connections'),
-        'Maximum rate': (int, 'Maximum rate'),
-        'Client compression': (bool, 'Client compression'),
-        'Clustering row size': (int, 'Clustering row size'),
-        'Rows per request': (int, 'Rows per request'),
-        'Total rows': (int, 'Total rows'),
-        'max': (int, 'latency max'),
-        '99.9th': (int, 'latency 99.9th percentile'),
-        '99th': (int, 'latency 99th percentile'),
-        '95th': (int, 'latency 95th percentile'),
-        '90th': (int, '90th'),
-        'median': (int, 'latency median'),
-        'Operations/s': (int, 'op rate'),
-        'Rows/s': (int, 'row rate'),
-        'Total ops': (int, 'Total partitions'),
-        'Time (avg)': (int, 'Total operation time'),
-        'Max error number at row': (int, 'Max error number at row'),
-        'Max error number': (str, 'Max error number'),
-        'Retries': (str, 'Retries'),
-        'number': (int, 'Retries number'),
-        'min interval': (int, 'Retries min interval'),
-        'max interval': (int, 'Retries max interval'),
-        'handler': (str, 'Retries handler'),
-        'Hdr memory consumption': (int, 'Hdr memory consumption bytes'),
-        'raw latency': (str, 'raw latency'),
-        'mean': (int, 'latency mean'),
-    }
 
     def __init__(self, stress_cmd, loader_set, timeout, node_list=None, round_robin=False,
                  stop_test_on_failure=False, stress_num=1, credentials=None, params=None):
@@ -239,55 +196,10 @@ class ScyllaBenchThread(DockerBasedStressThread):
 
         return loader, result, scylla_bench_event
 
-    def _parse_stress_summary(self, lines: list) -> dict:
+    def _parse_stress_summary(self, output: str) -> dict:
         """
         Parsing bench results, only parse the summary results.
         Collect results of all nodes and return a dictionaries' list,
         the new structure data will be easy to parse, compare, display or save.
         """
-        results = {'keyspace_idx': None, 'stdev gc time(ms)': None, 'Total errors': None,
-                   'total gc count': None, 'loader_idx': None, 'total gc time (s)': None,
-                   'total gc mb': 0, 'cpu_idx': None, 'avg gc time(ms)': None, 'latency mean': None}
-
-        for line in lines:
-            line.strip()
-            # Parse load params
-
-            if line.startswith('Results'):
-                continue
-            if 'c-o fixed latency' in line:
-                # Ignore C-O Fixed latencies
-                #
-                # c-o fixed latency :
-                #   max:        5.668863ms
-                #   99.9th:	    5.537791ms
-                #   99th:       3.440639ms
-                #   95th:       3.342335ms
-                break
-
-            split = line.split(':', maxsplit=1)
-            if len(split) < 2:
-                continue
-            key = split[0].strip()
-            value = ' '.join(split[1].split())
-            if value_opts := self._SB_STATS_MAPPING.get(key):
-                value_type, target_key = value_opts
-                match value_type:
-                    case builtins.int:
-                        if value.isdecimal():
-                            value = int(value)
-                        else:
-                            value = convert_metric_to_ms(value)
-                    case builtins.bool:
-                        value = value.lower() == 'true'
-                    case builtins.str:
-                        pass
-                    case _:
-                        LOGGER.debug('unknown value type found: `%s`', value_type)
-                results[target_key] = value
-            else:
-                LOGGER.debug('unknown result key found: `%s` with value `%s`', key, value)
-        row_rate = results.get('row rate')
-        if row_rate is not None:
-            results['partition rate'] = row_rate
-        return results
+        return parse_scylla_bench_summary(output)
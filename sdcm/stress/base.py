@@ -92,14 +92,15 @@ class DockerBasedStressThread:
     def _run_stress(self, loader, loader_idx, cpu_idx):
         raise NotImplementedError()
 
-    def get_results(self):
-        results = []
+    def iter_results(self):
+        """Yield results of the stress threads as soon as they finish."""
         timeout = self.hard_timeout + 120
         LOGGER.debug('Wait for %s stress threads results', self.max_workers)
         for future in concurrent.futures.as_completed(self.results_futures, timeout=timeout):
-            results.append(future.result())
+            yield future.result()
 
-        return results
+    def get_results(self):
+        return list(self.iter_results())
 
     def parse_results(self) -> tuple[list, dict]:
         """
@@ -113,12 +114,11 @@ class DockerBasedStressThread:
         results = []
         errors = {}
 
-        stress_results = self.get_results()
-        for loader, result, event in stress_results:
+        # parse an output while other stress threads are still finishing
+        for loader, result, event in self.iter_results():
             if result:
                 if hasattr(self, '_parse_stress_summary'):
-                    output = result.stdout + result.stderr
-                    if stress_summary := self._parse_stress_summary(output.splitlines()):
+                    if stress_summary := self._parse_stress_summary(result.stdout + result.stderr):
                         results.append(stress_summary)
                 else:
                     results.append(result)
@@ -30,6 +30,7 @@ from sdcm.reporting.tooling_reporter import LatteVersionReporter
 from sdcm.sct_events.loaders import LatteStressEvent
 from sdcm.sct_events import Severity
 from sdcm.stress.base import DockerBasedStressThread
+from sdcm.stress.summary_parsers import parse_latte_summary
 from sdcm.utils.common import get_sct_root_path
 from sdcm.utils.docker_remote import RemoteDocker
 from sdcm.utils.remote_logger import HDRHistogramFileLogger
@@ -180,26 +181,7 @@ class LatteStressThread(DockerBasedStressThread):
         :param result: output of latte stats
         :return: dict
         """
-        ops_regex = re.compile(r'\s*Throughput(.*?)\[op\/s\]\s*(?P<op_rate>\d*)\s')
-        latency_99_regex = re.compile(r'\s* 99 \s*(?P<latency_99th_percentile>\d*\.\d*)\s')
-        latency_mean_regex = re.compile(
-            r'\s*(?:Mean resp\. time|Request latency)\s*(?:\[(ms|s)\])?\s*(?P<latency_mean>\d+\.\d+)')
-
-        output = {'latency 99th percentile': 0, 'latency mean': 0, 'op rate': 0}
-        for line in result.stdout.split("SUMMARY STATS")[-1].splitlines():
-            if match := ops_regex.match(line):
-                output['op rate'] = match.groupdict()['op_rate']
-                continue
-            if match := latency_99_regex.match(line):
-                output['latency 99th percentile'] = float(match.groupdict()['latency_99th_percentile'])
-                continue
-            if match := latency_mean_regex.match(line):
-                output['latency mean'] = float(match.groupdict()['latency_mean'])
-                continue
-
-        # output back to strings
-        output = {k: str(v) for k, v in output.items()}
-        return output
+        return parse_latte_summary(result.stdout)
 
     def _run_stress(self, loader, loader_idx, cpu_idx):
         cpu_options = ""
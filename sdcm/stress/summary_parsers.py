@@ -0,0 +1,242 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+"""
+Parsers of the final output (summary) of stress tools.
+
+Output of a long stress run is mostly progress lines while the summary is a few dozen lines at its end, so the
+summary block is located by a search from the end of the output and only the lines of the block are parsed.
+"""
+
+import re
+import builtins
+import logging
+
+from sdcm.utils.common import convert_metric_to_ms
+
+LOGGER = logging.getLogger(__name__)
+
+CASSANDRA_STRESS_TAG_RE = re.compile(r"^[ \t]*TAG: loader_idx:(\d+)-cpu_idx:(\d+)-keyspace_idx:(\d+)", re.MULTILINE)
+CASSANDRA_STRESS_USERNAME_RE = re.compile(r"^[ \t]*Username:(.*)$", re.MULTILINE)
+CASSANDRA_STRESS_END_RE = re.compile(r"^[ \t]*END[ \t]*$", re.MULTILINE)
+CASSANDRA_STRESS_MIXED_LATENCY_RE = re.compile(r"\[READ:\s([\d,]+\.\d+)\sms,\sWRITE:\s([\d,]+\.\d)\sms\]")
+
+SCYLLA_BENCH_LINE_RE = re.compile(r"^([^:\n]*):([^\n]*)$", re.MULTILINE)
+SCYLLA_BENCH_STATS_MAPPING = {
+    # Mapping for scylla-bench statistic and configuration keys to db stats keys
+    'Mode': (str, 'Mode'),
+    'Workload': (str, 'Workload'),
+    'Timeout': (int, 'Timeout'),
+    'Consistency level': (str, 'Consistency level'),
+    'Partition count': (int, 'Partition count'),
+    'Clustering rows': (int, 'Clustering rows'),
+    'Page size': (int, 'Page size'),
+    'Concurrency': (int, 'Concurrency'),
+    'Connections': (int, 'Connections'),
+    'Maximum rate': (int, 'Maximum rate'),
+    'Client compression': (bool, 'Client compression'),
+    'Clustering row size': (int, 'Clustering row size'),
+    'Rows per request': (int, 'Rows per request'),
+    'Total rows': (int, 'Total rows'),
+    'max': (int, 'latency max'),
+    '99.9th': (int, 'latency 99.9th percentile'),
+    '99th': (int, 'latency 99th percentile'),
+    '95th': (int, 'latency 95th percentile'),
+    '90th': (int, '90th'),
+    'median': (int, 'latency median'),
+    'Operations/s': (int, 'op rate'),
+    'Rows/s': (int, 'row rate'),
+    'Total ops': (int, 'Total partitions'),
+    'Time (avg)': (int, 'Total operation time'),
+    'Max error number at row': (int, 'Max error number at row'),
+    'Max error number': (str, 'Max error number'),
+    'Retries': (str, 'Retries'),
+    'number': (int, 'Retries number'),
+    'min interval': (int, 'Retries min interval'),
+    'max interval': (int, 'Retries max interval'),
+    'handler': (str, 'Retries handler'),
+    'Hdr memory consumption': (int, 'Hdr memory consumption bytes'),
+    'raw latency': (str, 'raw latency'),
+    'mean': (int, 'latency mean'),
+}
+
+LATTE_OPS_RE = re.compile(r'\s*Throughput(.*?)\[op\/s\]\s*(?P<op_rate>\d*)\s')
+LATTE_LATENCY_99_RE = re.compile(r'\s* 99 \s*(?P<latency_99th_percentile>\d*\.\d*)\s')
+LATTE_LATENCY_MEAN_RE = re.compile(
+    r'\s*(?:Mean resp\. time|Request latency)\s*(?:\[(ms|s)\])?\s*(?P<latency_mean>\d+\.\d+)')
+
+
+class StressSummary(dict):
+    """
+    Summary of a stress tool run.
+
+    It's a dict of stats keyed the same way they are stored in Elasticsearch with typed accessors for the stats
+    which are common for all tools.
+    """
+
+    def __init__(self, tool: str, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.tool = tool
+
+    def get_float(self, key: str) -> float | None:
+        if (value := self.get(key)) is None or value == "":
+            return None
+        return float(str(value).replace(",", ""))
+
+    @property
+    def op_rate(self) -> float | None:
+        return self.get_float("op rate")
+
+    @property
+    def latency_mean(self) -> float | None:
+        return self.get_float("latency mean")
+
+    @property
+    def latency_99th_percentile(self) -> float | None:
+        return self.get_float("latency 99th percentile")
+
+
+def _rfind_line(text: str, prefix: str) -> int:
+    """Return the position of the last line of the text which starts with `prefix' (indentation ignored) or -1."""
+    pos = len(text)
+    while (pos := text.rfind(prefix, 0, pos)) >= 0:
+        line_start = text.rfind("\n", 0, pos) + 1
+        if not text[line_start:pos].strip():
+            return line_start
+    return -1
+
+
+def _next_line(text: str, pos: int) -> int:
+    return len(text) if (eol := text.find("\n", pos)) < 0 else eol + 1
+
+
+def parse_cassandra_stress_summary(output: str) -> StressSummary:
+    """
+    Parse c-s output: the loader & cpu info from the TAG line, username from the settings and the `Results:' block.
+
+    Results:
+    Op rate                   :    9,999 op/s  [WRITE: 9,999 op/s]
+    Partition rate            :    9,999 pk/s  [WRITE: 9,999 pk/s]
+    Row rate                  :    9,999 row/s [WRITE: 9,999 row/s]
+    Latency mean              :    1.1 ms [WRITE: 1.1 ms]
+    Latency median            :    0.6 ms [WRITE: 0.6 ms]
+    Latency 95th percentile   :    2.3 ms [WRITE: 2.3 ms]
+    Latency 99th percentile   :    5.4 ms [WRITE: 5.4 ms]
+    Latency 99.9th percentile :   23.7 ms [WRITE: 23.7 ms]
+    Latency max               : 15787.4 ms [WRITE: 15,787.4 ms]
+    Total partitions          : 108,000,096 [WRITE: 108,000,096]
+    Total errors              :          0 [WRITE: 0]
+    Total GC count            : 0
+    Total GC memory           : 0.000 KiB
+    Total GC time             :    0.0 seconds
+
+    END
+    """
+    results = StressSummary("cassandra-stress")
+    if (summary_start := _rfind_line(output, "Results:")) < 0:
+        LOGGER.warning('Cannot find summary in c-stress results: %s', output.rsplit("\n", 10)[-10:])
+        return results
+    summary_end = end.start() if (end := CASSANDRA_STRESS_END_RE.search(output, summary_start)) else len(output)
+
+    if tag := CASSANDRA_STRESS_TAG_RE.search(output, 0, summary_start):
+        results['loader_idx'], results['cpu_idx'], results['keyspace_idx'] = tag.groups()
+    if username := CASSANDRA_STRESS_USERNAME_RE.search(output, 0, summary_start):
+        # Mode:
+        # ...
+        #   Username: null
+        #   Password: null
+        results['username'] = username.group(1).strip()
+
+    for line in output[_next_line(output, summary_start):summary_end].splitlines():
+        line = line.strip()  # noqa: PLW2901
+        if (split_idx := line.find(':')) < 0:
+            continue
+        key = line[:split_idx].strip().lower()
+        results[key] = line[split_idx + 1:].split()[0].replace(",", "")
+        if match := CASSANDRA_STRESS_MIXED_LATENCY_RE.search(line):  # parse results for mixed workload
+            results[f'{key} read'], results[f'{key} write'] = match.groups()
+    return results
+
+
+def parse_scylla_bench_summary(output: str) -> StressSummary:
+    """Parse the configuration and the results of scylla-bench, C-O fixed latencies are ignored."""
+    results = StressSummary(
+        "scylla-bench",
+        {'keyspace_idx': None, 'stdev gc time(ms)': None, 'Total errors': None,
+         'total gc count': None, 'loader_idx': None, 'total gc time (s)': None,
+         'total gc mb': 0, 'cpu_idx': None, 'avg gc time(ms)': None, 'latency mean': None})
+
+    if (fixed_latency_pos := output.find("c-o fixed latency")) >= 0:
+        # c-o fixed latency :
+        #   max:        5.668863ms
+        #   99.9th:	    5.537791ms
+        output = output[:output.rfind("\n", 0, fixed_latency_pos) + 1]
+
+    for key, value in SCYLLA_BENCH_LINE_RE.findall(output):
+        if key.startswith('Results'):
+            continue
+        key = key.strip()  # noqa: PLW2901
+        value = ' '.join(value.split())  # noqa: PLW2901
+        if value_opts := SCYLLA_BENCH_STATS_MAPPING.get(key):
+            value_type, target_key = value_opts
+            match value_type:
+                case builtins.int:
+                    if value.isdecimal():
+                        value = int(value)  # noqa: PLW2901
+                    else:
+                        value = convert_metric_to_ms(value)  # noqa: PLW2901
+                case builtins.bool:
+                    value = value.lower() == 'true'  # noqa: PLW2901
+                case builtins.str:
+                    pass
+                case _:
+                    LOGGER.debug('unknown value type found: `%s`', value_type)
+            results[target_key] = value
+        else:
+            LOGGER.debug('unknown result key found: `%s` with value `%s`', key, value)
+    row_rate = results.get('row rate')
+    if row_rate is not None:
+        results['partition rate'] = row_rate
+    return results
+
+
+def parse_latte_summary(output: str) -> StressSummary:
+    """Parse latte `SUMMARY STATS' to match what we get out of cassandra-stress, latencies are in milliseconds."""
+    results = {'latency 99th percentile': 0, 'latency mean': 0, 'op rate': 0}
+    for line in output.rpartition("SUMMARY STATS")[2].splitlines():
+        if match := LATTE_OPS_RE.match(line):
+            results['op rate'] = match.group('op_rate')
+        elif match := LATTE_LATENCY_99_RE.match(line):
+            results['latency 99th percentile'] = float(match.group('latency_99th_percentile'))
+        elif match := LATTE_LATENCY_MEAN_RE.match(line):
+            results['latency mean'] = float(match.group('latency_mean'))
+
+    # output back to strings
+    return StressSummary("latte", {key: str(value) for key, value in results.items()})
+
+
+def parse_gemini_summary(output: str) -> StressSummary:
+    """Parse the `Results:' block of gemini text output, it ends with `run completed' line."""
+    results = StressSummary("gemini")
+    if (summary_start := output.rfind("Results:")) < 0:
+        return results
+    summary_start = _next_line(output, summary_start)
+    if (summary_end := output.find("run completed", summary_start)) < 0:
+        summary_end = len(output)
+    else:
+        summary_end = output.rfind("\n", 0, summary_end) + 1
+    for line in output[summary_start:summary_end].splitlines():
+        if (split_idx := line.find(":")) < 0:
+            continue
+        results[line[:split_idx].strip()] = int(line[split_idx + 1:].split()[0])
+    return results
@@ -27,46 +27,42 @@ from sdcm.provision.helpers.certificate import SCYLLA_SSL_CONF_DIR, c_s_transpor
 from sdcm.reporting.tooling_reporter import CassandraStressVersionReporter
 from sdcm.sct_events import Severity
 from sdcm.utils.common import FileFollowerThread, get_data_dir_path, time_period_str_to_seconds, SoftTimeoutContext
+from sdcm.utils.pattern_set import PatternSet
 from sdcm.utils.user_profile import get_profile_content, replace_scylla_qa_internal_path
 from sdcm.sct_events.loaders import CassandraStressEvent, CS_ERROR_EVENTS_PATTERNS, CS_NORMAL_EVENTS_PATTERNS
 from sdcm.stress.base import DockerBasedStressThread
+from sdcm.stress.summary_parsers import parse_cassandra_stress_summary
 from sdcm.utils.docker_remote import RemoteDocker
 from sdcm.utils.remote_logger import HDRHistogramFileLogger
 
 
 LOGGER = logging.getLogger(__name__)
 
+CS_EVENTS_PATTERN_SET = PatternSet(chain(CS_NORMAL_EVENTS_PATTERNS, CS_ERROR_EVENTS_PATTERNS))
+
 
 class CassandraStressEventsPublisher(FileFollowerThread):
     def __init__(self, node: Any, cs_log_filename: str, event_id: str = None, stop_test_on_failure: bool = True):
         super().__init__()
 
         self.node = str(node)
-        self.cs_log_filename = cs_log_filename
+        self.cs_log_filename = self.followed_filename = cs_log_filename
         self.event_id = event_id
         self.stop_test_on_failure = stop_test_on_failure
 
-    def run(self) -> None:
-        while not self.stopped():
-            if not os.path.isfile(self.cs_log_filename):
-                time.sleep(0.5)
-                continue
-
-            for line_number, line in enumerate(self.follow_file(self.cs_log_filename)):
-                if self.stopped():
-                    break
-
-                for pattern, event in chain(CS_NORMAL_EVENTS_PATTERNS, CS_ERROR_EVENTS_PATTERNS):
-                    if self.event_id:
-                        # Connect the event to the stress load
-                        event.event_id = self.event_id
-
-                    if pattern.search(line):
-                        if event.severity == Severity.CRITICAL and not self.stop_test_on_failure:
-                            event = event.clone()  # so we don't change the severity to other stress threads  # noqa: PLW2901
-                            event.severity = Severity.ERROR
-                        event.add_info(node=self.node, line=line, line_number=line_number).publish()
-                        break  # Stop iterating patterns to avoid creating two events for one line of the log
+    def process_line(self, line_number: int, line: str) -> int:
+        # Only the first matched pattern is used to avoid creating two events for one line of the log.
+        if not (found := CS_EVENTS_PATTERN_SET.search(line)):
+            return 0
+        _, event = found
+        if self.event_id:
+            # Connect the event to the stress load
+            event.event_id = self.event_id
+        if event.severity == Severity.CRITICAL and not self.stop_test_on_failure:
+            event = event.clone()  # so we don't change the severity to other stress threads
+            event.severity = Severity.ERROR
+        event.add_info(node=self.node, line=line, line_number=line_number).publish()
+        return 1
 
 
 class CassandraStressThread(DockerBasedStressThread):
@@ -398,76 +394,13 @@ class CassandraStressThread(DockerBasedStressThread):
 
         return self
 
-    def _parse_stress_summary(self, lines: list) -> dict:
+    def _parse_stress_summary(self, output: str) -> dict:
         """
         Parsing c-s results, only parse the summary results.
         Collect results of all nodes and return a dictionaries' list,
         the new structure data will be easy to parse, compare, display or save.
         """
-        results = {}
-        enable_parse = False
-
-        for line in lines:
-            line = line.strip()  # noqa: PLW2901
-            if not line:
-                continue
-            # Parse loader & cpu info
-            if line.startswith('TAG:'):
-                # TAG: loader_idx:1-cpu_idx:0-keyspace_idx:1
-                ret = re.findall(r"TAG: loader_idx:(\d+)-cpu_idx:(\d+)-keyspace_idx:(\d+)", line)
-                results['loader_idx'] = ret[0][0]
-                results['cpu_idx'] = ret[0][1]
-                results['keyspace_idx'] = ret[0][2]
-                continue
-            if line.startswith('Username:'):
-                # Mode:
-                # ...
-                #   Username: null
-                #   Password: null
-                results['username'] = line.split('Username:')[1].strip()
-            if line.startswith('Results:'):
-                # Results:
-                # Op rate                   :    9,999 op/s  [WRITE: 9,999 op/s]
-                # Partition rate            :    9,999 pk/s  [WRITE: 9,999 pk/s]
-                # Row rate                  :    9,999 row/s [WRITE: 9,999 row/s]
-                # ....
-                enable_parse = True
-                continue
-            if line == '':
-                continue
-            if line == 'END':
-                break
-            if not enable_parse:
-                continue
-            split_idx = line.find(':')
-            if split_idx < 0:
-                continue
-            # Op rate                   :    9,999 op/s  [WRITE: 9,999 op/s]
-            # Partition rate            :    9,999 pk/s  [WRITE: 9,999 pk/s]
-            # Row rate                  :    9,999 row/s [WRITE: 9,999 row/s]
-            # Latency mean              :    1.1 ms [WRITE: 1.1 ms]
-            # Latency median            :    0.6 ms [WRITE: 0.6 ms]
-            # Latency 95th percentile   :    2.3 ms [WRITE: 2.3 ms]
-            # Latency 99th percentile   :    5.4 ms [WRITE: 5.4 ms]
-            # Latency 99.9th percentile :   23.7 ms [WRITE: 23.7 ms]
-            # Latency max               : 15787.4 ms [WRITE: 15,787.4 ms]
-            # Total partitions          : 108,000,096 [WRITE: 108,000,096]
-            # Total errors              :          0 [WRITE: 0]
-            # Total GC count            : 0
-            # Total GC memory           : 0.000 KiB
-            # Total GC time             :    0.0 seconds
-            key = line[:split_idx].strip().lower()
-            value = line[split_idx + 1:].split()[0].replace(",", "")
-            results[key] = value
-            match = re.findall(r'\[READ:\s([\d,]+\.\d+)\sms,\sWRITE:\s([\d,]+\.\d)\sms\]', line)
-            if match:  # parse results for mixed workload
-                results['%s read' % key] = match[0][0]
-                results['%s write' % key] = match[0][1]
-
-        if not enable_parse:
-            LOGGER.warning('Cannot find summary in c-stress results: %s', lines[-10:])
-            return {}
-        return results
+        return parse_cassandra_stress_summary(output)
 
 
 stress_cmd_get_duration_pattern = re.compile(r' [-]{0,2}duration[\s=]+([\d]+[hms]+)')
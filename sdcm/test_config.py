@@ -19,6 +19,8 @@ from sdcm.utils.net import get_my_ip
 from sdcm.utils.decorators import retrying
 from sdcm.utils.docker_utils import ContainerManager
 from sdcm.utils.get_username import get_username
+from sdcm.utils.latency_journal import LatencyResultsJournal
+from sdcm.utils.latency_pipeline import LatencyCyclesPipeline
 from sdcm.utils.ldap import LdapServerNotReady
 from sdcm.utils.metaclasses import Singleton
 
@@ -50,6 +52,8 @@ class TestConfig(metaclass=Singleton):
     _logdir = None
     _latency_results_file_name = 'latency_results.json'
     _latency_results_file_path = None
+    _latency_results_journal = None
+    _latency_cycles_pipeline = None
     _tester_obj = None
     _argus_client: ArgusSCTClient | MagicMock = MagicMock()
 
@@ -116,6 +120,18 @@ class TestConfig(metaclass=Singleton):
                 pass
         return cls._latency_results_file_path
 
+    @classmethod
+    def latency_results_journal(cls) -> LatencyResultsJournal:
+        if not cls._latency_results_journal:
+            cls._latency_results_journal = LatencyResultsJournal(cls.latency_results_file())
+        return cls._latency_results_journal
+
+    @classmethod
+    def latency_cycles_pipeline(cls) -> LatencyCyclesPipeline:
+        if not cls._latency_cycles_pipeline:
+            cls._latency_cycles_pipeline = LatencyCyclesPipeline()
+        return cls._latency_cycles_pipeline
+
     @classmethod
     def test_name(cls):
         return cls._test_name
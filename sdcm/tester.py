@@ -31,14 +31,11 @@ from uuid import uuid4
 from functools import wraps, cache
 import threading
 import signal
-import json
 
 import botocore
 import yaml
 from invoke.exceptions import UnexpectedExit, Failure
 
-from cassandra.concurrent import execute_concurrent_with_args
-from cassandra import ConsistencyLevel
 from cassandra.cluster import Session
 
 from argus.client.sct.client import ArgusSCTClient
@@ -87,7 +84,7 @@ from sdcm.utils.common import format_timestamp, wait_ami_available, \
     make_threads_be_daemonic_by_default, ParallelObject, change_default_password, \
     parse_python_thread_command, get_data_dir_path
 from sdcm.utils.cql_utils import cql_quote_if_needed, cql_unquote_if_needed
-from sdcm.utils.database_query_utils import PartitionsValidationAttributes, fetch_all_rows
+from sdcm.utils.database_query_utils import PartitionsValidationAttributes
 from sdcm.utils.features import is_tablets_feature_enabled
 from sdcm.utils.get_username import get_username
 from sdcm.utils.decorators import log_run_info, retrying, measure_time, optional_stage
@@ -111,7 +108,9 @@ from sdcm.gemini_thread import GeminiStressThread
 from sdcm.utils.log_time_consistency import DbLogTimeConsistencyAnalyzer
 from sdcm.utils.net import get_my_ip, get_sct_runner_ip
 from sdcm.utils.operations_thread import ThreadParams
+from sdcm.utils.parallel_executor import configure_parallel_executor, get_parallel_executor
 from sdcm.utils.replication_strategy_utils import LocalReplicationStrategy, NetworkTopologyReplicationStrategy
+from sdcm.utils.table_copier import TableCopier
 from sdcm.utils.tablets.common import TabletsConfiguration
 from sdcm.utils.threads_and_processes_alive import gather_live_processes_and_dump_to_file, \
     gather_live_threads_and_dump_to_file
@@ -705,6 +704,14 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):
     def latency_results_file(self):
         return TestConfig.latency_results_file()
 
+    @property
+    def latency_results_journal(self):
+        return TestConfig.latency_results_journal()
+
+    @property
+    def latency_cycles_pipeline(self):
+        return TestConfig.latency_cycles_pipeline()
+
     @property
     def reliable_replication_factor(self) -> int:
         """
@@ -883,6 +890,7 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):
         self.test_config.set_tester_obj(self)
         self._init_logging()
         RemoteCmdRunnerBase.set_default_ssh_transport(self.params.get('ssh_transport'))
+        RemoteCmdRunnerBase.set_max_channels_per_host(self.params.get('ssh_max_channels_per_host'))
 
         self._profile_factory = None
         if self.params.get('enable_test_profiling'):
@@ -949,7 +957,9 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):
         self.partitions_attrs: PartitionsValidationAttributes | None = self._init_data_validation()
         # Cover multi-tenant configuration. Prevent event device double initiate
         start_events_device(log_dir=self.logdir,
-                            _registry=getattr(self, "_registry", None) or self.events_processes_registry)
+                            _registry=getattr(self, "_registry", None) or self.events_processes_registry,
+                            batched=self.params.get("events_device_batched"))
+        configure_parallel_executor(max_concurrency=self.params.get("parallel_tasks_max_concurrency"))
         enable_default_filters(sct_config=self.params)
 
         self.skip_test_stages = defaultdict(lambda: False, self.params.get('skip_test_stages') or {})
@@ -2740,33 +2750,7 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):
         """
         self.log.debug('Start copying data')
         with self.db_cluster.cql_connection_patient(node, verbose=False) as session:
-            # Copy data from source to the destination table
-            statement = "SELECT {columns} FROM {keyspace}.{table}".format(keyspace=src_keyspace,
-                                                                          table=src_table,
-                                                                          columns=','.join(
-                                                                              columns_list) if columns_list else '*')
-            # Get table columns list
-            result = session.execute(statement + ' LIMIT 1')
-            columns = result.column_names
-
-            # Fetch all rows from view / table
-            source_table_rows = fetch_all_rows(session=session, default_fetch_size=5000, statement=statement)
-            if not source_table_rows:
-                self.log.error("Can't copy data from %s. Fetch all rows failed, see error above", src_table)
-                return False
-
-            # TODO: Temporary function. Will be removed
-            self.log.debug('Rows in the {} MV before saving: {}'.format(src_table, len(source_table_rows)))
-
-            insert_statement = session.prepare(
-                'insert into {keyspace}.{name} ({columns}) '
-                'values ({values})'.format(keyspace=dest_keyspace,
-                                           name=dest_table,
-                                           columns=', '.join(columns),
-                                           values=', '.join(['?' for _ in columns])))
-
-            # Save all rows
-            # Workers = Parallel queries = (nodes in cluster) x (cores in node) x 3
+            # Parallel queries = (nodes in cluster) x (cores in node) x 3
             # (from https://www.scylladb.com/2017/02/13/efficient-full-table-scans-with-scylla-1-6/)
             cores = self.db_cluster.nodes[0].cpu_cores
             if not cores:
@@ -2774,32 +2758,15 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):
                 cores = 8
             max_workers = len(self.db_cluster.nodes) * cores * 3
 
-            session.default_consistency_level = ConsistencyLevel.QUORUM
-
-            results = execute_concurrent_with_args(session=session, statement=insert_statement,
-                                                   parameters=source_table_rows,
-                                                   concurrency=max_workers, results_generator=True)
-
-            try:
-                succeeded_rows = sum(1 for (success, result) in results if success)
-                if succeeded_rows != len(source_table_rows):
-                    self.log.warning('Problem during copying data. Not all rows were inserted. '
-                                     'Rows expected to be inserted: %s; '
-                                     'Actually inserted rows: %s.',
-                                     len(source_table_rows), succeeded_rows)
-                    return False
-            except Exception as exc:  # noqa: BLE001
-                self.log.warning('Problem during copying data: %s', exc)
+            # Token ranges of the source are read by `readers' workers, the rows are inserted while being read.
+            copier = TableCopier(session=session, src_keyspace=src_keyspace, src_table=src_table,
+                                 dest_keyspace=dest_keyspace, dest_table=dest_table, columns=columns_list,
+                                 readers=len(self.db_cluster.nodes) * 2, write_concurrency=max_workers)
+            if not copier.copy():
+                return False
+            if not copier.rows_copied:
+                self.log.error("Can't copy data from %s. No rows found", src_table)
                 return False
-
-            result = session.execute(f"SELECT count(*) FROM {dest_keyspace}.{dest_table}")
-            if result:
-                if result.current_rows[0].count != len(source_table_rows):
-                    self.log.warning('Problem during copying data. '
-                                     'Rows in source table: %s; '
-                                     'Rows in destination table: %s.',
-                                     len(source_table_rows), len(result.current_rows))
-                    return False
         self.log.debug('All rows have been copied from %s to %s', src_table, dest_table)
         return True
 
@@ -3044,6 +3011,12 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):
         self.stop_resources()
         self.get_test_failures()
 
+        with silence(parent=self, name='waiting for latency cycles post-processing'):
+            self.latency_cycles_pipeline.flush(timeout=3600)
+            self.latency_cycles_pipeline.log_stage_stats()
+        with silence(parent=self, name='compacting latency results journal'):
+            self.latency_results_journal.compact()
+
         with silence(parent=self, name='closing decoding queue as needed'):
             if self.test_config.BACKTRACE_DECODING:
                 self.test_config.DECODING_QUEUE.close()
@@ -3064,6 +3037,8 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):
             self.collect_logs()
         self.collect_ssl_conf()
         self.clean_resources()
+        with silence(parent=self, name='logging parallel tasks stats'):
+            get_parallel_executor().log_task_stats()
         if self.create_stats:
             self.update_test_with_errors()
         time.sleep(1)  # Sleep is needed to let final event being saved into files
@@ -3329,8 +3304,8 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):
                                         'email_recipients'),
                                     events=get_events_grouped_by_category(
                                         _registry=self.events_processes_registry))
-        with open(self.latency_results_file, encoding="utf-8") as file:
-            latency_results = json.load(file)
+        self.latency_cycles_pipeline.flush()
+        latency_results = self.latency_results_journal.load()
         self.log.debug('latency_results were loaded from file %s and its result is %s',
                        self.latency_results_file, latency_results)
         benchmarks_results = self.db_cluster.get_node_benchmarks_results() if self.db_cluster else {}
@@ -3344,8 +3319,7 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):
                                           "hdr": histogram_data_by_interval}
             latency_results = calculate_latency(latency_results)
             latency_results = analyze_hdr_percentiles(latency_results)
-            with open(self.latency_results_file, 'w', encoding="utf-8") as file:
-                json.dump(latency_results, file)
+            self.latency_results_journal.compact(latency_results)
             self.log.debug('collected latency values are: %s', latency_results)
             self.update({"latency_during_ops": latency_results})
             self.update_test_details()
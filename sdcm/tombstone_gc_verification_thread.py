@@ -64,9 +64,10 @@ class TombstoneGcVerificationThread:
                        len(sstables))
         if max_sstable_num < len(sstables):
             sstables = sstables[:max_sstable_num]
-        for sstable in sstables:
-            self._sstable_utils.verify_post_repair_sstable_tombstones(
-                table_repair_date=table_repair_date, sstable=sstable)
+        self._sstable_utils.run_on_sstables(
+            lambda sstable: self._sstable_utils.verify_post_repair_sstable_tombstones(
+                table_repair_date=table_repair_date, sstable=sstable),
+            sstables)
 
     def _run_tombstone_gc_verification(self):
         db_node = self._sstable_utils.db_node
@@ -0,0 +1,123 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+"""
+Decode raw Scylla backtraces (reactor stalls, crashes, etc.) with addr2line in batches.
+
+A reactor stall storm produces thousands of backtraces, most of them identical or sharing most of their addresses.
+Instead of running addr2line for every backtrace, BacktraceDecoder resolves all unknown addresses of a batch of
+backtraces by a single addr2line call per debug info file and keeps resolved addresses in an LRU cache keyed by
+(debug info file, address).  The debug info file is named after the build-id, so it's the build-id key in fact.
+"""
+
+import re
+import logging
+from collections import OrderedDict
+from typing import Callable, Iterable
+
+LOGGER = logging.getLogger(__name__)
+
+ADDR2LINE_CMD = "addr2line -Cpife"
+ADDR2LINE_BATCH_CMD = "addr2line -Cpifae"  # `-a' prints the address before each symbol, used to split the output
+ADDRESS_HEADER_RE = re.compile(r"^0x[0-9a-fA-F]+: ")
+INLINED_BY_PREFIX = " (inlined by) "
+
+
+class Addr2lineOutputError(Exception):
+    pass
+
+
+def split_addr2line_output(output: str) -> list[str]:
+    """
+    Split output of `addr2line -Cpifae' to the output of `addr2line -Cpife' for every address.
+
+    Each address has a line prefixed by the address, followed by `(inlined by)' lines of inlined frames.
+    """
+    entries = []
+    for line in output.splitlines(keepends=True):
+        if line.startswith(INLINED_BY_PREFIX) and entries:
+            entries[-1] += line
+        elif ADDRESS_HEADER_RE.match(line):
+            entries.append(ADDRESS_HEADER_RE.sub("", line, count=1))
+        else:
+            raise Addr2lineOutputError(f"Unexpected line in addr2line output: {line!r}")
+    return entries
+
+
+class BacktraceDecoder:
+    """
+    Decode batches of raw backtraces; `run_command' runs a command where debug info files are and returns its stdout.
+
+    If the output of a batch call can't be parsed, backtraces of the debug info file are decoded one by one, the
+    same way it was done before.
+    """
+
+    cache_size = 100_000  # addresses
+    max_addresses_per_call = 1000  # keep the command line short
+
+    def __init__(self, run_command: Callable[[str], str]):
+        self._run_command = run_command
+        self._symbols: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self._unbatched_debug_files = set()
+        self.addr2line_calls = 0
+
+    def decode(self, backtraces: Iterable[tuple[str, str]]) -> list[str]:
+        """Decode (debug info file, raw backtrace) pairs and return the decoded backtraces in the same order."""
+        backtraces = list(backtraces)
+        unique_backtraces = dict.fromkeys(backtraces)  # identical backtraces are decoded once
+        missing = {}
+        for debug_file, raw_backtrace in unique_backtraces:
+            if debug_file not in self._unbatched_debug_files:
+                addresses = missing.setdefault(debug_file, {})
+                for address in raw_backtrace.split():
+                    if (debug_file, address) not in self._symbols:
+                        addresses[address] = None
+        for debug_file, addresses in missing.items():
+            try:
+                self._resolve(debug_file, list(addresses))
+            except Addr2lineOutputError as exc:
+                LOGGER.warning("Failed to decode addresses of %s in a batch, decode backtraces one by one: %s",
+                               debug_file, exc)
+                self._unbatched_debug_files.add(debug_file)
+        for key in unique_backtraces:
+            unique_backtraces[key] = self._decode_backtrace(*key)
+        return [unique_backtraces[key] for key in backtraces]
+
+    def _decode_backtrace(self, debug_file: str, raw_backtrace: str) -> str:
+        addresses = raw_backtrace.split()
+        if debug_file in self._unbatched_debug_files:
+            self.addr2line_calls += 1
+            return self._run_command(f"{ADDR2LINE_CMD} {debug_file} {' '.join(addresses)}")
+        symbols = {}
+        for address in dict.fromkeys(addresses):
+            if (key := (debug_file, address)) in self._symbols:
+                self._symbols.move_to_end(key)
+                symbols[address] = self._symbols[key]
+        if missing := [address for address in dict.fromkeys(addresses) if address not in symbols]:
+            symbols.update(self._resolve(debug_file, missing))  # evicted from the cache by the same batch
+        return "".join(symbols[address] for address in addresses)
+
+    def _resolve(self, debug_file: str, addresses: list[str]) -> dict[str, str]:
+        resolved = {}
+        for index in range(0, len(addresses), self.max_addresses_per_call):
+            chunk = addresses[index:index + self.max_addresses_per_call]
+            self.addr2line_calls += 1
+            entries = split_addr2line_output(self._run_command(f"{ADDR2LINE_BATCH_CMD} {debug_file} {' '.join(chunk)}"))
+            if len(entries) != len(chunk):
+                raise Addr2lineOutputError(f"Got symbols for {len(entries)} addresses instead of {len(chunk)}")
+            resolved.update(zip(chunk, entries))
+            for address, symbol in zip(chunk, entries):
+                self._symbols[(debug_file, address)] = symbol
+            while len(self._symbols) > self.cache_size:
+                self._symbols.popitem(last=False)
+        return resolved
@@ -14,7 +14,6 @@
 
 from __future__ import absolute_import, annotations
 
-import atexit
 import itertools
 import os
 import logging
@@ -24,7 +23,6 @@ import time
 import datetime
 import errno
 import threading
-import select
 import shutil
 import copy
 import string
@@ -46,9 +44,9 @@ from contextlib import closing, contextmanager
 from functools import wraps, cached_property, lru_cache, singledispatch
 from collections import defaultdict, namedtuple
 import concurrent.futures
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
-from concurrent.futures.thread import _python_exit
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 import hashlib
+import weakref
 from pathlib import Path
 from collections import OrderedDict
 import requests
@@ -76,6 +74,9 @@ from sdcm.utils.aws_utils import (
 )
 from sdcm.utils.ssh_agent import SSHAgent
 from sdcm.utils.decorators import retrying
+from sdcm.utils.file_follower import get_file_follower_service, reopen_if_replaced
+from sdcm.utils.parallel_executor import get_parallel_executor
+from sdcm.utils.inotify import Inotify, IN_ATTRIB, IN_CREATE, IN_DELETE_SELF, IN_MODIFY, IN_MOVE_SELF, IN_MOVED_TO, IN_Q_OVERFLOW
 from sdcm import wait
 from sdcm.utils.ldap import DEFAULT_PWD_SUFFIX, SASLAUTHD_AUTHENTICATOR, LdapServerType
 from sdcm.keystore import KeyStore
@@ -419,14 +420,14 @@ class ParallelObject:
                 if function accept list as parameter, the item shuld be list of list item = [[]]
 
         :param timeout: global timeout for running all
-        :param num_workers: num of parallel threads, defaults to None
+        :param num_workers: max number of objects processed at once, defaults to None (same as ThreadPoolExecutor)
         :param disable_logging: disable logging for running disrupt_func, defaults to False
         """
         self.objects = objects
         self.timeout = timeout
         self.num_workers = num_workers
         self.disable_logging = disable_logging
-        self._thread_pool = ThreadPoolExecutor(max_workers=self.num_workers)
+        self._task_group = None
 
     def run(self, func: Callable, ignore_exceptions=False, unpack_objects: bool = False) -> List[ParallelObjectResult]:
         """Run callable object "disrupt_func" in parallel
@@ -472,14 +473,16 @@ class ParallelObject:
             func = func_wrap(func)
 
         futures = []
+        self._task_group = get_parallel_executor().task_group(max_workers=self.num_workers,
+                                                              name=getattr(func, "__qualname__", None))
 
         for obj in self.objects:
             if unpack_objects and isinstance(obj, (list, tuple)):
-                futures.append((self._thread_pool.submit(func, *obj), obj))
+                futures.append((self._task_group.submit(func, *obj), obj))
             elif unpack_objects and isinstance(obj, dict):
-                futures.append((self._thread_pool.submit(func, **obj), obj))
+                futures.append((self._task_group.submit(func, **obj), obj))
             else:
-                futures.append((self._thread_pool.submit(func, obj), obj))
+                futures.append((self._task_group.submit(func, obj), obj))
         time_out = self.timeout
         for future, target_obj in futures:
             try:
@@ -523,12 +526,9 @@ class ParallelObject:
         return self.run(lambda x: x(), ignore_exceptions=ignore_exceptions)
 
     def clean_up(self, futures):
-        # if there are futures that didn't run  we cancel them
-        for future, _ in futures:
-            future.cancel()
-        self._thread_pool.shutdown(wait=False)
-        # we need to unregister internal function that waits for all threads to finish when interpreter exits
-        atexit.unregister(_python_exit)
+        # if there are futures that didn't run we cancel them, including subtasks submitted by running ones
+        if not all(future.done() for future, _ in futures):
+            self._task_group.cancel()
 
     @staticmethod
     def run_named_tasks_in_parallel(tasks: dict[str, Callable],
@@ -1242,35 +1242,112 @@ def safe_kill(pid, signal):
 
 
 class FileFollowerIterator():
+    """
+    Iterate over lines of a file which is being written, till the thread object is stopped.
+
+    The file is read in big chunks and complete lines are yielded, the last incomplete line is yielded on stop.
+    When there is no new data, inotify is used to wait till the file is modified (or the iterator is woken up.)
+    If inotify is not available, the file is polled every `poll_interval' seconds.  Truncation and rotation
+    of the file are handled by reading it from the beginning.
+    """
+
+    chunk_size = 64 * 1024
+    poll_interval = 0.1  # seconds
+    inotify_wait_timeout = 1  # seconds, just in case an inotify event was lost (e.g., on network filesystems)
+    file_watch_mask = IN_MODIFY | IN_ATTRIB | IN_MOVE_SELF | IN_DELETE_SELF
+
     def __init__(self, filename, thread_obj):
         self.filename = filename
         self.thread_obj = thread_obj
+        self._inotify = None
+        self._file_wd = None
+
+    def wake(self):
+        if inotify := self._inotify:
+            inotify.wake()
+
+    def _open_inotify(self):
+        try:
+            inotify = Inotify()
+        except OSError as exc:
+            LOGGER.debug("inotify is not available (%s), poll %s every %ss", exc, self.filename, self.poll_interval)
+            return None
+        try:
+            # Watch the directory to find out when the file is created again after rotation.
+            inotify.add_watch(os.path.dirname(os.path.abspath(self.filename)), IN_CREATE | IN_MOVED_TO)
+            self._file_wd = inotify.add_watch(self.filename, self.file_watch_mask)
+        except OSError as exc:
+            LOGGER.debug("Failed to watch %s (%s), poll it every %ss", self.filename, exc, self.poll_interval)
+            inotify.close()
+            return None
+        return inotify
+
+    def _rewatch_file(self):
+        if not (inotify := self._inotify):
+            return
+        inotify.rm_watch(self._file_wd)
+        try:
+            self._file_wd = inotify.add_watch(self.filename, self.file_watch_mask)
+        except OSError as exc:
+            LOGGER.debug("Failed to watch %s (%s), poll it every %ss", self.filename, exc, self.poll_interval)
+            self._inotify = None
+            inotify.close()
+
+    def _wait_for_data(self):
+        if not self._inotify:
+            time.sleep(self.poll_interval)
+            return
+        basename = os.path.basename(self.filename)
+        deadline = time.perf_counter() + self.inotify_wait_timeout
+        while not self.thread_obj.stopped() and (timeout := deadline - time.perf_counter()) > 0:
+            for event in self._inotify.wait(timeout=timeout):
+                if event.wd == self._file_wd or event.name == basename or event.mask & IN_Q_OVERFLOW:
+                    return
 
     def __iter__(self):
-        with open(self.filename, encoding="utf-8") as input_file:
-            line = ''
-            poller = select.poll()
-            registered = False
+        input_file = open(self.filename, "rb")
+        self._inotify = self._open_inotify()
+        try:
+            position = 0
+            pending = b""
             while not self.thread_obj.stopped():
-                if not registered:
-                    poller.register(input_file, select.POLLIN)
-                    registered = True
-                if poller.poll(100):
-                    line += input_file.readline()
-                if not line or not line.endswith('\n'):
-                    time.sleep(0.1)
-                    continue
-                poller.unregister(input_file)
-                registered = False
-                yield line
-                line = ''
-            yield line
+                if chunk := input_file.read(self.chunk_size):
+                    position += len(chunk)
+                    *lines, pending = (pending + chunk).split(b"\n")
+                    for line in lines:
+                        yield line.decode("utf-8", errors="replace") + "\n"
+                elif reopened := reopen_if_replaced(self.filename, input_file, position):
+                    if reopened is not input_file:
+                        self._rewatch_file()
+                        if pending:
+                            yield pending.decode("utf-8", errors="replace")
+                    input_file, position, pending = reopened, 0, b""
+                else:
+                    self._wait_for_data()
+            yield pending.decode("utf-8", errors="replace")
+        finally:
+            input_file.close()
+            if inotify := self._inotify:
+                self._inotify = None
+                inotify.close()
 
 
 class FileFollowerThread():
+    """
+    Base class of log files followers.
+
+    A subclass either implements `run()', which is executed by a dedicated thread and iterates over
+    `follow_file()', or sets `followed_filename' and implements `process_line()', which is called for every
+    line of the file by the thread of the shared FileFollowerService.
+    """
+
+    followed_filename: Optional[str] = None
+
     def __init__(self):
         self.executor = concurrent.futures.ThreadPoolExecutor(1)
         self._stop_event = threading.Event()
+        self._followers = weakref.WeakSet()
+        self._followed_file = None
         self.future = None
 
     def __enter__(self):
@@ -1283,18 +1360,40 @@ class FileFollowerThread():
     def run(self):
         raise NotImplementedError()
 
+    def process_line(self, line_number: int, line: str) -> int:
+        """Process a line of `followed_filename' and return the number of events published."""
+        raise NotImplementedError()
+
+    @property
+    def lines_count(self) -> int:
+        return self._followed_file.lines_count if self._followed_file else 0
+
+    @property
+    def events_count(self) -> int:
+        return self._followed_file.events_count if self._followed_file else 0
+
     def start(self):
-        self.future = self.executor.submit(self.run)
+        if self.followed_filename is None:
+            self.future = self.executor.submit(self.run)
+        else:
+            self._followed_file = get_file_follower_service().follow(self.followed_filename, handler=self)
+            self.future = self._followed_file.future
         return self.future
 
     def stop(self):
         self._stop_event.set()
+        if self._followed_file:
+            self._followed_file.stop()
+        for follower in list(self._followers):
+            follower.wake()
 
     def stopped(self):
         return self._stop_event.is_set()
 
     def follow_file(self, filename):
-        return FileFollowerIterator(filename, self)
+        follower = FileFollowerIterator(filename, self)
+        self._followers.add(follower)
+        return follower
 
 
 class ScyllaCQLSession:
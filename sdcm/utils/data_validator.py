@@ -134,13 +134,17 @@
 import json
 import os
 import re
+import heapq
 import logging
 import uuid
-from typing import NamedTuple, Optional
+from itertools import zip_longest
+from typing import Iterable, NamedTuple, Optional
 
 from sdcm.sct_events import Severity
 from sdcm.test_config import TestConfig
-from sdcm.utils.database_query_utils import fetch_all_rows
+from sdcm.utils.database_query_utils import stream_rows
+from sdcm.utils.decorators import retrying
+from sdcm.utils.external_sort import SortedRows, iter_missing
 
 from sdcm.utils.user_profile import get_profile_content
 from sdcm.sct_events.health import DataValidatorEvent
@@ -151,10 +155,16 @@ LOGGER = logging.getLogger(__name__)
 
 class DataForValidation(NamedTuple):
     views: tuple  # list of view names with data for validation
-    actual_data: list
-    expected_data: list
-    before_update_rows: Optional[list]
-    after_update_rows: Optional[list]
+    actual_data: SortedRows
+    expected_data: SortedRows
+    before_update_rows: Optional[SortedRows]
+    after_update_rows: Optional[SortedRows]
+
+
+class RowsComparison(NamedTuple):
+    actual_rows: int
+    expected_rows: int
+    equal: bool
 
 
 class LongevityDataValidator:
@@ -163,6 +173,7 @@ class LongevityDataValidator:
     SUBSTRING_NOT_UPDATED = '_not_updated'
     SUBSTRING_DELETION = '_deletions'
     DEFAULT_FETCH_SIZE = 5000
+    FETCH_RETRIES = 4
 
     def __init__(self, longevity_self_object, user_profile_name, base_table_partition_keys,
                  stress_cmds_part='prepare_write_cmd'):
@@ -391,6 +402,54 @@ class LongevityDataValidator:
                     ).publish()
                 self._validate_updated_per_view.append(True)
 
+    def _stream_rows(self, session, statement: str, verbose: bool = True) -> Iterable[tuple]:
+        if verbose:
+            LOGGER.debug("Fetch all rows by statement: %s", statement)
+        return (tuple(row) for row in stream_rows(session=session, statement=statement,
+                                                  fetch_size=self.DEFAULT_FETCH_SIZE))
+
+    def fetch_sorted_rows(self, session, statement: str, verbose: bool = True) -> Optional[SortedRows]:
+        """Fetch and sort rows, the rows which don't fit into memory are kept in temporary files."""
+        @retrying(n=self.FETCH_RETRIES, sleep_time=5, message='Fetch all rows', raise_on_exceeded=False)
+        def _fetch_rows() -> SortedRows:
+            return SortedRows(self._stream_rows(session=session, statement=statement, verbose=verbose))
+
+        return _fetch_rows()
+
+    def count_rows(self, session, statement: str, verbose: bool = True) -> Optional[int]:
+        @retrying(n=self.FETCH_RETRIES, sleep_time=5, message='Fetch all rows', raise_on_exceeded=False)
+        def _count_rows() -> int:
+            return sum(1 for _ in self._stream_rows(session=session, statement=statement, verbose=verbose))
+
+        return _count_rows()
+
+    def compare_rows(self, session, actual_statement: str, expected_statement: str,
+                     verbose: bool = True) -> Optional[RowsComparison]:
+        """Compare results of the statements row by row w/o keeping them in memory."""
+        @retrying(n=self.FETCH_RETRIES, sleep_time=5, message='Fetch all rows', raise_on_exceeded=False)
+        def _compare_rows() -> RowsComparison:
+            actual_rows = expected_rows = 0
+            equal = True
+            for actual_row, expected_row in zip_longest(
+                    self._stream_rows(session=session, statement=actual_statement, verbose=verbose),
+                    self._stream_rows(session=session, statement=expected_statement, verbose=verbose)):
+                actual_rows += actual_row is not None
+                expected_rows += expected_row is not None
+                equal = equal and actual_row == expected_row
+            return RowsComparison(actual_rows=actual_rows, expected_rows=expected_rows, equal=equal)
+
+        return _compare_rows()
+
+    @staticmethod
+    def dump_rows(rows: Iterable, json_file) -> None:
+        """Same as `json.dump(list(rows), json_file)', but w/o building the list."""
+        json_file.write("[")
+        for idx, row in enumerate(rows):
+            if idx:
+                json_file.write(", ")
+            json.dump(row, json_file)
+        json_file.write("]")
+
     def save_count_rows_for_deletion(self):
         if not self.view_name_for_deletion_data:
             DataValidatorEvent.DataValidator(
@@ -405,10 +464,10 @@ class LongevityDataValidator:
         pk_name = self.base_table_partition_keys[0]
         with self.longevity_self_object.db_cluster.cql_connection_patient(
                 self.longevity_self_object.db_cluster.nodes[0], keyspace=self.keyspace_name) as session:
-            rows_before_deletion = fetch_all_rows(session=session, default_fetch_size=self.DEFAULT_FETCH_SIZE,
-                                                  statement=f"SELECT {pk_name} FROM {self.view_name_for_deletion_data}")
+            rows_before_deletion = self.count_rows(session=session,
+                                                   statement=f"SELECT {pk_name} FROM {self.view_name_for_deletion_data}")
             if rows_before_deletion:
-                self.rows_before_deletion = len(rows_before_deletion)
+                self.rows_before_deletion = rows_before_deletion
                 LOGGER.debug("%s rows for deletion", self.rows_before_deletion)
 
     def validate_range_not_expected_to_change(self, session, during_nemesis=False):
@@ -430,10 +489,11 @@ class LongevityDataValidator:
         if not during_nemesis:
             LOGGER.debug('Verify immutable rows')
 
-        actual_result = fetch_all_rows(session=session, default_fetch_size=self.DEFAULT_FETCH_SIZE,
-                                       statement=f"SELECT * FROM {self.view_name_for_not_updated_data}",
+        comparison = self.compare_rows(session=session,
+                                       actual_statement=f"SELECT * FROM {self.view_name_for_not_updated_data}",
+                                       expected_statement=f"SELECT * FROM {self.expected_data_table_name}",
                                        verbose=not during_nemesis)
-        if not actual_result:
+        if not comparison or not comparison.actual_rows:
             DataValidatorEvent.ImmutableRowsValidator(
                 severity=Severity.WARNING,
                 message=f"Can't validate immutable rows. "
@@ -442,10 +502,7 @@ class LongevityDataValidator:
             ).publish()
             return
 
-        expected_result = fetch_all_rows(session=session, default_fetch_size=self.DEFAULT_FETCH_SIZE,
-                                         statement=f"SELECT * FROM {self.expected_data_table_name}",
-                                         verbose=not during_nemesis)
-        if not expected_result:
+        if not comparison.expected_rows:
             DataValidatorEvent.ImmutableRowsValidator(
                 severity=Severity.WARNING,
                 message=f"Can't validate immutable rows. Fetch all rows from {self.expected_data_table_name} failed. "
@@ -455,19 +512,19 @@ class LongevityDataValidator:
 
         # Issue https://github.com/scylladb/scylla/issues/6181
         # Not fail the test if unexpected additional rows where found in actual result table
-        if len(actual_result) > len(expected_result):
+        if comparison.actual_rows > comparison.expected_rows:
             DataValidatorEvent.ImmutableRowsValidator(
                 severity=Severity.WARNING,
-                message=f"Actual dataset length more then expected ({len(actual_result)} > {len(expected_result)}). "
-                        f"Issue #6181"
+                message=f"Actual dataset length more then expected "
+                        f"({comparison.actual_rows} > {comparison.expected_rows}). Issue #6181"
             ).publish()
         elif not during_nemesis:
-            assert len(actual_result) == len(expected_result), \
+            assert comparison.actual_rows == comparison.expected_rows, \
                 'One or more rows are not as expected, suspected LWT wrong update. ' \
-                'Actual dataset length: {}, Expected dataset length: {}'.format(len(actual_result),
-                                                                                len(expected_result))
+                'Actual dataset length: {}, Expected dataset length: {}'.format(comparison.actual_rows,
+                                                                                comparison.expected_rows)
 
-            assert actual_result == expected_result, \
+            assert comparison.equal, \
                 'One or more rows are not as expected, suspected LWT wrong update'
 
             # Raise info event at the end of the test only.
@@ -475,17 +532,17 @@ class LongevityDataValidator:
                 severity=Severity.NORMAL,
                 message="Validation immutable rows finished successfully"
             ).publish()
-        elif len(actual_result) < len(expected_result):
+        elif comparison.actual_rows < comparison.expected_rows:
             DataValidatorEvent.ImmutableRowsValidator(
                 severity=Severity.ERROR,
                 error=f"Verify immutable rows. "
                       f"One or more rows not found as expected, suspected LWT wrong update. "
-                      f"Actual dataset length: {len(actual_result)}, "
-                      f"Expected dataset length: {len(expected_result)}"
+                      f"Actual dataset length: {comparison.actual_rows}, "
+                      f"Expected dataset length: {comparison.expected_rows}"
             ).publish()
         else:
             LOGGER.debug('Verify immutable rows. Actual dataset length: %s, Expected dataset length: %s',
-                         len(actual_result), len(expected_result))
+                         comparison.actual_rows, comparison.expected_rows)
 
     def list_of_view_names_for_update_test(self):
         # List of tuples of correlated  view names for validation: before update, after update, expected data
@@ -503,9 +560,9 @@ class LongevityDataValidator:
         # views_set[3] - do perform validation for the view or not
         partition_keys = ', '.join(self.base_table_partition_keys)
 
-        before_update_rows = fetch_all_rows(session=session, default_fetch_size=self.DEFAULT_FETCH_SIZE,
-                                            statement=f"SELECT {partition_keys} FROM {views_set[0]}",
-                                            verbose=not during_nemesis)
+        before_update_rows = self.fetch_sorted_rows(session=session,
+                                                    statement=f"SELECT {partition_keys} FROM {views_set[0]}",
+                                                    verbose=not during_nemesis)
         if not before_update_rows:
             DataValidatorEvent.UpdatedRowsValidator(
                 severity=Severity.WARNING,
@@ -514,9 +571,9 @@ class LongevityDataValidator:
             ).publish()
             return None
 
-        after_update_rows = fetch_all_rows(session=session, default_fetch_size=self.DEFAULT_FETCH_SIZE,
-                                           statement=f"SELECT {partition_keys} FROM {views_set[1]}",
-                                           verbose=not during_nemesis)
+        after_update_rows = self.fetch_sorted_rows(session=session,
+                                                   statement=f"SELECT {partition_keys} FROM {views_set[1]}",
+                                                   verbose=not during_nemesis)
         if not after_update_rows:
             DataValidatorEvent.UpdatedRowsValidator(
                 severity=Severity.WARNING,
@@ -525,9 +582,9 @@ class LongevityDataValidator:
             ).publish()
             return None
 
-        expected_rows = fetch_all_rows(session=session, default_fetch_size=self.DEFAULT_FETCH_SIZE,
-                                       statement=f"SELECT {partition_keys} FROM {views_set[2]}",
-                                       verbose=not during_nemesis)
+        expected_rows = self.fetch_sorted_rows(session=session,
+                                               statement=f"SELECT {partition_keys} FROM {views_set[2]}",
+                                               verbose=not during_nemesis)
         if not expected_rows:
             DataValidatorEvent.UpdatedRowsValidator(
                 severity=Severity.WARNING,
@@ -537,8 +594,8 @@ class LongevityDataValidator:
             return None
 
         return DataForValidation(views=views_set,
-                                 actual_data=sorted(before_update_rows + after_update_rows),
-                                 expected_data=sorted(expected_rows),
+                                 actual_data=SortedRows(heapq.merge(before_update_rows, after_update_rows)),
+                                 expected_data=expected_rows,
                                  before_update_rows=before_update_rows,
                                  after_update_rows=after_update_rows)
 
@@ -551,30 +608,30 @@ class LongevityDataValidator:
 
         with open(os.path.join(logdir, f"{data_for_validation.views[0]}_{unique_index}_debug.json"), "w",
                   encoding='utf8') as json_file:
-            json.dump(sorted(data_for_validation.before_update_rows), json_file)
+            LongevityDataValidator.dump_rows(data_for_validation.before_update_rows, json_file)
             LOGGER.info("before_update_rows json: %s", json_file.name)
 
         with open(os.path.join(logdir, f"{data_for_validation.views[1]}_{unique_index}_debug.json"), "w",
                   encoding='utf8') as json_file:
-            json.dump(sorted(data_for_validation.after_update_rows), json_file)
+            LongevityDataValidator.dump_rows(data_for_validation.after_update_rows, json_file)
             LOGGER.info("after_update_rows json: %s", json_file.name)
 
         with open(os.path.join(logdir, f"{data_for_validation.views[2]}_{unique_index}_debug.json"), "w",
                   encoding='utf8') as json_file:
-            json.dump(sorted(data_for_validation.expected_data), json_file)
+            LongevityDataValidator.dump_rows(data_for_validation.expected_data, json_file)
             LOGGER.info("expected_rows json: %s", json_file.name)
 
         with open(os.path.join(logdir, f"{data_for_validation.views[0]}_{unique_index}_actual_data_debug.json"), "w",
                   encoding='utf8') as json_file:
-            json.dump(sorted(data_for_validation.actual_data), json_file)
+            LongevityDataValidator.dump_rows(data_for_validation.actual_data, json_file)
             LOGGER.info("actual_data json: %s", json_file.name)
 
         return logdir
 
     def analyze_updated_data_and_save_in_file(self, data_for_validation: DataForValidation, session, logdir: str):
-        actual_data_set = {tuple(item) for item in sorted(data_for_validation.actual_data)}
-        expected_data_set = {tuple(item) for item in sorted(data_for_validation.expected_data)}
-        difference_set = expected_data_set - actual_data_set  # missed in the actual data after update
+        # missed in the actual data after update
+        difference_set = iter_missing(expected=data_for_validation.expected_data,
+                                      actual=data_for_validation.actual_data)
 
         if not self.base_table_name:
             DataValidatorEvent.UpdatedRowsValidator(
@@ -723,8 +780,7 @@ class LongevityDataValidator:
                              len(data_for_validation.expected_data))
                 continue
 
-            if (len(data_for_validation.actual_data) != len(data_for_validation.expected_data)) \
-                    or data_for_validation.actual_data != data_for_validation.expected_data:
+            if data_for_validation.actual_data != data_for_validation.expected_data:
                 LOGGER.debug("%s. Rows amount:\n  before update: %s\n  after update: %s\n  expected: %s\n "
                              "actual: %s",
                              data_for_validation.views[0], len(data_for_validation.before_update_rows),
@@ -760,9 +816,9 @@ class LongevityDataValidator:
         if not during_nemesis:
             LOGGER.debug('Verify deleted rows')
 
-        actual_result = fetch_all_rows(session=session, default_fetch_size=self.DEFAULT_FETCH_SIZE,
-                                       statement=f"SELECT {pk_name} FROM "
-                                                 f"{self.view_name_for_deletion_data}", verbose=not during_nemesis)
+        actual_result = self.count_rows(session=session,
+                                        statement=f"SELECT {pk_name} FROM {self.view_name_for_deletion_data}",
+                                        verbose=not during_nemesis)
         if actual_result is None:
             DataValidatorEvent.DeletedRowsValidator(
                 severity=Severity.ERROR,
@@ -771,7 +827,7 @@ class LongevityDataValidator:
             ).publish()
             return
 
-        if len(actual_result) < self.rows_before_deletion:
+        if actual_result < self.rows_before_deletion:
             if not during_nemesis:
                 # raise info event in the end of test only
                 DataValidatorEvent.DeletedRowsValidator(
@@ -780,12 +836,12 @@ class LongevityDataValidator:
                 ).publish()
             else:
                 LOGGER.debug('Validation deleted rows finished successfully')
-        elif len(actual_result) == self.rows_before_deletion:
+        elif actual_result == self.rows_before_deletion:
             DataValidatorEvent.DeletedRowsValidator(
                 severity=Severity.WARNING,
                 message="Rows were not deleted. Maybe need to increase dataset for delete."
             ).publish()
         else:
             LOGGER.warning('Deleted row were not found. May be issue #6181. '
-                           'Actual dataset length: {}, Expected dataset length: {}'.format(len(actual_result),
+                           'Actual dataset length: {}, Expected dataset length: {}'.format(actual_result,
                                                                                            self.rows_before_deletion))
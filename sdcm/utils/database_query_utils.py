@@ -16,15 +16,18 @@ from __future__ import absolute_import, annotations
 
 import logging
 import os
+import queue
 import sys
-from typing import List
+import threading
+from typing import Iterator, List
 
 from cassandra import ConsistencyLevel
+from cassandra.concurrent import execute_concurrent_with_args
+from cassandra.query import SimpleStatement
 
 from sdcm.sct_events import Severity
 from sdcm.sct_events.health import PartitionRowsValidationEvent
 from sdcm.sct_events.system import TestFrameworkEvent
-from sdcm.utils.common import PageFetcher
 from sdcm.utils.decorators import retrying, optional_stage
 
 LOGGER = logging.getLogger(__name__)
@@ -38,15 +41,19 @@ class PartitionsValidationAttributes:
     """
     PARTITIONS_ROWS_BEFORE = "partitions_rows_before"
     PARTITIONS_ROWS_AFTER = "partitions_rows_after"
+    COUNT_RETRIES = 3
+    COUNT_TIMEOUT = 600  # client side timeout of a count, longer than `using timeout 5m' of the query
 
     def __init__(self, tester, table_name: str, primary_key_column: str, limit_rows_number: int = 0,
                  max_partitions_in_test_table: str | None = None,
-                 partition_range_with_data_validation: str | None = None, validate_partitions: bool = False):
+                 partition_range_with_data_validation: str | None = None, validate_partitions: bool = False,
+                 max_concurrent_queries: int = 100):
         """
         limit_rows_number is a limit for querying rows per partition.
         When running a health-check and calling "validate_partitions",
         it would nor read more than this number of rows-per-partition.
         The default is NO limit_rows_number, marked by '0'.
+        max_concurrent_queries is a limit of partitions counted at once.
         """
         self.tester = tester
         self.table_name = table_name
@@ -58,6 +65,7 @@ class PartitionsValidationAttributes:
         self.limit_rows_number = limit_rows_number
         self.partitions_dict_before = None
         self.validate_partitions = validate_partitions
+        self.max_concurrent_queries = int(max_concurrent_queries)
 
     def _init_partition_range(self):
         if self.partition_range_with_data_validation:
@@ -87,51 +95,73 @@ class PartitionsValidationAttributes:
         # Unless ignore_limit_rows_number is True.
 
         error_message = "Failed to collect partition info. Error details: {}"
+        save_into_file_name = self.PARTITIONS_ROWS_BEFORE \
+            if not self.partitions_rows_collected else self.PARTITIONS_ROWS_AFTER
+        partitions_stats_file = os.path.join(self.tester.logdir, save_into_file_name)
         try:
             with self.db_cluster.cql_connection_patient(node=self.db_cluster.nodes[0],
                                                         connect_timeout=600) as session:
                 session.default_consistency_level = ConsistencyLevel.QUORUM
+                session.default_timeout = self.COUNT_TIMEOUT
                 pk_list = sorted(get_partition_keys(ks_cf=self.table_name, session=session,
                                                     pk_name=self.primary_key_column))
+                if self.partition_range_with_data_validation:
+                    # Count existing partitions that intersects with partition_range_with_data_validation
+                    pk_list = [partition for partition in pk_list if
+                               int(partition) in range(self.partition_start_range,
+                                                       self.partition_end_range)]
+                LOGGER.debug("%s partition-keys to query are in range: %s - %s", len(pk_list), pk_list[0], pk_list[-1])
+
+                # Collect data about partitions' rows amount.
+                with open(partitions_stats_file, 'a', encoding="utf-8") as stats_file:
+                    partitions = self.count_partitions_rows(session=session, pk_list=pk_list, stats_file=stats_file,
+                                                            ignore_limit_rows_number=ignore_limit_rows_number)
         except Exception as exc:  # noqa: BLE001
             TestFrameworkEvent(source=self.__class__.__name__, message=error_message.format(exc),
                                severity=Severity.ERROR).publish()
             return None
 
-        # Collect data about partitions' rows amount.
-        partitions = {}
-        if self.partition_range_with_data_validation:
-            # Count existing partitions that intersects with partition_range_with_data_validation
-            pk_list = [partition for partition in pk_list if
-                       int(partition) in range(self.partition_start_range,
-                                               self.partition_end_range)]
-        save_into_file_name = self.PARTITIONS_ROWS_BEFORE \
-            if not self.partitions_rows_collected else self.PARTITIONS_ROWS_AFTER
-        partitions_stats_file = os.path.join(self.tester.logdir, save_into_file_name)
-        LOGGER.debug("%s partition-keys to query are in range: %s - %s", len(pk_list), pk_list[0], pk_list[-1])
-        with open(partitions_stats_file, 'a', encoding="utf-8") as stats_file:
-            for i in pk_list:
-                count_pk_rows_cmd = self.get_count_pk_rows_query(key=i,
-                                                                 ignore_limit_rows_number=ignore_limit_rows_number)
-                try:
-                    with self.db_cluster.cql_connection_patient(node=self.db_cluster.nodes[0],
-                                                                connect_timeout=600) as session:
-                        pk_rows_num_query_result = fetch_all_rows(session=session, default_fetch_size=3000,
-                                                                  statement=count_pk_rows_cmd, retries=1, timeout=600,
-                                                                  raise_on_exceeded=True, verbose=False)
-                        pk_rows_num_result = pk_rows_num_query_result[0].count
-                except Exception as exc:  # noqa: BLE001
-                    TestFrameworkEvent(source=self.__class__.__name__, message=error_message.format(exc),
-                                       severity=Severity.ERROR).publish()
-                    return None
-
-                partitions[i] = pk_rows_num_result
-                stats_file.write('{i}:{rows}, '.format(i=i, rows=partitions[i]))
         LOGGER.info('File with partitions row data: {}'.format(partitions_stats_file))
         if save_into_file_name == self.PARTITIONS_ROWS_BEFORE:
             self.partitions_rows_collected = True
         return partitions
 
+    def count_partitions_rows(self, session, pk_list: list, stats_file,
+                              ignore_limit_rows_number: bool = False) -> dict[int, int]:
+        """
+        Count rows of the partitions using a single session, up to `max_concurrent_queries' partitions at once.
+
+        The query is prepared, so the token-aware policy of the session sends each count to a replica of the
+        partition and the work is split across the nodes by token ranges.  Results are written to `stats_file'
+        as they arrive.  A failed (e.g., timed out) count doesn't stop others, such keys are counted again
+        after all other ones, up to COUNT_RETRIES times.
+        """
+        statement = session.prepare(self.get_count_pk_rows_query(key="?",
+                                                                 ignore_limit_rows_number=ignore_limit_rows_number))
+        statement.consistency_level = ConsistencyLevel.QUORUM
+        partitions = {}
+        keys = pk_list
+        for attempt in range(self.COUNT_RETRIES + 1):
+            failed = {}
+            results = execute_concurrent_with_args(session=session, statement=statement,
+                                                   parameters=[(key, ) for key in keys],
+                                                   concurrency=self.max_concurrent_queries,
+                                                   raise_on_first_error=False, results_generator=True)
+            for key, (success, result) in zip(keys, results):
+                if not success:
+                    failed[key] = result
+                    continue
+                partitions[key] = result.one().count
+                stats_file.write('{i}:{rows}, '.format(i=key, rows=partitions[key]))
+            if not failed:
+                break
+            keys = list(failed)
+            LOGGER.warning("Failed to count rows of %s partitions (attempt %s), first error: %s",
+                           len(keys), attempt + 1, next(iter(failed.values())))
+        else:
+            raise next(iter(failed.values()))
+        return partitions
+
     def collect_initial_partitions_info(self) -> None:
         LOGGER.debug('Save partitions info before reads')
         self.partitions_dict_before = self.collect_partitions_info(ignore_limit_rows_number=True)
@@ -224,12 +254,65 @@ def get_partition_keys(ks_cf: str, session, pk_name: str = 'pk', limit: int = No
     return pks_list
 
 
+def stream_rows(session, statement, fetch_size: int = 5000, prefetch_pages: int = 2, timeout: float | None = None,
+                consistency_level=ConsistencyLevel.QUORUM) -> Iterator:
+    """
+    Iterate over rows returned by a paged query.
+
+    Next pages are requested in background while the rows of the previous ones are consumed, but not more than
+    `prefetch_pages' pages are kept in memory, so memory usage doesn't depend on the size of the result.
+    `timeout' is the max time to wait for a page.
+    """
+    if isinstance(statement, str):
+        statement = SimpleStatement(statement, fetch_size=fetch_size, consistency_level=consistency_level)
+    pages = queue.Queue()
+    lock = threading.Lock()
+    buffered_pages = 0
+    fetching = True
+    future = session.execute_async(statement) if timeout is None else session.execute_async(statement,
+                                                                                            timeout=timeout)
+
+    def fetch_next_page():
+        # Should be called with the lock held.
+        nonlocal fetching
+        if not fetching and future.has_more_pages and buffered_pages < prefetch_pages:
+            fetching = True
+            future.start_fetching_next_page()
+
+    def handle_page(rows):
+        nonlocal buffered_pages, fetching
+        with lock:
+            fetching = False
+            buffered_pages += 1
+            pages.put(rows)
+            if future.has_more_pages:
+                fetch_next_page()
+            else:
+                pages.put(None)
+
+    future.add_callbacks(callback=handle_page, errback=pages.put)
+    while True:
+        try:
+            page = pages.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No page of `{statement}' results received in {timeout} seconds") from None
+        if page is None:
+            return
+        if isinstance(page, BaseException):
+            raise page
+        with lock:
+            buffered_pages -= 1
+            fetch_next_page()
+        yield from page
+
+
 def fetch_all_rows(session, default_fetch_size, statement, retries: int = 4, timeout: int = None,
                    raise_on_exceeded: bool = False, verbose=True):
     """
     ******* Caution *******
     All data from table will be read to the memory
     BE SURE that the builder has enough memory and your dataset will be less then 2Gb.
+    Use `stream_rows()' to process big results.
     """
     if verbose:
         LOGGER.debug("Fetch all rows by statement: %s", statement)
@@ -240,10 +323,8 @@ def fetch_all_rows(session, default_fetch_size, statement, retries: int = 4, tim
 
     @retrying(n=retries, sleep_time=5, message='Fetch all rows', raise_on_exceeded=raise_on_exceeded)
     def _fetch_rows() -> list:
-        result = session.execute_async(statement)
-        fetcher = PageFetcher(result).request_all() if not timeout else \
-            PageFetcher(result).request_all(timeout=timeout)
-        return fetcher.all_data()
+        return list(stream_rows(session=session, statement=statement, fetch_size=default_fetch_size,
+                                timeout=timeout))
 
     current_rows = _fetch_rows()
     if verbose and current_rows:
@@ -15,10 +15,9 @@ import sys
 import time
 import logging
 import datetime
-import json
-import os
 from functools import wraps, partial, cached_property
-from typing import Optional, Callable
+from concurrent.futures import Future
+from typing import Any, Optional, Callable
 
 from botocore.exceptions import ClientError
 
@@ -177,6 +176,14 @@ def _find_hdr_tags(*args):
     raise ValueError("Failed to find 'hdr_tags'")
 
 
+def _get_latency_stage_result(stages: dict[str, Future], stage: str, default: Any) -> Any:
+    try:
+        return stages[stage].result()
+    except Exception as err:  # noqa: BLE001
+        LOGGER.error("Failed to get %s of latency cycle: %s", stage, err)
+        return default
+
+
 def latency_calculator_decorator(original_function: Optional[Callable] = None, *, legend: Optional[str] = None,
                                  cycle_name: Optional[str] = None, workload_type: Optional[str] = None):
     """
@@ -185,6 +192,7 @@ def latency_calculator_decorator(original_function: Optional[Callable] = None, *
     For proper usage, it requires workload name (write, read, mixed) to be included in the test name
     or setting 'workload_name' test parameter.
     Also requires monitoring set and 'use_hdrhistogram' test parameter to be set to True.
+    The results are collected in background (see `LatencyCyclesPipeline'), flush the pipeline before reading them.
 
     :param func: Remote method to run.
     :return: Wrapped method.
@@ -229,7 +237,6 @@ def latency_calculator_decorator(original_function: Optional[Callable] = None, *
             if not monitoring_set or not monitoring_set.nodes:
                 return res
             monitor = monitoring_set.nodes[0]
-            screenshots = monitoring_set.get_grafana_screenshots(node=monitor, test_start_time=start)
             if workload_type:
                 workload = workload_type
             elif 'read' in test_name:
@@ -243,80 +250,64 @@ def latency_calculator_decorator(original_function: Optional[Callable] = None, *
             else:
                 return res
 
-            latency_results_file_path = tester.latency_results_file
-            if not os.path.exists(latency_results_file_path):
-                latency_results = {}
-            else:
-                with open(latency_results_file_path, encoding="utf-8") as file:
-                    data = file.read().strip()
-                    latency_results = json.loads(data or '{}')
-
-            if "steady" not in func_name.lower():
-                if func_name not in latency_results:
-                    latency_results[func_name] = {"legend": legend or func_name}
-                if 'cycles' not in latency_results[func_name]:
-                    latency_results[func_name]['cycles'] = []
-
-            result = latency.collect_latency(monitor, start, end, workload, cluster, all_nodes_list)
-            result["screenshots"] = screenshots
-            result["duration"] = f"{datetime.timedelta(seconds=int(end - start))}"
-            result["duration_in_sec"] = int(end - start)
-
             try:
                 hdr_tags = _find_hdr_tags(kwargs, res, _self)
             except Exception as err:  # noqa: BLE001
                 LOGGER.error("Failed to find 'hdr_tags': %s", err)
                 hdr_tags = []
-            try:
-                result["hdr"] = tester.get_hdrhistogram_by_interval(
-                    hdr_tags=hdr_tags, stress_operation=workload,
-                    start_time=start, end_time=end)
-                LOGGER.debug("hdr: %s", result["hdr"])
-            except Exception as err:  # noqa: BLE001
-                LOGGER.error("Failed to get hdrhistogram_by_interval error: %s", err)
-                result["hdr"] = {}
 
-            try:
-                result["hdr_summary"] = tester.get_hdrhistogram(
-                    hdr_tags=hdr_tags, stress_operation=workload,
-                    start_time=start, end_time=end)
-            except Exception as err:  # noqa: BLE001
-                LOGGER.error("Failed to get hdrhistogram error: %s", err)
-                result["hdr_summary"] = {}
-            hdr_throughput = 0
-            for summary, values in result["hdr_summary"].items():
-                hdr_throughput += values["throughput"]
-            result["cycle_hdr_throughput"] = round(hdr_throughput)
-            result["reactor_stalls_stats"] = reactor_stall_stats
-            error_thresholds = tester.params.get("latency_decorator_error_thresholds")
-            if "steady" in func_name.lower():
-                if 'Steady State' not in latency_results:
-                    latency_results['Steady State'] = result
+            def persist(stages):
+                result = _get_latency_stage_result(stages, "latency", default={})
+                result["screenshots"] = _get_latency_stage_result(stages, "screenshots", default=[])
+                result["duration"] = f"{datetime.timedelta(seconds=int(end - start))}"
+                result["duration_in_sec"] = int(end - start)
+                result["hdr"] = _get_latency_stage_result(stages, "hdr", default={})
+                LOGGER.debug("hdr: %s", result["hdr"])
+                result["hdr_summary"] = _get_latency_stage_result(stages, "hdr_summary", default={})
+                hdr_throughput = 0
+                for summary, values in result["hdr_summary"].items():
+                    hdr_throughput += values["throughput"]
+                result["cycle_hdr_throughput"] = round(hdr_throughput)
+                result["reactor_stalls_stats"] = reactor_stall_stats
+                error_thresholds = tester.params.get("latency_decorator_error_thresholds")
+                if "steady" in func_name.lower():
+                    if tester.latency_results_journal.add_steady_state(result):
+                        send_result_to_argus(
+                            argus_client=tester.test_config.argus_client(),
+                            workload=workload,
+                            name="Steady State",
+                            description="Latencies without any operation running",
+                            cycle=0,
+                            result=result,
+                            start_time=start,
+                            error_thresholds=error_thresholds,
+                        )
+                else:
+                    cycle = tester.latency_results_journal.add_cycle(func_name, result, legend=legend)
                     send_result_to_argus(
                         argus_client=tester.test_config.argus_client(),
                         workload=workload,
-                        name="Steady State",
-                        description="Latencies without any operation running",
-                        cycle=0,
+                        name=f"{func_name}",
+                        description=legend or "",
+                        cycle=cycle,
                         result=result,
                         start_time=start,
                         error_thresholds=error_thresholds,
                     )
-            else:
-                latency_results[func_name]['cycles'].append(result)
-                send_result_to_argus(
-                    argus_client=tester.test_config.argus_client(),
-                    workload=workload,
-                    name=f"{func_name}",
-                    description=legend or "",
-                    cycle=len(latency_results[func_name]['cycles']),
-                    result=result,
-                    start_time=start,
-                    error_thresholds=error_thresholds,
-                )
-
-            with open(latency_results_file_path, 'w', encoding="utf-8") as file:
-                json.dump(latency_results, file)
+
+            # Collection of the results takes minutes, don't delay the next nemesis by it.
+            tester.latency_cycles_pipeline.submit(
+                name=func_name,
+                stages={
+                    "screenshots": partial(monitoring_set.get_grafana_screenshots,
+                                           node=monitor, test_start_time=start, test_end_time=end),
+                    "latency": partial(latency.collect_latency, monitor, start, end, workload, cluster, all_nodes_list),
+                    "hdr": partial(tester.get_hdrhistogram_by_interval,
+                                   hdr_tags=hdr_tags, stress_operation=workload, start_time=start, end_time=end),
+                    "hdr_summary": partial(tester.get_hdrhistogram,
+                                           hdr_tags=hdr_tags, stress_operation=workload, start_time=start, end_time=end),
+                },
+                persist=persist)
 
             return res
 
@@ -0,0 +1,123 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+"""
+External sort of rows which don't have to fit into memory.
+
+Rows are sorted in chunks, all chunks except the last one are spilled to temporary files and the chunks are
+merged lazily on iteration.  Comparison of two sorted sequences is done by a single pass over both of them.
+"""
+
+import os
+import heapq
+import pickle
+import shutil
+import tempfile
+import weakref
+from itertools import zip_longest
+from typing import Any, Iterable, Iterator, Optional
+
+_MISSING = object()
+
+
+class SortedRows:
+    """
+    Sorted rows which can be iterated many times, memory usage is O(`chunk_size').
+
+    Rows should be comparable and picklable (e.g., tuples, not the driver's named tuples.)
+    """
+    DEFAULT_CHUNK_SIZE = 100_000
+
+    def __init__(self, rows: Iterable, chunk_size: int = DEFAULT_CHUNK_SIZE, tmp_dir: Optional[str] = None):
+        self._tmp_dir = None
+        self._finalizer = None
+        self._runs: list[str] = []
+        self._count = 0
+        chunk = []
+        try:
+            for row in rows:
+                chunk.append(row)
+                self._count += 1
+                if len(chunk) >= chunk_size:
+                    self._spill(chunk, tmp_dir)
+                    chunk = []
+        except BaseException:
+            self.close()
+            raise
+        chunk.sort()
+        self._chunk = chunk
+
+    def _spill(self, chunk: list, tmp_dir: Optional[str]) -> None:
+        if self._tmp_dir is None:
+            self._tmp_dir = tempfile.mkdtemp(prefix="sct-sorted-rows-", dir=tmp_dir)
+            self._finalizer = weakref.finalize(self, shutil.rmtree, self._tmp_dir, ignore_errors=True)
+        chunk.sort()
+        path = os.path.join(self._tmp_dir, f"run-{len(self._runs)}.pickle")
+        with open(path, "wb") as run_file:
+            for row in chunk:
+                pickle.dump(row, run_file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._runs.append(path)
+
+    @staticmethod
+    def _read_run(path: str) -> Iterator:
+        with open(path, "rb") as run_file:
+            while True:
+                try:
+                    yield pickle.load(run_file)
+                except EOFError:
+                    return
+
+    @property
+    def spilled(self) -> bool:
+        return bool(self._runs)
+
+    def __iter__(self) -> Iterator:
+        return heapq.merge(self._chunk, *(self._read_run(path) for path in self._runs))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, SortedRows) and len(self) != len(other):
+            return False
+        return all(row == other_row for row, other_row in zip_longest(self, other, fillvalue=_MISSING))
+
+    __hash__ = None
+
+    def close(self) -> None:
+        if self._finalizer is not None:
+            self._finalizer()
+        self._runs = []
+        self._chunk = []
+        self._count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+def iter_missing(expected: Iterable, actual: Iterable) -> Iterator:
+    """Yield distinct rows of sorted `expected' which are not in sorted `actual'."""
+    actual = iter(actual)
+    actual_row = next(actual, _MISSING)
+    previous = _MISSING
+    for row in expected:
+        if previous is not _MISSING and row == previous:
+            continue
+        previous = row
+        while actual_row is not _MISSING and actual_row < row:
+            actual_row = next(actual, _MISSING)
+        if actual_row is _MISSING or actual_row != row:
+            yield row
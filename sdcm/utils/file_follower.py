@@ -0,0 +1,260 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+"""Follow many growing log files by one thread and dispatch their lines to handlers."""
+
+from __future__ import annotations
+
+import os
+import logging
+import threading
+from typing import NamedTuple, Optional, Protocol
+from concurrent.futures import Future
+
+from sdcm.utils.inotify import Inotify, IN_ATTRIB, IN_CREATE, IN_MODIFY, IN_MOVED_TO, IN_Q_OVERFLOW
+
+LOGGER = logging.getLogger(__name__)
+
+
+class LineHandler(Protocol):
+    def process_line(self, line_number: int, line: str) -> int:
+        """Process a line of the followed file and return the number of events published."""
+
+
+class FollowedFileStats(NamedTuple):
+    filename: str
+    lines: int
+    events: int
+
+
+def reopen_if_replaced(filename: str, input_file, position: int):
+    """
+    Check if the followed file was truncated or rotated.
+
+    Return `input_file' rewound to the beginning if the file was truncated, a new file object if the file was
+    rotated, or None if the file is still the same.
+    """
+    try:
+        stat = os.stat(filename)
+    except FileNotFoundError:
+        return None
+    fstat = os.fstat(input_file.fileno())
+    if fstat.st_size < position:
+        LOGGER.debug("%s was truncated, read it from the beginning", filename)
+        input_file.seek(0)
+        return input_file
+    if (stat.st_dev, stat.st_ino) != (fstat.st_dev, fstat.st_ino):
+        LOGGER.debug("%s was rotated, read the new file from the beginning", filename)
+        input_file.close()
+        return open(filename, "rb")
+    return None
+
+
+class FollowedFile:
+    """A file followed by FileFollowerService: keeps the read position, the incomplete last line and counters."""
+
+    def __init__(self, filename: str, handler: LineHandler, service: FileFollowerService):
+        self.filename = filename
+        self.path = os.path.abspath(filename)
+        self.handler = handler
+        self.future = Future()
+        self.lines_count = 0
+        self.events_count = 0
+        self.stop_requested = False
+        self._service = service
+        self._file = None
+        self._position = 0
+        self._pending = b""
+
+    @property
+    def stats(self) -> FollowedFileStats:
+        return FollowedFileStats(filename=self.filename, lines=self.lines_count, events=self.events_count)
+
+    def stop(self) -> None:
+        self.stop_requested = True
+        self._service.wake()
+
+    def _dispatch(self, line: bytes) -> None:
+        line_number = self.lines_count
+        self.lines_count += 1
+        try:
+            self.events_count += self.handler.process_line(line_number, line.decode("utf-8", errors="replace")) or 0
+        except Exception:  # noqa: BLE001
+            LOGGER.exception("Failed to process line #%s of %s", line_number, self.filename)
+
+    def read(self, max_chunks: int, chunk_size: int) -> bool:
+        """Dispatch complete lines of new data and return True if there can be more data to read."""
+        if self._file is None:
+            try:
+                self._file = open(self.filename, "rb")
+            except FileNotFoundError:
+                return False
+        for _ in range(max_chunks):
+            if chunk := self._file.read(chunk_size):
+                self._position += len(chunk)
+                *lines, self._pending = (self._pending + chunk).split(b"\n")
+                for line in lines:
+                    self._dispatch(line + b"\n")
+                continue
+            if (reopened := reopen_if_replaced(self.filename, self._file, self._position)) is None:
+                return False
+            if self._pending and reopened is not self._file:
+                self._dispatch(self._pending)
+            self._file, self._position, self._pending = reopened, 0, b""
+        return True
+
+    def close(self) -> None:
+        if self._pending:
+            self._dispatch(self._pending)
+            self._pending = b""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class FileFollowerService:
+    """
+    Follow any number of log files by a single thread.
+
+    Directories of the followed files are watched using inotify, so a file is read only after it was
+    modified, created or moved to its place, and only complete lines are dispatched to the handler of the file.
+    If inotify is not available, all followed files are checked every `poll_interval' seconds.  The thread is
+    started by the first `follow()' call and exits after the last followed file is stopped.
+    """
+
+    chunk_size = 64 * 1024
+    max_chunks_per_pass = 16  # don't let a single busy file starve other followed files
+    poll_interval = 0.1  # seconds
+    inotify_wait_timeout = 1  # seconds, just in case an inotify event was lost (e.g., on network filesystems)
+    directory_watch_mask = IN_MODIFY | IN_ATTRIB | IN_CREATE | IN_MOVED_TO
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._followed: list[FollowedFile] = []
+        self._thread: Optional[threading.Thread] = None
+        self._inotify: Optional[Inotify] = None
+        self._wakeup_event = threading.Event()
+
+    def follow(self, filename: str, handler: LineHandler) -> FollowedFile:
+        """Start to follow the file; the future of the returned object is done after it's stopped and drained."""
+        followed = FollowedFile(filename=filename, handler=handler, service=self)
+        with self._lock:
+            self._followed.append(followed)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="FileFollowerService", daemon=True)
+                self._thread.start()
+        self.wake()
+        return followed
+
+    def stats(self) -> list[FollowedFileStats]:
+        with self._lock:
+            return [followed.stats for followed in self._followed]
+
+    def wake(self) -> None:
+        with self._lock:
+            if inotify := self._inotify:
+                inotify.wake()
+            else:
+                self._wakeup_event.set()
+
+    def _open_inotify(self) -> Optional[Inotify]:
+        try:
+            inotify = Inotify()
+        except OSError as exc:
+            LOGGER.debug("inotify is not available (%s), poll followed files every %ss", exc, self.poll_interval)
+            return None
+        with self._lock:
+            self._inotify = inotify
+        return inotify
+
+    def _close_inotify(self, inotify: Inotify) -> None:
+        with self._lock:
+            if self._inotify is inotify:
+                self._inotify = None
+        inotify.close()
+
+    def _sync_watches(self, inotify: Inotify, dir_watches: dict[str, int], followed_files: list[FollowedFile]) -> None:
+        directories = {os.path.dirname(followed.path) for followed in followed_files}
+        for directory in set(dir_watches) - directories:
+            inotify.rm_watch(dir_watches.pop(directory))
+        for directory in directories - set(dir_watches):
+            try:
+                dir_watches[directory] = inotify.add_watch(directory, self.directory_watch_mask)
+            except OSError as exc:
+                # The directory doesn't exist yet or out of inotify watches: rely on the periodical rescan.
+                LOGGER.debug("Failed to watch %s: %s", directory, exc)
+
+    def _wait(self, inotify: Optional[Inotify], dir_watches: dict[str, int]) -> Optional[set[str]]:
+        """Wait for changes and return paths of changed files, or None if all files should be checked."""
+        if inotify is None:
+            self._wakeup_event.wait(self.poll_interval)
+            self._wakeup_event.clear()
+            return None
+        events = inotify.wait(timeout=self.inotify_wait_timeout)
+        if not events or any(event.mask & IN_Q_OVERFLOW for event in events):
+            return None  # a timeout, a wakeup or lost events
+        directories = {wd: directory for directory, wd in dir_watches.items()}
+        return {os.path.join(directories[event.wd], event.name) for event in events if event.wd in directories}
+
+    def _run(self) -> None:
+        inotify = self._open_inotify()
+        dir_watches = {}  # directory -> watch descriptor
+        changed = None
+        try:
+            while True:
+                with self._lock:
+                    if not (followed_files := list(self._followed)):
+                        self._thread = None
+                        return
+                if inotify:
+                    self._sync_watches(inotify, dir_watches, followed_files)
+                more_data = False
+                for followed in followed_files:
+                    if changed is None or followed.path in changed or followed.stop_requested:
+                        more_data |= followed.read(max_chunks=self.max_chunks_per_pass, chunk_size=self.chunk_size)
+                    if followed.stop_requested:
+                        while followed.read(max_chunks=self.max_chunks_per_pass, chunk_size=self.chunk_size):
+                            pass
+                        self._unfollow(followed)
+                changed = None if more_data else self._wait(inotify, dir_watches)
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.exception("FileFollowerService failed")
+            with self._lock:
+                followed_files, self._followed, self._thread = self._followed, [], None
+            for followed in followed_files:
+                followed.future.set_exception(exc)
+        finally:
+            if inotify:
+                self._close_inotify(inotify)
+
+    def _unfollow(self, followed: FollowedFile) -> None:
+        with self._lock:
+            self._followed.remove(followed)
+        try:
+            followed.close()
+        finally:
+            followed.future.set_result(followed.stats)
+
+
+_SERVICE_LOCK = threading.Lock()
+_SERVICE: Optional[FileFollowerService] = None
+_SERVICE_PID: Optional[int] = None
+
+
+def get_file_follower_service() -> FileFollowerService:
+    """Return the file follower service of the current process."""
+    global _SERVICE, _SERVICE_PID  # noqa: PLW0603
+    with _SERVICE_LOCK:
+        if _SERVICE is None or _SERVICE_PID != os.getpid():  # threads don't survive fork()
+            _SERVICE, _SERVICE_PID = FileFollowerService(), os.getpid()
+        return _SERVICE
@@ -1,20 +1,25 @@
 import glob
 import os.path
 import time
+import bisect
 import logging
+import functools
+import threading
 import multiprocessing
-from typing import Any
+from typing import Iterator
 from dataclasses import asdict, dataclass, make_dataclass
 from concurrent.futures.process import ProcessPoolExecutor
 
 from hdrh.histogram import HdrHistogram
-from hdrh.log import HistogramLogReader
+from hdrh.log import re_start_time, re_base_time, re_histogram_interval
 
 LOGGER = logging.getLogger(__file__)
 
 PROCESS_LIMIT = multiprocessing.cpu_count()
 TIME_INTERVAL = 600
 PERCENTILES = [50, 90, 95, 99, 99.9, 99.99, 99.999]
+# Decoded interval histogram takes ~300KB of memory.
+DECODED_INTERVALS_CACHE_SIZE = 256
 
 
 def make_hdrhistogram_summary(
@@ -117,6 +122,145 @@ class _HdrRangeHistogram:
     histogram: _HdrHistogram | None
 
 
+class _HdrLogIndex:
+    """
+    Index of interval lines of a HDR log file: tag, start timestamps and byte offset of every interval.
+
+    Timestamps are calculated the same way as HistogramLogReader does, so a range query returns the same
+    intervals as reading of the file with HistogramLogReader, but without reading and decoding of lines
+    which are out of the range or have another tag.  The index is extended when the file grows.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.reset()
+
+    def reset(self) -> None:
+        self.size = 0
+        self.tags: list[str | None] = []
+        self.absolute_start_times: list[float] = []
+        self.relative_start_times: list[float] = []
+        self.end_times: list[float] = []
+        self.offsets: list[int] = []
+        self.lengths: list[int] = []
+        self._sorted = {True: True, False: True}  # keyed by `absolute'
+
+        # HistogramLogReader state.
+        self._start_time_sec = 0.0
+        self._observed_start_time = False
+        self._base_time_sec = 0.0
+        self._observed_base_time = False
+
+    def update(self) -> None:
+        if (size := os.path.getsize(self.path)) < self.size:
+            self.reset()  # the file was rewritten
+        if size == self.size:
+            return
+        with open(self.path, "rb") as hdr_file:
+            hdr_file.seek(self.size)
+            offset = self.size
+            for line in hdr_file:
+                if not line.endswith(b"\n"):
+                    break  # the line is still being written
+                self._index_line(line.decode("utf-8", errors="replace"), offset, len(line))
+                offset += len(line)
+        self.size = offset
+
+    def _index_line(self, line: str, offset: int, length: int) -> None:
+        if line[0] == "#":
+            if match_res := re_start_time.match(line):
+                self._start_time_sec = float(match_res.group(1))
+                self._observed_start_time = True
+                return
+            if match_res := re_base_time.match(line):
+                self._base_time_sec = float(match_res.group(1))
+                self._observed_base_time = True
+                return
+        if line.startswith("Tag="):
+            index = line.find(",")
+            tag = line[4:index]
+            line = line[index + 1:]
+        else:
+            tag = None
+        if not (match_res := re_histogram_interval.match(line)):
+            return  # probably a legend line that starts with "\"StartTimestamp"
+        log_time_stamp_in_sec = float(match_res.group(1))
+        interval_length_sec = float(match_res.group(2))
+        if not self._observed_start_time:
+            self._start_time_sec = log_time_stamp_in_sec
+            self._observed_start_time = True
+        if not self._observed_base_time:
+            if log_time_stamp_in_sec < self._start_time_sec - (365 * 24 * 3600.0):
+                self._base_time_sec = self._start_time_sec
+            else:
+                self._base_time_sec = 0.0
+            self._observed_base_time = True
+        absolute_start_time = log_time_stamp_in_sec + self._base_time_sec
+        relative_start_time = absolute_start_time - self._start_time_sec
+        if self.offsets:
+            self._sorted[True] &= self.absolute_start_times[-1] <= absolute_start_time
+            self._sorted[False] &= self.relative_start_times[-1] <= relative_start_time
+        self.tags.append(tag)
+        self.absolute_start_times.append(absolute_start_time)
+        self.relative_start_times.append(relative_start_time)
+        self.end_times.append(absolute_start_time + interval_length_sec)
+        self.offsets.append(offset)
+        self.lengths.append(length)
+
+    def find(self, range_start_time_sec: float, range_end_time_sec: float, absolute: bool) -> list[int]:
+        """
+        Return numbers of intervals which HistogramLogReader returns for the time range: skip intervals
+        started before the range and stop on the first interval started after the range.
+        """
+        start_times = self.absolute_start_times if absolute else self.relative_start_times
+        first = bisect.bisect_left(start_times, range_start_time_sec) if self._sorted[absolute] else 0
+        intervals = []
+        for number in range(first, len(start_times)):
+            if (start_time := start_times[number]) < range_start_time_sec:
+                continue
+            if start_time > range_end_time_sec:
+                break
+            intervals.append(number)
+        return intervals
+
+    def get_interval_histogram(self, number: int) -> HdrHistogram:
+        return _decode_interval_histogram(self.path, self.offsets[number], self.lengths[number],
+                                          self.absolute_start_times[number], self.end_times[number])
+
+
+@functools.lru_cache(maxsize=DECODED_INTERVALS_CACHE_SIZE)
+def _decode_interval_histogram(path: str, offset: int, length: int,
+                               start_time_sec: float, end_time_sec: float) -> HdrHistogram:
+    """Decode interval histogram from the HDR log line. Don't modify returned histogram, it's cached."""
+    with open(path, "rb") as hdr_file:
+        hdr_file.seek(offset)
+        line = hdr_file.read(length).decode("utf-8", errors="replace")
+    tag = None
+    if line.startswith("Tag="):
+        index = line.find(",")
+        tag = line[4:index]
+        line = line[index + 1:]
+    histogram = HdrHistogram.decode(re_histogram_interval.match(line).group(4))
+    histogram.set_start_time_stamp(start_time_sec * 1000.0)
+    histogram.set_end_time_stamp(end_time_sec * 1000.0)
+    if tag:
+        histogram.set_tag(tag)
+    return histogram
+
+
+_HDR_LOG_INDEXES: dict[str, _HdrLogIndex] = {}
+_HDR_LOG_INDEXES_LOCK = threading.Lock()
+
+
+def get_hdr_log_index(path: str) -> _HdrLogIndex:
+    """Return up-to-date index of the HDR log file (built once per process and extended if the file grows.)"""
+    with _HDR_LOG_INDEXES_LOCK:
+        if (hdr_log_index := _HDR_LOG_INDEXES.get(path)) is None:
+            hdr_log_index = _HDR_LOG_INDEXES[path] = _HdrLogIndex(path)
+        hdr_log_index.update()
+    return hdr_log_index
+
+
 class _HdrRangeHistogramBuilder:
     def __init__(self, hdr_tags: list[str], stress_operation: str,
                  start_time: int | float, end_time: int | float,
@@ -145,6 +289,9 @@ class _HdrRangeHistogramBuilder:
                                                interval=TIME_INTERVAL) -> list[dict[str, dict[str, int]]]:
         """
         Build Several Range Histogram Summaries from provided hdr logs files path splitted by interval
+
+        Every hdr log file is processed once (in parallel with other files) and its intervals are collected
+        to histograms for all time windows and hdr tags, after that histograms from all files are merged.
         """
         start_ts = int(self.start_time)
         end_ts = int(self.end_time)
@@ -152,35 +299,74 @@ class _HdrRangeHistogramBuilder:
             window_step = int(end_ts - start_ts)
         else:
             window_step = interval or TIME_INTERVAL
-
-        futures = []
-        interval_num = 0
-        start_intervals = range(start_ts, end_ts, window_step)
-
-        max_workers = len(start_intervals)*len(self.hdr_tags)
-        max_workers = PROCESS_LIMIT if max_workers > PROCESS_LIMIT else max_workers
-
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            for start_interval in start_intervals:
-                end_interval = end_ts if start_interval + window_step > end_ts else start_interval + window_step
-                for hdr_tag in self.hdr_tags:
-                    futures.append(executor.submit(self._build_histograms_summary_with_interval_by_tag,
-                                                   path, hdr_tag, start_interval, end_interval, interval_num))
-                interval_num += 1
-            results = {}
+        windows = [(start_interval, min(start_interval + window_step, end_ts))
+                   for start_interval in range(start_ts, end_ts, window_step)]
+
+        if os.path.isfile(path):
+            hdr_files = [path]
+        elif os.path.isdir(path):
+            hdr_files = []
+            for hdr_file in self._get_list_of_hdr_files(path):
+                if os.stat(hdr_file).st_size == 0:
+                    LOGGER.error("File %s is empty", hdr_file)
+                    continue
+                hdr_files.append(hdr_file)
+        else:
+            return []
+        if not hdr_files:
+            return []
+
+        with ProcessPoolExecutor(max_workers=min(len(hdr_files), PROCESS_LIMIT)) as executor:
+            futures = [executor.submit(self._build_file_histograms_by_windows, hdr_file, windows)
+                       for hdr_file in hdr_files]
+            histograms: dict[tuple[int, str], _HdrHistogram] = {}
             for future in futures:
-                if res := future.result():
-                    if res["interval_num"] not in results:
-                        results[res["interval_num"]] = {}
-                    results[res["interval_num"]].update(res["result"])
+                for (interval_num, hdr_tag), (encoded, start_ms, end_ms) in future.result().items():
+                    file_histogram = HdrHistogram.decode(encoded)
+                    file_histogram.set_start_time_stamp(start_ms)
+                    file_histogram.set_end_time_stamp(end_ms)
+                    if (histogram := histograms.get((interval_num, hdr_tag))) is None:
+                        histogram = histograms[(interval_num, hdr_tag)] = _HdrHistogram()
+                        histogram.set_tag(hdr_tag)
+                        histogram.set_start_time_stamp(start_ms)
+                    histogram.add(file_histogram)
 
-        keys = list(results.keys())
-        keys.sort()
         summary = []
-        for key in keys:
-            summary.append(results[key])
+        for interval_num, (start_interval, end_interval) in enumerate(windows):
+            interval_summary = {}
+            for hdr_tag in self.hdr_tags:
+                if (histogram := histograms.get((interval_num, hdr_tag))) is None:
+                    continue
+                if result := self._get_summary_for_operation_by_hdr_tag(_HdrRangeHistogram(
+                        start_time=start_interval, end_time=end_interval, histogram=histogram, hdr_tag=hdr_tag)):
+                    interval_summary.update(result)
+            if interval_summary:
+                summary.append(interval_summary)
         return summary
 
+    def _build_file_histograms_by_windows(
+            self, hdr_file: str, windows: list[tuple[int, int]]) -> dict[tuple[int, str], tuple[bytes, float, float]]:
+        """
+        Build histograms of the hdr log file for every time window and hdr tag.
+
+        Return encoded histograms with their start and end timestamps keyed by (interval number, hdr tag).
+        """
+        histograms = {}
+        for interval_num, (start_interval, end_interval) in enumerate(windows):
+            window_builder = _HdrRangeHistogramBuilder(
+                hdr_tags=self.hdr_tags,
+                stress_operation=self.stress_operation,
+                start_time=start_interval,
+                end_time=end_interval,
+            )
+            for hdr_tag in self.hdr_tags:
+                range_histogram = window_builder._build_histogram_from_file(hdr_file, hdr_tag)
+                if range_histogram and range_histogram.histogram:
+                    histogram = range_histogram.histogram
+                    histograms[(interval_num, hdr_tag)] = (
+                        histogram.encode(), histogram.get_start_time_stamp(), histogram.get_end_time_stamp())
+        return histograms
+
     def build_from_log_line(self, log_line: str, hst_log_start_time: float) -> dict[str, dict[str, int]] | None:
         """
         Build Range Histogram Summary from provided log_line
@@ -203,47 +389,26 @@ class _HdrRangeHistogramBuilder:
         return self._get_summary_for_operation_by_hdr_tag(histogram)
 
     def _build_histogram_from_file(self, hdr_file: str, hdr_tag: str) -> _HdrRangeHistogram | None:
-        def analyze_hdr_file():
-            """
-            :return: tuple(tag_not_found, file_with_correct_time_interval)
-            tag_not_found: bool - row with HDR tag (like "WRITE-st") is not found in the file
-            file_with_correct_time_interval: bool - HDR file keep the data for different time interval
-            """
-            hdr_reader = HistogramLogReader(hdr_file, _HdrHistogram())
-            if not (next_hist := hdr_reader.get_next_interval_histogram(range_start_time_sec=self.start_time,
-                                                                        range_end_time_sec=self.end_time,
-                                                                        absolute=self.absolute_time)):
-                return True, False
-
-            tag_not_found = True
-            file_with_correct_time_interval = True
-            while next_hist:
-                tag = next_hist.get_tag()
-                if tag == hdr_tag:
-                    if histogram.get_start_time_stamp() == 0:
-                        histogram.set_start_time_stamp(next_hist.get_start_time_stamp())
-                    histogram.add(next_hist)
-                    tag_not_found = False
-
-                next_hist = hdr_reader.get_next_interval_histogram(range_start_time_sec=self.start_time,
-                                                                   range_end_time_sec=self.end_time,
-                                                                   absolute=self.absolute_time)
-            return tag_not_found, file_with_correct_time_interval
-
         if not os.path.exists(hdr_file):
             LOGGER.error("File doesn't exists: %s", hdr_file)
             return _HdrRangeHistogram(start_time=0, end_time=0, histogram=None, hdr_tag=None)
 
-        histogram = _HdrHistogram()
-        histogram.set_tag(hdr_tag)
-        _, file_with_correct_time_interval = analyze_hdr_file()
-
-        if not file_with_correct_time_interval:
+        hdr_log_index = get_hdr_log_index(hdr_file)
+        if not (intervals := hdr_log_index.find(range_start_time_sec=self.start_time,
+                                                range_end_time_sec=self.end_time,
+                                                absolute=self.absolute_time)):
             # Keep this message for future debug
             LOGGER.debug("The file '%s' does not include the time interval from `%s` to `%s`",
                          hdr_file, self.start_time, self.end_time)
             return None
 
+        histogram = _HdrHistogram()
+        histogram.set_tag(hdr_tag)
+        for next_hist in self._iter_interval_histograms(hdr_log_index, intervals, hdr_tag):
+            if histogram.get_start_time_stamp() == 0:
+                histogram.set_start_time_stamp(next_hist.get_start_time_stamp())
+            histogram.add(next_hist)
+
         # Keep this message for future debug
         LOGGER.debug("Collect data from the file '%s' (time interval from `%s` to `%s`)",
                      hdr_file, self.start_time, self.end_time)
@@ -253,6 +418,13 @@ class _HdrRangeHistogramBuilder:
         return _HdrRangeHistogram(
             start_time=self.start_time, end_time=self.end_time, histogram=histogram, hdr_tag=histogram.get_tag())
 
+    @staticmethod
+    def _iter_interval_histograms(hdr_log_index: _HdrLogIndex,
+                                  intervals: list[int], hdr_tag: str) -> Iterator[HdrHistogram]:
+        for number in intervals:
+            if hdr_log_index.tags[number] == hdr_tag:
+                yield hdr_log_index.get_interval_histogram(number)
+
     def _get_list_of_hdr_files(self, base_path: str) -> list[str]:
         """
             find all hdr log file by pattern like glob wc
@@ -360,17 +532,3 @@ class _HdrRangeHistogramBuilder:
             return None
 
         return self._get_summary_for_operation_by_hdr_tag(histogram)
-
-    def _build_histograms_summary_with_interval_by_tag(
-            self, path: str, hdr_tag: str,
-            start_interval: int, end_interval: int,
-            interval_num: int) -> dict[str, Any] | None:
-        result = _HdrRangeHistogramBuilder(
-            hdr_tags=[hdr_tag],
-            stress_operation=self.stress_operation,
-            start_time=start_interval,
-            end_time=end_interval,
-        ).build_histogram_summary_by_tag(path, hdr_tag)
-        if result:
-            return {"interval_num": interval_num, "result": result}
-        return None
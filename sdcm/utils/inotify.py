@@ -0,0 +1,141 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+"""Minimal ctypes binding for inotify(7) Linux API."""
+
+import os
+import errno
+import select
+import struct
+import ctypes
+import threading
+import ctypes.util
+from typing import NamedTuple, Optional
+from functools import lru_cache
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+READ_BUFFER_SIZE = 64 * 1024
+
+
+class InotifyEvent(NamedTuple):
+    wd: int
+    mask: int
+    cookie: int
+    name: str
+
+
+@lru_cache(maxsize=None)
+def _get_libc() -> ctypes.CDLL:
+    libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    for func in (libc.inotify_init1, libc.inotify_add_watch, libc.inotify_rm_watch):
+        func.restype = ctypes.c_int
+    return libc
+
+
+def _check(result: int) -> int:
+    if result < 0:
+        error = ctypes.get_errno()
+        raise OSError(error, os.strerror(error))
+    return result
+
+
+class Inotify:
+    """
+    inotify instance which can be waited for events by one thread and woken up by another.
+
+    Raises OSError if inotify is not available (e.g., not Linux or out of inotify instances/watches.)
+    """
+
+    def __init__(self):
+        try:
+            libc = _get_libc()
+            self._fd = _check(libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC))
+        except AttributeError as exc:
+            raise OSError(errno.ENOSYS, "inotify is not supported") from exc
+        self._wakeup_read_fd, self._wakeup_write_fd = os.pipe()
+        os.set_blocking(self._wakeup_read_fd, False)
+        os.set_blocking(self._wakeup_write_fd, False)
+        self._poller = select.poll()
+        self._poller.register(self._fd, select.POLLIN)
+        self._poller.register(self._wakeup_read_fd, select.POLLIN)
+        self._closed = False
+        self._close_lock = threading.Lock()
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def add_watch(self, path: str, mask: int) -> int:
+        return _check(_get_libc().inotify_add_watch(self._fd, os.fsencode(path), ctypes.c_uint32(mask)))
+
+    def rm_watch(self, wd: int) -> None:
+        _get_libc().inotify_rm_watch(self._fd, wd)  # the watch can be removed by the kernel already
+
+    def read_events(self) -> list[InotifyEvent]:
+        events = []
+        while True:
+            try:
+                data = os.read(self._fd, READ_BUFFER_SIZE)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset < len(data):
+                wd, mask, cookie, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+                events.append(InotifyEvent(wd=wd, mask=mask, cookie=cookie, name=os.fsdecode(name)))
+
+    def wait(self, timeout: Optional[float] = None) -> list[InotifyEvent]:
+        """Wait for events for `timeout' seconds (forever if None) or till `wake()' call."""
+        self._poller.poll(None if timeout is None else timeout * 1000)
+        try:
+            while os.read(self._wakeup_read_fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        return self.read_events()
+
+    def wake(self) -> None:
+        with self._close_lock:
+            if self._closed:
+                return
+            try:
+                os.write(self._wakeup_write_fd, b"\0")
+            except BlockingIOError:
+                pass  # the pipe is full, i.e., already woken up
+
+    def close(self) -> None:
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            for fd in (self._fd, self._wakeup_read_fd, self._wakeup_write_fd):
+                os.close(fd)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
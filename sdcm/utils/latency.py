@@ -10,15 +10,11 @@
 # See LICENSE for more details.
 #
 # Copyright (c) 2020 ScyllaDB
-import statistics
 from typing import Any
 
 from sdcm.argus_results import LATENCY_ERROR_THRESHOLDS
 from sdcm.db_stats import PrometheusDBStats
-
-
-def avg(values):
-    return sum(values)/len(values)
+from sdcm.utils.metric_series import MetricSeries
 
 
 def collect_latency(monitor_node, start, end, load_type, cluster, nodes_list):  # noqa: PLR0914
@@ -28,41 +24,33 @@ def collect_latency(monitor_node, start, end, load_type, cluster, nodes_list):
     cassandra_stress_precision = ['99', '95']  # in the future should include also 'max'
     scylla_precision = ['99']  # in the future should include also '95', '5'
     threshold = 10  # ms
+    loads = ['read', 'write'] if load_type == 'mixed' else [load_type]
+
+    queries = {}
+    for precision in cassandra_stress_precision:
+        perc = precision if precision == 'max' else f'perc_{precision}'
+        queries[('c-s', precision)] = f'sct_cassandra_stress_{load_type}_gauge{{type="lat_{perc}"}}'
+    for load in loads:
+        for precision in scylla_precision:
+            queries[(load, precision)] = f'histogram_quantile(0.{precision},sum(rate(scylla_storage_proxy_' \
+                                         f'coordinator_{load}_latency_bucket{{}}[{duration}s])) by (instance, le))'
+    results = prometheus.query_many(queries, start, end)
 
     for precision in cassandra_stress_precision:
         metric = f'c-s {precision}' if precision == 'max' else f'c-s P{precision}'
-        if not precision == 'max':
-            precision = f'perc_{precision}'  # noqa: PLW2901
-        query = f'sct_cassandra_stress_{load_type}_gauge{{type="lat_{precision}"}}'
-        query_res = prometheus.query(query, start, end)
-        latency_values_lst = []
-        max_latency_values_lst = []
-        for entry in query_res:
-            if not entry['values']:
-                continue
-            sequence = [float(val[-1]) for val in entry['values'] if not val[-1].lower() == 'nan']
-            if not sequence or all(val == sequence[0] for val in sequence):
-                continue
-            latency_values_lst.extend(sequence)
-            max_latency_values_lst.extend(sequence)
-
-        if latency_values_lst:
-            res[metric] = float(format(avg(latency_values_lst), '.2f'))
-            res[f'{metric}_stdev'] = float(format(statistics.stdev(latency_values_lst), '.2f'))
-            res[f'{metric}_points_above_threshold'] = len([v for v in latency_values_lst if v > threshold])
-        if max_latency_values_lst:
-            res[f'{metric} max'] = float(format(max(max_latency_values_lst), '.2f'))
-
-    if load_type == 'mixed':
-        load_type = ['read', 'write']
-    else:
-        load_type = [load_type]
+        query_res = results[('c-s', precision)]
+        sequences = (MetricSeries.from_prometheus_values(entry['values']) for entry in query_res)
+        latency_values = MetricSeries.concatenate(sequence for sequence in sequences if not sequence.is_constant())
 
-    for load in load_type:
+        if latency_values:
+            res[metric] = float(format(latency_values.mean(), '.2f'))
+            res[f'{metric}_stdev'] = float(format(latency_values.stdev(), '.2f'))
+            res[f'{metric}_points_above_threshold'] = latency_values.count_above(threshold)
+            res[f'{metric} max'] = float(format(latency_values.max(), '.2f'))
+
+    for load in loads:
         for precision in scylla_precision:
-            query = f'histogram_quantile(0.{precision},sum(rate(scylla_storage_proxy_coordinator_{load}_' \
-                    f'latency_bucket{{}}[{duration}s])) by (instance, le))'
-            query_res = prometheus.query(query, start, end)
+            query_res = results[(load, precision)]
             for entry in query_res:
                 node_ip = entry['metric']['instance'].replace('[', '').replace(']', '')
                 node = cluster.get_node_by_ip(node_ip)
@@ -76,11 +64,9 @@ def collect_latency(monitor_node, start, end, load_type, cluster, nodes_list):
                     continue
                 node_name = f'node-{node_idx}'
                 metric = f"Scylla P{precision}_{load} - {node_name}"
-                if not entry['values']:
-                    continue
-                sequence = [float(val[-1]) for val in entry['values'] if not val[-1].lower() == 'nan']
+                sequence = MetricSeries.from_prometheus_values(entry['values'])
                 if sequence:
-                    res[metric] = float(format(avg(sequence) / 1000, '.2f'))
+                    res[metric] = float(format(sequence.mean() / 1000, '.2f'))
 
     return res
 
@@ -115,7 +101,7 @@ def calculate_latency(latency_results):
         for temp_key, temp_val in temp_dict.items():
             if 'Cycles Average' not in result_dict[key]:
                 result_dict[key]['Cycles Average'] = {}
-            average = float(format(avg([float(val) for val in temp_val]), '.2f'))
+            average = float(format(MetricSeries(map(float, temp_val)).mean(), '.2f'))
             result_dict[key]['Cycles Average'][temp_key] = average
             if 'Relative to Steady' not in result_dict[key]:
                 result_dict[key]['Relative to Steady'] = {}
@@ -0,0 +1,147 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+"""
+Append-only store of latency results collected by `latency_calculator_decorator'.
+
+Every cycle (or the steady state window) is a single JSON line appended to the file, so recording a cycle doesn't
+depend on the size of the results collected so far.  A line w/o the record marker is a whole results dict: that's
+the format of a compacted journal and also of the results files written before the journal was introduced.
+"""
+
+import os
+import json
+import logging
+import threading
+from collections import Counter
+from typing import Any, Iterator
+
+LOGGER = logging.getLogger(__name__)
+
+RECORD_KEY = "journal_record"
+STEADY_STATE = "Steady State"
+
+
+class LatencyResultsJournal:
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._cycles = None  # number of cycles per name, counted on first append
+        self._has_steady_state = False
+
+    def iter_records(self) -> Iterator[dict[str, Any]]:
+        """Stream records of the journal; a torn line left by a crash in the middle of an append is skipped."""
+        try:
+            file = open(self.path, encoding="utf-8")  # noqa: SIM115
+        except FileNotFoundError:
+            return
+        with file:
+            for line_number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    LOGGER.warning("%s:%d: skip corrupted latency results record", self.path, line_number)
+
+    def load(self) -> dict[str, Any]:
+        """Reconstruct the results dict in the format expected by `calculate_latency()' and the reporters."""
+        results = {}
+        for record in self.iter_records():
+            match record.get(RECORD_KEY):
+                case None:
+                    results = record
+                case "steady_state":
+                    results.setdefault(STEADY_STATE, record["result"])
+                case "cycle":
+                    name = record["name"]
+                    entry = results.setdefault(name, {"legend": record.get("legend") or name})
+                    entry.setdefault("cycles", []).append(record["result"])
+                case unknown:
+                    LOGGER.warning("%s: unknown latency results record type: %s", self.path, unknown)
+        return results
+
+    def _build_index(self) -> None:
+        self._cycles, self._has_steady_state = Counter(), False
+        for record in self.iter_records():
+            match record.get(RECORD_KEY):
+                case None:
+                    self._cycles = Counter({name: len(value["cycles"]) for name, value in record.items()
+                                            if isinstance(value, dict) and "cycles" in value})
+                    self._has_steady_state = STEADY_STATE in record
+                case "steady_state":
+                    self._has_steady_state = True
+                case "cycle":
+                    self._cycles[record["name"]] += 1
+
+    def _append(self, record: dict[str, Any]) -> None:
+        data = (json.dumps(record) + "\n").encode("utf-8")
+        fd = os.open(self.path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            if (size := os.fstat(fd).st_size) and os.pread(fd, 1, size - 1) != b"\n":
+                data = b"\n" + data  # don't glue the record to a torn one
+            while data:
+                data = data[os.write(fd, data):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def add_cycle(self, name: str, result: dict[str, Any], legend: str | None = None) -> int:
+        """Append a cycle of `name' and return its number (1-based.)"""
+        with self._lock:
+            if self._cycles is None:
+                self._build_index()
+            self._append({RECORD_KEY: "cycle", "name": name, "legend": legend, "result": result})
+            self._cycles[name] += 1
+            return self._cycles[name]
+
+    def add_steady_state(self, result: dict[str, Any]) -> bool:
+        """Record the steady state results, only the first ones are kept; return True if recorded."""
+        with self._lock:
+            if self._cycles is None:
+                self._build_index()
+            if self._has_steady_state:
+                return False
+            self._append({RECORD_KEY: "steady_state", "result": result})
+            self._has_steady_state = True
+            return True
+
+    def compact(self, results: dict[str, Any] | None = None) -> dict[str, Any]:
+        """
+        Atomically replace the journal by a single results dict.
+
+        If `results' are not given then the journal records are merged, otherwise given results (e.g., with
+        calculated stats) replace the journal.
+        """
+        with self._lock:
+            if results is None:
+                results = self.load()
+            if not results and not os.path.exists(self.path):
+                return results
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(results, file)
+                file.write("\n")
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, self.path)
+            self._cycles = None
+            return results
+
+    def clear(self) -> None:
+        with self._lock:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+            self._cycles = None
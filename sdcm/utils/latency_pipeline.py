@@ -0,0 +1,154 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+"""
+Background post-processing of latency cycles (see `latency_calculator_decorator'.)
+
+Stages of a cycle (Grafana screenshots, Prometheus queries, HDR histograms) don't depend on each other, so they
+run concurrently on the parallel executor and the decorated nemesis returns without waiting for them.  When all
+stages of a cycle are done, its persist function runs; persist functions run one at a time and in the order the
+cycles were submitted, so the cycles are numbered and stored the same way as when they were processed inline.
+
+The task groups of the pipeline are detached: cycles are submitted by nemeses, which could run as tasks of some
+group (e.g., of a ParallelObject), and pending cycles shouldn't be cancelled when that group is.
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable
+
+from sdcm.utils.parallel_executor import TaskGroup, TaskStats, get_parallel_executor
+
+LOGGER = logging.getLogger(__name__)
+
+TASK_NAME_PREFIX = "latency_cycle."
+
+
+@dataclass
+class _Cycle:
+    name: str
+    stages: dict[str, Future]
+    persist: Callable[[dict[str, Future]], None]
+    pending: int = field(default=0)
+
+
+class LatencyCyclesPipeline:
+    """
+    Bounded queue of latency cycles being post-processed.
+
+    At most `max_pending_cycles' cycles are in flight, `submit()' blocks until a slot is free.
+    """
+
+    def __init__(self, max_pending_cycles: int = 4, max_workers_per_stage: int = 2):
+        if max_pending_cycles <= 0:
+            raise ValueError("max_pending_cycles must be greater than 0")
+        self.max_pending_cycles = max_pending_cycles
+        self.max_workers_per_stage = max_workers_per_stage
+        self._lock = threading.Lock()
+        self._cycle_done = threading.Condition(self._lock)
+        self._persist_submit_lock = threading.Lock()  # keeps the order of cycles submitted to the persist group
+        self._cycles: deque[_Cycle] = deque()
+        self._in_flight = 0
+        self._groups: dict[str, TaskGroup] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _task_group(self, stage: str) -> TaskGroup:
+        # Should be called with the lock held.
+        if stage not in self._groups:
+            max_workers = 1 if stage == "persist" else self.max_workers_per_stage
+            self._groups[stage] = get_parallel_executor().task_group(
+                max_workers=max_workers, name=f"{TASK_NAME_PREFIX}{stage}", detached=True)
+        return self._groups[stage]
+
+    def submit(self, name: str, stages: dict[str, Callable], persist: Callable[[dict[str, Future]], None]) -> None:
+        """
+        Run `stages' concurrently and then call `persist' with the futures of the stages.
+
+        Stages are callables w/o arguments, `persist' should get results of the futures and handle their errors.
+        """
+        with self._lock:
+            while self._in_flight >= self.max_pending_cycles:
+                self._cycle_done.wait()
+            self._in_flight += 1
+            cycle = _Cycle(name=name, stages={}, persist=persist, pending=len(stages))
+            self._cycles.append(cycle)
+            for stage, func in stages.items():
+                cycle.stages[stage] = self._task_group(stage).submit(func)
+        for future in cycle.stages.values():
+            future.add_done_callback(lambda _, cycle=cycle: self._stage_done(cycle))
+        if not stages:
+            self._stage_done(cycle, count=0)
+
+    def _stage_done(self, cycle: _Cycle, count: int = 1) -> None:
+        # The persist task is submitted w/o holding the lock, since it could be run by the current thread.
+        with self._persist_submit_lock:
+            ready = []
+            with self._lock:
+                cycle.pending -= count
+                # Keep the order: a cycle is persisted only after all cycles submitted before it.
+                while self._cycles and self._cycles[0].pending <= 0:
+                    ready.append(self._cycles.popleft())
+                persist_group = self._task_group("persist")
+            for ready_cycle in ready:
+                future = persist_group.submit(self._persist, ready_cycle)
+                future.add_done_callback(lambda future, cycle=ready_cycle: self._persist_done(cycle, future))
+
+    def _persist(self, cycle: _Cycle) -> None:
+        try:
+            cycle.persist(cycle.stages)
+        except Exception:
+            LOGGER.exception("Failed to persist results of latency cycle %s", cycle.name)
+        finally:
+            self._cycle_finished()
+
+    def _persist_done(self, cycle: _Cycle, future: Future) -> None:
+        if future.cancelled():
+            LOGGER.warning("Persisting of latency cycle %s was cancelled", cycle.name)
+            self._cycle_finished()
+
+    def _cycle_finished(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._cycle_done.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until all submitted cycles are persisted; return False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    LOGGER.warning("%d latency cycles are still being processed", self._in_flight)
+                    return False
+                self._cycle_done.wait(remaining)
+        return True
+
+    @staticmethod
+    def get_stage_stats() -> dict[str, TaskStats]:
+        """Timing of the stages, it's collected by the parallel executor under `latency_cycle.<stage>' names."""
+        return {name.removeprefix(TASK_NAME_PREFIX): stats
+                for name, stats in get_parallel_executor().get_task_stats().items()
+                if name.startswith(TASK_NAME_PREFIX)}
+
+    def log_stage_stats(self) -> None:
+        for stage, stats in sorted(self.get_stage_stats().items()):
+            LOGGER.info("Latency cycles %s stage: %d tasks (%d failed), run time: %.1fs total, %.1fs max, "
+                        "wait time: %.1fs total",
+                        stage, stats.count, stats.failed, stats.run_time, stats.max_run_time, stats.wait_time)
@@ -0,0 +1,192 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+import os
+import re
+from typing import Iterator, List, Optional, Tuple
+
+from sdcm.utils.pattern_set import PatternSet
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+TUNING_SAMPLE_SIZE = 1024 * 1024
+NON_ASCII_RE = re.compile(rb"[\x80-\xff]")
+
+
+class LiteralsPrefilter:
+    """
+    Find lines in a bytes buffer which may match any pattern of the given pattern sets.
+
+    Every pattern in a PatternSet has groups of literals and every line matched by the pattern contains
+    a literal of each group.  It's enough to look for literals of one group only, so the group with
+    the fewest occurrences in the first scanned megabyte is chosen for every pattern.  If some pattern
+    has no literals at all, every line is a candidate.
+    """
+
+    def __init__(self, *pattern_sets: PatternSet, extra_literals: Tuple[str, ...] = ()):
+        self._groups_per_pattern = [[(literal.lower().encode(), )] for literal in extra_literals]
+        self.match_all = False
+        for pattern_set in pattern_sets:
+            for entry in pattern_set.entries:
+                if not entry.literal_groups:
+                    self.match_all = True
+                self._groups_per_pattern.append(
+                    [tuple(literal.lower().encode() for literal in group) for group in entry.literal_groups])
+        self._occurrences = dict.fromkeys(
+            (literal for groups in self._groups_per_pattern for group in groups for literal in group), 0)
+        self._sampled_size = 0
+        self._literals: List[bytes] = []
+
+    def _choose_literals(self, sample: bytes) -> None:
+        for literal in self._occurrences:
+            self._occurrences[literal] += sample.count(literal)
+        self._sampled_size += len(sample)
+        literals = set()
+        for groups in filter(None, self._groups_per_pattern):
+            literals.update(min(groups, key=lambda group: (sum(self._occurrences[literal] for literal in group),
+                                                           -min(map(len, group)))))
+        self._literals = sorted(literals)
+
+    def line_starts(self, buffer: bytearray, start: int, end: int) -> List[int]:
+        """Return sorted offsets of the lines in buffer[start:end] which contain any of the literals."""
+        lowered = buffer[start:end].lower()
+        if self._sampled_size < TUNING_SAMPLE_SIZE:
+            self._choose_literals(lowered)
+        starts = set()
+        for literal in self._literals:
+            position = lowered.find(literal)
+            while position != -1:
+                starts.add(lowered.rfind(b"\n", 0, position) + 1)
+                if (position := lowered.find(b"\n", position)) == -1:
+                    break
+                position = lowered.find(literal, position)
+        if not lowered.isascii():
+            # regex case folding for non-ASCII chars differs from bytes.lower(), check such lines anyway
+            match = NON_ASCII_RE.search(lowered)
+            while match:
+                starts.add(lowered.rfind(b"\n", 0, match.start()) + 1)
+                if (position := lowered.find(b"\n", match.start())) == -1:
+                    break
+                match = NON_ASCII_RE.search(lowered, position)
+        return [start + line_start for line_start in sorted(starts)]
+
+
+class IncrementalLogScanner:
+    """
+    Scan lines appended to a log file since the previous scan.
+
+    The file is read as bytes in big chunks into one reusable buffer.  Only lines which pass the prefilter
+    are decoded, other lines are just counted.  A line without a trailing newline is postponed, since it
+    can be half-written, unless it's still there after `max_partial_line_retries' scans.
+    """
+
+    def __init__(self,  # noqa: PLR0913
+                 path: str,
+                 prefilter: Optional[LiteralsPrefilter] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 max_line_size: Optional[int] = None,
+                 max_partial_line_retries: int = 20):
+        self.path = path
+        self.prefilter = None if prefilter is None or prefilter.match_all else prefilter
+        self.max_line_size = max_line_size or chunk_size
+        self.max_partial_line_retries = max_partial_line_retries
+        self.position = 0
+        self.line_number = 0
+        self._buffer = bytearray(chunk_size)
+        self._buffer_position = 0
+        self._partial_line_position = None
+        self._partial_line_retries = 0
+        self._skip_rest_of_line = False
+
+    def seek_to_end(self) -> None:
+        try:
+            self.position = os.path.getsize(self.path)
+        except FileNotFoundError:
+            self.position = 0
+
+    def _decode(self, start: int, end: int) -> str:
+        return self._buffer[start:min(end, start + self.max_line_size)].decode("utf-8", errors="replace")
+
+    def _lines(self, start: int, end: int) -> Iterator[Tuple[int, str]]:
+        """Yield (line number, line) for the lines in the buffer[start:end] which pass the prefilter."""
+        buffer = self._buffer
+        if self.prefilter is None:
+            line_starts = None
+        else:
+            line_starts = iter(self.prefilter.line_starts(buffer, start, end))
+        counted = line_start = start
+        while True:
+            if line_starts is not None:
+                if (line_start := next(line_starts, None)) is None:
+                    break
+                self.line_number += buffer.count(b"\n", counted, line_start)
+            elif line_start >= end:
+                break
+            line_end = buffer.find(b"\n", line_start, end) + 1 or end
+            line_number = self.line_number
+            # keep the state consistent even if the consumer doesn't ask for the next line
+            self.line_number += 1
+            self.position = self._buffer_position + line_end
+            yield line_number, self._decode(line_start, line_end)
+            counted = line_start = line_end
+        if line_starts is not None:
+            self.line_number += buffer.count(b"\n", counted, end)
+        self.position = self._buffer_position + end
+
+    def _skip_line_head(self, size: int) -> Iterator[Tuple[int, str]]:
+        """Yield the head of a line which doesn't fit into the buffer, the rest of it will be skipped."""
+        self._skip_rest_of_line = True
+        self.position = self._buffer_position + size
+        if self.prefilter is None or self.prefilter.line_starts(self._buffer, 0, size):
+            yield self.line_number, self._decode(0, size)
+
+    def scan(self) -> Iterator[Tuple[int, str]]:  # noqa: PLR0912
+        """Yield (line number, line) for every line appended since the previous scan which pass the prefilter."""
+        try:
+            file_size = os.path.getsize(self.path)
+        except FileNotFoundError:
+            return
+        if file_size < self.position:
+            # the file was truncated or rotated, start over
+            self.position = 0
+            self._skip_rest_of_line = False
+        with open(self.path, "rb", buffering=0) as log_file:
+            while True:
+                self._buffer_position = self.position
+                log_file.seek(self._buffer_position)
+                if not (size := log_file.readinto(self._buffer)):
+                    return
+                start = 0
+                if self._skip_rest_of_line:
+                    if (start := self._buffer.find(b"\n", 0, size) + 1) == 0:
+                        self.position += size
+                        continue
+                    self._skip_rest_of_line = False
+                    self.line_number += 1
+                    self.position += start
+                end = self._buffer.rfind(b"\n", start, size) + 1
+                if end:
+                    yield from self._lines(start, end)
+                if end == size:
+                    continue
+                if size == len(self._buffer):
+                    if not end and not start:
+                        yield from self._skip_line_head(size)
+                    continue
+                # a line without a trailing newline at the end of the file
+                if self._partial_line_position != self.position:
+                    self._partial_line_position = self.position
+                    self._partial_line_retries = 0
+                self._partial_line_retries += 1
+                if self._partial_line_retries > self.max_partial_line_retries:
+                    yield from self._lines(end or start, size)
+                return
@@ -0,0 +1,121 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+"""
+Statistics of Prometheus range query series.
+
+A series of a multi-day run has hundreds of thousands of points, so values are parsed in bulk into a compact
+array of doubles and all the statistics are computed by built-ins looping in C instead of per-point Python code.
+"""
+
+import math
+import operator
+from array import array
+from itertools import compress, groupby
+from typing import Iterable, Sequence
+
+
+class MetricSeries:
+    """
+    Values of a metric with their timestamps.
+
+    NaN values (no data) are dropped by `from_prometheus_values()' only, values passed to the constructor are kept
+    as is.
+    """
+
+    __slots__ = ("timestamps", "values")
+
+    def __init__(self, values: Iterable[float] = (), timestamps: Iterable[float] | None = None):
+        self.values = array("d", values)
+        self.timestamps = array("d", range(len(self.values)) if timestamps is None else timestamps)
+        if len(self.timestamps) != len(self.values):
+            raise ValueError(f"Got {len(self.timestamps)} timestamps for {len(self.values)} values")
+
+    @classmethod
+    def from_prometheus_values(cls, values: Sequence[Sequence]) -> "MetricSeries":
+        """Parse `values' of a range query result, i.e., [[<timestamp>, "<value>"], ...]"""
+        if not values:
+            return cls()
+        timestamps, raw_values = zip(*values)
+        parsed = array("d", map(float, raw_values))
+        if any(nan_mask := list(map(math.isnan, parsed))):
+            keep = list(map(operator.not_, nan_mask))
+            return cls(compress(parsed, keep), compress(map(float, timestamps), keep))
+        return cls(parsed, map(float, timestamps))
+
+    @classmethod
+    def concatenate(cls, series: Iterable["MetricSeries"]) -> "MetricSeries":
+        result = cls()
+        for item in series:
+            result.values.extend(item.values)
+            result.timestamps.extend(item.timestamps)
+        return result
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} of {len(self)} values>"
+
+    def is_constant(self) -> bool:
+        return not self.values or min(self.values) == max(self.values)
+
+    def max(self) -> float:
+        return max(self.values)
+
+    def min(self) -> float:
+        return min(self.values)
+
+    def mean(self) -> float:
+        return sum(self.values) / len(self.values)
+
+    def _sum_of_squared_deviations(self) -> float:
+        deviations = array("d", map(self.mean().__rsub__, self.values))
+        return sum(map(operator.mul, deviations, deviations))
+
+    def stdev(self) -> float:
+        """Sample standard deviation, same as `statistics.stdev()'."""
+        if len(self.values) < 2:
+            raise ValueError("stdev requires at least two data points")
+        return math.sqrt(self._sum_of_squared_deviations() / (len(self.values) - 1))
+
+    def pstdev(self) -> float:
+        """Population standard deviation, same as `statistics.pstdev()'."""
+        return math.sqrt(self._sum_of_squared_deviations() / len(self.values))
+
+    def percentile(self, percent: float) -> float:
+        """Percentile with linear interpolation between closest ranks (the default method of NumPy.)"""
+        if not 0 <= percent <= 100:
+            raise ValueError(f"Percentile should be in [0, 100] range, got {percent}")
+        values = sorted(self.values)
+        rank = (len(values) - 1) * percent / 100
+        lower = math.floor(rank)
+        upper = min(lower + 1, len(values) - 1)
+        return values[lower] + (values[upper] - values[lower]) * (rank - lower)
+
+    def count_above(self, threshold: float) -> int:
+        return sum(map(float(threshold).__lt__, self.values))
+
+    def at_least(self, min_value: float) -> "MetricSeries":
+        """Return a series of the points with values not less than `min_value'."""
+        keep = list(map(float(min_value).__le__, self.values))
+        return self.__class__(compress(self.values, keep), compress(self.timestamps, keep))
+
+    def downsample(self, step: float) -> "MetricSeries":
+        """Average sorted by time points into `step' seconds long buckets timestamped by their start."""
+        values, timestamps = array("d"), array("d")
+        for bucket, points in groupby(zip(self.timestamps, self.values), key=lambda point: point[0] // step):
+            bucket_values = [value for _, value in points]
+            values.append(sum(bucket_values) / len(bucket_values))
+            timestamps.append(bucket * step)
+        return self.__class__(values, timestamps)
@@ -0,0 +1,322 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+"""
+Process wide pool of worker threads for running tasks in parallel (e.g., by ParallelObject.)
+
+Tasks are submitted via a TaskGroup, which limits the number of its tasks running at once, the same as
+`max_workers' of ThreadPoolExecutor does.  Worker threads are reused by all groups and exit after they were
+idle for a while.
+
+If `max_concurrency' of the executor is set, it's the limit of top-level tasks running at once in the process.
+Tasks submitted by a running task (i.e., nested ParallelObject calls) are not counted against the limit: they are
+limited by their group only, otherwise a parent task which waits for its subtasks could hold the last slot and
+deadlock.  When a group is cancelled (e.g., on a timeout), tasks of the group and of all groups created by its
+tasks which didn't start yet are cancelled too.
+
+A detached group has no parent even if it's created by a task, so it's not cancelled with the group of its
+creator, and its tasks are not counted against the limit either (its creator could wait for them while holding a
+slot.)  It's used for background work which outlives the task which started it (e.g., latency cycles pipeline.)
+
+The group of a running task is kept in a context variable and tasks run in a copy of the context they were
+submitted from.  Threads don't inherit the context (before Python 3.14), so groups created by a thread started
+by a task are top-level, unless the thread's target is wrapped with `in_current_context()' (or `parent' is passed
+to `task_group()' explicitly.)  If the task waits for such a thread and `max_concurrency' is set, the thread's
+tasks could wait for the slot held by the task forever, so targets of threads which tasks wait for (e.g., node
+setup threads of `wait_for_init()') should be wrapped.
+
+The number of worker threads is limited by `max_workers' of the executor.  When all of them are busy, top-level
+tasks wait for a free worker, and nested and detached tasks are run by the thread which submits them, since their
+parent could be one of the busy workers.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import logging
+import functools
+import threading
+import contextvars
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Callable, NamedTuple, Optional
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_GROUP_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)  # the same as ThreadPoolExecutor uses
+TASK_TIMINGS_HISTORY_SIZE = 1000
+
+_current_group: contextvars.ContextVar[Optional[TaskGroup]] = contextvars.ContextVar("current_task_group", default=None)
+
+
+class TaskTiming(NamedTuple):
+    name: str
+    wait_time: float  # seconds from the submission till start
+    run_time: float
+    failed: bool
+
+
+@dataclass
+class TaskStats:
+    count: int = 0
+    failed: int = 0
+    wait_time: float = 0.0
+    run_time: float = 0.0
+    max_run_time: float = 0.0
+
+    def add(self, timing: TaskTiming) -> None:
+        self.count += 1
+        self.failed += timing.failed
+        self.wait_time += timing.wait_time
+        self.run_time += timing.run_time
+        self.max_run_time = max(self.max_run_time, timing.run_time)
+
+
+class _Task(NamedTuple):
+    group: TaskGroup
+    future: Future
+    func: Callable
+    args: tuple
+    kwargs: dict
+    name: str
+    submit_time: float
+    context: contextvars.Context
+
+
+def current_task_group() -> Optional[TaskGroup]:
+    """Return the group of the task running in the current context, if any."""
+    return _current_group.get()
+
+
+def in_current_context(func: Callable) -> Callable:
+    """Wrap `func' to run in a copy of the current context, e.g., as a target of a thread started by a task."""
+    context = contextvars.copy_context()
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return context.copy().run(func, *args, **kwargs)  # a context can't be entered by several threads at once
+    return wrapper
+
+
+def task_cancelled() -> bool:
+    """Check if the task running in the current thread was cancelled, can be used by long tasks to stop early."""
+    return bool((group := current_task_group()) and group.cancelled)
+
+
+class TaskGroup:
+    """Tasks submitted by one caller; at most `max_workers' of them run at once."""
+
+    def __init__(self, executor: ParallelExecutor, max_workers: Optional[int] = None, name: Optional[str] = None,
+                 parent: Optional[TaskGroup] = None, detached: bool = False):
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+        if parent is not None and detached:
+            raise ValueError("a detached group can't have a parent")
+        self.executor = executor
+        self.max_workers = max_workers or DEFAULT_GROUP_MAX_WORKERS
+        self.name = name
+        self.detached = detached
+        self.parent = None if detached else parent or current_task_group()
+        self._lock = threading.Lock()
+        self._pending: deque[_Task] = deque()
+        self._running = 0
+        self._cancelled = False
+
+    @property
+    def nested(self) -> bool:
+        return self.parent is not None
+
+    @property
+    def concurrency_limited(self) -> bool:
+        """Tasks of top-level groups are counted against `max_concurrency' of the executor."""
+        return not (self.nested or self.detached)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled or (self.parent is not None and self.parent.cancelled)
+
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        future = Future()
+        task = _Task(group=self, future=future, func=func, args=args, kwargs=kwargs,
+                     name=self.name or getattr(func, "__qualname__", repr(func)), submit_time=time.perf_counter(),
+                     context=contextvars.copy_context())
+        with self._lock:
+            if self.cancelled:
+                future.cancel()
+                return future
+            if self._running >= self.max_workers:
+                self._pending.append(task)
+                return future
+            self._running += 1
+        if not self.executor._schedule(task):
+            self.executor._run(task)  # no free worker for a nested task
+        return future
+
+    def cancel(self) -> None:
+        """Cancel tasks which didn't start yet, including tasks of the groups created by tasks of this group."""
+        with self._lock:
+            self._cancelled = True
+            pending, self._pending = self._pending, deque()
+        for task in pending:
+            task.future.cancel()
+
+    def _task_done(self) -> Optional[_Task]:
+        """Schedule the next pending task, return it if it should be run by the current thread."""
+        with self._lock:
+            if not self._pending:
+                self._running -= 1
+                return None
+            task = self._pending.popleft()
+        return None if self.executor._schedule(task) else task
+
+
+class ParallelExecutor:
+    """Pool of worker threads which grows on demand up to `max_workers' and shrinks when the threads are idle."""
+
+    idle_worker_timeout = 60  # seconds
+    max_workers = 1024
+
+    def __init__(self, max_concurrency: Optional[int] = None):
+        self.max_concurrency = max_concurrency
+        self.task_timings: deque[TaskTiming] = deque(maxlen=TASK_TIMINGS_HISTORY_SIZE)
+        self._task_stats: dict[str, TaskStats] = {}
+        self._lock = threading.Lock()
+        self._work_available = threading.Condition(self._lock)
+        self._queue: deque[_Task] = deque()
+        self._waiting: deque[_Task] = deque()  # top-level tasks waiting for a free slot
+        self._top_level_running = 0
+        self._workers = 0
+        self._idle_workers = 0
+        self._worker_seq = 0
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    def task_group(self, max_workers: Optional[int] = None, name: Optional[str] = None,
+                   parent: Optional[TaskGroup] = None, detached: bool = False) -> TaskGroup:
+        return TaskGroup(executor=self, max_workers=max_workers, name=name, parent=parent, detached=detached)
+
+    def get_task_stats(self) -> dict[str, TaskStats]:
+        with self._lock:
+            return {name: TaskStats(**vars(stats)) for name, stats in self._task_stats.items()}
+
+    def log_task_stats(self, top: int = 20) -> None:
+        """Log stats of the tasks which took most of the time."""
+        stats = sorted(self.get_task_stats().items(), key=lambda item: item[1].run_time, reverse=True)
+        for name, task_stats in stats[:top]:
+            LOGGER.info("%s: %d tasks (%d failed), run time: %.1fs total, %.1fs max, wait time: %.1fs total",
+                        name, task_stats.count, task_stats.failed,
+                        task_stats.run_time, task_stats.max_run_time, task_stats.wait_time)
+
+    def _schedule(self, task: _Task, caller_runs: bool = True) -> bool:
+        """Queue the task to a worker, return False if the task should be run by the caller instead."""
+        with self._lock:
+            if task.group.concurrency_limited:
+                if self.max_concurrency and self._top_level_running >= self.max_concurrency:
+                    self._waiting.append(task)
+                    return True
+                self._top_level_running += 1
+            elif caller_runs and len(self._queue) >= self._idle_workers and self._workers >= self.max_workers:
+                return False
+            self._dispatch(task)
+            return True
+
+    def _dispatch(self, task: _Task) -> None:
+        # Should be called with the lock held.
+        self._queue.append(task)
+        if len(self._queue) <= self._idle_workers:
+            self._work_available.notify()
+            return
+        if self._workers >= self.max_workers:
+            return  # the task waits for a busy worker
+        self._workers += 1
+        self._worker_seq += 1
+        threading.Thread(target=self._worker, name=f"ParallelExecutor-{self._worker_seq}", daemon=True).start()
+
+    def _worker(self) -> None:
+        while True:
+            with self._lock:
+                self._idle_workers += 1
+                while not self._queue:
+                    if not self._work_available.wait(self.idle_worker_timeout) and not self._queue:
+                        self._idle_workers -= 1
+                        self._workers -= 1
+                        return
+                self._idle_workers -= 1
+                task = self._queue.popleft()
+            self._run(task)
+
+    def _run(self, task: Optional[_Task]) -> None:
+        while task is not None:
+            if task.group.cancelled:
+                task.future.cancel()
+            if task.future.set_running_or_notify_cancel():
+                task.context.run(self._run_in_context, task)
+            task = self._task_done(task)
+
+    def _run_in_context(self, task: _Task) -> None:
+        _current_group.set(task.group)
+        start_time = time.perf_counter()
+        try:
+            result = task.func(*task.args, **task.kwargs)
+        except BaseException as exc:  # noqa: BLE001
+            task.future.set_exception(exc)
+        else:
+            task.future.set_result(result)
+        finally:
+            self._record(TaskTiming(name=task.name,
+                                    wait_time=start_time - task.submit_time,
+                                    run_time=time.perf_counter() - start_time,
+                                    failed=task.future.exception() is not None))
+
+    def _record(self, timing: TaskTiming) -> None:
+        LOGGER.debug("Task %s was done in %.3fs (waited %.3fs)", timing.name, timing.run_time, timing.wait_time)
+        with self._lock:
+            self.task_timings.append(timing)
+            self._task_stats.setdefault(timing.name, TaskStats()).add(timing)
+
+    def _task_done(self, task: _Task) -> Optional[_Task]:
+        if task.group.concurrency_limited:
+            with self._lock:
+                if self._waiting:
+                    self._dispatch(self._waiting.popleft())  # pass the slot to the next waiting task
+                else:
+                    self._top_level_running -= 1
+        return task.group._task_done()
+
+
+_EXECUTOR_LOCK = threading.Lock()
+_EXECUTOR: Optional[ParallelExecutor] = None
+_EXECUTOR_PID: Optional[int] = None
+_MAX_CONCURRENCY: Optional[int] = None
+
+
+def configure_parallel_executor(max_concurrency: Optional[int]) -> None:
+    """Set the limit of top-level tasks running at once in this process (None or 0 for no limit.)"""
+    global _MAX_CONCURRENCY  # noqa: PLW0603
+    with _EXECUTOR_LOCK:
+        _MAX_CONCURRENCY = max_concurrency or None
+        if _EXECUTOR is not None:
+            _EXECUTOR.max_concurrency = _MAX_CONCURRENCY
+
+
+def get_parallel_executor() -> ParallelExecutor:
+    """Return the parallel executor of the current process."""
+    global _EXECUTOR, _EXECUTOR_PID  # noqa: PLW0603
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None or _EXECUTOR_PID != os.getpid():  # threads don't survive fork()
+            _EXECUTOR, _EXECUTOR_PID = ParallelExecutor(max_concurrency=_MAX_CONCURRENCY), os.getpid()
+        return _EXECUTOR
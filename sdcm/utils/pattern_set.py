@@ -0,0 +1,170 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+import re
+from typing import Generic, Iterable, Iterator, List, NamedTuple, Optional, Tuple, TypeVar
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+    from re import _constants as sre_constants
+except ImportError:
+    import sre_parse
+    import sre_constants
+
+T = TypeVar("T")
+
+# literals shorter than this are not worth a prefilter check
+MIN_LITERAL_LENGTH = 2
+
+
+class PatternSetEntry(NamedTuple):
+    pattern: re.Pattern
+    item: object
+    literals: Optional[Tuple[str, ...]]
+    literal_groups: List[Tuple[str, ...]]
+    ignore_case: bool
+
+
+def _best_literals(candidates: List[Tuple[str, ...]]) -> Optional[Tuple[str, ...]]:
+    if not candidates:
+        return None
+    return max(candidates, key=lambda alts: (min(map(len, alts)), -len(alts)))
+
+
+def _literal_groups(parsed, ignore_case: bool) -> List[Tuple[str, ...]]:
+    """
+    Walk a parsed regex sequence and return groups of literals. Every string which the regex matches
+    contains at least one literal from each of the groups.
+    """
+    groups = []
+    run = []
+
+    def flush_run():
+        if len(run) >= MIN_LITERAL_LENGTH:
+            groups.append(("".join(run), ))
+        run.clear()
+
+    for opcode, argument in parsed:
+        if opcode is sre_constants.LITERAL:
+            run.append(chr(argument))
+            continue
+        flush_run()
+        if opcode is sre_constants.SUBPATTERN:
+            _, add_flags, _, subpattern = argument
+            if add_flags & re.IGNORECASE and not ignore_case:
+                continue
+            groups.extend(_literal_groups(subpattern, ignore_case))
+        elif opcode is sre_constants.BRANCH:
+            alternatives = []
+            for branch in argument[1]:
+                if not (literals := _best_literals(_literal_groups(branch, ignore_case))):
+                    break
+                alternatives.extend(literals)
+            else:
+                groups.append(tuple(alternatives))
+    flush_run()
+    return groups
+
+
+def extract_literal_groups(pattern: re.Pattern) -> List[Tuple[str, ...]]:
+    """
+    Return groups of literals, such that every string matched by the `pattern' contains one literal of each group.
+
+    Literals are lower-cased if the pattern is case-insensitive.
+    """
+    if not isinstance(pattern.pattern, str):
+        return []
+    ignore_case = bool(pattern.flags & re.IGNORECASE)
+    try:
+        groups = _literal_groups(sre_parse.parse(pattern.pattern, pattern.flags), ignore_case)
+    except Exception:  # noqa: BLE001
+        return []
+    if ignore_case:
+        groups = [tuple(literal.lower() for literal in group)
+                  for group in groups if all(literal.isascii() for literal in group)]
+    return groups
+
+
+def extract_required_literals(pattern: re.Pattern) -> Optional[Tuple[str, ...]]:
+    """
+    Return literals one of which appears in every string matched by the `pattern' (lower-cased
+    if the pattern is case-insensitive), or None if there is no usable literal.
+    """
+    return _best_literals(extract_literal_groups(pattern))
+
+
+class PatternSet(Generic[T]):
+    """
+    Ordered set of regex patterns which is matched against a line in one call.
+
+    Every pattern gets a cheap literal prefilter: a string can match the pattern only if it contains
+    one of the literals extracted from the pattern, so the expensive `re.search' call is done only
+    for patterns which passed the prefilter. The order of patterns is kept, i.e. the first pattern
+    which matches wins, same as iterating over a list of (pattern, item) pairs.
+
+    Example:
+        >>> patterns = PatternSet([(re.compile("Reactor stalled", re.IGNORECASE), "stall"), (re.compile("error"), "error")])
+        >>> match, item = patterns.search("some error: reactor stalled for 33 ms")
+        >>> item
+        'stall'
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[re.Pattern, T]]):
+        self.entries = []
+        for pattern, item in patterns:
+            literal_groups = extract_literal_groups(pattern)
+            self.entries.append(PatternSetEntry(pattern=pattern,
+                                                item=item,
+                                                literals=_best_literals(literal_groups),
+                                                literal_groups=literal_groups,
+                                                ignore_case=bool(pattern.flags & re.IGNORECASE)))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[Tuple[re.Pattern, T]]:
+        return ((entry.pattern, entry.item) for entry in self.entries)
+
+    def _candidates(self, line: str) -> Iterator[PatternSetEntry]:
+        if not line.isascii():
+            # str.lower() and the regex engine case folding differ for some non-ASCII chars
+            yield from self.entries
+            return
+        lowered = None
+        for entry in self.entries:
+            if entry.literals is None:
+                yield entry
+                continue
+            if entry.ignore_case:
+                if lowered is None:
+                    lowered = line.lower()
+                haystack = lowered
+            else:
+                haystack = line
+            for literal in entry.literals:
+                if literal in haystack:
+                    yield entry
+                    break
+
+    def search(self, line: str) -> Optional[Tuple[re.Match, T]]:
+        """Return (match, item) for the first pattern which matches the `line', or None."""
+        for entry in self._candidates(line):
+            if match := entry.pattern.search(line):
+                return match, entry.item
+        return None
+
+    def search_all(self, line: str) -> Iterator[Tuple[re.Match, T]]:
+        """Yield (match, item) for every pattern which matches the `line', in order."""
+        for entry in self._candidates(line):
+            if match := entry.pattern.search(line):
+                yield match, entry.item
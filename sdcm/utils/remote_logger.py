@@ -14,15 +14,16 @@
 from __future__ import annotations
 
 import os
+import sys
 import time
+import signal
 import socket
 import logging
 import subprocess
 from abc import abstractmethod, ABCMeta
 from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime
 from functools import cached_property
-from threading import Lock, Thread, Event as ThreadEvent
+from threading import Lock, RLock, Thread, Event as ThreadEvent, get_ident
 from typing import TYPE_CHECKING
 from multiprocessing import Process, Event
 from textwrap import dedent
@@ -69,8 +70,144 @@ class LoggerBase(metaclass=ABCMeta):
         ...
 
 
+POSITION_MARKER = "\x1e"  # ASCII record separator, starts lines with a position to resume from
+POSITION_MARKER_PERIOD = 100  # lines
+
+
+class ResumableLogWriter:
+    """
+    Watcher of a follow command output which writes it to a local log file and keeps the position to resume from.
+
+    The remote side prints a marker line with a position (journald cursor or file offset) every few lines.
+    The output after a position is deterministic, so on reconnect the follow command is restarted from the last
+    position and the lines received after it are skipped: every line gets to the file exactly once.
+    A partial line of an interrupted stream is dropped, it'll be received again after the reconnect.
+    """
+
+    FLUSH_INTERVAL = 1  # seconds
+    BUFFER_SIZE = 64 * 1024
+
+    def __init__(self, log_file: str):
+        self.position: str | None = None
+        self.lines_after_position = 0
+        self._skip_lines = 0
+        self._lock = RLock()  # the file can be closed by a signal handler
+        self._streams: dict[int, list] = {}  # thread id -> [length of the submitted stream, partial line]
+        self._file = open(log_file, "a", encoding="utf-8", buffering=self.BUFFER_SIZE)  # noqa: SIM115
+        self._closed = ThreadEvent()
+        self._flusher = Thread(target=self._flush_periodically, name=f"{self.__class__.__name__}-flusher", daemon=True)
+        self._flusher.start()
+
+    def submit(self, stream: str) -> list:
+        """Invoke watchers API: the whole output of a stream is passed on every call."""
+        state = self._streams.setdefault(get_ident(), [0, ""])
+        data, state[0] = stream[state[0]:], len(stream)
+        self._feed(state, data)
+        return []
+
+    def submit_line(self, line: str) -> None:
+        self._feed(self._streams.setdefault(get_ident(), [0, ""]), line)
+
+    def _feed(self, state: list, data: str) -> None:
+        *lines, state[1] = (state[1] + data).split("\n")
+        if not lines:
+            return
+        with self._lock:
+            for line in lines:
+                if line.startswith(POSITION_MARKER):
+                    if line[1:] != self.position:  # the same position is printed at the start of a resumed command
+                        self.position = line[1:]
+                        # a new position in the replayed output: the lines left to skip are already written after it
+                        self.lines_after_position = self._skip_lines
+                elif self._skip_lines:
+                    self._skip_lines -= 1
+                else:
+                    self._file.write(line + "\n")
+                    self.lines_after_position += 1
+
+    def reconnect(self) -> None:
+        """Prepare to receive output of the follow command restarted from the last position."""
+        with self._lock:
+            self._streams.clear()
+            self._skip_lines = self.lines_after_position
+            self._file.flush()
+
+    def _flush_periodically(self) -> None:
+        while not self._closed.wait(self.FLUSH_INTERVAL):
+            with self._lock:
+                self._file.flush()
+
+    def close(self) -> None:
+        self._closed.set()
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def follow_journal_cmd(journalctl_cmd: str, cursor: str | None, output_format: str = "sct") -> str:
+    """
+    Follow the journal in `sct' (ISO timestamps with the priority) or `short' format with cursor markers.
+
+    The cursor is printed every `POSITION_MARKER_PERIOD' records and when there is no more records to read.
+    """
+    python_prog = dedent("""
+        import json, sys, select, datetime
+
+        priorities = \\"emerg,alert,critical,error,warning,notice,info,debug\\"
+        prio_map = {str(i): str(prio).upper() for i, prio in enumerate(priorities.split(','))}
+        cursor, pending = None, 0
+
+        for line in iter(sys.stdin.readline, ''):
+            d = json.loads(line)
+            ts = datetime.datetime.fromtimestamp(int(d.get('__REALTIME_TIMESTAMP', '1000')) / 1000**2)
+            if sys.argv[1] == 'short':
+                o = ts.strftime('%b %d %H:%M:%S')
+            else:
+                o = ts.isoformat(timespec='milliseconds')
+            o += f\\" {d.get('_HOSTNAME', 'unknown')}\\"
+            if sys.argv[1] != 'short':
+                o += f\\" !{prio_map.get(d.get('PRIORITY', '7'), '???')} |\\"
+            o += f\\" {d.get('SYSLOG_IDENTIFIER', 'unknown')}[{d.get('_PID', '0')}]:\\"
+            o += f\\" {d.get('MESSAGE', '')}\\"
+            print(o)
+            cursor, pending = d.get('__CURSOR', cursor), pending + 1
+            if pending >= PERIOD or not select.select([sys.stdin], [], [], 0)[0]:
+                print('\\\\x1e' + cursor, flush=True)
+                pending = 0
+    """).replace("PERIOD", str(POSITION_MARKER_PERIOD))
+    after_cursor = f"--after-cursor='{cursor}' " if cursor else ""
+    return f'PYTHON_PROG="{python_prog}"\n{journalctl_cmd} {after_cursor}-o json | python3 -c "$PYTHON_PROG" {output_format}'
+
+
+def follow_file_cmd(path: str, offset: str | None, sudo: bool = False, pattern: str | None = None) -> str:
+    """
+    Follow the file (optionally, only lines which match `pattern') with byte offset markers.
+
+    It starts from the last 10 lines of the file as `tail -f' does or from the offset.  If the file is shorter than
+    the offset (i.e., it was rotated), it starts from the beginning.  The offset is printed at the start and every
+    `POSITION_MARKER_PERIOD' lines of the file.
+    """
+    sudo = "sudo " if sudo else ""
+    if offset is None:
+        start = f"OFF=$(( $({sudo}stat -c %s {path} 2>/dev/null || echo 0) - $({sudo}tail -n 10 {path} 2>/dev/null | wc -c) ))"
+    else:
+        start = f'OFF={int(offset)}; [ "$({sudo}stat -c %s {path} 2>/dev/null || echo 0)" -ge "$OFF" ] || OFF=0'
+    awk_pattern = f"/{pattern}/ " if pattern else ""
+    print_marker = 'printf "\\036%.0f\\n", off; fflush()'
+    # mawk waits for a full buffer of input before processing it unless it's in the interactive mode.
+    awk = 'case "$(awk -W version 2>&1)" in mawk*) AWK="awk -W interactive" ;; *) AWK=awk ;; esac'
+    return (f"{start}; {awk}; {sudo}tail -c +$((OFF + 1)) -F {path} 2>/dev/null | LC_ALL=C $AWK -v off=$OFF '"
+            f"BEGIN {{ {print_marker} }} {{ off += length($0) + 1 }} {awk_pattern}{{ print; fflush() }} "
+            f"NR % {POSITION_MARKER_PERIOD} == 0 {{ {print_marker} }}'")
+
+
 class SSHLoggerBase(LoggerBase):
-    RETRIEVE_LOG_MESSAGE_TEMPLATE = "Reading Scylla logs from {since}"
+    RETRIEVE_LOG_MESSAGE_TEMPLATE = "Reading Scylla logs from {position}"
     VERBOSE_RETRIEVE = True
     READINESS_CHECK_DELAY = 10  # seconds
 
@@ -93,28 +230,35 @@ class SSHLoggerBase(LoggerBase):
 
     @raise_event_on_failure
     def _journal_thread(self) -> None:
-        read_from_timestamp = None
-        while not self._termination_event.is_set():
-            if self._is_ready_to_retrieve():
-                self._retrieve(since=read_from_timestamp)
-                read_from_timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
-            else:
-                time.sleep(self.READINESS_CHECK_DELAY)
+        with ResumableLogWriter(self._target_log_file) as writer:
+            # The process gets terminated on stop, exit gracefully to write the lines buffered by the writer.
+            signal.signal(signal.SIGTERM, lambda *_: sys.exit())
+            while not self._termination_event.is_set():
+                if self._is_ready_to_retrieve():
+                    self._retrieve(writer=writer)
+                else:
+                    time.sleep(self.READINESS_CHECK_DELAY)
 
     def _is_ready_to_retrieve(self) -> bool:
         return self._remoter.is_up()
 
-    def _retrieve(self, since: str) -> None:
-        self._log.debug(self.RETRIEVE_LOG_MESSAGE_TEMPLATE.format(since=since or "the beginning"))
+    def _retrieve(self, writer: ResumableLogWriter) -> None:
+        self._log.debug(self.RETRIEVE_LOG_MESSAGE_TEMPLATE.format(position=writer.position or "the beginning"))
+        started = time.perf_counter()
         try:
             self._remoter.run(
-                cmd=self._logger_cmd_template.format(since=f'--since "{since}" ' if since else ""),
+                cmd=self._logger_cmd(position=writer.position),
                 verbose=self.VERBOSE_RETRIEVE,
                 ignore_status=True,
-                log_file=self._target_log_file,
+                watchers=[writer],
             )
         except Exception as details:  # noqa: BLE001
             self._log.error("Error retrieving remote node DB service log: %s", details)
+        finally:
+            writer.reconnect()
+        if time.perf_counter() - started < self.READINESS_CHECK_DELAY:
+            # Don't hammer a flaky node with reconnects.
+            self._termination_event.wait(self.READINESS_CHECK_DELAY)
 
     @cached_property
     def _remoter(self) -> RemoteCmdRunnerBase:
@@ -125,9 +269,9 @@ class SSHLoggerBase(LoggerBase):
             return self._node.remoter
         return RemoteCmdRunnerBase.create_remoter(**self._node.remoter.get_init_arguments())
 
-    @property
     @abstractmethod
-    def _logger_cmd_template(self) -> str:  # The `since' parameter will be passed to a returned template.
+    def _logger_cmd(self, position: str | None) -> str:
+        """Command to follow the log from `position' (see `ResumableLogWriter'.)"""
         ...
 
 
@@ -143,6 +287,7 @@ class HDRHistogramFileLogger(SSHLoggerBase):
         self._thread = None
         self._lock = Lock()
         self._started = False
+        self._writer = None
 
     def start(self) -> None:
         with self._lock:
@@ -164,10 +309,11 @@ class HDRHistogramFileLogger(SSHLoggerBase):
             self._started = False
             if self._thread.running():
                 self._thread.cancel()
+            if self._writer:
+                self._writer.reconnect()  # flush what was received so far
 
-    @cached_property
-    def _logger_cmd_template(self) -> str:
-        return f"tail -f {self._remote_log_file}"
+    def _logger_cmd(self, position: str | None) -> str:
+        return follow_file_cmd(self._remote_log_file, offset=position)
 
     def validate_and_collect_hdr_file(self):
         """
@@ -200,20 +346,22 @@ class HDRHistogramFileLogger(SSHLoggerBase):
     # @raise_event_on_failure
     def _journal_thread(self) -> None:
         LOGGER.debug("Start journal thread. %s", self._remote_log_file)
-        read_from_timestamp = None
+        self._writer = ResumableLogWriter(self._target_log_file)
         te_is_set = self._termination_event.is_set()
-        while not te_is_set:
-            LOGGER.debug("Start check if remoter ready. %s", self._remote_log_file)
-            if self._is_ready_to_retrieve():
-                LOGGER.debug("Remoter ready. %s", self._remote_log_file)
-                self._retrieve(since=read_from_timestamp)
-                LOGGER.debug("Retrieve finished. %s", self._remote_log_file)
-                read_from_timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
-            else:
-                LOGGER.debug("Remoter is not ready. %s", self._remote_log_file)
-                time.sleep(self.READINESS_CHECK_DELAY)
-            te_is_set = self._termination_event.is_set()
-            LOGGER.debug("_termination_event is set?: %s. %s", te_is_set, self._remote_log_file)
+        try:
+            while not te_is_set:
+                LOGGER.debug("Start check if remoter ready. %s", self._remote_log_file)
+                if self._is_ready_to_retrieve():
+                    LOGGER.debug("Remoter ready. %s", self._remote_log_file)
+                    self._retrieve(writer=self._writer)
+                    LOGGER.debug("Retrieve finished. %s", self._remote_log_file)
+                else:
+                    LOGGER.debug("Remoter is not ready. %s", self._remote_log_file)
+                    time.sleep(self.READINESS_CHECK_DELAY)
+                te_is_set = self._termination_event.is_set()
+                LOGGER.debug("_termination_event is set?: %s. %s", te_is_set, self._remote_log_file)
+        finally:
+            self._writer.close()
 
     def _is_ready_to_retrieve(self) -> bool:
         LOGGER.debug("Before remoter is_up. %s", self._remote_log_file)
@@ -234,45 +382,17 @@ class SSHScyllaSystemdLogger(SSHLoggerBase):
     def _is_ready_to_retrieve(self) -> bool:
         return super()._is_ready_to_retrieve() and self._remoter.sudo(cmd="which python3", ignore_status=True).ok
 
-    @staticmethod
-    def reformat_output_command(cmd: str) -> str:
-        """
-        Wrapping journalctl -f command with a python program
-        that read a s json stream, and add the level/priority that
-        is missing from regular output
-        """
-        return dedent("""
-            PYTHON_PROG="
-            import json,sys, datetime
-
-            priorities = \\"emerg,alert,critical,error,warning,notice,info,debug\\"
-            prio_map = {{str(i) : str(prio).upper() for i, prio in enumerate(priorities.split(','))}}
-
-            for line in iter(sys.stdin.readline, b''):
-                d = json.loads(line)
-                o = str(datetime.datetime.fromtimestamp(int(d.get('__REALTIME_TIMESTAMP', '1000')) / 1000**2).isoformat(timespec='milliseconds'))
-                o += f\\" {{d.get('_HOSTNAME', 'unknown')}}\\"
-                o += f\\" !{{prio_map.get(d.get('PRIORITY', '7'), '???')}} |\\"
-                o += f\\" {{d.get('SYSLOG_IDENTIFIER', 'unknown')}}[{{d.get('_PID', '0')}}]:\\"
-                o += f\\" {{d.get('MESSAGE', '')}}\\"
-                print(o)
-            "
-                      """
-                      f'{cmd} -o json | python3 -c "$PYTHON_PROG"'
-                      )
-
-    @cached_property
-    def _logger_cmd_template(self) -> str:
-        return self.reformat_output_command(
-            f'{self._node.journalctl} -f --no-tail --no-pager '
-            '--utc {since} '
+    def _logger_cmd(self, position: str | None) -> str:
+        return follow_journal_cmd(
+            f'{self._node.journalctl} -f --no-tail --no-pager --utc '
             '-u scylla-ami-setup.service '
             '-u scylla-image-setup.service '
             '-u scylla-io-setup.service '
             '-u scylla-server.service '
             '-u scylla-jmx.service '
             '-u scylla-housekeeping-restart.service '
-            '-u scylla-housekeeping-daily.service'
+            '-u scylla-housekeeping-daily.service',
+            cursor=position,
         )
 
 
@@ -283,19 +403,35 @@ class SSHNonRootScyllaSystemdLogger(SSHLoggerBase):
     """
     SCYLLA_LOG_FILE = "~/scylladb/scylla-server.log"
 
-    @cached_property
-    def _logger_cmd_template(self) -> str:
-        return f"mkdir -p ~/scylladb && touch {self.SCYLLA_LOG_FILE} && tail -F {self.SCYLLA_LOG_FILE}"
+    def _logger_cmd(self, position: str | None) -> str:
+        return (f"mkdir -p ~/scylladb && touch {self.SCYLLA_LOG_FILE} && "
+                f"{follow_file_cmd(self.SCYLLA_LOG_FILE, offset=position)}")
 
 
 class SSHGeneralSystemdLogger(SSHLoggerBase):
+    JOURNALCTL_CMD = "sudo journalctl -f --no-pager --utc"
+
+    def __init__(self, node: BaseNode, target_log_file: str):
+        super().__init__(node=node, target_log_file=target_log_file)
+        self._followed = False
+
     @cached_property
-    def _logger_cmd_template(self) -> str:
-        return 'sudo journalctl -f --no-tail --no-pager --utc {since} '
+    def _is_python3_available(self) -> bool:
+        return self._remoter.run(cmd="which python3", ignore_status=True).ok
+
+    def _logger_cmd(self, position: str | None) -> str:
+        if self._is_python3_available:
+            return follow_journal_cmd(f"{self.JOURNALCTL_CMD} --no-tail", cursor=position, output_format="short")
+        # The cursor can't be tracked w/o python3 on the node, so just don't re-read the journal on reconnects.
+        if self._followed:
+            return f"{self.JOURNALCTL_CMD} -n 0"
+        self._followed = True
+        return f"{self.JOURNALCTL_CMD} --no-tail"
 
 
 class SSHGeneralFileLogger(SSHLoggerBase):
     REMOTE_LOG_PATH = "/var/log/syslog"
+    LINE_PATTERN = None
 
     def _is_ready_to_retrieve(self) -> bool:
         return super()._is_ready_to_retrieve() and self._is_file_exist(file_path=self.REMOTE_LOG_PATH)
@@ -307,15 +443,12 @@ class SSHGeneralFileLogger(SSHLoggerBase):
             self._log.error("Error checking if file %s exists: %s", file_path, details)
         return False
 
-    @cached_property
-    def _logger_cmd_template(self) -> str:
-        return f"sudo tail -f {self.REMOTE_LOG_PATH}"
+    def _logger_cmd(self, position: str | None) -> str:
+        return follow_file_cmd(self.REMOTE_LOG_PATH, offset=position, sudo=True, pattern=self.LINE_PATTERN)
 
 
 class SSHScyllaFileLogger(SSHGeneralFileLogger):
-    @cached_property
-    def _logger_cmd_template(self) -> str:
-        return f"{super()._logger_cmd_template} | grep scylla"
+    LINE_PATTERN = "scylla"
 
 
 class CommandLoggerBase(LoggerBase):
@@ -0,0 +1,118 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+"""
+Incremental parsing of SSTables JSON dumps (`sstabledump' or `scylla sstable dump-data'.)
+
+A dump looks like {"sstables": {"<sstable>": [<partition>, <partition>, ...], ...}} and can be many GBs, so
+partitions are parsed one by one and only one partition is kept in memory at a time.
+"""
+
+import re
+import gzip
+import json
+from functools import partial
+from typing import Any, Iterable, Iterator
+
+WHITESPACE_RE = re.compile(r"\s*")
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+class _JsonStream:
+    def __init__(self, chunks: Iterable[str]):
+        self._chunks = iter(chunks)
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self, min_size: int = 0) -> bool:
+        """Read chunks till the unparsed part of the buffer is `min_size' long at least; return False on EOF."""
+        self._buffer, self._pos = self._buffer[self._pos:], 0
+        chunks = [self._buffer]
+        size = len(self._buffer)
+        while not self._eof:
+            if (chunk := next(self._chunks, None)) is None:
+                self._eof = True
+                break
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > min_size:
+                break
+        self._buffer = "".join(chunks)
+        return size > len(chunks[0])
+
+    def peek(self) -> str:
+        while True:
+            self._pos = WHITESPACE_RE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise json.JSONDecodeError("Unexpected end of data", self._buffer, self._pos)
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting {char!r}", self._buffer, self._pos)
+        self._pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # Incomplete value, read at least as much as it's already read to avoid quadratic reparsing.
+                if not self._fill(min_size=2 * (len(self._buffer) - self._pos)):
+                    raise
+                continue
+            if end == len(self._buffer) and self._fill():
+                continue  # a number could be cut by the end of the chunk
+            self._pos = end
+            return value
+
+    def items(self, close: str) -> Iterator[None]:
+        """Iterate over items of an array or an object, the opening bracket should be consumed already."""
+        first = True
+        while True:
+            if self.peek() == close:
+                self._pos += 1
+                return
+            if not first:
+                self.expect(",")
+            first = False
+            yield
+
+
+def iter_sstable_dump_partitions(chunks: Iterable[str]) -> Iterator[tuple[str, Any]]:
+    """Parse a JSON dump of SSTables given as text chunks and yield (sstable, partition) pairs."""
+    stream = _JsonStream(chunks)
+    stream.expect("{")
+    for _ in stream.items("}"):
+        key = stream.value()
+        stream.expect(":")
+        if key != "sstables":
+            stream.value()
+            continue
+        stream.expect("{")
+        for _ in stream.items("}"):
+            sstable = stream.value()
+            stream.expect(":")
+            stream.expect("[")
+            for _ in stream.items("]"):
+                yield sstable, stream.value()
+
+
+def read_sstable_dump(path: str, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[tuple[str, Any]]:
+    """Parse a (gzipped if the name ends with .gz) JSON dump file of SSTables and yield (sstable, partition) pairs."""
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as dump_file:
+        yield from iter_sstable_dump_partitions(iter(partial(dump_file.read, chunk_size), ""))
@@ -1,10 +1,16 @@
+import os
 import datetime
 import json
 import logging
 import random
+import tempfile
+import uuid
 from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
 
 from sdcm.paths import SCYLLA_YAML_PATH
+from sdcm.utils.common import ParallelObject
+from sdcm.utils.sstable.sstable_dump import read_sstable_dump
 from sdcm.utils.version_utils import ComparableScyllaVersion
 from sdcm.exceptions import SstablesNotFound
 
@@ -36,12 +42,29 @@ class SstableUtils:
 
     def count_tombstones(self):
         sstables = self.get_sstables()
-        tombstones_num = 0
-        for sstable in sstables:
-            tombstones_num += self.count_sstable_tombstones(sstable=sstable)
+        tombstones_num = sum(self.run_on_sstables(self.count_sstable_tombstones, sstables))
         self.log.debug('Got %s tombstones for %s', tombstones_num, self.ks_cf)
         return tombstones_num
 
+    def run_on_sstables(self, func: Callable[[str], Any], sstables: list[str],
+                        num_workers: int = 1, timeout: Optional[int] = None) -> list:
+        """
+        Run `func(sstable)' for SSTables of the node and return the results in the same order.
+
+        SSTables are processed one by one by default, since every sstabledump adds load to the DB node, which is
+        usually under a stress load.  Use `num_workers' to process several of them at once (up to
+        `db_node.remoter.max_channels_per_host' is reasonable.)  There is no overall timeout unless `timeout' is set.
+        If `func' fails for some SSTable, the first exception is raised after all SSTables are processed.
+        """
+        if not sstables:
+            return []
+        results = ParallelObject(sstables, num_workers=num_workers, timeout=timeout,
+                                 disable_logging=True).run(func, ignore_exceptions=True)
+        for result in results:
+            if result.exc:
+                raise result.exc
+        return [result.result for result in results]
+
     def get_sstables(self, from_minutes_ago: int = 0):
         selected_sstables = []
         ks_cf_path = self.ks_cf.replace('.', '/')
@@ -137,33 +160,18 @@ class SstableUtils:
         :param sstable: The SSTable file path.
         :return: The number of tombstones in the SSTable, or 0 if SSTable doesn't exist.
         """
-        if not self._run_sstabledump(sstable=sstable):  # Check if SSTable exists and was dumped
-            self.log.debug("Skipping tombstone count as SSTable %s does not exist or dump failed.", sstable)
-            return 0
-
-        # Fetch the dumped JSON content
-        result = self.db_node.remoter.run(
-            f'sudo cat {self.REMOTE_SSTABLEDUMP_PATH}', verbose=False, ignore_status=False)
-
-        if not result.ok:
-            self.log.debug("Failed to retrieve SSTable dump data for %s: (%s, %s)", sstable, result.stdout,
-                           result.stderr)
-            return 0
-
         try:
-            dump_data = json.loads(result.stdout)
             num_tombstones = sum(
-                1 for partition in dump_data.get("sstables", {}).get("anonymous", [])
-                if "tombstone" in partition or partition.get("expired") is True
+                1 for name, partition in self._iter_sstabledump_partitions(sstable=sstable)
+                if name == "anonymous" and ("tombstone" in partition or partition.get("expired") is True)
             )
-
-            self.log.debug("Found %s tombstones in SSTable %s", num_tombstones, sstable)
-            return num_tombstones
-
         except json.JSONDecodeError as e:
             self.log.error("Failed to parse SSTable dump JSON for %s: %s", sstable, str(e))
             raise
 
+        self.log.debug("Found %s tombstones in SSTable %s", num_tombstones, sstable)
+        return num_tombstones
+
     def verify_a_live_normal_node_is_used(self):
         if not self.db_node:
             self.db_node = next(node for node in self.db_cluster.data_nodes if node.db_up())
@@ -231,6 +239,33 @@ class SstableUtils:
 
         return True  # Successfully dumped SSTable
 
+    def _iter_sstabledump_partitions(self, sstable: str, tombstones_only: bool = False) -> Iterator[tuple[str, Any]]:
+        """
+        Dump the SSTable and yield (sstable, partition) pairs of the dump.
+
+        The dump is compressed on the node, copied to a local temporary file and parsed incrementally, so the memory
+        used doesn't depend on the size of the SSTable.  Nothing is yielded if the SSTable doesn't exist, the dump
+        failed, or `tombstones_only' is True and there are no tombstones in the dump.
+        """
+        remote_json_path = f"/tmp/sstabledump-{uuid.uuid4().hex}.json"  # unique for SSTables dumped in parallel
+        try:
+            if not self._run_sstabledump(sstable=sstable, remote_json_path=remote_json_path):
+                self.log.debug("SSTable %s does not exist or dump failed.", sstable)
+                return
+            if tombstones_only and not self._are_tombstones_in_sstabledump(
+                    sstable=sstable, remote_json_path=remote_json_path):
+                return
+            self.db_node.remoter.run(f"sudo gzip -1 -f {remote_json_path}", verbose=False)
+            with tempfile.TemporaryDirectory() as local_dir:
+                local_path = os.path.join(local_dir, "sstabledump.json.gz")
+                if not self.db_node.remoter.receive_files(src=f"{remote_json_path}.gz", dst=local_path):
+                    self.log.warning("Failed to retrieve SSTable dump data for %s", sstable)
+                    return
+                yield from read_sstable_dump(local_path)
+        finally:
+            self.db_node.remoter.run(f"sudo rm -f {remote_json_path} {remote_json_path}.gz",
+                                     verbose=False, ignore_status=True)
+
     def _are_tombstones_in_sstabledump(self, sstable: str, remote_json_path: str = REMOTE_SSTABLEDUMP_PATH) -> bool:
         # Check if tombstones exist in the dumped sstable JSON
         check_tombstones_cmd = f'sudo grep -q tombstone {remote_json_path}'
@@ -249,30 +284,12 @@ class SstableUtils:
         :param sstable: The SSTable file path.
         :return: List of tombstone deletion entries.
         """
-        if not self._run_sstabledump(sstable=sstable):  # Check if SSTable exists and was dumped
-            self.log.debug("Skipping tombstone search as SSTable %s does not exist or dump failed.", sstable)
-            return []
-        if not self._are_tombstones_in_sstabledump(sstable=sstable):
-            return []
-
-        tombstones_deletion_info = []
-        result = self.db_node.remoter.run(f'sudo cat {self.REMOTE_SSTABLEDUMP_PATH}', verbose=False,
-                                          ignore_status=False)
-
-        if not result.ok:
-            self.log.warning("Failed to retrieve SSTable dump data for %s: (%s, %s)", sstable, result.stdout,
-                             result.stderr)
-            return tombstones_deletion_info
-
         try:
-            dump_data = json.loads(result.stdout)
-
-            # Get the list of records for the given SSTable
-            sstable_data = dump_data['sstables'].get(sstable, [])
-
-            # Extract entries that contain a tombstone
-            tombstones_deletion_info = [entry for entry in sstable_data if 'tombstone' in entry]
-
+            # Extract entries of the given SSTable that contain a tombstone
+            tombstones_deletion_info = [
+                entry for name, entry in self._iter_sstabledump_partitions(sstable=sstable, tombstones_only=True)
+                if name == sstable and 'tombstone' in entry
+            ]
         except json.JSONDecodeError as e:
             self.log.error("Failed to parse SSTable dump JSON for %s: %s", sstable, str(e))
             raise
@@ -0,0 +1,201 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+"""
+Copy rows of a table or a materialized view to another table with the same columns.
+
+The token ring is split into ranges which are read with paging by parallel workers.  Rows are passed to the
+writer through a bounded queue, so reads and writes overlap and only a few pages are kept in memory.  When all rows
+are written, rows in every token range of the destination table are counted and compared to the number of rows
+inserted into this range, instead of counting the whole table at once.
+"""
+
+import time
+import queue
+import bisect
+import logging
+import threading
+from collections import Counter
+from concurrent.futures import Future
+from typing import Iterator, Optional
+
+from cassandra import ConsistencyLevel
+from cassandra.concurrent import execute_concurrent_with_args
+from cassandra.metadata import Murmur3Token
+
+from sdcm.utils.database_query_utils import stream_rows
+from sdcm.utils.parallel_executor import get_parallel_executor
+
+LOGGER = logging.getLogger(__name__)
+
+MIN_TOKEN = -2 ** 63
+MAX_TOKEN = 2 ** 63 - 1
+
+
+def split_token_ring(ranges_count: int) -> list[tuple[int, int]]:
+    """Split the Murmur3 token ring into `ranges_count' (start, end] ranges."""
+    step = (MAX_TOKEN - MIN_TOKEN) // ranges_count
+    bounds = [MIN_TOKEN + step * idx for idx in range(ranges_count)] + [MAX_TOKEN]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def get_partition_key(session, keyspace: str, table: str) -> list[str]:
+    """Return partition key columns of a table or a materialized view."""
+    rows = session.execute("SELECT column_name, kind, position FROM system_schema.columns "
+                           "WHERE keyspace_name = %s AND table_name = %s", (keyspace, table))
+    return [row.column_name for row in sorted(rows, key=lambda row: row.position) if row.kind == "partition_key"]
+
+
+class TableCopier:
+    def __init__(self, session, src_keyspace: str, src_table: str, dest_keyspace: str, dest_table: str,
+                 columns: Optional[list[str]] = None, readers: int = 8, write_concurrency: int = 100,
+                 ranges_per_reader: int = 4, fetch_size: int = 5000, queue_size: int = 8):
+        self.session = session
+        self.src = f"{src_keyspace}.{src_table}"
+        self.dest = f"{dest_keyspace}.{dest_table}"
+        self.src_partition_key = ", ".join(get_partition_key(session, src_keyspace, src_table))
+        self.dest_partition_key = ", ".join(get_partition_key(session, dest_keyspace, dest_table))
+        self.columns = columns
+        self.readers = readers
+        self.write_concurrency = write_concurrency
+        self.token_ranges = split_token_ring(readers * ranges_per_reader)
+        self.fetch_size = fetch_size
+        self.rows_read = 0
+        self.rows_copied = 0
+        self.duration = 0.0
+        self._rows_queue = queue.Queue(maxsize=queue_size)
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+        self._inserted = Counter()  # number of rows inserted into token ranges of the destination table
+        self._failed_inserts = 0
+        self._insert_error = None
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_copied / self.duration if self.duration else 0.0
+
+    def _prepare(self, query: str):
+        statement = self.session.prepare(query)
+        statement.consistency_level = ConsistencyLevel.QUORUM
+        return statement
+
+    def _put(self, item) -> None:
+        while not self._stopped.is_set():
+            try:
+                self._rows_queue.put(item, timeout=1)
+                return
+            except queue.Full:
+                continue
+
+    def _read_range(self, select_statement, token_range: tuple[int, int]) -> int:
+        bound = select_statement.bind(token_range)
+        bound.fetch_size = self.fetch_size
+        rows_read = 0
+        page = []
+        for row in stream_rows(session=self.session, statement=bound, prefetch_pages=1):
+            if self._stopped.is_set():
+                break
+            page.append(row)
+            rows_read += 1
+            if len(page) >= self.fetch_size:
+                self._put(page)
+                page = []
+        if page:
+            self._put(page)
+        return rows_read
+
+    def _iter_rows(self, read_futures: list[Future]) -> Iterator:
+        while True:
+            try:
+                yield from self._rows_queue.get(timeout=0.1)
+            except queue.Empty:
+                # Pages are put before a read is done, so nothing can be added after this check.
+                if all(future.done() for future in read_futures) and self._rows_queue.empty():
+                    return
+
+    def _insert_done(self, _, dest_range: int, in_flight: threading.Semaphore) -> None:
+        with self._lock:
+            self._inserted[dest_range] += 1
+        in_flight.release()
+
+    def _insert_failed(self, exc: Exception, in_flight: threading.Semaphore) -> None:
+        with self._lock:
+            self._failed_inserts += 1
+            self._insert_error = self._insert_error or exc
+        in_flight.release()
+
+    def _write(self, insert_statement, read_futures: list[Future]) -> None:
+        range_ends = [end for _, end in self.token_ranges]
+        in_flight = threading.Semaphore(self.write_concurrency)
+        for row in self._iter_rows(read_futures):
+            bound = insert_statement.bind(row)
+            dest_range = bisect.bisect_left(range_ends, Murmur3Token.from_key(bound.routing_key).value)
+            in_flight.acquire()
+            future = self.session.execute_async(bound)
+            future.add_callbacks(callback=self._insert_done, callback_args=(dest_range, in_flight),
+                                 errback=self._insert_failed, errback_args=(in_flight, ))
+        for _ in range(self.write_concurrency):
+            in_flight.acquire()
+
+    def _verify(self) -> bool:
+        count_statement = self._prepare(f"SELECT count(*) FROM {self.dest} WHERE token({self.dest_partition_key}) > ? "
+                                        f"AND token({self.dest_partition_key}) <= ?")
+        results = execute_concurrent_with_args(session=self.session, statement=count_statement,
+                                               parameters=self.token_ranges, concurrency=self.readers,
+                                               raise_on_first_error=False, results_generator=True)
+        mismatched = 0
+        for idx, (success, result) in enumerate(results):
+            if not success:
+                LOGGER.warning("Unable to count rows of %s in token range %s: %s", self.dest, self.token_ranges[idx],
+                               result)
+                mismatched += 1
+            elif (count := result.one().count) != self._inserted[idx]:
+                LOGGER.warning("Rows in token range %s of %s: %s, expected: %s",
+                               self.token_ranges[idx], self.dest, count, self._inserted[idx])
+                mismatched += 1
+        if mismatched:
+            LOGGER.warning("Problem during copying data. Rows in %s of %s token ranges of %s are not as expected",
+                           mismatched, len(self.token_ranges), self.dest)
+        return not mismatched
+
+    def copy(self) -> bool:
+        start_time = time.perf_counter()
+        columns = self.columns or list(self.session.execute(f"SELECT * FROM {self.src} LIMIT 1").column_names)
+        select_statement = self._prepare(f"SELECT {', '.join(columns)} FROM {self.src} "
+                                         f"WHERE token({self.src_partition_key}) > ? "
+                                         f"AND token({self.src_partition_key}) <= ?")
+        insert_statement = self._prepare(f"INSERT INTO {self.dest} ({', '.join(columns)}) "
+                                         f"VALUES ({', '.join('?' for _ in columns)})")
+        task_group = get_parallel_executor().task_group(max_workers=self.readers, name="table_copier.read")
+        read_futures = [task_group.submit(self._read_range, select_statement, token_range)
+                        for token_range in self.token_ranges]
+        try:
+            self._write(insert_statement, read_futures=read_futures)
+        finally:
+            self._stopped.set()
+            task_group.cancel()
+        try:
+            self.rows_read = sum(future.result() for future in read_futures)
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.warning("Problem during copying data. Failed to read rows from %s: %s", self.src, exc)
+            return False
+        self.rows_copied = sum(self._inserted.values())
+        self.duration = time.perf_counter() - start_time
+        LOGGER.info("Copied %s rows from %s to %s in %.1fs (%.0f rows/s)",
+                    self.rows_copied, self.src, self.dest, self.duration, self.rows_per_second)
+        if self._failed_inserts:
+            LOGGER.warning("Problem during copying data. Not all rows were inserted. "
+                           "Rows expected to be inserted: %s; Actually inserted rows: %s. First error: %s",
+                           self.rows_read, self.rows_copied, self._insert_error)
+            return False
+        return self._verify()
@@ -19,7 +19,7 @@ import tempfile
 import logging
 from textwrap import dedent
 
-from sdcm.prometheus import nemesis_metrics_obj
+from sdcm.prometheus import nemesis_metrics_obj, stress_metrics_aggregator
 from sdcm.sct_events.loaders import YcsbStressEvent
 from sdcm.remote import FailuresWatcher
 from sdcm.utils import alternator
@@ -35,12 +35,30 @@ class YcsbStatsPublisher(FileFollowerThread):
     METRICS = {}
     collectible_ops = ['read', 'insert', 'update', 'read-failed', 'update-failed', 'verify']
 
+    # 729.39 current ops/sec;
+    # [READ: Count=510, Max=195327, Min=2011, Avg=4598.69, 90=5743, 99=12583, 99.9=194815, 99.99=195327]
+    # [CLEANUP: Count=5, Max=3, Min=0, Avg=0.6, 90=3, 99=3, 99.9=3, 99.99=3]
+    # [UPDATE: Count=490, Max=190975, Min=2004, Avg=3866.96, 90=4395, 99=6755, 99.9=190975, 99.99=190975]
+    OPERATION_REGEXES = {
+        operation: re.compile(
+            fr'\[{operation.upper()}:\sCount=(?P<count>\d*?),'
+            fr'.*?Max=(?P<max>\d*?),.*?Min=(?P<min>\d*?),'
+            fr'.*?Avg=(?P<avg>.*?),.*?90=(?P<p90>\d*?),'
+            fr'.*?99=(?P<p99>\d*?),.*?99.9=(?P<p999>\d*?),'
+            fr'.*?99.99=(?P<p9999>\d*?)[\],\s]'
+        ) for operation in collectible_ops
+    }
+    VERIFY_REGEX = re.compile(r'\[VERIFY:(.*?)\]')
+    VERIFY_STATUS_REGEX = re.compile(r"Return\((?P<status>.*?)\)=(?P<value>\d*)")
+
     def __init__(self, loader_node, loader_idx, ycsb_log_filename):
         super().__init__()
         self.loader_node = loader_node
         self.loader_idx = loader_idx
         self.ycsb_log_filename = ycsb_log_filename
         self.uuid = generate_random_string(10)
+        self.metrics_aggregator = stress_metrics_aggregator()
+        self._published_labels = {}
         for operation in self.collectible_ops:
             gauge_name = self.gauge_name(operation)
             if gauge_name not in self.METRICS:
@@ -53,62 +71,57 @@ class YcsbStatsPublisher(FileFollowerThread):
     def gauge_name(operation):
         return 'sct_ycsb_%s_gauge' % operation.replace('-', '_')
 
-    def set_metric(self, operation, name, value):
+    def publish_metrics(self, operation, values):
         metric = self.METRICS[self.gauge_name(operation)]
-        metric.labels(self.loader_node.ip_address, self.loader_idx, self.uuid, name).set(value)
+        metrics = [((self.loader_node.ip_address, str(self.loader_idx), self.uuid, name), value)
+                   for name, value in values.items()]
+        self._published_labels.setdefault(operation, set()).update(labels for labels, _ in metrics)
+        self.metrics_aggregator.publish(metric, metrics)
 
-    def handle_verify_metric(self, line):
-        verify_status_regex = re.compile(r"Return\((?P<status>.*?)\)=(?P<value>\d*)")
-        verify_regex = re.compile(r'\[VERIFY:(.*?)\]')
-        verify_content = verify_regex.findall(line)[0]
+    def set_metric(self, operation, name, value):
+        self.publish_metrics(operation, {name: value})
 
-        for status_match in verify_status_regex.finditer(verify_content):
-            stat = status_match.groupdict()
-            self.set_metric('verify', stat['status'], float(stat['value']))
+    def handle_verify_metric(self, line):
+        verify_content = self.VERIFY_REGEX.findall(line)[0]
+        self.publish_metrics('verify', {match['status']: float(match['value'])
+                                        for match in self.VERIFY_STATUS_REGEX.finditer(verify_content)})
+
+    def process_metrics_line(self, line):
+        try:
+            for operation, regex in self.OPERATION_REGEXES.items():
+                match = regex.search(line)
+                if match:
+                    if operation == 'verify':
+                        self.handle_verify_metric(line)
+
+                    values = {}
+                    for key, value in match.groupdict().items():
+                        if not key == 'count':
+                            try:
+                                value = float(value) / 1000.0  # noqa: PLW2901
+                            except ValueError:
+                                value = float(0)  # noqa: PLW2901
+                        values[key] = float(value)
+                    self.publish_metrics(operation, values)
+
+        except Exception:
+            LOGGER.exception("fail to send metric")
 
     def run(self):
-
-        # 729.39 current ops/sec;
-        # [READ: Count=510, Max=195327, Min=2011, Avg=4598.69, 90=5743, 99=12583, 99.9=194815, 99.99=195327]
-        # [CLEANUP: Count=5, Max=3, Min=0, Avg=0.6, 90=3, 99=3, 99.9=3, 99.99=3]
-        # [UPDATE: Count=490, Max=190975, Min=2004, Avg=3866.96, 90=4395, 99=6755, 99.9=190975, 99.99=190975]
-
-        regex_dict = {}
-        for operation in self.collectible_ops:
-            regex_dict[operation] = re.compile(
-                fr'\[{operation.upper()}:\sCount=(?P<count>\d*?),'
-                fr'.*?Max=(?P<max>\d*?),.*?Min=(?P<min>\d*?),'
-                fr'.*?Avg=(?P<avg>.*?),.*?90=(?P<p90>\d*?),'
-                fr'.*?99=(?P<p99>\d*?),.*?99.9=(?P<p999>\d*?),'
-                fr'.*?99.99=(?P<p9999>\d*?)[\],\s]'
-            )
-
-        while not self.stopped():
-            exists = os.path.isfile(self.ycsb_log_filename)
-            if not exists:
-                time.sleep(0.5)
-                continue
-
-            for _, line in enumerate(self.follow_file(self.ycsb_log_filename)):
-                if self.stopped():
-                    break
-                try:
-                    for operation, regex in regex_dict.items():
-                        match = regex.search(line)
-                        if match:
-                            if operation == 'verify':
-                                self.handle_verify_metric(line)
-
-                            for key, value in match.groupdict().items():
-                                if not key == 'count':
-                                    try:
-                                        value = float(value) / 1000.0  # noqa: PLW2901
-                                    except ValueError:
-                                        value = float(0)  # noqa: PLW2901
-                                self.set_metric(operation, key, float(value))
-
-                except Exception:
-                    LOGGER.exception("fail to send metric")
+        try:
+            while not self.stopped():
+                exists = os.path.isfile(self.ycsb_log_filename)
+                if not exists:
+                    time.sleep(0.5)
+                    continue
+
+                for line in self.follow_file(self.ycsb_log_filename):
+                    if self.stopped():
+                        break
+                    self.process_metrics_line(line)
+        finally:
+            for operation, labels in self._published_labels.items():
+                self.metrics_aggregator.release(self.METRICS[self.gauge_name(operation)], labels)
 
 
 class YcsbStressThread(DockerBasedStressThread):
@@ -68,4 +68,9 @@ class MockRemoter:
         else:
             raise RuntimeError('Wrong response value, could be Result or Exception')
 
+    max_channels_per_host = CommandRunner.max_channels_per_host
     sudo = CommandRunner.sudo
+    run_batch = CommandRunner.run_batch
+    sudo_batch = CommandRunner.sudo_batch
+    _run_batch_command = CommandRunner._run_batch_command
+    _sudo_cmd = CommandRunner._sudo_cmd
@@ -0,0 +1,86 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+import shutil
+
+import pytest
+
+from sdcm.remote import LocalCmdRunner
+from sdcm.utils.backtrace_decoder import ADDR2LINE_CMD, BacktraceDecoder
+
+STALL_BACKTRACE = "0x6c5af2\n0x5d41ac\n/lib64/libpthread.so.0+0xf5cf"
+OTHER_BACKTRACE = "0x6c5af2\n0x5d4666"
+
+
+class FakeAddr2line:
+    """Emulates addr2line: symbol of 0x5d41ac has an inlined frame."""
+
+    def __init__(self):
+        self.commands = []
+
+    @staticmethod
+    def symbol(address):
+        text = f"func_{address} at file.cc:1\n"
+        if address == "0x5d41ac":
+            text += f" (inlined by) caller_{address} at file.cc:2\n"
+        return text
+
+    def __call__(self, cmd):
+        self.commands.append(cmd)
+        _, options, _, *addresses = cmd.split()
+        with_address = "a" in options
+        return "".join((f"0x{int(address.split('+')[-1], 16):016x}: " if with_address else "") + self.symbol(address)
+                       for address in addresses)
+
+
+def test_backtraces_are_decoded_in_one_call_and_cached():
+    addr2line = FakeAddr2line()
+    decoder = BacktraceDecoder(run_command=addr2line)
+    backtraces = [("/tmp/debug_1", STALL_BACKTRACE)] * 3 + [("/tmp/debug_1", OTHER_BACKTRACE)]
+    decoded = decoder.decode(backtraces)
+    assert decoded[:3] == ["".join(map(addr2line.symbol, STALL_BACKTRACE.split()))] * 3
+    assert decoded[3] == addr2line.symbol("0x6c5af2") + addr2line.symbol("0x5d4666")
+    assert addr2line.commands == [
+        "addr2line -Cpifae /tmp/debug_1 0x6c5af2 0x5d41ac /lib64/libpthread.so.0+0xf5cf 0x5d4666"]
+    assert decoder.decode([("/tmp/debug_1", OTHER_BACKTRACE), ("/tmp/debug_2", OTHER_BACKTRACE)]) == [decoded[3]] * 2
+    assert addr2line.commands[1:] == ["addr2line -Cpifae /tmp/debug_2 0x6c5af2 0x5d4666"]
+
+
+def test_evicted_addresses_are_resolved_again():
+    addr2line = FakeAddr2line()
+    decoder = BacktraceDecoder(run_command=addr2line)
+    decoder.cache_size = 2
+    expected = "".join(map(addr2line.symbol, STALL_BACKTRACE.split()))
+    assert decoder.decode([("/tmp/debug_1", STALL_BACKTRACE)]) == [expected]
+    assert len(addr2line.commands) == 2
+
+
+def test_fallback_to_decoding_one_by_one():
+    commands = []
+
+    def run_command(cmd):
+        commands.append(cmd)
+        return "unexpected output\n"
+
+    decoder = BacktraceDecoder(run_command=run_command)
+    assert decoder.decode([("/tmp/debug_1", STALL_BACKTRACE)] * 2) == ["unexpected output\n"] * 2
+    assert commands[1:] == [f"{ADDR2LINE_CMD} /tmp/debug_1 0x6c5af2 0x5d41ac /lib64/libpthread.so.0+0xf5cf"]
+
+
+@pytest.mark.skipif(not shutil.which("addr2line"), reason="addr2line is not installed")
+def test_same_output_as_addr2line_per_backtrace():
+    remoter = LocalCmdRunner()
+    decoder = BacktraceDecoder(run_command=lambda cmd: remoter.run(cmd, verbose=False).stdout)
+    debug_file = shutil.which("addr2line")
+    expected = remoter.run(f"{ADDR2LINE_CMD} {debug_file} {' '.join(STALL_BACKTRACE.split())}", verbose=False).stdout
+    assert decoder.decode([(debug_file, STALL_BACKTRACE)]) == [expected]
@@ -16,6 +16,7 @@ import json
 from multiprocessing import Queue
 import unittest
 from functools import cached_property
+from unittest.mock import MagicMock, patch
 
 from sdcm.cluster import TestConfig
 from sdcm.db_log_reader import DbLogReader
@@ -188,3 +189,33 @@ class TestDecodeBactraces(unittest.TestCase, EventsUtilsMixin):
             if event.get('backtrace') and event.get('raw_backtrace'):
                 self.assertEqual(event['backtrace'].strip(),
                                  "addr2line -Cpife scylla_debug_info_file {}".format(' '.join(event['raw_backtrace'].split("\n"))))
+
+    def test_05_failed_backtrace_does_not_fail_batch(self):
+        class Decoder:
+            def decode(self, backtraces):
+                if any(raw_backtrace == "bad" for _, raw_backtrace in backtraces):
+                    raise ValueError("addr2line failed")
+                return [f"decoded {raw_backtrace} with {debug_file}" for debug_file, raw_backtrace in backtraces]
+
+        def copy_scylla_debug_info(node_name, build_id):
+            if build_id is None:
+                raise ValueError("no build id")
+            return f"debug_{build_id}"
+
+        def set_backtrace_known_issue(event):
+            if event.raw_backtrace == "known":
+                raise ConnectionError("github is not available")
+            event.known_issue = "issue"
+
+        batch = [{"node": "node", "build_id": build_id, "event": MagicMock(raw_backtrace=raw_backtrace,
+                                                                           backtrace=None, known_issue=None)}
+                 for build_id, raw_backtrace in (("1", "good"), (None, "no_build_id"), ("1", "bad"), ("2", "known"))]
+        with patch.object(self.monitor_node, "copy_scylla_debug_info", side_effect=copy_scylla_debug_info), \
+                patch.object(self.monitor_node, "_set_backtrace_known_issue", side_effect=set_backtrace_known_issue):
+            self.monitor_node._decode_and_publish_backtraces(Decoder(), {}, batch)
+
+        events = [obj["event"] for obj in batch]
+        assert [event.backtrace for event in events] == ["decoded good with debug_1", None, None,
+                                                         "decoded known with debug_2"]
+        assert [event.known_issue for event in events] == ["issue", None, None, None]
+        assert all(event.publish.called for event in events)
@@ -0,0 +1,66 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+import os
+import random
+
+import pytest
+
+from sdcm.utils.external_sort import SortedRows, iter_missing
+
+
+@pytest.fixture(name="rows")
+def fixture_rows():
+    rows = [(random.randrange(1000), f"key{idx % 13}") for idx in range(2500)]
+    random.shuffle(rows)
+    return rows
+
+
+def test_rows_are_sorted_in_spilled_chunks(rows, tmp_path):
+    sorted_rows = SortedRows(iter(rows), chunk_size=100, tmp_dir=str(tmp_path))
+    assert sorted_rows.spilled
+    assert len(os.listdir(next(tmp_path.iterdir()))) == 25
+    assert len(sorted_rows) == len(rows)
+    assert list(sorted_rows) == sorted(rows)
+    assert list(sorted_rows) == sorted(rows), "should be possible to iterate many times"
+    assert sorted_rows == SortedRows(rows)
+    assert sorted_rows == sorted(rows)
+    assert sorted_rows != SortedRows(rows[1:])
+    assert sorted_rows != sorted(rows)[:-1]
+
+    sorted_rows.close()
+    assert not list(tmp_path.iterdir())
+
+
+def test_small_result_is_not_spilled(tmp_path):
+    with SortedRows([(3, ), (1, ), (2, )], tmp_dir=str(tmp_path)) as sorted_rows:
+        assert not sorted_rows.spilled
+        assert list(sorted_rows) == [(1, ), (2, ), (3, )]
+    assert not list(tmp_path.iterdir())
+
+
+def test_failed_fetch_removes_spilled_chunks(tmp_path):
+    def rows():
+        yield from ((idx, ) for idx in range(250))
+        raise ConnectionError("connection lost")
+
+    with pytest.raises(ConnectionError):
+        SortedRows(rows(), chunk_size=100, tmp_dir=str(tmp_path))
+    assert not list(tmp_path.iterdir())
+
+
+def test_iter_missing(rows):
+    expected = SortedRows(rows, chunk_size=100)
+    actual = SortedRows((row for row in rows if row[0] % 10), chunk_size=100)
+    assert list(iter_missing(expected=expected, actual=actual)) == sorted({row for row in rows if not row[0] % 10})
+    assert not list(iter_missing(expected=actual, actual=expected))
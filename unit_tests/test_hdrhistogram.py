@@ -0,0 +1,122 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+import random
+
+import pytest
+from hdrh.log import HistogramLogReader
+
+from sdcm.utils.hdrhistogram import (
+    _HdrHistogram,
+    _HdrRangeHistogramBuilder,
+    get_hdr_log_index,
+    make_hdrhistogram_summary,
+    make_hdrhistogram_summary_by_interval,
+)
+
+START_TIME = 1_700_000_000
+TAGS = ("WRITE-st", "WRITE-rt", "READ-st", "READ-rt")
+
+
+def write_hdr_file(path, start_time=START_TIME, intervals=60, interval_length=10, tags=TAGS, seed=0):
+    """Write HDR log file in the cassandra-stress format: relative timestamps and a tagged line per interval."""
+    rnd = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as hdr_file:
+        hdr_file.write(f"#[StartTime: {start_time:.3f} (seconds since epoch), Tue Nov 14 22:13:20 UTC 2023]\n")
+        hdr_file.write('"StartTimestamp","Interval_Length","Interval_Max","Interval_Compressed_Histogram"\n')
+        for interval in range(intervals):
+            for tag in tags:
+                histogram = _HdrHistogram()
+                for _ in range(50):
+                    histogram.record_value(rnd.randint(100_000, 50_000_000))
+                hdr_file.write(f"Tag={tag},{interval * interval_length:.3f},{interval_length:.3f},"
+                               f"{histogram.get_max_value() / 1_000_000:.3f},{histogram.encode().decode()}\n")
+
+
+def build_histogram_by_log_reader(builder, hdr_file, hdr_tag):
+    """Straightforward reading of all intervals in the range by HistogramLogReader."""
+    reader = HistogramLogReader(hdr_file, _HdrHistogram())
+    histogram = _HdrHistogram()
+    histogram.set_tag(hdr_tag)
+    while next_hist := reader.get_next_interval_histogram(range_start_time_sec=builder.start_time,
+                                                          range_end_time_sec=builder.end_time,
+                                                          absolute=builder.absolute_time):
+        if next_hist.get_tag() == hdr_tag:
+            if histogram.get_start_time_stamp() == 0:
+                histogram.set_start_time_stamp(next_hist.get_start_time_stamp())
+            histogram.add(next_hist)
+    return histogram
+
+
+@pytest.mark.parametrize("start_time,end_time,absolute", (
+    (START_TIME, START_TIME + 600, True),
+    (START_TIME + 95, START_TIME + 300, True),
+    (START_TIME + 300, START_TIME + 300, True),
+    (START_TIME + 1000, START_TIME + 2000, True),
+    (100, 200, False),
+))
+def test_build_histogram_from_file_by_index(tmp_path, start_time, end_time, absolute):
+    hdr_file = str(tmp_path / "hdrh-cs-write-l1-c0-k1-test.hdr")
+    write_hdr_file(hdr_file)
+    builder = _HdrRangeHistogramBuilder(hdr_tags=list(TAGS), stress_operation="write",
+                                        start_time=start_time, end_time=end_time)
+    builder.absolute_time = absolute
+    for tag in TAGS:
+        expected = build_histogram_by_log_reader(builder, hdr_file, tag)
+        range_histogram = builder._build_histogram_from_file(hdr_file, tag)
+        if expected.get_start_time_stamp() == 0:
+            assert range_histogram is None
+            continue
+        histogram = range_histogram.histogram
+        assert histogram.get_total_count() == expected.get_total_count()
+        assert histogram.get_start_time_stamp() == expected.get_start_time_stamp()
+        assert histogram.get_end_time_stamp() == expected.get_end_time_stamp()
+        assert histogram.get_percentile_to_value_dict([50, 99, 99.9]) == \
+            expected.get_percentile_to_value_dict([50, 99, 99.9])
+
+
+def test_hdr_log_index_is_extended(tmp_path):
+    hdr_file = tmp_path / "hdrh-cs-write-l1-c0-k1-test.hdr"
+    write_hdr_file(hdr_file, intervals=2, tags=("WRITE-st", ))
+    lines = hdr_file.read_bytes().splitlines(keepends=True)
+    hdr_file.write_bytes(b"".join(lines[:-1]) + lines[-1][:20])  # the last line is still being written
+    assert len(get_hdr_log_index(str(hdr_file)).offsets) == 1
+    with hdr_file.open("ab") as fobj:
+        fobj.write(lines[-1][20:])
+    index = get_hdr_log_index(str(hdr_file))
+    assert index.tags == ["WRITE-st", "WRITE-st"]
+    assert index.absolute_start_times == [START_TIME, START_TIME + 10]
+    assert index.relative_start_times == [0, 10]
+    assert index.find(range_start_time_sec=START_TIME + 5, range_end_time_sec=START_TIME + 600, absolute=True) == [1]
+
+
+def test_make_hdrhistogram_summary_by_interval(tmp_path):
+    for loader in range(2):
+        (tmp_path / f"loader-{loader}").mkdir()
+        write_hdr_file(tmp_path / f"loader-{loader}" / "hdrh-cs-write-l1-c0-k1-test.hdr", seed=loader)
+    summary = make_hdrhistogram_summary_by_interval(
+        hdr_tags=["WRITE-rt", "READ-rt"], stress_operation="mixed", path=str(tmp_path),
+        start_time=START_TIME, end_time=START_TIME + 600, interval=200)
+    assert len(summary) == 3
+    assert [interval["WRITE--WRITE-rt"]["start_time"] for interval in summary] == \
+        [START_TIME * 1000, (START_TIME + 200) * 1000, (START_TIME + 400) * 1000]
+
+    # Same as building of a summary for every interval and tag separately.
+    for interval_summary, start_interval in zip(summary, range(START_TIME, START_TIME + 600, 200)):
+        builder = _HdrRangeHistogramBuilder(hdr_tags=["WRITE-rt", "READ-rt"], stress_operation="mixed",
+                                            start_time=start_interval, end_time=start_interval + 200)
+        assert interval_summary == {**builder.build_histogram_summary_by_tag(str(tmp_path), "WRITE-rt"),
+                                    **builder.build_histogram_summary_by_tag(str(tmp_path), "READ-rt")}
+    total = make_hdrhistogram_summary(hdr_tags=["WRITE-rt", "READ-rt"], stress_operation="mixed",
+                                      start_time=START_TIME, end_time=START_TIME + 600, base_path=str(tmp_path))
+    assert set(total[0]) == {"WRITE--WRITE-rt", "READ--READ-rt"}
@@ -0,0 +1,73 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from sdcm.utils.latency_journal import LatencyResultsJournal
+
+
+@pytest.fixture(name="journal")
+def fixture_journal(tmp_path):
+    path = tmp_path / "latency_results.json"
+    path.touch()
+    return LatencyResultsJournal(str(path))
+
+
+def test_records_are_reconstructed_into_results_dict(journal):
+    assert journal.load() == {}
+    assert journal.add_steady_state({"op rate": 1})
+    assert not journal.add_steady_state({"op rate": 2})
+    assert journal.add_cycle("_add_node", {"op rate": 3}, legend="Add node") == 1
+    assert journal.add_cycle("_add_node", {"op rate": 4}) == 2
+    assert journal.add_cycle("major_compaction", {"op rate": 5}) == 1
+    assert journal.load() == {
+        "Steady State": {"op rate": 1},
+        "_add_node": {"legend": "Add node", "cycles": [{"op rate": 3}, {"op rate": 4}]},
+        "major_compaction": {"legend": "major_compaction", "cycles": [{"op rate": 5}]},
+    }
+
+
+def test_concurrent_appends(journal):
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        cycles = list(executor.map(lambda idx: journal.add_cycle("nemesis", {"idx": idx}), range(200)))
+    assert sorted(cycles) == list(range(1, 201))
+    assert sorted(cycle["idx"] for cycle in journal.load()["nemesis"]["cycles"]) == list(range(200))
+
+
+def test_torn_record_is_skipped(journal):
+    journal.add_cycle("nemesis", {"idx": 0})
+    with open(journal.path, "a", encoding="utf-8") as file:
+        file.write('{"journal_record": "cycle", "name": "nem')  # killed in the middle of append
+    journal.add_cycle("nemesis", {"idx": 1})
+    assert journal.load()["nemesis"]["cycles"] == [{"idx": 0}, {"idx": 1}]
+
+
+def test_compact_and_legacy_format(journal):
+    with open(journal.path, "w", encoding="utf-8") as file:
+        json.dump({"Steady State": {"op rate": 1}, "nemesis": {"legend": "nemesis", "cycles": [{"idx": 0}]}}, file)
+    assert not journal.add_steady_state({"op rate": 2})
+    assert journal.add_cycle("nemesis", {"idx": 1}) == 2
+    results = journal.compact()
+    assert results == {"Steady State": {"op rate": 1},
+                       "nemesis": {"legend": "nemesis", "cycles": [{"idx": 0}, {"idx": 1}]}}
+    with open(journal.path, encoding="utf-8") as file:
+        assert json.load(file) == results
+    journal.compact(results | {"summary": {}})
+    assert journal.add_cycle("nemesis", {"idx": 2}) == 3
+    assert journal.load()["summary"] == {}
+    journal.clear()
+    assert journal.load() == {}
+    assert journal.add_cycle("nemesis", {"idx": 3}) == 1
@@ -0,0 +1,105 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+import time
+import threading
+
+import pytest
+
+from sdcm.utils.latency_pipeline import LatencyCyclesPipeline
+from sdcm.utils.parallel_executor import get_parallel_executor
+
+
+def sleep_and_return(delay, value):
+    def stage():
+        time.sleep(delay)
+        return value
+    return stage
+
+
+def test_cycles_are_persisted_in_order_and_stages_run_concurrently():
+    persisted = []
+    pipeline = LatencyCyclesPipeline(max_pending_cycles=3)
+
+    def persist(stages):
+        persisted.append({stage: future.result() for stage, future in stages.items()})
+
+    start_time = time.perf_counter()
+    pipeline.submit("slow", {"a": sleep_and_return(0.4, 1), "b": sleep_and_return(0.4, 2)}, persist)
+    pipeline.submit("fast", {"a": sleep_and_return(0, 3), "b": sleep_and_return(0.1, 4)}, persist)
+    pipeline.submit("empty", {}, persist)
+    assert time.perf_counter() - start_time < 0.1, "submit shouldn't wait for the stages"
+    assert pipeline.flush(timeout=10)
+    assert time.perf_counter() - start_time < 0.7
+    assert persisted == [{"a": 1, "b": 2}, {"a": 3, "b": 4}, {}]
+    assert pipeline.in_flight == 0
+    assert {"a", "b", "persist"} <= set(pipeline.get_stage_stats())
+
+
+def test_submit_is_bounded_and_failures_dont_block():
+    release = threading.Event()
+    persisted = []
+    pipeline = LatencyCyclesPipeline(max_pending_cycles=1)
+
+    def failing_stage():
+        release.wait(10)
+        raise ValueError("no data")
+
+    def persist(stages):
+        persisted.append(stages["stage"].exception())
+        raise RuntimeError("Argus is down")
+
+    pipeline.submit("first", {"stage": failing_stage}, persist)
+    second = threading.Thread(target=pipeline.submit, args=("second", {"stage": failing_stage}, persist))
+    second.start()
+    second.join(0.2)
+    assert second.is_alive(), "second cycle should wait for a free slot"
+    assert not pipeline.flush(timeout=0.1)
+    release.set()
+    second.join(10)
+    assert pipeline.flush(timeout=10)
+    assert [str(exc) for exc in persisted] == ["no data", "no data"]
+
+
+def test_max_pending_cycles_validation():
+    with pytest.raises(ValueError):
+        LatencyCyclesPipeline(max_pending_cycles=0)
+
+
+def test_cycles_are_not_cancelled_with_group_of_first_caller():
+    persisted = []
+    pipeline = LatencyCyclesPipeline(max_pending_cycles=4)
+
+    def persist(stages):
+        persisted.append(stages["stage"].result())
+
+    # e.g., a nemesis run by ParallelObject, which cancels its group on a timeout
+    nemesis_group = get_parallel_executor().task_group(name="nemesis")
+    nemesis_group.submit(pipeline.submit, "first", {"stage": sleep_and_return(0.1, 0)}, persist).result(timeout=10)
+    nemesis_group.cancel()
+    for idx in range(1, 4):
+        pipeline.submit(f"cycle-{idx}", {"stage": sleep_and_return(0, idx)}, persist)
+    assert pipeline.flush(timeout=10)
+    assert persisted == [0, 1, 2, 3]
+
+
+def test_cancelled_persist_is_not_in_flight():
+    persisted = []
+    pipeline = LatencyCyclesPipeline(max_pending_cycles=1)
+    pipeline.submit("first", {}, persisted.append)
+    assert pipeline.flush(timeout=10)
+    pipeline._groups["persist"].cancel()
+    pipeline.submit("second", {}, persisted.append)
+    assert pipeline.flush(timeout=2)
+    assert pipeline.in_flight == 0
+    assert persisted == [{}]
@@ -11,11 +11,22 @@
 #
 # Copyright (c) 2022 ScyllaDB
 
+import os
 import uuid
+from pathlib import Path
 
 import pytest
 
-from sdcm.logcollector import Collector
+from sdcm.logcollector import (
+    Collector,
+    CollectingNode,
+    CommandLog,
+    FileLog,
+    LogCollector,
+    check_archive,
+    get_dir_size,
+)
+from sdcm.remote import LocalCmdRunner
 from sdcm.provision import provisioner_factory
 from unit_tests.lib.fake_resources import prepare_fake_region
 
@@ -47,3 +58,36 @@ def test_create_collecting_nodes(test_id, tmp_path_factory):
     assert len(collector.monitor_set) == len(monitor_nodes)
     for collecting_node, v_m in zip(collector.monitor_set, monitor_nodes):
         assert collecting_node.name == v_m.name
+
+
+class StreamingLogCollector(LogCollector):
+    cluster_log_type = "streaming"
+    log_entities = [
+        CommandLog(name="big.log", command="seq 1 100000"),
+        CommandLog(name="failed.log", command="echo partial output; exit 3"),
+        FileLog(name="system.log", command="echo system log"),
+    ]
+
+
+def test_logs_are_streamed_and_collected_incrementally(test_id, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(LogCollector, "collect_log_remotely", None)  # no intermediate files on the node
+    collector = StreamingLogCollector(nodes=[CollectingNode(name="node-1")], test_id=test_id,
+                                      storage_dir=str(tmp_path), params=None)
+    node_dir = Path(collector.local_dir) / "node-1"
+
+    stats = collector.collect_logs_from_node(collector.nodes[0])
+    assert (node_dir / "big.log").read_text() == "".join(f"{idx}\n" for idx in range(1, 100001))
+    assert (node_dir / "failed.log").read_text() == "partial output\n"
+    assert (node_dir / "system.log").read_text() == "system log\n"
+    assert sorted(os.listdir(node_dir)) == ["big.log", "failed.log", "system.log"]
+    assert stats.size == get_dir_size(str(node_dir))
+    assert stats.failed == 0
+    assert collector.nodes_stats == {"node-1": stats}
+
+    (node_dir / "failed.log").unlink()
+    stats = collector.collect_logs_from_node(collector.nodes[0])
+    assert stats.size == len("partial output\n")
+
+    archive = collector.archive_to_tarfile(collector.local_dir)
+    assert check_archive(LocalCmdRunner(), archive)
@@ -0,0 +1,86 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+import math
+import random
+import logging
+import statistics
+from types import SimpleNamespace
+
+import pytest
+
+from sdcm import db_stats
+from sdcm.utils.latency import calculate_latency
+from sdcm.utils.metric_series import MetricSeries
+
+
+@pytest.fixture(name="prometheus_values")
+def fixture_prometheus_values():
+    rnd = random.Random(14)
+    return [[1700000000 + 20 * index, "NaN" if rnd.random() < 0.05 else str(rnd.lognormvariate(1, 1))]
+            for index in range(10_000)]
+
+
+def test_parsing_drops_nan(prometheus_values):
+    series = MetricSeries.from_prometheus_values(prometheus_values)
+    expected = [(float(ts), float(val)) for ts, val in prometheus_values if val.lower() != "nan"]
+    assert list(zip(series.timestamps, series.values)) == expected
+    assert not MetricSeries.from_prometheus_values([])
+    assert not MetricSeries.from_prometheus_values([[1, "NaN"], [2, "nan"]])
+
+
+def test_stats_are_the_same_as_per_element_ones(prometheus_values):
+    values = [float(val) for _, val in prometheus_values if val.lower() != "nan"]
+    series = MetricSeries.from_prometheus_values(prometheus_values)
+    assert series.mean() == sum(values) / len(values)
+    assert series.max() == max(values) and series.min() == min(values)
+    assert series.stdev() == pytest.approx(statistics.stdev(values), rel=1e-12)
+    assert series.pstdev() == pytest.approx(statistics.pstdev(values), rel=1e-12)
+    assert series.count_above(10) == len([val for val in values if val > 10])
+    assert list(series.at_least(5).values) == [val for val in values if val >= 5]
+    assert series.percentile(0) == min(values) and series.percentile(100) == max(values)
+    assert series.percentile(50) == statistics.median(values)
+    assert series.percentile(99) == pytest.approx(statistics.quantiles(values, n=100, method="inclusive")[-1])
+
+
+def test_concatenate_and_is_constant():
+    series = MetricSeries.concatenate([MetricSeries([1, 2]), MetricSeries(), MetricSeries([3])])
+    assert list(series.values) == [1, 2, 3]
+    assert not series.is_constant()
+    assert MetricSeries([7, 7, 7]).is_constant()
+
+
+def test_downsample():
+    series = MetricSeries.from_prometheus_values([[0, "1"], [20, "3"], [40, "NaN"], [60, "5"], [80, "7"], [120, "9"]])
+    downsampled = series.downsample(60)
+    assert list(downsampled.timestamps) == [0, 60, 120]
+    assert list(downsampled.values) == [2, 6, 9]
+
+
+def test_calc_stats(prometheus_values):
+    values = [float(val) for _, val in prometheus_values if val.lower() != "nan"]
+    filtered = [val for val in values if val >= max(values) * 0.01]
+    stats = db_stats.TestStatsMixin._calc_stats(SimpleNamespace(log=logging.getLogger()), prometheus_values)
+    assert stats == {"max": max(values), "min": min(filtered), "avg": sum(filtered) / len(filtered),
+                     "stdev": db_stats.stddev(filtered)}
+    mean = sum(filtered) / len(filtered)
+    assert stats["stdev"] == math.sqrt(sum((val - mean) ** 2 for val in filtered) / len(filtered))
+
+
+def test_calculate_latency():
+    results = {
+        "Steady State": {"latency 99th percentile": 2.0},
+        "Nemesis": {"cycles": [{"latency 99th percentile": 3.0, "latency 99th percentile_stdev": 0.5},
+                               {"latency 99th percentile": "3.5"}]},
+    }
+    assert calculate_latency(results)["Nemesis"]["Cycles Average"] == {"latency 99th percentile": 3.25}
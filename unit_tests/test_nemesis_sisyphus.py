@@ -1,8 +1,14 @@
+import ast
+import inspect
+from pathlib import Path
+
+import pytest
 import yaml
 
 from sdcm import sct_abs_path
 from sdcm.nemesis import Nemesis, COMPLEX_NEMESIS
-from sdcm.nemesis_registry import NemesisRegistry
+from sdcm.nemesis_registry import NemesisRegistry, get_disrupt_method_from_class
+from sdcm.utils.ast_utils import BooleanEvaluator
 
 
 def test_list_all_available_nemesis(generate_file=True):
@@ -24,3 +30,42 @@ def test_list_all_available_nemesis(generate_file=True):
         static_nemesis_list = yaml.safe_load(nemesis_file)
 
     assert static_nemesis_list == method_properties
+
+
+def get_test_cases_nemesis_selectors() -> list[str]:
+    selectors = set()
+    for config_file in Path(sct_abs_path("test-cases")).rglob("*.yaml"):
+        config = yaml.safe_load(config_file.read_text(encoding="utf-8"))
+        if not isinstance(config, dict) or not (selector := config.get("nemesis_selector")):
+            continue
+        for phrase in selector if isinstance(selector, list) else [selector]:
+            if phrase:
+                selectors.update({phrase, f"{phrase} and kubernetes", f"{phrase} and not disabled"})
+    return sorted(selectors)
+
+
+def filter_subclasses_by_evaluator(registry, logical_phrase):
+    """Reference implementation, evaluates the selector AST per class"""
+    expression_ast = ast.parse(logical_phrase, mode="eval")
+    evaluator = BooleanEvaluator()
+    nemesis_subclasses = []
+    for nemesis in registry.get_subclasses():
+        if nemesis in registry.excluded_list:
+            continue
+        evaluator.context = dict(**nemesis.__dict__, **{nemesis.__name__: True})
+        if method_name := get_disrupt_method_from_class(nemesis):
+            evaluator.context[method_name] = True
+        if evaluator.visit(expression_ast):
+            nemesis_subclasses.append(nemesis)
+    return nemesis_subclasses
+
+
+@pytest.mark.parametrize("logical_phrase", get_test_cases_nemesis_selectors())
+def test_filter_subclasses_equivalent_to_evaluator(logical_phrase):
+    registry = NemesisRegistry(Nemesis, COMPLEX_NEMESIS)
+    expected = filter_subclasses_by_evaluator(registry, logical_phrase)
+
+    assert registry.filter_subclasses(registry.get_subclasses(), logical_phrase) == expected
+    assert registry.get_disrupt_methods(logical_phrase) == [
+        func for name, func in inspect.getmembers(Nemesis)
+        if name in {get_disrupt_method_from_class(nemesis) for nemesis in expected} and callable(func)]
@@ -0,0 +1,123 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from functools import partial
+from types import SimpleNamespace
+from unittest.mock import patch
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+
+from sdcm.db_stats import PrometheusDBStats
+from sdcm.utils.latency import collect_latency
+
+PROMETHEUS_CONFIG = """
+global:
+  scrape_interval: 20s
+scrape_configs:
+- job_name: scylla
+  scrape_interval: 20s
+"""
+
+
+class FakePrometheusHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):  # noqa: N802
+        url = urlparse(self.path)
+        if url.path == "/api/v1/status/config":
+            self.server.config_requests += 1
+            data = {"yaml": PROMETHEUS_CONFIG}
+        elif url.path == "/api/v1/query_range":
+            time.sleep(self.server.query_delay)
+            query = parse_qs(url.query)["query"][0]
+            with self.server.lock:
+                self.server.queries.append(query)
+            data = {"resultType": "matrix", "result": self.server.results.get(query, [])}
+        else:
+            self.send_error(404)
+            return
+        body = json.dumps({"status": "success", "data": data}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def prometheus_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakePrometheusHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connections = server.config_requests = 0
+    server.queries = []
+    server.results = {}
+    server.query_delay = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_connections_are_reused_and_config_is_cached(prometheus_server):
+    prometheus_server.results["up"] = [{"metric": {}, "values": [[1, "1"], [2, "1"]]}]
+    for _ in range(3):
+        prometheus = PrometheusDBStats(host="127.0.0.1", port=prometheus_server.server_port)
+        assert prometheus.scylla_scrape_interval == 20
+        assert prometheus.query("up", start=0, end=200) == [{"metric": {}, "values": [[1, "1"], [2, "1"]]}]
+    assert prometheus_server.config_requests == 1
+    assert prometheus_server.connections == 1
+
+
+def test_query_many_runs_queries_concurrently(prometheus_server):
+    prometheus_server.query_delay = 0.3
+    prometheus_server.results = {f"metric_{index}": [{"metric": {"index": str(index)}, "values": []}]
+                                 for index in range(4)}
+    prometheus = PrometheusDBStats(host="127.0.0.1", port=prometheus_server.server_port)
+    start_time = time.perf_counter()
+    results = prometheus.query_many({index: f"metric_{index}" for index in range(4)}, start=0, end=200)
+    assert time.perf_counter() - start_time < 1
+    assert results == {index: [{"metric": {"index": str(index)}, "values": []}] for index in range(4)}
+
+
+def test_collect_latency(prometheus_server):
+    write_latency = ('histogram_quantile(0.99,sum(rate(scylla_storage_proxy_coordinator_write_latency_bucket{}[200s]))'
+                     ' by (instance, le))')
+    prometheus_server.results = {
+        'sct_cassandra_stress_write_gauge{type="lat_perc_99"}': [{"metric": {}, "values": [[1, "2"], [2, "4"]]}],
+        'sct_cassandra_stress_write_gauge{type="lat_perc_95"}': [{"metric": {}, "values": [[1, "1"], [2, "NaN"]]}],
+        write_latency: [{"metric": {"instance": "10.0.0.1"}, "values": [[1, "3000"], [2, "5000"]]}],
+    }
+    node = SimpleNamespace(name="longevity-db-node-1", ip_address="10.0.0.1")
+    cluster = SimpleNamespace(get_node_by_ip=lambda ip: node if ip == node.ip_address else None)
+    monitor_node = SimpleNamespace(external_address="127.0.0.1")
+    prometheus_class = partial(PrometheusDBStats, port=prometheus_server.server_port)
+    with patch("sdcm.utils.latency.PrometheusDBStats", prometheus_class):
+        result = collect_latency(monitor_node, start=0, end=200, load_type="write", cluster=cluster, nodes_list=[])
+    assert result == {"c-s P99": 3.0, "c-s P99_stdev": 1.41, "c-s P99_points_above_threshold": 0, "c-s P99 max": 4.0,
+                      "Scylla P99_write - node-1": 4.0}
+    assert len(prometheus_server.queries) == 3
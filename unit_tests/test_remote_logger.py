@@ -0,0 +1,120 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+import json
+import time
+import subprocess
+
+import pytest
+
+from sdcm.utils.remote_logger import POSITION_MARKER, ResumableLogWriter, follow_file_cmd, follow_journal_cmd
+
+FAKE_JOURNALCTL = """#!/usr/bin/env python3
+import sys
+records = open({records!r}).read().splitlines()
+cursors = [__import__("json").loads(record)["__CURSOR"] for record in records]
+after = [arg.split("=", 1)[1] for arg in sys.argv if arg.startswith("--after-cursor=")]
+start = cursors.index(after[0]) + 1 if after else 0
+print("\\n".join(records[start:]))
+"""
+
+
+@pytest.fixture(name="journalctl")
+def fixture_journalctl(tmp_path):
+    records = [{"__CURSOR": f"s=a1b2;i={idx:x};b=c3d4", "__REALTIME_TIMESTAMP": str(1700000000000000 + idx * 1000),
+                "_HOSTNAME": "db-node-1", "PRIORITY": "6", "SYSLOG_IDENTIFIER": "scylla", "_PID": "7",
+                "MESSAGE": f"message {idx}" + ("\nsecond line" if idx % 50 == 7 else "")}
+               for idx in range(250)]
+    (tmp_path / "records.json").write_text("\n".join(json.dumps(record) for record in records))
+    journalctl = tmp_path / "journalctl"
+    journalctl.write_text(FAKE_JOURNALCTL.format(records=str(tmp_path / "records.json")))
+    journalctl.chmod(0o755)
+    return str(journalctl)
+
+
+def run_cmd(cmd: str) -> list[str]:
+    output = subprocess.run(["bash", "-c", cmd], capture_output=True, check=True, text=True).stdout
+    return [f"{line}\n" for line in output.split("\n")[:-1]]  # not splitlines(): the marker is a line boundary for it
+
+
+@pytest.mark.parametrize("disconnect_at", [0, 99, 150])
+def test_journal_is_resumed_by_cursor(tmp_path, journalctl, disconnect_at):
+    lines = run_cmd(follow_journal_cmd(journalctl, cursor=None))
+    expected = [line for line in lines if not line.startswith(POSITION_MARKER)]
+    assert len(expected) == 255
+    assert expected[0] == "2023-11-14T22:13:20.000 db-node-1 !INFO | scylla[7]: message 0\n"
+
+    log_file = tmp_path / "system.log"
+    with ResumableLogWriter(str(log_file)) as writer:
+        for line in lines[:disconnect_at]:
+            writer.submit_line(line)
+        writer.submit_line(lines[disconnect_at][:10])  # connection lost in the middle of a line
+        writer.reconnect()
+        for line in run_cmd(follow_journal_cmd(journalctl, cursor=writer.position)):
+            writer.submit_line(line)
+    assert log_file.read_text() == "".join(expected)
+
+
+def test_file_is_resumed_by_offset(tmp_path):
+    remote_file = tmp_path / "syslog"
+    remote_file.write_text("".join(f"line {idx}\n" for idx in range(300)))
+    log_file = tmp_path / "system.log"
+
+    def follow(writer, till_line):
+        with subprocess.Popen(["bash", "-c", follow_file_cmd(str(remote_file), offset=writer.position)],
+                              stdout=subprocess.PIPE, text=True, start_new_session=True) as proc:
+            try:
+                for line in proc.stdout:
+                    writer.submit_line(line)
+                    if line == f"line {till_line}\n":
+                        break
+            finally:
+                subprocess.run(["pkill", "-s", str(proc.pid)], check=False)
+        writer.reconnect()
+
+    with ResumableLogWriter(str(log_file)) as writer:
+        follow(writer, till_line=299)
+        with remote_file.open("a") as file:
+            file.write("".join(f"line {idx}\n" for idx in range(300, 550)))
+        follow(writer, till_line=420)
+        follow(writer, till_line=549)
+    assert log_file.read_text() == "".join(f"line {idx}\n" for idx in range(290, 550))
+
+
+def test_writer_flushes_periodically(tmp_path, monkeypatch):
+    monkeypatch.setattr(ResumableLogWriter, "FLUSH_INTERVAL", 0.1)
+    log_file = tmp_path / "system.log"
+    with ResumableLogWriter(str(log_file)) as writer:
+        writer.submit("line 1\nline 2\npartial")
+        writer.submit("line 1\nline 2\npartial line 3\n")
+        deadline = time.perf_counter() + 5
+        while log_file.read_text() != "line 1\nline 2\npartial line 3\n" and time.perf_counter() < deadline:
+            time.sleep(0.1)
+        assert log_file.read_text() == "line 1\nline 2\npartial line 3\n"
+        assert writer.lines_after_position == 3
+
+
+def test_position_in_replayed_output(tmp_path):
+    log_file = tmp_path / "system.log"
+    with ResumableLogWriter(str(log_file)) as writer:
+        for line in [f"{POSITION_MARKER}M", "line 1", "line 2", "line 3", "line 4", "line 5"]:
+            writer.submit_line(f"{line}\n")
+        writer.reconnect()
+        for line in [f"{POSITION_MARKER}M", "line 1", "line 2", f"{POSITION_MARKER}C2", "line 3", "line 4"]:
+            writer.submit_line(f"{line}\n")
+        writer.reconnect()  # lost again while the replayed lines are still skipped
+        assert writer.position == "C2"
+        for line in [f"{POSITION_MARKER}C2", "line 3", "line 4", "line 5", "line 6"]:
+            writer.submit_line(f"{line}\n")
+        assert writer.lines_after_position == 4
+    assert log_file.read_text() == "".join(f"line {idx}\n" for idx in range(1, 7))
@@ -12,18 +12,23 @@
 # Copyright (c) 2020 ScyllaDB
 
 import os
+import time
 import getpass
 import unittest
 import threading
 from typing import Union, Optional
 from logging import getLogger
 
+from invoke import Context
+from invoke.exceptions import UnexpectedExit
+
 # from parameterized import parameterized
 
 from sdcm.remote import RemoteLibSSH2CmdRunner, RemoteCmdRunner, LocalCmdRunner, RetryableNetworkException, \
     SSHConnectTimeoutError, shell_script_cmd
 from sdcm.remote.kubernetes_cmd_runner import KubernetesCmdRunner
 from sdcm.remote.base import CommandRunner, Result
+from sdcm.remote.remote_base import RemoteCmdRunnerBase
 from sdcm.remote.remote_file import remote_file
 from sdcm.cluster_k8s import KubernetesCluster
 
@@ -376,6 +381,128 @@ class TestRemoteCmdRunners(unittest.TestCase):
         else:
             self.assertEqual(paramiko_thread_results[0].stdout, paramiko_thread_results[1].stdout)
 
+    @unittest.skip('To be ran manually')
+    def test_run_batch(self):
+        cmds = [f"sleep 0.5; echo {index}" for index in range(8)]
+        for remoter_type in (RemoteCmdRunner, RemoteLibSSH2CmdRunner):
+            remoter = remoter_type(hostname='127.0.0.1', user=getpass.getuser(), key_file=self.key_file)
+            try:
+                start_time = time.perf_counter()
+                results = remoter.run_batch(cmds, max_channels=4)
+                self.assertLess(time.perf_counter() - start_time, 2)
+                self.assertEqual([result.stdout.strip() for result in results], [str(index) for index in range(8)])
+                self.assertEqual(remoter.connection_pool.created, 4)
+            finally:
+                remoter.stop()
+
+
+class _LocalConnection:
+    """Runs commands locally, instead of SSH connection."""
+
+    def __init__(self):
+        self.context = Context()
+        self.closed = False
+
+    def run(self, command, **kwargs):
+        return self.context.run(command, **kwargs)
+
+    def open(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class _PooledRunner(RemoteCmdRunnerBase):
+    exception_retryable = (ConnectionError, )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.created_connections = []
+
+    def _create_connection(self):
+        self.created_connections.append(connection := _LocalConnection())
+        return connection
+
+    def is_up(self, timeout: float = 30):
+        return True
+
+    def _run_on_retryable_exception(self, exc: Exception, new_session: bool) -> bool:
+        return True
+
+
+class TestRunBatch(unittest.TestCase):
+    def test_results_are_ordered(self):
+        results = LocalCmdRunner().run_batch([f"sleep 0.{3 - index}; echo {index}" for index in range(4)])
+        self.assertEqual([result.stdout.strip() for result in results], ["0", "1", "2", "3"])
+
+    def test_commands_run_in_parallel(self):
+        start_time = time.perf_counter()
+        LocalCmdRunner().run_batch(["sleep 0.5"] * 4, max_channels=4)
+        self.assertLess(time.perf_counter() - start_time, 1.5)
+
+    def test_failure_is_raised_after_all_commands_are_done(self):
+        with self.assertRaises(UnexpectedExit) as context:
+            LocalCmdRunner().run_batch(["false", "sleep 0.5; echo done"], verbose=False)
+        self.assertEqual(context.exception.result.command, "false")
+        results = LocalCmdRunner().run_batch(["false", "true"], ignore_status=True, verbose=False)
+        self.assertEqual([result.exited for result in results], [1, 0])
+
+    def test_sudo_batch(self):
+        class _Runner(CommandRunner):
+            def run(self, cmd, *_, **__):
+                return Result(command=cmd)
+
+            def _create_connection(self):
+                pass
+
+            def is_up(self, timeout: Optional[float] = None) -> bool:
+                return True
+
+        results = _Runner("localhost", user="joe").sudo_batch(["true", "false"])
+        self.assertEqual([result.command for result in results], ["sudo true", "sudo false"])
+
+    def test_connections_are_pooled(self):
+        remoter = _PooledRunner(hostname="pooled-host")
+        remoter.max_channels_per_host = 3
+        try:
+            results = remoter.run_batch([f"sleep 0.2; echo {index}" for index in range(9)], verbose=False)
+            self.assertEqual([result.stdout.strip() for result in results], [str(index) for index in range(9)])
+            self.assertEqual(len(remoter.created_connections), 3)
+            remoter.run_batch(["true"] * 3, verbose=False)
+            pooled_connections = list(remoter.created_connections)
+            self.assertEqual(len(pooled_connections), 3)
+            self.assertNotIn(remoter.connection, pooled_connections)
+        finally:
+            remoter.stop()
+        self.assertTrue(all(connection.closed for connection in pooled_connections))
+
+    def test_broken_connection_is_not_reused(self):
+        remoter = _PooledRunner(hostname="broken-connection-host")
+        remoter.max_channels_per_host = 1
+        remoter.run_batch(["true"], verbose=False)
+        broken_connection = remoter.created_connections[0]
+        broken_connection.run = lambda command, **kwargs: (_ for _ in ()).throw(ConnectionError())
+        with self.assertRaises(ConnectionError):
+            remoter.run_batch(["true"], verbose=False, retry=0)
+        remoter.run_batch(["true"], verbose=False)
+        self.assertEqual(len(remoter.created_connections), 2)
+        self.assertTrue(broken_connection.closed)
+        remoter.stop()
+
+    def test_pool_is_shared_by_remoters_of_host(self):
+        remoter, other_remoter = _PooledRunner(hostname="shared-host"), _PooledRunner(hostname="shared-host")
+        remoter.max_channels_per_host = other_remoter.max_channels_per_host = 2
+        try:
+            remoter.run_batch(["true"] * 2, verbose=False)
+            other_remoter.run_batch(["true"] * 2, verbose=False)
+            self.assertIs(remoter.connection_pool, other_remoter.connection_pool)
+            self.assertEqual(len(remoter.created_connections), 2)
+            self.assertEqual(other_remoter.created_connections, [])
+            self.assertIsNot(_PooledRunner(hostname="other-host").connection_pool, remoter.connection_pool)
+        finally:
+            remoter.stop()
+
 
 class TestSudoAndRunShellScript(unittest.TestCase):
     @classmethod
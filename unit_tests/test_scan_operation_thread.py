@@ -6,8 +6,10 @@ test_scan_positive - positive scenario
 test_scan_negative_operation_timed_out - getting operation_timed_out in scan execution
 test_scan_negative_exception - getting operation_timed_out in scan execution (with and without nemesis)
 """
+from collections import namedtuple
 from pathlib import Path
 import os
+import random
 from threading import Event
 from importlib import reload
 from unittest.mock import MagicMock, patch
@@ -21,6 +23,8 @@ from sdcm.utils.issues import SkipPerIssues
 from sdcm.test_config import TestConfig
 import sdcm.scan_operation_thread
 from sdcm.scan_operation_thread import ScanOperationThread, ThreadParams, PrometheusDBStats
+from sdcm.sct_events.database import FullPartitionScanEvent, FullPartitionScanReversedOrderEvent
+from sdcm.utils.operations_thread import OperationThreadStats
 
 
 def mock_retrying_decorator(*args, **kwargs):
@@ -31,6 +35,8 @@ def mock_retrying_decorator(*args, **kwargs):
 with patch("sdcm.utils.decorators.retrying", mock_retrying_decorator):
     reload(sdcm.scan_operation_thread)
 
+Row = namedtuple("Row", ["pk", "ck"])
+
 DEFAULT_PARAMS = {
     "termination_event": Event(),
     "user": "sla_role_name",
@@ -229,3 +235,40 @@ def test_scan_negative_running_nemesis(mode, severity, running_nemesis, execute_
     all_events = get_event_log_file(events)
     assert "Severity.NORMAL" in all_events[0] and "period_type=begin" in all_events[0]
     assert f"Severity.{severity}" in all_events[1] and "period_type=end" in all_events[1]
+
+
+class FakeRowsFuture:
+    has_more_pages = False
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def add_callbacks(self, callback, errback):
+        callback(self.rows)
+
+
+@pytest.mark.parametrize("limit", ["", 3])
+def test_partition_scan_digests_comparison(limit, cluster, tmp_path):
+    params = ThreadParams(db_cluster=cluster, ks_cf="a.b", mode="partition", **DEFAULT_PARAMS)
+    operation = sdcm.scan_operation_thread.FullPartitionScanOperation(
+        generator=random.Random(1), thread_params=params, thread_stats=OperationThreadStats())
+    operation.limit = limit
+    rows = [Row(pk=1, ck=ck) for ck in range(10)]
+
+    def scan(scan_rows, scan_event):
+        operation.scan_event = scan_event
+        sdcm.scan_operation_thread.PagedResultHandler(future=FakeRowsFuture(scan_rows), scan_operation=operation)
+
+    operation.reset_digests()
+    scan(rows[::-1][:limit or None], FullPartitionScanReversedOrderEvent)
+    scan(rows, FullPartitionScanEvent)
+    assert operation._compare_digests()
+
+    scan(rows[::-1][:limit or None], FullPartitionScanReversedOrderEvent)
+    scan(rows[:-1] + [Row(pk=1, ck=42)], FullPartitionScanEvent)
+    with patch.object(TestConfig, "logdir", return_value=str(tmp_path)):
+        assert not operation._compare_digests()
+    diff_file, = (tmp_path / "fullscans").iterdir()
+    diff_line, = diff_file.read_text(encoding="utf-8").splitlines()
+    assert diff_line.startswith("1 42 ") and " | 1 9 " in diff_line
+    assert not operation.reversed_query_digests and not operation.normal_query_digests
@@ -19,7 +19,9 @@ import threading
 import multiprocessing
 
 from sdcm.sct_events.health import ClusterHealthValidatorEvent
-from sdcm.sct_events.events_device import EventsDevice, start_events_main_device, get_events_main_device
+from sdcm.sct_events.events_device import \
+    EventsDevice, BatchedEventsDevice, start_events_main_device, start_batched_events_main_device, \
+    get_events_main_device
 from sdcm.sct_events.events_processes import EventsProcessesRegistry
 from sdcm.wait import wait_for
 
@@ -89,3 +91,63 @@ class TestEventsDevice(unittest.TestCase):
             self.assertTrue(events_device.subscribe_address)
         finally:
             events_device.stop(timeout=1)
+
+
+class TestBatchedEventsDevice(unittest.TestCase):
+    temp_dir = None
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.events_processes_registry = EventsProcessesRegistry(log_dir=cls.temp_dir)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls.temp_dir)
+
+    def setUp(self):
+        self.events_device = BatchedEventsDevice(_registry=self.events_processes_registry)
+
+    def test_publish_subscribe(self):
+        events = [ClusterHealthValidatorEvent.NodeStatus() for _ in range(25)]
+
+        # Put events to the publish queue, they'll be sent in a few batches.
+        for event in events:
+            self.events_device.publish_event(event)
+
+        stop_event = threading.Event()
+        counter = multiprocessing.Value(ctypes.c_uint32, 0)
+
+        threading.Timer(interval=1, function=stop_event.set).start()  # stop subscriber in 1 second.
+        self.events_device.start_delay = 0.5
+        self.events_device.pub_batch_size = 10
+        self.events_device.start()
+
+        try:
+            events_generator = self.events_device.outbound_events(stop_event=stop_event, events_counter=counter)
+            for event in events:
+                event_class, event_received = next(events_generator)
+                self.assertEqual(event_class, "ClusterHealthValidatorEvent")
+                self.assertEqual(event_received, event)
+            self.assertRaises(StopIteration, next, events_generator)
+        finally:
+            self.events_device.stop(timeout=1)
+
+        self.assertEqual(self.events_device.events_counter, counter.value)
+        self.assertEqual(counter.value, 25)
+
+        # Raw events are flushed by the device on stop.
+        with self.events_device.raw_events_log.open() as raw_events_log:
+            self.assertEqual(len(raw_events_log.readlines()), 25)
+
+    def test_start_get_batched_events_main_device(self):
+        self.assertIsNone(get_events_main_device(_registry=self.events_processes_registry))
+        start_batched_events_main_device(_registry=self.events_processes_registry)
+        events_device = get_events_main_device(_registry=self.events_processes_registry)
+        wait_for(func=events_device.is_alive, timeout=5)
+        try:
+            self.assertIsInstance(events_device, BatchedEventsDevice)
+            self.assertEqual(events_device.events_counter, 0)
+            self.assertTrue(events_device.subscribe_address)
+        finally:
+            events_device.stop(timeout=1)
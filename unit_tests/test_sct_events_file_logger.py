@@ -13,6 +13,7 @@
 
 import time
 import unittest
+import unittest.mock
 
 from sdcm.sct_events import Severity
 from sdcm.sct_events.system import SpotTerminationEvent
@@ -104,3 +105,64 @@ class TestFileLogger(unittest.TestCase, EventsUtilsMixin):
             self.assertEqual(len(group), 5)
             for num, event in enumerate(group, start=0 if severity == Severity.CRITICAL.name else 5):
                 self.assertIn(f"m-{num}-{severity}", event)
+
+
+class TestFileLoggerBuffering(unittest.TestCase, EventsUtilsMixin):
+
+    def setUp(self) -> None:
+        self.setup_events_processes(events_device=False, events_main_device=True, registry_patcher=False)
+        # Don't flush by timer to check forced flushes.
+        with unittest.mock.patch.object(EventsFileLogger, "flush_period", 3600), \
+                unittest.mock.patch.object(EventsFileLogger, "idle_flush_delay", 3600):
+            start_events_logger(_registry=self.events_processes_registry)
+        self.file_logger = get_events_logger(_registry=self.events_processes_registry)
+
+        time.sleep(EVENTS_SUBSCRIBERS_START_DELAY)
+
+    def tearDown(self) -> None:
+        self.teardown_events_processes()
+
+    def publish_events(self, severity: Severity, count: int) -> None:
+        with self.wait_for_n_events(self.file_logger, count=count, timeout=3, last_event_processing_delay=0.5):
+            for num in range(count):
+                event = SpotTerminationEvent(node="node", message=f"m-{num}-{severity.name}")
+                event.severity = severity
+                self.events_main_device.publish_event(event)
+
+    def test_critical_event_is_flushed(self) -> None:
+        self.publish_events(Severity.WARNING, count=10)
+        self.assertEqual(self.file_logger.events_log.read_text(), "")
+        self.assertEqual(get_logger_event_summary(_registry=self.events_processes_registry), {})
+
+        self.publish_events(Severity.CRITICAL, count=1)
+        self.assertEqual(len(self.file_logger.events_log.read_text().splitlines()), 11)
+        self.assertDictEqual(get_logger_event_summary(_registry=self.events_processes_registry),
+                             {Severity.WARNING.name: 10, Severity.CRITICAL.name: 1})
+
+        self.file_logger.stop(timeout=3)
+
+    def test_error_event_is_flushed(self) -> None:
+        self.publish_events(Severity.NORMAL, count=10)
+        self.assertEqual(self.file_logger.events_log.read_text(), "")
+
+        self.publish_events(Severity.ERROR, count=1)
+        self.assertEqual(len(self.file_logger.events_log.read_text().splitlines()), 11)
+        self.assertDictEqual(get_logger_event_summary(_registry=self.events_processes_registry),
+                             {Severity.NORMAL.name: 10, Severity.ERROR.name: 1})
+        grouped = get_events_grouped_by_category(_registry=self.events_processes_registry)
+        self.assertEqual(len(grouped[Severity.ERROR.name]), 1)
+        self.assertEqual(len(grouped[Severity.NORMAL.name]), 10)
+
+        self.file_logger.stop(timeout=3)
+
+    def test_no_events_lost_on_stop(self) -> None:
+        self.publish_events(Severity.ERROR, count=100)
+        self.publish_events(Severity.NORMAL, count=100)
+        self.file_logger.stop(timeout=3)
+
+        self.assertEqual(len(self.file_logger.events_log.read_text().splitlines()), 200)
+        self.assertDictEqual(get_logger_event_summary(_registry=self.events_processes_registry),
+                             {Severity.ERROR.name: 100, Severity.NORMAL.name: 100})
+        grouped = get_events_grouped_by_category(_registry=self.events_processes_registry)
+        self.assertEqual(len(grouped[Severity.ERROR.name]), 100)
+        self.assertEqual(len(grouped[Severity.NORMAL.name]), 100)
@@ -0,0 +1,129 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+import gzip
+import json
+import shutil
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from sdcm.remote import LocalCmdRunner
+from sdcm.utils.sstable.sstable_dump import iter_sstable_dump_partitions, read_sstable_dump
+from sdcm.utils.sstable.sstable_utils import SstableUtils
+
+TOMBSTONE = {"timestamp": 1738230562965937, "deletion_time": "2025-01-30 09:49:23z"}
+
+
+def make_dump(sstable, partitions_num):
+    return {"sstables": {sstable: [
+        {"key": {"token": str(index), "raw": "0004" * (index % 5)},
+         "rows": [{"type": "clustering-row", "value": -1.5e3}]}
+        | ({"tombstone": TOMBSTONE} if index % 3 == 0 else {})
+        for index in range(partitions_num)]}}
+
+
+def expected_partitions(dump):
+    return [(sstable, partition) for sstable, partitions in dump["sstables"].items() for partition in partitions]
+
+
+@pytest.mark.parametrize("chunk_size", (1, 7, 1024, 1024 * 1024))
+def test_partitions_are_parsed_incrementally(chunk_size):
+    dump = make_dump("anonymous", 100)
+    dump["sstables"]["empty"] = []
+    text = json.dumps(dump, indent=2)
+    chunks = [text[index:index + chunk_size] for index in range(0, len(text), chunk_size)]
+    assert list(iter_sstable_dump_partitions(chunks)) == expected_partitions(dump)
+
+
+def test_truncated_dump():
+    text = json.dumps(make_dump("anonymous", 10))
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_sstable_dump_partitions([text[:-10]]))
+
+
+def test_read_gzipped_dump(tmp_path):
+    dump = make_dump("anonymous", 1000)
+    with gzip.open(tmp_path / "dump.json.gz", "wt", encoding="utf-8") as dump_file:
+        json.dump(dump, dump_file)
+    assert list(read_sstable_dump(str(tmp_path / "dump.json.gz"), chunk_size=100)) == expected_partitions(dump)
+
+
+class FakeRemoter:
+    """Runs commands locally; `fake-dump <sstable>' prints JSON dump of a generated SSTable."""
+
+    max_channels_per_host = 4
+
+    def __init__(self, dumps):
+        self.dumps = dumps
+        self.local_runner = LocalCmdRunner()
+        self.lock = threading.Lock()
+        self.running_dumps = self.max_running_dumps = 0
+
+    def run(self, cmd, **kwargs):
+        cmd = cmd.removeprefix("sudo ")
+        if cmd.startswith("fake-dump "):
+            sstable, output = cmd.removeprefix("fake-dump ").split(" 1>")
+            with self.lock:
+                self.running_dumps += 1
+                self.max_running_dumps = max(self.max_running_dumps, self.running_dumps)
+            with open(output, "w", encoding="utf-8") as dump_file:
+                json.dump(self.dumps[sstable], dump_file)
+            threading.Event().wait(0.1)
+            with self.lock:
+                self.running_dumps -= 1
+            cmd = "true"
+        return self.local_runner.run(cmd, **kwargs)
+
+    @staticmethod
+    def receive_files(src, dst):
+        shutil.copy(src, dst)
+        return True
+
+
+class FakeNode:
+    parent_cluster = None
+
+    def __init__(self, dumps):
+        self.remoter = FakeRemoter(dumps)
+
+
+@pytest.fixture
+def sstable_utils(tmp_path):
+    sstables = []
+    dumps = {}
+    for index in range(8):
+        sstables.append(sstable := str(tmp_path / f"me-{index}-big-Data.db"))
+        dumps[sstable] = make_dump("anonymous" if index % 2 else sstable, partitions_num=30 * index)
+        (tmp_path / sstable).touch()
+    with patch("sdcm.utils.sstable.sstable_utils.get_sstable_data_dump_command", return_value="fake-dump"):
+        utils = SstableUtils(ks_cf="ks.cf", db_node=FakeNode(dumps))
+        utils.get_sstables = lambda *_, **__: sstables
+        yield utils
+
+
+def test_count_tombstones(sstable_utils):
+    # only partitions of the "anonymous" SSTable are counted, the same as before
+    assert sstable_utils.count_tombstones() == sum(10 * index for index in range(8) if index % 2)
+    assert sstable_utils.db_node.remoter.max_running_dumps == 1, "SSTables should be dumped one by one by default"
+
+
+def test_get_compacted_tombstone_deletion_info(sstable_utils):
+    sstables = sstable_utils.get_sstables() + ["/var/lib/scylla/data/ks/cf/me-deleted-big-Data.db"]
+    deletion_info = sstable_utils.run_on_sstables(sstable_utils.get_compacted_tombstone_deletion_info, sstables,
+                                                  num_workers=FakeRemoter.max_channels_per_host)
+    assert sstable_utils.db_node.remoter.max_running_dumps == FakeRemoter.max_channels_per_host
+    assert [len(info) for info in deletion_info] == [0 if index % 2 else 10 * index for index in range(8)] + [0]
+    assert deletion_info[2][0] == {"key": {"token": "0", "raw": ""}, "tombstone": TOMBSTONE,
+                                   "rows": [{"type": "clustering-row", "value": -1.5e3}]}
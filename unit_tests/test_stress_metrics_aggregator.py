@@ -0,0 +1,117 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+import prometheus_client
+import pytest
+
+from sdcm.loader import CassandraStressExporter
+from sdcm.prometheus import StressMetricsAggregator
+from sdcm.wait import wait_for
+
+CS_LINE = ("total,      83086089,   70178,   70178,   70178,    14.2,    11.9,    33.2,    53.6,    77.7,   105.4, "
+           "1220.0,  0.00868,      0,      0,       0,       0,       0,       0\n")
+
+
+class FakeMetrics:
+    def __init__(self, registry):
+        self.registry = registry
+
+    def create_gauge(self, name, desc, param_list):
+        return prometheus_client.Gauge(name, desc, param_list, registry=self.registry)
+
+
+@pytest.fixture(name="registry")
+def fixture_registry():
+    return prometheus_client.CollectorRegistry()
+
+
+@pytest.fixture(name="aggregator")
+def fixture_aggregator():
+    aggregator = StressMetricsAggregator()
+    aggregator.interval = 0.1
+    return aggregator
+
+
+def test_latest_value_of_interval_is_exposed(registry, aggregator):
+    gauge = prometheus_client.Gauge("sct_test_gauge", "test", ["instance", "type"], registry=registry)
+    for value in range(1000):
+        aggregator.publish(gauge, [(("10.0.0.1", "ops"), value), (("10.0.0.1", "lat_perc_99"), value / 10)])
+    aggregator.flush()
+    assert registry.get_sample_value("sct_test_gauge", {"instance": "10.0.0.1", "type": "ops"}) == 999
+    assert registry.get_sample_value("sct_test_gauge", {"instance": "10.0.0.1", "type": "lat_perc_99"}) == 99.9
+    assert aggregator.series_count == 2
+
+
+def test_released_series_are_removed(registry, aggregator):
+    gauge = prometheus_client.Gauge("sct_test_gauge", "test", ["instance", "type"], registry=registry)
+    aggregator.publish(gauge, [(("10.0.0.1", "ops"), 1), (("10.0.0.2", "ops"), 2)])
+    aggregator.flush()
+    aggregator.publish(gauge, [(("10.0.0.1", "ops"), 3)])
+    aggregator.release(gauge, [("10.0.0.1", "ops")])
+    aggregator.release(gauge, [("10.0.0.2", "ops")])
+    aggregator.publish(gauge, [(("10.0.0.2", "ops"), 4)])  # e.g., the next stress command on the same loader
+    aggregator.flush()
+    # the last value published before the release is exposed till the next flush
+    assert registry.get_sample_value("sct_test_gauge", {"instance": "10.0.0.1", "type": "ops"}) == 3
+    assert registry.get_sample_value("sct_test_gauge", {"instance": "10.0.0.2", "type": "ops"}) == 4
+    aggregator.flush()
+    assert registry.get_sample_value("sct_test_gauge", {"instance": "10.0.0.1", "type": "ops"}) is None
+    assert registry.get_sample_value("sct_test_gauge", {"instance": "10.0.0.2", "type": "ops"}) == 4
+    assert aggregator.series_count == 1
+
+
+def test_last_values_published_with_release_are_exposed(registry, aggregator):
+    gauge = prometheus_client.Gauge("sct_test_gauge", "test", ["instance", "type"], registry=registry)
+    aggregator.publish(gauge, [(("10.0.0.1", "ops"), 1), (("10.0.0.1", "lat_perc_99"), 10)])
+    aggregator.release(gauge, [("10.0.0.1", "ops"), ("10.0.0.1", "lat_perc_99")])
+    aggregator.flush()
+    assert registry.get_sample_value("sct_test_gauge", {"instance": "10.0.0.1", "type": "ops"}) == 1
+    assert registry.get_sample_value("sct_test_gauge", {"instance": "10.0.0.1", "type": "lat_perc_99"}) == 10
+    aggregator.publish(gauge, [(("10.0.0.1", "ops"), 2)])  # the next stress command with the same labels
+    aggregator.flush()
+    assert registry.get_sample_value("sct_test_gauge", {"instance": "10.0.0.1", "type": "ops"}) == 2
+    assert registry.get_sample_value("sct_test_gauge", {"instance": "10.0.0.1", "type": "lat_perc_99"}) is None
+    assert aggregator.series_count == 1
+
+
+def test_number_of_series_is_capped(registry, aggregator):
+    gauge = prometheus_client.Gauge("sct_test_gauge", "test", ["instance", "type"], registry=registry)
+    aggregator.max_series = 3
+    aggregator.publish(gauge, [((f"10.0.0.{idx}", "ops"), idx) for idx in range(5)])
+    aggregator.flush()
+    assert aggregator.series_count == 3
+    assert aggregator.dropped_updates == 2
+    assert registry.get_sample_value("sct_test_gauge", {"instance": "10.0.0.4", "type": "ops"}) is None
+
+
+def test_cassandra_stress_exporter(tmp_path, registry, aggregator, monkeypatch):
+    monkeypatch.setattr(CassandraStressExporter, "METRICS_GAUGES", {})
+    log_file = tmp_path / "cassandra-stress.log"
+    log_file.write_text("Keyspace: keyspace1\n" + CS_LINE * 3, encoding="utf-8")
+    exporter = CassandraStressExporter("10.0.0.1", FakeMetrics(registry), "write", str(log_file),
+                                       loader_idx=1, cpu_idx=0)
+    exporter.metrics_aggregator = aggregator
+    labels = {"cassandra_stress_write": "0", "instance": "10.0.0.1", "loader_idx": "1", "cpu_idx": "0",
+              "keyspace": "keyspace1"}
+
+    def get_value(metric_type):
+        return registry.get_sample_value("sct_cassandra_stress_write_gauge", labels | {"type": metric_type})
+
+    with exporter:
+        wait_for(lambda: get_value("ops") == 70178, timeout=10, step=0.1, text="Waiting for c-s metrics")
+        assert get_value("lat_perc_99") == 53.6
+        assert get_value("errors") == 0
+    exporter.future.result(timeout=10)
+    aggregator.flush()
+    assert get_value("ops") is None
+    assert aggregator.series_count == 0
@@ -0,0 +1,60 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+import json
+from pathlib import Path
+
+import pytest
+
+from sdcm.stress.summary_parsers import (
+    StressSummary,
+    parse_cassandra_stress_summary,
+    parse_gemini_summary,
+    parse_latte_summary,
+    parse_scylla_bench_summary,
+)
+from sdcm.utils.common import get_sct_root_path
+
+TEST_DATA_DIR = Path(__file__).parent / "test_data" / "test_stress_summary"
+PROGRESS_LINE = "total,  162389554,  90458,  90458,  90458,  11.0,  9.5,  22.8,  34.5,  52.1,  110.8, 1799.0,  0.00253,  0\n"
+
+
+@pytest.mark.parametrize("parser,output_file,golden_file", (
+    (parse_cassandra_stress_summary, "cassandra_stress_write.log", "cassandra_stress_write.json"),
+    (parse_cassandra_stress_summary, "cassandra_stress_mixed.log", "cassandra_stress_mixed.json"),
+    (parse_cassandra_stress_summary, "cassandra_stress_no_summary.log", "cassandra_stress_no_summary.json"),
+    (parse_scylla_bench_summary, "scylla_bench_write.log", "scylla_bench_write.json"),
+    (parse_latte_summary, Path(get_sct_root_path()) / "data_dir" / "latte_stress_output.log", "latte.json"),
+    (parse_gemini_summary, "gemini.log", "gemini.json"),
+))
+def test_golden_outputs(parser, output_file, golden_file):
+    summary = parser((TEST_DATA_DIR / output_file).read_text(encoding="utf-8"))
+    assert isinstance(summary, StressSummary)
+    assert summary == json.loads((TEST_DATA_DIR / golden_file).read_text(encoding="utf-8"))
+
+
+def test_long_cassandra_stress_output():
+    output = (TEST_DATA_DIR / "cassandra_stress_write.log").read_text(encoding="utf-8")
+    header, summary = output.split("\n\n\nResults:\n")
+    summary = parse_cassandra_stress_summary(f"{header}{PROGRESS_LINE * 100_000}\n\nResults:\n{summary}")
+    assert summary == json.loads((TEST_DATA_DIR / "cassandra_stress_write.json").read_text(encoding="utf-8"))
+
+
+def test_typed_accessors():
+    summary = parse_cassandra_stress_summary((TEST_DATA_DIR / "cassandra_stress_mixed.log").read_text(encoding="utf-8"))
+    assert summary.tool == "cassandra-stress"
+    assert (summary.op_rate, summary.latency_mean, summary.latency_99th_percentile) == (24102, 12.4, 41.7)
+    assert summary.get_float("latency max read") == 1215.3
+    summary = parse_scylla_bench_summary((TEST_DATA_DIR / "scylla_bench_write.log").read_text(encoding="utf-8"))
+    assert (summary.op_rate, summary.latency_mean, summary.latency_99th_percentile) == (88445, 2.269873, 6.193151)
+    assert StressSummary("gemini").op_rate is None
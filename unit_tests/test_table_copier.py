@@ -0,0 +1,53 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+import pytest
+
+from sdcm.utils.table_copier import MAX_TOKEN, MIN_TOKEN, TableCopier, split_token_ring
+from unit_tests.test_cluster import DummyScyllaCluster
+
+
+def test_split_token_ring():
+    ranges = split_token_ring(7)
+    assert len(ranges) == 7
+    assert ranges[0][0] == MIN_TOKEN
+    assert ranges[-1][1] == MAX_TOKEN
+    assert all(start < end for start, end in ranges)
+    assert all(prev_end == start for (_, prev_end), (start, _) in zip(ranges, ranges[1:]))
+
+
+@pytest.mark.integration
+def test_copy_view_to_table(docker_scylla, params, events):
+
+    cluster = DummyScyllaCluster([docker_scylla])
+    cluster.params = params
+
+    with cluster.cql_connection_patient(docker_scylla) as session:
+        session.execute(
+            "CREATE KEYSPACE copier WITH replication = {'class': 'NetworkTopologyStrategy', 'replication_factor': 1}")
+        session.execute("CREATE TABLE copier.users (username text, ck int, email text, PRIMARY KEY(username, ck))")
+        session.execute("CREATE MATERIALIZED VIEW copier.users_by_email AS SELECT * FROM copier.users "
+                        "WHERE email IS NOT NULL AND username IS NOT NULL AND ck IS NOT NULL "
+                        "PRIMARY KEY(email, username, ck)")
+        session.execute("CREATE TABLE copier.users_copy (email text, username text, ck int, "
+                        "PRIMARY KEY(username, email, ck))")
+        insert = session.prepare("INSERT INTO copier.users (username, ck, email) VALUES (?, ?, ?)")
+        for idx in range(1000):
+            session.execute(insert, (f"user{idx % 100}", idx, f"user{idx}@example.com"))
+
+        copier = TableCopier(session=session, src_keyspace="copier", src_table="users_by_email",
+                             dest_keyspace="copier", dest_table="users_copy", readers=3, write_concurrency=10,
+                             fetch_size=50, queue_size=2)
+        assert copier.copy()
+        assert copier.rows_read == copier.rows_copied == 1000
+        assert session.execute("SELECT count(*) FROM copier.users_copy").one().count == 1000
@@ -12,9 +12,11 @@
 # Copyright (c) 2020 ScyllaDB
 
 import os
+import time
 import hashlib
 import shutil
 import logging
+import tempfile
 import unittest
 import unittest.mock
 from pathlib import Path
@@ -22,7 +24,7 @@ from pathlib import Path
 from sdcm import sct_config
 from sdcm.cluster import BaseNode, BaseCluster, BaseScyllaCluster
 from sdcm.utils.distro import Distro
-from sdcm.utils.common import convert_metric_to_ms, download_dir_from_cloud
+from sdcm.utils.common import convert_metric_to_ms, download_dir_from_cloud, FileFollowerThread
 from sdcm.utils.sstable import load_inventory
 from sdcm.utils.sstable.load_utils import SstableLoadUtils
 
@@ -39,6 +41,76 @@ class TestUtils(unittest.TestCase):
             assert actual == converted, f"Expected {converted}, got {actual}"
 
 
+class LinesCollector(FileFollowerThread):
+    def __init__(self, filename):
+        super().__init__()
+        self.filename = filename
+        self.lines = []
+
+    def run(self):
+        for line in self.follow_file(self.filename):
+            self.lines.append(line)
+
+    def wait_for_lines(self, count, timeout=3):
+        end_time = time.perf_counter() + timeout
+        while len(self.lines) < count and time.perf_counter() < end_time:
+            time.sleep(0.01)
+        return self.lines
+
+
+class TestFileFollower(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_file = Path(self.temp_dir) / "stress.log"
+        self.log_file.write_text("line 1\nline")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def append(self, text):
+        with self.log_file.open("a") as log_file:
+            log_file.write(text)
+
+    def check_follow_appended_lines(self):
+        with LinesCollector(str(self.log_file)) as collector:
+            self.assertEqual(collector.wait_for_lines(1), ["line 1\n"])
+            self.append(" 2\nline 3\nline 4")
+            self.assertEqual(collector.wait_for_lines(3), ["line 1\n", "line 2\n", "line 3\n"])
+        collector.future.result(timeout=3)
+        self.assertEqual(collector.lines, ["line 1\n", "line 2\n", "line 3\n", "line 4"])
+
+    def test_follow_appended_lines(self):
+        self.check_follow_appended_lines()
+
+    def test_follow_appended_lines_without_inotify(self):
+        with unittest.mock.patch("sdcm.utils.common.Inotify", side_effect=OSError("not supported")):
+            self.check_follow_appended_lines()
+
+    def test_stop_wakes_follower_up(self):
+        with unittest.mock.patch("sdcm.utils.common.FileFollowerIterator.inotify_wait_timeout", 60):
+            with LinesCollector(str(self.log_file)) as collector:
+                collector.wait_for_lines(1)
+                time.sleep(0.1)
+            start_time = time.perf_counter()
+            collector.future.result(timeout=3)
+        self.assertLess(time.perf_counter() - start_time, 1)
+
+    def test_follow_truncated_file(self):
+        with LinesCollector(str(self.log_file)) as collector:
+            collector.wait_for_lines(1)
+            self.log_file.write_text("new 1\n")
+            self.assertEqual(collector.wait_for_lines(2), ["line 1\n", "new 1\n"])
+
+    def test_follow_rotated_file(self):
+        with LinesCollector(str(self.log_file)) as collector:
+            collector.wait_for_lines(1)
+            self.append(" 2\n")
+            collector.wait_for_lines(2)
+            self.log_file.rename(self.log_file.with_suffix(".log.1"))
+            self.log_file.write_text("new 1\n")
+            self.assertEqual(collector.wait_for_lines(3), ["line 1\n", "line 2\n", "new 1\n"])
+
+
 class TestDownloadDir(unittest.TestCase):
     @staticmethod
     def clear_cloud_downloaded_path(url):
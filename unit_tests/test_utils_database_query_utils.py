@@ -1,9 +1,57 @@
+import threading
+from types import SimpleNamespace
+
 import pytest
 
-from sdcm.utils.database_query_utils import fetch_all_rows
+from sdcm.utils.database_query_utils import PartitionsValidationAttributes, fetch_all_rows, stream_rows
 from unit_tests.test_cluster import DummyScyllaCluster
 
 
+class FakePagedFuture:
+    def __init__(self, pages, fail_on_page=None):
+        self.pages = pages
+        self.fail_on_page = fail_on_page
+        self.fetched_pages = 0
+        self.has_more_pages = True
+        self.callbacks = None
+
+    def add_callbacks(self, callback, errback):
+        self.callbacks = (callback, errback)
+        self.start_fetching_next_page()
+
+    def start_fetching_next_page(self):
+        threading.Timer(0.01, self._page_received).start()
+
+    def _page_received(self):
+        callback, errback = self.callbacks
+        if self.fetched_pages == self.fail_on_page:
+            errback(ConnectionError("connection lost"))
+            return
+        page = self.pages[self.fetched_pages]
+        self.fetched_pages += 1
+        self.has_more_pages = self.fetched_pages < len(self.pages)
+        callback(page)
+
+
+def test_stream_rows_prefetch_is_bounded():
+    future = FakePagedFuture(pages=[[(page, row) for row in range(10)] for page in range(20)])
+    session = SimpleNamespace(execute_async=lambda statement, **_: future)
+    rows = stream_rows(session=session, statement="select * from ks.cf", fetch_size=10, prefetch_pages=3, timeout=5)
+    assert next(rows) == (0, 0)
+    threading.Event().wait(0.2)
+    assert future.fetched_pages == 4  # the page being consumed and 3 prefetched ones
+    assert list(rows) == [(page, row) for page in range(20) for row in range(10)][1:]
+
+
+def test_stream_rows_error():
+    future = FakePagedFuture(pages=[[(page, row) for row in range(10)] for page in range(20)], fail_on_page=5)
+    session = SimpleNamespace(execute_async=lambda statement, **_: future)
+    rows = stream_rows(session=session, statement="select * from ks.cf", fetch_size=10, timeout=5)
+    with pytest.raises(ConnectionError):
+        for _ in rows:
+            pass
+
+
 @pytest.mark.integration
 def test_fetch_all_rows(docker_scylla, params, events):
 
@@ -24,3 +72,28 @@ def test_fetch_all_rows(docker_scylla, params, events):
         statement = 'select * from  mview.users;'
         full_res = fetch_all_rows(session=session, default_fetch_size=100, statement=statement)
         assert full_res
+
+
+@pytest.mark.integration
+def test_collect_partitions_info(docker_scylla, params, events, tmp_path):
+
+    cluster = DummyScyllaCluster([docker_scylla])
+    cluster.params = params
+
+    with cluster.cql_connection_patient(docker_scylla) as session:
+        session.execute(
+            "CREATE KEYSPACE IF NOT EXISTS validation WITH replication = "
+            "{'class': 'NetworkTopologyStrategy', 'replication_factor': 1}")
+        session.execute("CREATE TABLE validation.test (pk bigint, ck bigint, PRIMARY KEY(pk, ck))")
+        insert = session.prepare("INSERT INTO validation.test (pk, ck) VALUES (?, ?)")
+        for pk in range(50):
+            for ck in range(pk % 7):
+                session.execute(insert, (pk, ck))
+
+    partitions_attrs = PartitionsValidationAttributes(tester=SimpleNamespace(db_cluster=cluster, logdir=str(tmp_path)),
+                                                      table_name="validation.test", primary_key_column="pk",
+                                                      max_concurrent_queries=8)
+    partitions = partitions_attrs.collect_partitions_info()
+    assert partitions == {pk: pk % 7 for pk in range(50) if pk % 7}
+    stats = (tmp_path / PartitionsValidationAttributes.PARTITIONS_ROWS_BEFORE).read_text()
+    assert stats == "".join(f"{pk}:{rows}, " for pk, rows in partitions.items())
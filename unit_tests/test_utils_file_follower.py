@@ -0,0 +1,103 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+import time
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from sdcm.utils.common import FileFollowerThread
+from sdcm.utils.file_follower import FileFollowerService
+
+
+class LinesCollector(FileFollowerThread):
+    def __init__(self, filename):
+        super().__init__()
+        self.followed_filename = filename
+        self.lines = []
+        self.threads = set()
+
+    def process_line(self, line_number, line):
+        self.threads.add(threading.current_thread().name)
+        self.lines.append((line_number, line))
+        return int("ERROR" in line)
+
+
+def wait_for_lines(collector, count, timeout=3):
+    end_time = time.perf_counter() + timeout
+    while len(collector.lines) < count and time.perf_counter() < end_time:
+        time.sleep(0.01)
+    return [line for _, line in collector.lines]
+
+
+@pytest.fixture(params=(True, False), ids=("inotify", "polling"))
+def service(request):
+    service = FileFollowerService()
+    with patch("sdcm.utils.common.get_file_follower_service", return_value=service):
+        if request.param:
+            yield service
+        else:
+            with patch("sdcm.utils.file_follower.Inotify", side_effect=OSError("not supported")):
+                yield service
+
+
+def test_many_files_are_followed_by_one_thread(tmp_path, service):
+    collectors = [LinesCollector(str(tmp_path / f"stress-{index}.log")) for index in range(5)]
+    for collector in collectors[:3]:
+        Path(collector.followed_filename).write_text("line 1\n")
+    for collector in collectors:
+        collector.start()
+    for index, collector in enumerate(collectors):
+        with open(collector.followed_filename, "a", encoding="utf-8") as log_file:
+            log_file.write(f"ERROR in stress #{index}\nlast")
+    for collector in collectors:
+        wait_for_lines(collector, 2 if collectors.index(collector) < 3 else 1)
+        collector.stop()
+    for index, collector in enumerate(collectors):
+        stats = collector.future.result(timeout=3)
+        expected = (["line 1\n"] if index < 3 else []) + [f"ERROR in stress #{index}\n", "last"]
+        assert [line for _, line in collector.lines] == expected
+        assert [line_number for line_number, _ in collector.lines] == list(range(len(expected)))
+        assert collector.threads == {"FileFollowerService"}
+        assert (stats.lines, stats.events) == (collector.lines_count, collector.events_count) == (len(expected), 1)
+    assert not service.stats()
+
+
+def test_partial_lines_and_rotation(tmp_path, service):
+    log_file = tmp_path / "stress.log"
+    log_file.write_text("line 1\nline")
+    with LinesCollector(str(log_file)) as collector:
+        assert wait_for_lines(collector, 1) == ["line 1\n"]
+        with log_file.open("a") as fobj:
+            fobj.write(" 2\n")
+        assert wait_for_lines(collector, 2) == ["line 1\n", "line 2\n"]
+        assert service.stats()[0].lines == 2
+        log_file.rename(tmp_path / "stress.log.1")
+        log_file.write_text("new 1\n")
+        assert wait_for_lines(collector, 3) == ["line 1\n", "line 2\n", "new 1\n"]
+        log_file.write_text("new\n")  # truncated
+        assert wait_for_lines(collector, 4)[-1] == "new\n"
+    collector.future.result(timeout=3)
+
+
+def test_handler_failure_does_not_stop_following(tmp_path, service):
+    log_file = tmp_path / "stress.log"
+    log_file.write_text("bad\ngood\n")
+    collector = LinesCollector(str(log_file))
+    process_line = collector.process_line
+    collector.process_line = lambda line_number, line: process_line(line_number, line) / ("bad" not in line)
+    with collector:
+        assert wait_for_lines(collector, 2) == ["bad\n", "good\n"]
+    assert collector.future.result(timeout=3).lines == 2
@@ -0,0 +1,84 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+from pathlib import Path
+
+import pytest
+
+from sdcm.sct_events.database import SYSTEM_ERROR_EVENTS_PATTERNS
+from sdcm.utils.log_scanner import IncrementalLogScanner, LiteralsPrefilter
+from sdcm.utils.pattern_set import PatternSet
+
+TEST_DATA_DIR = Path(__file__).parent / "test_data"
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    return tmp_path / "system.log"
+
+
+@pytest.mark.parametrize("use_prefilter", (False, True))
+@pytest.mark.parametrize("chunk_size", (4096, 1024 * 1024))
+def test_scan_appended_log_in_pieces(log_file, use_prefilter, chunk_size):
+    pattern_set = PatternSet(SYSTEM_ERROR_EVENTS_PATTERNS)
+    data = (TEST_DATA_DIR / "system_core.log").read_bytes()
+    expected = [(index, line) for index, line in enumerate(data.decode().splitlines(keepends=True))
+                if pattern_set.search(line)]
+    scanner = IncrementalLogScanner(path=str(log_file),
+                                    prefilter=LiteralsPrefilter(pattern_set) if use_prefilter else None,
+                                    chunk_size=chunk_size)
+    found = []
+    with log_file.open("wb") as log:
+        for position in range(0, len(data), 1000):
+            log.write(data[position:position + 1000])
+            log.flush()
+            found.extend((index, line) for index, line in scanner.scan() if pattern_set.search(line))
+    assert found == expected
+    assert scanner.line_number == data.count(b"\n")
+    assert scanner.position == len(data)
+
+
+def test_partial_line_is_postponed(log_file):
+    log_file.write_text("first line\nsecond li")
+    scanner = IncrementalLogScanner(path=str(log_file), max_partial_line_retries=2)
+    assert list(scanner.scan()) == [(0, "first line\n")]
+    assert not list(scanner.scan())
+    with log_file.open("a") as log:
+        log.write("ne\nthird")
+    assert list(scanner.scan()) == [(1, "second line\n")]
+    assert not list(scanner.scan())
+    assert list(scanner.scan()) == [(2, "third")]
+
+
+def test_long_line_is_truncated(log_file):
+    log_file.write_text("a" * 100 + "\n" + "b" * 10 + "\n")
+    scanner = IncrementalLogScanner(path=str(log_file), chunk_size=32, max_line_size=16)
+    assert list(scanner.scan()) == [(0, "a" * 16), (1, "b" * 10 + "\n")]
+
+
+def test_prefilter_skips_lines_without_literals(log_file):
+    log_file.write_text("INFO nothing here\nERROR [shard 1] something bad\nReactor Stalled for 100 ms\n")
+    prefilter = LiteralsPrefilter(PatternSet(SYSTEM_ERROR_EVENTS_PATTERNS))
+    scanner = IncrementalLogScanner(path=str(log_file), prefilter=prefilter)
+    assert [index for index, _ in scanner.scan()] == [1, 2]
+
+
+def test_seek_to_end_and_truncation(log_file):
+    log_file.write_text("old line\n")
+    scanner = IncrementalLogScanner(path=str(log_file))
+    scanner.seek_to_end()
+    with log_file.open("a") as log:
+        log.write("new line\n")
+    assert [line for _, line in scanner.scan()] == ["new line\n"]
+    log_file.write_text("rotated\n")
+    assert [line for _, line in scanner.scan()] == ["rotated\n"]
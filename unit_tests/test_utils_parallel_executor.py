@@ -0,0 +1,159 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from sdcm.utils.common import ParallelObject, ParallelObjectException
+from sdcm.utils.parallel_executor import ParallelExecutor, current_task_group, in_current_context, task_cancelled
+
+
+class ConcurrencyTracker:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def track(self, duration):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(duration)
+        with self.lock:
+            self.running -= 1
+        return threading.current_thread().name
+
+
+@pytest.fixture
+def executor():
+    executor = ParallelExecutor()
+    with patch("sdcm.utils.common.get_parallel_executor", return_value=executor):
+        yield executor
+
+
+def test_worker_threads_are_reused(executor):
+    tracker = ConcurrencyTracker()
+    first = {result.result for result in ParallelObject([0.2] * 4, timeout=5, num_workers=4).run(tracker.track)}
+    second = {result.result for result in ParallelObject([0.2] * 4, timeout=5, num_workers=4).run(tracker.track)}
+    assert executor.workers == 4
+    assert first | second <= {f"ParallelExecutor-{index}" for index in range(1, 5)}
+    assert executor.get_task_stats()["ConcurrencyTracker.track"].count == 8
+
+
+def test_group_max_workers(executor):
+    tracker = ConcurrencyTracker()
+    ParallelObject([0.2] * 6, timeout=5, num_workers=2).run(tracker.track)
+    assert tracker.max_running == 2
+
+
+def test_max_concurrency_does_not_limit_nested_tasks(executor):
+    executor.max_concurrency = 1
+    tracker = ConcurrencyTracker()
+
+    def parent(_):
+        return [result.result for result in ParallelObject([0.2] * 3, timeout=5, num_workers=3).run(tracker.track)]
+
+    results = ParallelObject([0.2] * 2, timeout=5, num_workers=2).run(parent)
+    assert [len(result.result) for result in results] == [3, 3]
+    assert tracker.max_running == 3  # the nested tasks of one parent at a time
+    assert executor.get_task_stats()["test_max_concurrency_does_not_limit_nested_tasks.<locals>.parent"].count == 2
+
+
+def test_timeout_cancels_nested_tasks(executor):
+    started = []
+    stopped_early = threading.Event()
+
+    def subtask(index):
+        started.append(index)
+        for _ in range(50):
+            if task_cancelled():
+                stopped_early.set()
+                return
+            time.sleep(0.01)
+
+    def parent(_):
+        ParallelObject(range(5), timeout=5, num_workers=1).run(subtask)
+
+    with pytest.raises(ParallelObjectException):
+        ParallelObject([1], timeout=0.1).run(parent)
+    assert stopped_early.wait(timeout=3)
+    time.sleep(0.1)
+    assert started == [0]
+
+
+def test_groups_of_threads_started_by_task_are_nested(executor):
+    executor.max_concurrency = 1
+    tracker = ConcurrencyTracker()
+
+    def parent(_):
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(in_current_context(ParallelObject([0.1] * 2, timeout=5).run), tracker.track)
+                       for _ in range(2)]
+            return sum(len(future.result()) for future in futures)
+
+    results = ParallelObject([0.1] * 2, timeout=5, num_workers=2).run(parent)
+    assert [result.result for result in results] == [4, 4]
+
+
+def test_group_of_thread_started_by_task_is_nested(executor):
+    executor.max_concurrency = 1
+    groups = []
+
+    def child():
+        groups.append(group := executor.task_group())
+        groups.append(group.submit(current_task_group).result(timeout=5))
+
+    def parent():
+        thread = threading.Thread(target=in_current_context(child))
+        thread.start()
+        thread.join(10)
+        return current_task_group()
+
+    parent_group = executor.task_group().submit(parent).result(timeout=10)
+    assert groups[0].parent is parent_group
+    assert groups[1] is groups[0]
+
+
+def test_max_workers_is_not_exceeded(executor):
+    executor.max_workers = 2
+    tracker = ConcurrencyTracker()
+
+    def parent(_):
+        return [result.result for result in ParallelObject([0.1] * 3, timeout=5, num_workers=3).run(tracker.track)]
+
+    results = ParallelObject([0.1] * 4, timeout=10, num_workers=4).run(parent)
+    assert [len(result.result) for result in results] == [3, 3, 3, 3]
+    assert executor.workers <= 2
+
+
+def test_detached_group_is_not_cancelled_with_creator(executor):
+    executor.max_concurrency = 1
+    release = threading.Event()
+
+    def parent():
+        group = executor.task_group(detached=True)
+        return group, group.submit(release.wait, 5)
+
+    creator_group = executor.task_group()
+    detached_group, future = creator_group.submit(parent).result(timeout=5)
+    creator_group.cancel()
+    assert detached_group.parent is None
+    assert not detached_group.cancelled
+    # the running detached task doesn't hold the only slot of top-level tasks
+    assert executor.task_group().submit(lambda: "top-level").result(timeout=5) == "top-level"
+    release.set()
+    assert future.result(timeout=5) is True
@@ -0,0 +1,81 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+import re
+from pathlib import Path
+
+import pytest
+
+from sdcm.sct_events.database import SYSTEM_ERROR_EVENTS_PATTERNS, SCYLLA_DATABASE_CONTINUOUS_EVENTS
+from sdcm.sct_events.system import INSTANCE_STATUS_EVENTS_PATTERNS
+from sdcm.utils.pattern_set import PatternSet, extract_required_literals
+
+TEST_DATA_DIR = Path(__file__).parent / "test_data"
+
+
+def _first_match_by_loop(patterns, line):
+    for pattern, item in patterns:
+        if match := pattern.search(line):
+            return match.span(), item
+    return None
+
+
+def _all_patterns():
+    patterns = list(SYSTEM_ERROR_EVENTS_PATTERNS + INSTANCE_STATUS_EVENTS_PATTERNS)
+    for event in SCYLLA_DATABASE_CONTINUOUS_EVENTS:
+        patterns.append((re.compile(event.begin_pattern), event))
+        patterns.append((re.compile(event.end_pattern), event))
+    return patterns
+
+
+@pytest.mark.parametrize("pattern,expected", (
+    (re.compile("Reactor stalled", re.IGNORECASE), ("reactor stalled", )),
+    (re.compile(r"(^ERROR|!\s*?ERR).*\[shard.*\]"), ("[shard", )),
+    (re.compile("(unknown verb exception|unknown_verb_error)"), (" verb exception", "_verb_error")),
+    (re.compile(r"(?P<other_bt>/lib.*?\+0x[0-9a-f]*$)|(?P<scylla_bt>0x[0-9a-f]*$)"), ("/lib", "0x")),
+    (re.compile(r"\d+ ms"), (" ms", )),
+    (re.compile(r"[a-z]+\d*"), None),
+    (re.compile(r"(error|\d+)"), None),
+))
+def test_extract_required_literals(pattern, expected):
+    assert extract_required_literals(pattern) == expected
+
+
+def test_pattern_set_keeps_first_match_wins_order():
+    patterns = PatternSet([
+        (re.compile("Reactor stalled", re.IGNORECASE), "stall"),
+        (re.compile("backtrace", re.IGNORECASE), "backtrace"),
+    ])
+    match, item = patterns.search("Reactor stalled for 33 ms on shard 1. Backtrace: 0x1")
+    assert item == "stall"
+    assert match.group() == "Reactor stalled"
+    assert patterns.search("nothing to see here") is None
+    assert [item for _, item in patterns.search_all("REACTOR STALLED, backtrace")] == ["stall", "backtrace"]
+
+
+def test_pattern_set_non_ascii_line():
+    patterns = PatternSet([(re.compile("kelvin", re.IGNORECASE), "kelvin")])
+    # KELVIN SIGN is case-folded to `k' by the regex engine, but str.lower() keeps it as is
+    assert patterns.search("Kelvin")[1] == "kelvin"
+
+
+@pytest.mark.parametrize("log_file", ("system.log", "system_core.log", "system_interlace_stall.log",
+                                      "system_one_line_backtrace.log", "system_status_events.log",
+                                      "system_suppressed_messages.log", "power_off.log"))
+def test_pattern_set_is_equivalent_to_patterns_loop(log_file):
+    patterns = _all_patterns()
+    pattern_set = PatternSet(patterns)
+    with open(TEST_DATA_DIR / log_file, encoding="utf-8", errors="replace") as log:
+        for line in log:
+            found = pattern_set.search(line)
+            assert (found and (found[0].span(), found[1])) == _first_match_by_loop(patterns, line), line
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+"""
+Replay backtraces of a recorded reactor stall storm through the backtrace decoding and report the time spent.
+
+Compares decoding of one backtrace per addr2line call (the way the monitor node used to decode them) with
+BacktraceDecoder batches.  Commands run locally, `--latency' emulates the round trip of an SSH command.
+
+e.g.
+    ./utils/benchmark_backtrace_decoding.py -i ~/sct-results/latest/db-cluster-*/node-1/system.log \\
+        --debug-file /usr/lib/debug/opt/scylladb/libexec/scylla.debug --events 5000 --latency 0.05
+"""
+
+import os
+import re
+import sys
+import time
+import shutil
+import itertools
+
+import click
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from sdcm.cluster import BaseNode  # noqa: E402
+from sdcm.remote import LocalCmdRunner  # noqa: E402
+from sdcm.utils.backtrace_decoder import ADDR2LINE_CMD, BacktraceDecoder  # noqa: E402
+
+BACKTRACE_ADDRESS_RE = re.compile(r"^(0x[0-9a-fA-F]+|\S+\+0x[0-9a-fA-F]+)$")
+
+
+def read_backtraces(input_file):
+    backtraces = []
+    backtrace = None
+    with open(input_file, encoding="utf-8", errors="replace") as log_file:
+        for line in log_file:
+            message = line.rsplit(": ", 1)[-1].strip()
+            if backtrace is not None and BACKTRACE_ADDRESS_RE.match(message):
+                backtrace.append(message)
+                continue
+            if backtrace:
+                backtraces.append("\n".join(backtrace))
+            backtrace = [] if message.lower().endswith("backtrace:") else None
+    if backtrace:
+        backtraces.append("\n".join(backtrace))
+    return backtraces
+
+
+class Remoter:
+    def __init__(self, latency):
+        self.latency = latency
+        self.commands = 0
+        self.local_runner = LocalCmdRunner()
+
+    def run(self, cmd):
+        self.commands += 1
+        time.sleep(self.latency)
+        return self.local_runner.run(cmd, verbose=False, ignore_status=True).stdout
+
+
+def decode_one_by_one(remoter, debug_file, backtraces):
+    decoded = []
+    for raw_backtrace in backtraces:
+        remoter.run(f"test -f {debug_file}")
+        decoded.append(remoter.run(f"{ADDR2LINE_CMD} {debug_file} {' '.join(raw_backtrace.split())}"))
+    return decoded
+
+
+def decode_in_batches(remoter, debug_file, backtraces):
+    decoder = BacktraceDecoder(run_command=remoter.run)
+    decoded = []
+    batch_size = BaseNode.decode_backtraces_batch_size
+    for index in range(0, len(backtraces), batch_size):
+        decoded.extend(decoder.decode((debug_file, raw_backtrace)
+                                      for raw_backtrace in backtraces[index:index + batch_size]))
+    return decoded
+
+
+def run_benchmark(name, decode_func, debug_file, backtraces, latency):
+    remoter = Remoter(latency=latency)
+    start = time.perf_counter()
+    decoded = decode_func(remoter, debug_file, backtraces)
+    elapsed = time.perf_counter() - start
+    click.echo(f"{name:>12}: {len(backtraces)} backtraces in {elapsed:.2f}s, {len(backtraces) / elapsed:.0f} backtraces/s, "
+               f"{remoter.commands} commands")
+    return decoded
+
+
+@click.command(help="Benchmark decoding of a recorded reactor stall storm")
+@click.option("-i", "--input-file", type=click.Path(exists=True),
+              default=os.path.join(os.path.dirname(__file__), "..", "unit_tests", "test_data", "system.log"))
+@click.option("--debug-file", default=shutil.which("addr2line"), help="Debug info file of the Scylla binary")
+@click.option("-n", "--events", default=1000, type=int, help="Number of backtraces to replay (the log is repeated)")
+@click.option("--latency", default=0.0, type=float, help="Seconds added to every command, emulates SSH round trip")
+@click.option("--skip-one-by-one", is_flag=True, default=False, help="Don't run the (slow) one by one decoding")
+def benchmark(input_file, debug_file, events, latency, skip_one_by_one):
+    if not (recorded := read_backtraces(input_file)):
+        raise click.ClickException(f"No backtraces found in {input_file}")
+    backtraces = list(itertools.islice(itertools.cycle(recorded), events))
+    click.echo(f"{len(recorded)} backtraces found in {input_file}, "
+               f"{len(set(backtraces))} unique, {len({address for bt in backtraces for address in bt.split()})} addresses")
+    batched = run_benchmark("batches", decode_in_batches, debug_file, backtraces, latency)
+    if skip_one_by_one:
+        return
+    if run_benchmark("one by one", decode_one_by_one, debug_file, backtraces, latency) != batched:
+        raise click.ClickException("Batch decoding results differ from the one by one decoding results")
+    click.echo("Results are identical")
+
+
+if __name__ == "__main__":
+    benchmark()
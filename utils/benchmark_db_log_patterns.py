@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+"""
+Replay a recorded Scylla system.log through the DB log patterns matching and report the throughput.
+
+Compares the plain loop over all patterns (the way DbLogReader used to match lines) with PatternSet.
+The log is streamed line by line, so multi-GB logs can be used.
+
+e.g.
+    ./utils/benchmark_db_log_patterns.py -i ~/sct-results/latest/db-cluster-*/node-1/system.log
+"""
+
+import os
+import re
+import sys
+import time
+import itertools
+
+import click
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from sdcm.db_log_reader import LOG_LINE_MAX_PROCESSING_SIZE  # noqa: E402
+from sdcm.sct_events.database import SYSTEM_ERROR_EVENTS_PATTERNS, SCYLLA_DATABASE_CONTINUOUS_EVENTS  # noqa: E402
+from sdcm.utils.pattern_set import PatternSet  # noqa: E402
+
+
+def get_patterns():
+    patterns = []
+    for event in SCYLLA_DATABASE_CONTINUOUS_EVENTS:
+        patterns.append((re.compile(event.begin_pattern), event))
+        patterns.append((re.compile(event.end_pattern), event))
+    return patterns, list(SYSTEM_ERROR_EVENTS_PATTERNS)
+
+
+def read_lines(input_file, max_lines):
+    with open(input_file, encoding="utf-8", errors="replace") as log_file:
+        for line in itertools.islice(log_file, max_lines):
+            yield line[:LOG_LINE_MAX_PROCESSING_SIZE]
+
+
+def loop_match(patterns_lists, line):
+    result = []
+    for patterns in patterns_lists:
+        for pattern, item in patterns:
+            if match := pattern.search(line):
+                result.append((match.span(), item))
+                break
+        else:
+            result.append(None)
+    return result
+
+
+def pattern_set_match(pattern_sets, line):
+    result = []
+    for pattern_set in pattern_sets:
+        found = pattern_set.search(line)
+        result.append(found and (found[0].span(), found[1]))
+    return result
+
+
+def run_benchmark(name, match_func, patterns, input_file, max_lines):
+    lines = size = matched = digest = 0
+    start = time.perf_counter()
+    for line in read_lines(input_file, max_lines):
+        lines += 1
+        size += len(line)
+        result = match_func(patterns, line)
+        matched += any(result)
+        digest = hash((digest, *(found and (found[0], id(found[1])) for found in result)))
+    elapsed = time.perf_counter() - start
+    click.echo(f"{name:>12}: {lines} lines ({size / 1024 ** 2:.1f} MiB) in {elapsed:.2f}s, "
+               f"{lines / elapsed:.0f} lines/s, {size / 1024 ** 2 / elapsed:.2f} MiB/s, {matched} matched lines")
+    return digest
+
+
+@click.command(help="Benchmark DB log patterns matching on a recorded system.log")
+@click.option("-i", "--input-file", required=True, type=click.Path(exists=True))
+@click.option("-n", "--max-lines", default=None, type=int, help="Replay only first N lines of the log")
+@click.option("--skip-loop", is_flag=True, default=False, help="Don't run the (slow) plain loop matching")
+def benchmark(input_file, max_lines, skip_loop):
+    continuous_patterns, system_patterns = get_patterns()
+    pattern_sets_digest = run_benchmark(
+        "PatternSet", pattern_set_match, [PatternSet(continuous_patterns), PatternSet(system_patterns)],
+        input_file, max_lines)
+    if skip_loop:
+        return
+    loop_digest = run_benchmark("loop", loop_match, [continuous_patterns, system_patterns], input_file, max_lines)
+    if loop_digest != pattern_sets_digest:
+        raise click.ClickException("PatternSet results differ from the plain loop results")
+    click.echo("Results are identical")
+
+
+if __name__ == "__main__":
+    benchmark()
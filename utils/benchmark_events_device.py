@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+"""
+Measure throughput of the events devices during an events storm.
+
+A number of producer threads publish events as fast as they can and a subscriber counts the events received.
+The throughput is the number of events delivered to the subscriber per second.
+
+e.g.
+    ./utils/benchmark_events_device.py -n 20000 -p 4
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import threading
+
+import click
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from sdcm.sct_events.events_device import EventsDevice, BatchedEventsDevice  # noqa: E402
+from sdcm.sct_events.events_processes import EventsProcessesRegistry  # noqa: E402
+from sdcm.sct_events.system import InfoEvent  # noqa: E402
+
+DEVICES = {
+    "EventsDevice": EventsDevice,
+    "BatchedEventsDevice": BatchedEventsDevice,
+}
+
+
+def run_benchmark(name, events_number, producers):
+    temp_dir = tempfile.mkdtemp()
+    events_device = DEVICES[name](_registry=EventsProcessesRegistry(log_dir=temp_dir))
+    events_device.start()
+    stop_event = threading.Event()
+    received = 0
+
+    def subscriber():
+        nonlocal received
+        for _ in events_device.inbound_events(stop_event=stop_event):
+            received += 1
+
+    def producer(events):
+        for event in events:
+            events_device.publish_event(event)
+            event._ready_to_publish = False  # the same as SctEvent.publish() does
+
+    subscriber_thread = threading.Thread(target=subscriber, daemon=True)
+    subscriber_thread.start()
+    time.sleep(1)  # give the subscriber a chance to connect
+
+    # Create events in advance to measure the devices only.
+    producer_threads = [
+        threading.Thread(target=producer, daemon=True, args=(
+            [InfoEvent(message=f"{name} benchmark event #{index}") for index in range(events_number // producers)], ))
+        for _ in range(producers)]
+    start = time.perf_counter()
+    for thread in producer_threads:
+        thread.start()
+    for thread in producer_threads:
+        thread.join()
+    published = time.perf_counter() - start
+    expected = events_number // producers * producers
+    last_received, stall_time = received, time.perf_counter()
+    while received < expected and time.perf_counter() - stall_time < 10:
+        time.sleep(0.01)
+        if received != last_received:
+            last_received, stall_time = received, time.perf_counter()
+    elapsed = time.perf_counter() - start
+
+    stop_event.set()
+    events_device.stop(timeout=10)
+    subscriber_thread.join(timeout=5)
+    shutil.rmtree(temp_dir)
+
+    click.echo(f"{name:>20}: {received}/{expected} events delivered in {elapsed:.2f}s "
+               f"({received / elapsed:.0f} events/s), producers were done in {published:.2f}s")
+
+
+@click.command(help="Benchmark events devices throughput")
+@click.option("-n", "--events-number", default=10000, type=int, help="Number of events to publish")
+@click.option("-p", "--producers", default=1, type=int, help="Number of producer threads")
+@click.option("-d", "--device", "devices", multiple=True, type=click.Choice(list(DEVICES)), default=list(DEVICES),
+              help="Device to benchmark (can be used multiple times)")
+def benchmark(events_number, producers, devices):
+    for name in devices:
+        run_benchmark(name, events_number, producers)
+
+
+if __name__ == "__main__":
+    benchmark()
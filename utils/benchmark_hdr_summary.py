@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+"""
+Benchmark building of HDR histograms summaries by interval on a synthetic HDR logs directory.
+
+Generates cassandra-stress like hdrh-*.hdr files (one per loader, 10s intervals) and compares the per file
+aggregation used by make_hdrhistogram_summary_by_interval() with one task per (interval, tag) pair.
+
+e.g.
+    ./utils/benchmark_hdr_summary.py --hours 12 --loaders 10
+"""
+
+import os
+import sys
+import time
+import random
+import shutil
+import tempfile
+from concurrent.futures.process import ProcessPoolExecutor
+
+import click
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from sdcm.utils.hdrhistogram import (  # noqa: E402
+    PROCESS_LIMIT,
+    TIME_INTERVAL,
+    _HdrHistogram,
+    _HdrRangeHistogramBuilder,
+    make_hdrhistogram_summary_by_interval,
+)
+
+START_TIME = 1_700_000_000
+HDR_INTERVAL = 10  # seconds, the same as SCT uses for cassandra-stress
+TAGS = ("WRITE-st", "WRITE-rt", "READ-st", "READ-rt")
+
+
+def generate_hdr_dir(base_path: str, hours: float, loaders: int, payloads: int = 100) -> None:
+    rnd = random.Random(0)
+    encoded = []
+    for _ in range(payloads):
+        histogram = _HdrHistogram()
+        for _ in range(1000):
+            histogram.record_value(rnd.randint(100_000, 50_000_000))
+        encoded.append((histogram.get_max_value() / 1_000_000, histogram.encode().decode()))
+    for loader in range(loaders):
+        os.makedirs(loader_dir := os.path.join(base_path, f"loader-{loader}"))
+        with open(os.path.join(loader_dir, "hdrh-cs-mixed-l1-c0-k1-benchmark.hdr"), "w", encoding="utf-8") as hdr:
+            hdr.write(f"#[StartTime: {START_TIME:.3f} (seconds since epoch), Tue Nov 14 22:13:20 UTC 2023]\n")
+            hdr.write('"StartTimestamp","Interval_Length","Interval_Max","Interval_Compressed_Histogram"\n')
+            for interval in range(int(hours * 3600 / HDR_INTERVAL)):
+                for tag in TAGS:
+                    max_value, payload = rnd.choice(encoded)
+                    hdr.write(f"Tag={tag},{interval * HDR_INTERVAL:.3f},{HDR_INTERVAL:.3f},{max_value:.3f},{payload}\n")
+
+
+def _build_window_summary_by_tag(path, hdr_tag, start_interval, end_interval, interval_num):
+    result = _HdrRangeHistogramBuilder(hdr_tags=[hdr_tag], stress_operation="mixed",
+                                       start_time=start_interval, end_time=end_interval,
+                                       ).build_histogram_summary_by_tag(path, hdr_tag)
+    return result and {"interval_num": interval_num, "result": result}
+
+
+def summary_by_window_and_tag(hdr_tags, path, start_time, end_time, interval):
+    """One task per (interval, tag) pair, the way summaries by interval were built before."""
+    window_step = end_time - start_time if end_time - start_time < TIME_INTERVAL else interval
+    start_intervals = range(start_time, end_time, window_step)
+    with ProcessPoolExecutor(max_workers=min(len(start_intervals) * len(hdr_tags), PROCESS_LIMIT)) as executor:
+        futures = [executor.submit(_build_window_summary_by_tag, path, hdr_tag,
+                                   start_interval, min(start_interval + window_step, end_time), interval_num)
+                   for interval_num, start_interval in enumerate(start_intervals) for hdr_tag in hdr_tags]
+        results = {}
+        for future in futures:
+            if res := future.result():
+                results.setdefault(res["interval_num"], {}).update(res["result"])
+    return [results[key] for key in sorted(results)]
+
+
+@click.command(help="Benchmark HDR histograms summaries by interval on a synthetic HDR logs directory")
+@click.option("--hours", default=12.0, type=float, help="Duration of the synthetic stress run")
+@click.option("--loaders", default=10, type=int, help="Number of loaders (HDR files)")
+@click.option("--interval", default=TIME_INTERVAL, type=int, help="Summary interval in seconds")
+@click.option("--skip-per-window", is_flag=True, default=False, help="Don't run one task per (interval, tag) pair")
+def benchmark(hours, loaders, interval, skip_per_window):
+    base_path = tempfile.mkdtemp()
+    try:
+        start = time.perf_counter()
+        generate_hdr_dir(base_path, hours, loaders)
+        click.echo(f"Generated {loaders} HDR files for {hours}h in {time.perf_counter() - start:.1f}s")
+        args = dict(hdr_tags=["WRITE-rt", "READ-rt"], path=base_path,
+                    start_time=START_TIME, end_time=START_TIME + int(hours * 3600), interval=interval)
+
+        start = time.perf_counter()
+        summary = make_hdrhistogram_summary_by_interval(stress_operation="mixed", **args)
+        click.echo(f"{'per file':>16}: {len(summary)} intervals in {time.perf_counter() - start:.1f}s")
+        if skip_per_window:
+            return
+
+        start = time.perf_counter()
+        expected = summary_by_window_and_tag(**args)
+        click.echo(f"{'per window & tag':>16}: {len(expected)} intervals in {time.perf_counter() - start:.1f}s")
+        if summary != expected:
+            raise click.ClickException("Summaries are different")
+        click.echo("Summaries are identical")
+    finally:
+        shutil.rmtree(base_path)
+
+
+if __name__ == "__main__":
+    benchmark()